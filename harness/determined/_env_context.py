@@ -28,6 +28,7 @@ class EnvContext:
         det_trial_unique_port_offset: int,
         det_trial_runner_network_interface: str,
         det_trial_id: str,
+        det_trial_run_id: int,
         det_experiment_id: str,
         det_agent_id: str,
         det_cluster_id: str,
@@ -56,6 +57,7 @@ class EnvContext:
         self.det_trial_unique_port_offset = det_trial_unique_port_offset
         self.det_trial_runner_network_interface = det_trial_runner_network_interface
         self.det_trial_id = det_trial_id
+        self.det_trial_run_id = det_trial_run_id
         self.det_experiment_id = det_experiment_id
         self.det_agent_id = det_agent_id
         self.det_cluster_id = det_cluster_id
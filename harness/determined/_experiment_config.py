@@ -17,6 +17,9 @@ class ExperimentConfig(dict):
     def native_parallel_enabled(self) -> bool:
         return bool(self["resources"]["native_parallel"])
 
+    def distributed_backend(self) -> str:
+        return str(self.get("resources", {}).get("distributed_backend") or "horovod")
+
     def averaging_training_metrics_enabled(self) -> bool:
         return bool(self["optimizations"]["average_training_metrics"])
 
@@ -35,6 +38,17 @@ class ExperimentConfig(dict):
 
         return self["profiling"]["begin_on_batch"], self["profiling"].get("end_after_batch", None)
 
+    def profiling_continuous(self) -> bool:
+        return bool(self.get("profiling", {}).get("continuous", False))
+
+    def profiling_sampling(self) -> Tuple[int, int]:
+        """Return (sample_every_n_batches, max_samples_per_series) for continuous profiling."""
+        profiling = self.get("profiling", {})
+        return (
+            int(profiling.get("sample_every_n_batches") or 10),
+            int(profiling.get("max_samples_per_series") or 100),
+        )
+
     def get_data_layer_type(self) -> str:
         return cast(str, self["data_layer"]["type"])
 
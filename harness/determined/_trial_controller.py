@@ -97,12 +97,22 @@ class TrialController(metaclass=abc.ABCMeta):
     def supports_averaging_training_metrics() -> bool:
         return False
 
+    @staticmethod
+    def supports_torch_distributed() -> bool:
+        return False
+
     def initialize_wrapper(self) -> None:
         pass
 
     def _check_if_trial_supports_configurations(self, env: det.EnvContext) -> None:
         if env.experiment_config.averaging_training_metrics_enabled():
             check.true(self.supports_averaging_training_metrics())
+        if self.hvd_config.use and self.hvd_config.backend == "torch":
+            check.true(
+                self.supports_torch_distributed(),
+                "The torch distributed backend (resources.distributed_backend: torch) is only "
+                "supported by PyTorchTrial.",
+            )
 
 
 class CallbackTrialController(TrialController):
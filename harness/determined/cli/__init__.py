@@ -1,18 +0,0 @@
-from . import (
-    agent,
-    checkpoint,
-    cli,
-    command,
-    experiment,
-    master,
-    model,
-    notebook,
-    remote,
-    render,
-    resources,
-    shell,
-    template,
-    tensorboard,
-    trial,
-    user,
-)
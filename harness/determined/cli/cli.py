@@ -1,47 +1,32 @@
 import hashlib
+import importlib
+import os
 import socket
 import ssl
 import sys
 from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser, FileType, Namespace
-from typing import Any, Dict, List, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 import argcomplete
 import argcomplete.completers
-import OpenSSL
 import requests
 import tabulate
 from termcolor import colored
 
 import determined
 import determined.cli
-from determined.cli import checkpoint, experiment, render
-from determined.cli.agent import args_description as agent_args_description
-from determined.cli.master import args_description as master_args_description
-from determined.cli.model import args_description as model_args_description
-from determined.cli.notebook import args_description as notebook_args_description
-from determined.cli.oauth import args_description as oauth_args_description
-from determined.cli.remote import args_description as remote_args_description
-from determined.cli.resources import args_description as resources_args_description
-from determined.cli.shell import args_description as shell_args_description
-from determined.cli.sso import args_description as auth_args_description
-from determined.cli.template import args_description as template_args_description
-from determined.cli.tensorboard import args_description as tensorboard_args_description
-from determined.cli.trial import args_description as trial_args_description
-from determined.cli.user import args_description as user_args_description
-from determined.cli.version import args_description as version_args_description
+from determined.cli import render
 from determined.cli.version import check_version
 from determined.common import api, yaml
 from determined.common.api import authentication, certs
 from determined.common.check import check_not_none
-from determined.common.declarative_argparse import Arg, Cmd, add_args
+from determined.common.declarative_argparse import Arg, Cmd, add_args, generate_aliases
 from determined.common.util import (
     chunks,
     debug_mode,
     get_default_master_address,
     safe_load_yaml_with_exceptions,
 )
-from determined.deploy.cli import DEPLOY_CMD_NAME
-from determined.deploy.cli import args_description as deploy_args_description
 
 from .errors import EnterpriseOnlyError
 
@@ -154,10 +139,6 @@ args_description = [
         action="version", help="print CLI version and exit",
         version="%(prog)s {}".format(determined.__version__)),
 
-    experiment.args_description,
-
-    checkpoint.args_description,
-
     Cmd("task", None, "manage tasks (commands, experiments, notebooks, shells, tensorboards)", [
         Cmd("list", list_tasks, "list tasks in cluster", [
             Arg("--csv", action="store_true", help="print as CSV"),
@@ -168,43 +149,105 @@ args_description = [
         Arg("config_file", type=FileType("r"),
             help="experiment config file (.yaml)")
     ]),
-
-    deploy_args_description,
 ]  # type: List[object]
 
+# The subcommands defined by other modules, with the name and help string of each. Importing all of
+# these modules (and the SDKs that `det deploy` uses) is slow, so only the modules of the
+# subcommand being run are imported; every other subcommand is only described by its name and help
+# string, which is enough for `det --help`.
+DEPLOY_CMD_NAME = "d|eploy"
+
+subcommand_modules = [
+    ("determined.cli.agent", [("a|gent", "manage agents"), ("s|lot", "manage slots")]),
+    ("determined.cli.checkpoint", [("c|heckpoint", "manage checkpoints")]),
+    ("determined.cli.experiment", [("e|xperiment", "manage experiments")]),
+    ("determined.cli.master", [("m|aster", "manage master")]),
+    ("determined.cli.model", [("m|odel", "manage models")]),
+    ("determined.cli.notebook", [("notebook", "manage notebooks")]),
+    ("determined.cli.oauth", [("oauth", "manage OAuth")]),
+    ("determined.cli.remote", [("command cmd", "manage commands")]),
+    ("determined.cli.resources", [("res|ources", "query historical resource allocation")]),
+    ("determined.cli.shell", [("shell", "manage shells")]),
+    ("determined.cli.sso", [("auth", "manage auth")]),
+    ("determined.cli.template", [("template tpl", "manage config templates")]),
+    ("determined.cli.tensorboard", [("tensorboard", "manage TensorBoard instances")]),
+    ("determined.cli.trial", [("t|rial", "manage trials")]),
+    ("determined.cli.user", [("u|ser", "manage users")]),
+    ("determined.cli.version", [("version", "show version information")]),
+    ("determined.deploy.cli", [(DEPLOY_CMD_NAME, "manage deployments")]),
+]  # type: List[Tuple[str, List[Tuple[str, str]]]]
+
 # fmt: on
 
 
-all_args_description = (
-    args_description
-    + master_args_description
-    + model_args_description
-    + agent_args_description
-    + notebook_args_description
-    + resources_args_description
-    + shell_args_description
-    + template_args_description
-    + tensorboard_args_description
-    + trial_args_description
-    + remote_args_description
-    + user_args_description
-    + version_args_description
-    + auth_args_description
-    + oauth_args_description
-)
+def _command_names(cmd_name: str) -> List[str]:
+    main_name, aliases = generate_aliases(cmd_name)
+    return [main_name] + aliases
 
 
-def make_parser() -> ArgumentParser:
+def _find_subcommand(args: List[str]) -> Optional[str]:
+    """Return the first positional argument of args, i.e. the name of the subcommand to run."""
+    # Options of the top-level parser which take a value, like --master.
+    value_options = [
+        option
+        for arg in args_description
+        if isinstance(arg, Arg) and arg.kwargs.get("action") is None
+        for option in arg.args
+    ]
+    takes_value = False
+    for arg in args:
+        if takes_value:
+            takes_value = False
+        elif arg == "--":
+            continue
+        elif arg.startswith("-"):
+            # argparse also accepts unambiguous prefixes of long options.
+            takes_value = "=" not in arg and any(
+                option == arg or (arg.startswith("--") and option.startswith(arg))
+                for option in value_options
+            )
+        else:
+            return arg
+    return None
+
+
+def subcommands_description(args: Optional[List[str]] = None) -> List[Any]:
+    """
+    Return the descriptions of the subcommands defined by other modules. Only the modules of the
+    subcommand named in args are imported, unless args is None or the shell is completing a command
+    line, in which case all of them are.
+    """
+    subcommand = None if args is None else _find_subcommand(args)
+    import_all = args is None or "_ARGCOMPLETE" in os.environ
+
+    description = []  # type: List[Any]
+    for module_name, cmds in subcommand_modules:
+        if import_all or any(subcommand in _command_names(name) for name, _ in cmds):
+            module_description = importlib.import_module(module_name).args_description
+            if isinstance(module_description, list):
+                description.extend(module_description)
+            else:
+                description.append(module_description)
+        else:
+            description.extend(Cmd(name, None, help_str, []) for name, help_str in cmds)
+    return description
+
+
+def make_parser(args: Optional[List[str]] = None) -> ArgumentParser:
+    """
+    Make the parser of the CLI. If args are passed, only the subcommand they name is described in
+    full; see subcommands_description().
+    """
     parser = ArgumentParser(
         description="Determined command-line client", formatter_class=ArgumentDefaultsHelpFormatter
     )
-    add_args(parser, all_args_description)
+    add_args(parser, args_description + subcommands_description(args))
     return parser
 
 
 def main(args: List[str] = sys.argv[1:]) -> None:
     try:
-        parser = make_parser()
+        parser = make_parser(args)
         argcomplete.autocomplete(parser)
 
         parsed_args = parser.parse_args(args)
@@ -241,6 +284,9 @@ def main(args: List[str] = sys.argv[1:]) -> None:
                 addr = api.parse_master_address(parsed_args.master)
                 check_not_none(addr.hostname)
                 check_not_none(addr.port)
+                # pyOpenSSL is only needed here, and slow to import.
+                import OpenSSL
+
                 try:
                     ctx = OpenSSL.SSL.Context(OpenSSL.SSL.TLSv1_2_METHOD)
                     conn = OpenSSL.SSL.Connection(ctx, socket.socket())
@@ -1,3 +1,5 @@
+import gzip
+import json
 from typing import Any, Dict, List, Optional
 
 import backoff
@@ -38,13 +40,18 @@ def post_trial_profiler_metrics_batches(
     """
     Post the given metrics to the master to be persisted. Labels
     must contain only a subset of the keys: trial_id,  name,
-    gpu_uuid, agent_id and metric_type, where metric_type is one
-    of PROFILER_METRIC_TYPE_SYSTEM or PROFILER_METRIC_TYPE_TIMING.
+    gpu_uuid, agent_id, metric_type and run_epoch, where metric_type
+    is one of PROFILER_METRIC_TYPE_SYSTEM or PROFILER_METRIC_TYPE_TIMING.
+
+    The request body is gzip-compressed, since the repetitive labels and timestamps of a batch
+    compress very well.
     """
+    body = json.dumps({"batches": [b.__dict__ for b in batches]}).encode("utf-8")
     api.post(
         master_url,
         "/api/v1/trials/profiler/metrics",
-        body={"batches": [b.__dict__ for b in batches]},
+        data=gzip.compress(body, compresslevel=6),
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
     )
 
 
@@ -109,6 +109,10 @@ class Checkpoint(object):
                 checkpoint under. If this parameter is not set, the checkpoint will
                 be downloaded to ``checkpoints/<checkpoint_uuid>`` relative to the
                 current working directory.
+
+        If the ``DET_CHECKPOINT_CACHE_DIR`` environment variable is set, checkpoints are
+        downloaded through a local cache in that directory, so that downloading the same
+        checkpoint again only copies it from the cache.
         """
         if path is not None:
             local_ckpt_dir = pathlib.Path(path)
@@ -125,7 +129,10 @@ class Checkpoint(object):
         if not any(p.exists() for p in potential_metadata_paths):
             # If the target directory doesn't already appear to contain a
             # checkpoint, attempt to fetch one.
-            if self.experiment_config["checkpoint_storage"]["type"] == "shared_fs":
+            checkpoint_storage = self.experiment_config["checkpoint_storage"]
+            if checkpoint_storage["type"] == "shared_fs" and not checkpoint_storage.get(
+                "content_addressed"
+            ):
                 src_ckpt_dir = self._find_shared_fs_path()
                 shutil.copytree(str(src_ckpt_dir), str(local_ckpt_dir))
             else:
@@ -140,6 +147,7 @@ class Checkpoint(object):
                         storage.S3StorageManager,
                         storage.GCSStorageManager,
                         storage.AzureStorageManager,
+                        storage.ContentAddressedStorageManager,
                     ),
                 ):
                     raise AssertionError(
@@ -152,7 +160,11 @@ class Checkpoint(object):
                 metadata = storage.StorageMetadata.from_json(
                     {"uuid": self.uuid, "resources": self.resources}
                 )
-                manager.download(metadata, str(local_ckpt_dir))
+                checkpoint_cache = storage.CheckpointCache.from_env()
+                if checkpoint_cache is not None:
+                    checkpoint_cache.download(manager, metadata, str(local_ckpt_dir))
+                else:
+                    manager.download(metadata, str(local_ckpt_dir))
 
         if not local_ckpt_dir.joinpath("metadata.json").exists():
             with open(local_ckpt_dir.joinpath("metadata.json"), "w") as f:
@@ -1,10 +1,9 @@
 # This is a generated file.  Editing it will make you sad.
 
-import json
+from determined.common.schemas.util import LazySchemas
 
-schemas = {
-    "http://determined.ai/schemas/expconf/v0/azure.json": json.loads(
-        r"""
+texts = {
+    "http://determined.ai/schemas/expconf/v0/azure.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/azure.json",
@@ -112,10 +111,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/bind-mount.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/bind-mount.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/bind-mount.json",
@@ -162,10 +159,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/bind-mounts.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/bind-mounts.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/bind-mounts.json",
@@ -176,10 +171,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/check-data-layer-cache.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/check-data-layer-cache.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/check-data-layer-cache.json",
@@ -218,10 +211,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/check-epoch-not-used.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/check-epoch-not-used.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/check-epoch-not-used.json",
@@ -245,10 +236,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/check-global-batch-size.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/check-global-batch-size.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/check-global-batch-size.json",
@@ -316,10 +305,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/check-grid-hyperparameter.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/check-grid-hyperparameter.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/check-grid-hyperparameter.json",
@@ -397,10 +384,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/check-positive-length.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/check-positive-length.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/check-positive-length.json",
@@ -418,10 +403,8 @@ schemas = {
     ]
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/checkpoint-storage.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/checkpoint-storage.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/checkpoint-storage.json",
@@ -470,14 +453,18 @@ schemas = {
         "account_url": true,
         "bucket": true,
         "checkpoint_path": true,
+        "concurrency": true,
         "connection_string": true,
         "container": true,
         "container_path": true,
+        "content_addressed": true,
         "credential": true,
         "endpoint_url": true,
         "hdfs_path": true,
         "hdfs_url": true,
         "host_path": true,
+        "max_retries": true,
+        "multipart_chunk_size": true,
         "propagation": true,
         "secret_key": true,
         "storage_path": true,
@@ -511,10 +498,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/data-layer-gcs.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/data-layer-gcs.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/data-layer-gcs.json",
@@ -578,10 +563,8 @@ schemas = {
     ]
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/data-layer-s3.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/data-layer-s3.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/data-layer-s3.json",
@@ -666,10 +649,8 @@ schemas = {
     ]
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/data-layer-shared-fs.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/data-layer-shared-fs.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/data-layer-shared-fs.json",
@@ -710,10 +691,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/data-layer.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/data-layer.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/data-layer.json",
@@ -737,10 +716,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/device.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/device.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/device.json",
@@ -768,10 +745,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/devices.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/devices.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/devices.json",
@@ -782,10 +757,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/environment-image-map.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/environment-image-map.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/environment-image-map.json",
@@ -815,10 +788,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/environment-image.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/environment-image.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/environment-image.json",
@@ -838,10 +809,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/environment-variables-map.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/environment-variables-map.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/environment-variables-map.json",
@@ -872,10 +841,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/environment-variables.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/environment-variables.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/environment-variables.json",
@@ -898,10 +865,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/environment.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/environment.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/environment.json",
@@ -1028,10 +993,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/experiment.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/experiment.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/experiment.json",
@@ -1343,10 +1306,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/gcs.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/gcs.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/gcs.json",
@@ -1370,6 +1331,13 @@ schemas = {
             ],
             "default": null
         },
+        "content_addressed": {
+            "type": [
+                "boolean",
+                "null"
+            ],
+            "default": false
+        },
         "save_experiment_best": {
             "type": [
                 "integer",
@@ -1397,10 +1365,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/hdfs.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/hdfs.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/hdfs.json",
@@ -1471,10 +1437,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/hyperparameter-categorical.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-categorical.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/hyperparameter-categorical.json",
@@ -1496,10 +1460,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/hyperparameter-const.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-const.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/hyperparameter-const.json",
@@ -1518,10 +1480,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/hyperparameter-double.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-double.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/hyperparameter-double.json",
@@ -1559,10 +1519,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/hyperparameter-int.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-int.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/hyperparameter-int.json",
@@ -1600,10 +1558,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/hyperparameter-log.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-log.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/hyperparameter-log.json",
@@ -1646,10 +1602,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/hyperparameter.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/hyperparameter.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/hyperparameter.json",
@@ -1700,10 +1654,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/hyperparameters.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/hyperparameters.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/hyperparameters.json",
@@ -1728,10 +1680,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/internal.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/internal.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/internal.json",
@@ -1749,10 +1699,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/kerberos.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/kerberos.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/kerberos.json",
@@ -1770,10 +1718,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/length.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/length.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/length.json",
@@ -1827,10 +1773,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/native.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/native.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/native.json",
@@ -1850,10 +1794,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/optimizations.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/optimizations.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/optimizations.json",
@@ -1898,6 +1840,33 @@ schemas = {
             ],
             "default": false
         },
+        "gradient_compression_method": {
+            "enum": [
+                null,
+                "fp16",
+                "bf16",
+                "topk",
+                "powersgd"
+            ],
+            "default": null
+        },
+        "gradient_compression_rank": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "minimum": 1,
+            "default": 4
+        },
+        "gradient_compression_topk_ratio": {
+            "type": [
+                "number",
+                "null"
+            ],
+            "exclusiveMinimum": 0,
+            "maximum": 1,
+            "default": 0.01
+        },
         "grad_updates_size_file": {
             "type": [
                 "string",
@@ -1939,10 +1908,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/profiling.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/profiling.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/profiling.json",
@@ -1973,6 +1940,29 @@ schemas = {
             ],
             "default": null,
             "minimum": 0
+        },
+        "continuous": {
+            "type": [
+                "boolean",
+                "null"
+            ],
+            "default": false
+        },
+        "sample_every_n_batches": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": 10,
+            "minimum": 1
+        },
+        "max_samples_per_series": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": 100,
+            "minimum": 1
         }
     },
     "compareProperties": {
@@ -1982,10 +1972,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/registry-auth.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/registry-auth.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/registry-auth.json",
@@ -2046,10 +2034,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/reproducibility.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/reproducibility.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/reproducibility.json",
@@ -2071,10 +2057,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/resources.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/resources.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/resources.json",
@@ -2098,6 +2082,14 @@ schemas = {
             "default": [],
             "optionalRef": "http://determined.ai/schemas/expconf/v0/devices.json"
         },
+        "distributed_backend": {
+            "enum": [
+                null,
+                "horovod",
+                "torch"
+            ],
+            "default": "horovod"
+        },
         "max_slots": {
             "type": [
                 "integer",
@@ -2160,10 +2152,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/s3.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/s3.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/s3.json",
@@ -2208,6 +2198,37 @@ schemas = {
             ],
             "default": null
         },
+        "concurrency": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": 8,
+            "minimum": 1
+        },
+        "multipart_chunk_size": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": 67108864,
+            "minimum": 5242880
+        },
+        "max_retries": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": 3,
+            "minimum": 0
+        },
+        "content_addressed": {
+            "type": [
+                "boolean",
+                "null"
+            ],
+            "default": false
+        },
         "save_experiment_best": {
             "type": [
                 "integer",
@@ -2235,10 +2256,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/searcher-adaptive-asha.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/searcher-adaptive-asha.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/searcher-adaptive-asha.json",
@@ -2354,10 +2373,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/searcher-adaptive-simple.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/searcher-adaptive-simple.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$comment": "this is EOL searcher, not to be used in new experiments",
@@ -2450,10 +2467,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/searcher-adaptive.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/searcher-adaptive.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$comment": "this is an EOL searcher, not to be used in new experiments",
@@ -2562,10 +2577,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/searcher-async-halving.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/searcher-async-halving.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/searcher-async-halving.json",
@@ -2663,10 +2676,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/searcher-grid.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/searcher-grid.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/searcher-grid.json",
@@ -2731,10 +2742,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/searcher-pbt.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/searcher-pbt.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/searcher-pbt.json",
@@ -2877,10 +2886,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/searcher-random.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/searcher-random.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/searcher-random.json",
@@ -2954,10 +2961,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/searcher-single.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/searcher-single.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/searcher-single.json",
@@ -3014,10 +3019,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/searcher-sync-halving.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/searcher-sync-halving.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$comment": "this is an EOL searcher, not to be used in new experiments",
@@ -3108,10 +3111,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/searcher.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/searcher.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/searcher.json",
@@ -3224,10 +3225,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/security.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/security.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/security.json",
@@ -3247,10 +3246,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/shared-fs.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/shared-fs.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/shared-fs.json",
@@ -3309,6 +3306,13 @@ schemas = {
             ],
             "default": null
         },
+        "content_addressed": {
+            "type": [
+                "boolean",
+                "null"
+            ],
+            "default": false
+        },
         "save_experiment_best": {
             "type": [
                 "integer",
@@ -3345,10 +3349,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/tensorboard-storage.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/tensorboard-storage.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/tensorboard-storage.json",
@@ -3382,10 +3384,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/test-root.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/test-root.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/test-root.json",
@@ -3445,10 +3445,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/test-sub.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/test-sub.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/test-sub.json",
@@ -3467,10 +3465,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/test-union-a.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/test-union-a.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/test-union-a.json",
@@ -3498,10 +3494,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/test-union-b.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/test-union-b.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/test-union-b.json",
@@ -3529,10 +3523,8 @@ schemas = {
     }
 }
 
-"""
-    ),
-    "http://determined.ai/schemas/expconf/v0/test-union.json": json.loads(
-        r"""
+""",
+    "http://determined.ai/schemas/expconf/v0/test-union.json": r"""
 {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "$id": "http://determined.ai/schemas/expconf/v0/test-union.json",
@@ -3552,6 +3544,7 @@ schemas = {
     }
 }
 
-"""
-    ),
+""",
 }
+
+schemas = LazySchemas(texts)
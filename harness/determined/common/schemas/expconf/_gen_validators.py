@@ -0,0 +1,3995 @@
+# This is a generated file.  Editing it will make you sad.
+
+import numbers
+import os
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Tuple
+
+
+def _is_integer(x: Any) -> bool:
+    if isinstance(x, bool):
+        return False
+    return isinstance(x, int) or (isinstance(x, float) and x.is_integer())
+
+
+def _is_number(x: Any) -> bool:
+    return isinstance(x, numbers.Number) and not isinstance(x, bool)
+
+
+def _equal(one: Any, two: Any) -> bool:
+    """Compare like json-schema, where booleans are not numbers."""
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return bool(one == two)
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(
+            key in two and _equal(value, two[key]) for key, value in one.items()
+        )
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return bool(one == two)
+
+
+def _has_all(x: Any, keys: Tuple[str, ...]) -> bool:
+    return all(key in x for key in keys)
+
+
+def _get_by_path(x: Any, path: str) -> Any:
+    for key in path.split("."):
+        if not x:
+            return None
+        x = x.get(key)
+    return x
+
+
+def _compare(compare: Dict[str, str], x: Any) -> bool:
+    a = _get_by_path(x, compare["a"])
+    b = _get_by_path(x, compare["b"])
+    if a is None or b is None:
+        return True
+    if compare["type"] == "a<b":
+        return bool(a < b)
+    if compare["type"] == "a<=b":
+        return bool(a <= b)
+    a = os.path.normpath(a)
+    b = os.path.normpath(b)
+    if os.path.isabs(a):
+        return bool(a.startswith(b))
+    return not a.startswith("..")
+
+
+_C0 = frozenset(["account_url", "connection_string", "container", "credential", "save_experiment_best", "save_trial_best", "save_trial_latest", "type"])
+_C1 = frozenset(["container_path", "host_path", "propagation", "read_only"])
+_C2 = re.compile("^/")
+_C3 = frozenset(["type"])
+_C4 = ("double", "log", "int")
+_C5 = frozenset(["access_key", "account_url", "bucket", "checkpoint_path", "concurrency", "connection_string", "container", "container_path", "content_addressed", "credential", "endpoint_url", "hdfs_path", "hdfs_url", "host_path", "max_retries", "multipart_chunk_size", "propagation", "save_experiment_best", "save_trial_best", "save_trial_latest", "secret_key", "storage_path", "tensorboard_path", "type", "user"])
+_C6 = frozenset(["bucket", "bucket_directory_path", "local_cache_container_path", "local_cache_host_path", "type"])
+_C7 = frozenset(["access_key", "bucket", "bucket_directory_path", "endpoint_url", "local_cache_container_path", "local_cache_host_path", "secret_key", "type"])
+_C8 = frozenset(["container_storage_path", "host_storage_path", "type"])
+_C9 = frozenset(["container_path", "host_path", "mode"])
+_C10 = frozenset(["cpu", "gpu"])
+_C11 = frozenset(["add_capabilities", "drop_capabilities", "environment_variables", "force_pull_image", "image", "pod_spec", "ports", "registry_auth"])
+_C12 = frozenset(["bind_mounts", "checkpoint_policy", "checkpoint_storage", "data", "data_layer", "debug", "description", "entrypoint", "environment", "hyperparameters", "internal", "labels", "max_restarts", "min_checkpoint_period", "min_validation_period", "name", "optimizations", "perform_initial_validation", "profiling", "records_per_epoch", "reproducibility", "resources", "scheduling_unit", "searcher", "security", "tensorboard_storage"])
+_C13 = (None, "best", "all", "none")
+_C14 = re.compile("^[a-zA-Z0-9_.]+:[a-zA-Z0-9_]+$")
+_C15 = frozenset(["bucket", "content_addressed", "save_experiment_best", "save_trial_best", "save_trial_latest", "type"])
+_C16 = frozenset(["hdfs_path", "hdfs_url", "save_experiment_best", "save_trial_best", "save_trial_latest", "type", "user"])
+_C17 = frozenset(["type", "vals"])
+_C18 = frozenset(["type", "val"])
+_C19 = frozenset(["count", "maxval", "minval", "type"])
+_C20 = {"type": "a<b", "a": "minval", "b": "maxval"}
+_C21 = frozenset(["base", "count", "maxval", "minval", "type"])
+_C22 = frozenset(["global_batch_size"])
+_C23 = frozenset(["native"])
+_C24 = frozenset(["config_file"])
+_C25 = frozenset(["batches"])
+_C26 = frozenset(["records"])
+_C27 = frozenset(["epochs"])
+_C28 = frozenset(["command"])
+_C29 = frozenset(["aggregation_frequency", "auto_tune_tensor_fusion", "average_aggregated_gradients", "average_training_metrics", "grad_updates_size_file", "gradient_compression", "gradient_compression_method", "gradient_compression_rank", "gradient_compression_topk_ratio", "mixed_precision", "tensor_fusion_cycle_time", "tensor_fusion_threshold"])
+_C30 = (None, "fp16", "bf16", "topk", "powersgd")
+_C31 = (None, "O0", "O1", "O2", "O3")
+_C32 = re.compile("^O")
+_C33 = frozenset(["begin_on_batch", "continuous", "enabled", "end_after_batch", "max_samples_per_series", "sample_every_n_batches"])
+_C34 = {"type": "a<=b", "a": "begin_on_batch", "b": "end_after_batch"}
+_C35 = frozenset(["auth", "email", "identitytoken", "password", "registrytoken", "serveraddress", "username"])
+_C36 = frozenset(["experiment_seed"])
+_C37 = frozenset(["agent_label", "devices", "distributed_backend", "max_slots", "native_parallel", "priority", "resource_pool", "shm_size", "slots", "slots_per_trial", "weight"])
+_C38 = (None, "horovod", "torch")
+_C39 = frozenset(["access_key", "bucket", "concurrency", "content_addressed", "endpoint_url", "max_retries", "multipart_chunk_size", "save_experiment_best", "save_trial_best", "save_trial_latest", "secret_key", "type"])
+_C40 = frozenset(["bracket_rungs", "divisor", "max_concurrent_trials", "max_length", "max_rungs", "max_trials", "metric", "mode", "name", "smaller_is_better", "source_checkpoint_uuid", "source_trial_id", "stop_once"])
+_C41 = (None, "aggressive", "standard", "conservative")
+_C42 = frozenset(["divisor", "max_length", "max_rungs", "max_trials", "metric", "mode", "name", "smaller_is_better", "source_checkpoint_uuid", "source_trial_id"])
+_C43 = frozenset(["bracket_rungs", "budget", "divisor", "max_length", "max_rungs", "metric", "mode", "name", "smaller_is_better", "source_checkpoint_uuid", "source_trial_id", "train_stragglers"])
+_C44 = frozenset(["divisor", "max_concurrent_trials", "max_length", "max_trials", "metric", "name", "num_rungs", "smaller_is_better", "source_checkpoint_uuid", "source_trial_id", "stop_once"])
+_C45 = frozenset(["max_concurrent_trials", "max_length", "metric", "name", "smaller_is_better", "source_checkpoint_uuid", "source_trial_id"])
+_C46 = frozenset(["explore_function", "length_per_round", "metric", "name", "num_rounds", "population_size", "replace_function", "smaller_is_better", "source_checkpoint_uuid", "source_trial_id"])
+_C47 = frozenset(["truncate_fraction"])
+_C48 = frozenset(["perturb_factor", "resample_probability"])
+_C49 = frozenset(["max_concurrent_trials", "max_length", "max_trials", "metric", "name", "smaller_is_better", "source_checkpoint_uuid", "source_trial_id"])
+_C50 = frozenset(["max_length", "metric", "name", "smaller_is_better", "source_checkpoint_uuid", "source_trial_id"])
+_C51 = frozenset(["budget", "divisor", "max_length", "metric", "name", "num_rungs", "smaller_is_better", "source_checkpoint_uuid", "source_trial_id", "train_stragglers"])
+_C52 = frozenset(["bracket_rungs", "budget", "divisor", "explore_function", "length_per_round", "max_concurrent_trials", "max_length", "max_rungs", "max_trials", "metric", "mode", "name", "num_rounds", "num_rungs", "population_size", "replace_function", "smaller_is_better", "source_checkpoint_uuid", "source_trial_id", "stop_once", "train_stragglers"])
+_C53 = frozenset(["kerberos"])
+_C54 = frozenset(["checkpoint_path", "container_path", "content_addressed", "host_path", "propagation", "save_experiment_best", "save_trial_best", "save_trial_latest", "storage_path", "tensorboard_path", "type"])
+_C55 = {"type": "a_is_subdir_of_b", "a": "storage_path", "b": "host_path"}
+_C56 = frozenset(["defaulted_array", "nodefault_array", "runtime_defaultable", "sub_obj", "sub_union", "val_x"])
+_C57 = frozenset(["val_y"])
+_C58 = frozenset(["common_val", "type", "val_a"])
+_C59 = frozenset(["common_val", "type", "val_b"])
+
+
+def _f0(x: Any) -> bool:
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _f1(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "connection_string" not in x or "credential" not in x:
+            return False
+        if "connection_string" in x and not _f0(x["connection_string"]):
+            return False
+        if "credential" in x and not _f0(x["credential"]):
+            return False
+    return True
+
+
+def _f2(x: Any) -> bool:
+    if _f1(x):
+        return False
+    return True
+
+
+def _f3(x: Any) -> bool:
+    if x != "azure":
+        return False
+    return True
+
+
+def _f4(x: Any) -> bool:
+    if not (isinstance(x, str) or x is None):
+        return False
+    return True
+
+
+def _f5(x: Any) -> bool:
+    if not (_is_integer(x) or x is None):
+        return False
+    if _is_number(x):
+        if x < 0:
+            return False
+    return True
+
+
+def _sane_expconf_v0_azure(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _f2(x):
+        return False
+    if isinstance(x, dict):
+        if not _C0.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f3(x["type"]):
+            return False
+        if "container" in x and not _f4(x["container"]):
+            return False
+        if "connection_string" in x and not _f4(x["connection_string"]):
+            return False
+        if "account_url" in x and not _f4(x["account_url"]):
+            return False
+        if "credential" in x and not _f4(x["credential"]):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _f6(x: Any) -> bool:
+    if not _has_all(x, ("connection_string",)):
+        return False
+    return True
+
+
+def _f7(x: Any) -> bool:
+    if not _has_all(x, ("account_url",)):
+        return False
+    return True
+
+
+def _f8(x: Any) -> bool:
+    if (_f6(x) + _f7(x)) != 1:
+        return False
+    return True
+
+
+def _f9(x: Any) -> bool:
+    if not _f8(x):
+        return False
+    return True
+
+
+def _complete_expconf_v0_azure(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("container",)):
+        return False
+    if not _f9(x):
+        return False
+    if not _f2(x):
+        return False
+    if isinstance(x, dict):
+        if not _C0.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f3(x["type"]):
+            return False
+        if "container" in x and not _f4(x["container"]):
+            return False
+        if "connection_string" in x and not _f4(x["connection_string"]):
+            return False
+        if "account_url" in x and not _f4(x["account_url"]):
+            return False
+        if "credential" in x and not _f4(x["credential"]):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _f10(x: Any) -> bool:
+    if isinstance(x, str):
+        if not _C2.search(x):
+            return False
+    return True
+
+
+def _f11(x: Any) -> bool:
+    if not isinstance(x, str):
+        return False
+    if not _f10(x):
+        return False
+    return True
+
+
+def _f12(x: Any) -> bool:
+    if x != ".":
+        return False
+    return True
+
+
+def _f13(x: Any) -> bool:
+    if _f12(x):
+        return False
+    return True
+
+
+def _f14(x: Any) -> bool:
+    if not isinstance(x, str):
+        return False
+    if not _f13(x):
+        return False
+    return True
+
+
+def _f15(x: Any) -> bool:
+    if not (isinstance(x, bool) or x is None):
+        return False
+    return True
+
+
+def _sane_expconf_v0_bind_mount(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C1.issuperset(x):
+            return False
+        if "host_path" not in x or "container_path" not in x:
+            return False
+        if "host_path" in x and not _f11(x["host_path"]):
+            return False
+        if "container_path" in x and not _f14(x["container_path"]):
+            return False
+        if "read_only" in x and not _f15(x["read_only"]):
+            return False
+        if "propagation" in x and not _f4(x["propagation"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_bind_mount(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C1.issuperset(x):
+            return False
+        if "host_path" not in x or "container_path" not in x:
+            return False
+        if "host_path" in x and not _f11(x["host_path"]):
+            return False
+        if "container_path" in x and not _f14(x["container_path"]):
+            return False
+        if "read_only" in x and not _f15(x["read_only"]):
+            return False
+        if "propagation" in x and not _f4(x["propagation"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_bind_mounts(x: Any) -> bool:
+    if not isinstance(x, list):
+        return False
+    if isinstance(x, list):
+        if not all(map(_sane_expconf_v0_bind_mount, x)):
+            return False
+    return True
+
+
+def _complete_expconf_v0_bind_mounts(x: Any) -> bool:
+    if not isinstance(x, list):
+        return False
+    if isinstance(x, list):
+        if not all(map(_complete_expconf_v0_bind_mount, x)):
+            return False
+    return True
+
+
+def _f16(x: Any) -> bool:
+    if not x is None:
+        return False
+    return True
+
+
+def _f17(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "local_cache_host_path" not in x:
+            return False
+        if "local_cache_container_path" in x and not _f16(x["local_cache_container_path"]):
+            return False
+        if "local_cache_host_path" in x and not _f0(x["local_cache_host_path"]):
+            return False
+    return True
+
+
+def _f18(x: Any) -> bool:
+    if _f17(x):
+        return False
+    return True
+
+
+def _f19(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "local_cache_container_path" not in x:
+            return False
+        if "local_cache_container_path" in x and not _f0(x["local_cache_container_path"]):
+            return False
+        if "local_cache_host_path" in x and not _f16(x["local_cache_host_path"]):
+            return False
+    return True
+
+
+def _f20(x: Any) -> bool:
+    if _f19(x):
+        return False
+    return True
+
+
+def _sane_expconf_v0_check_data_layer_cache(x: Any) -> bool:
+    if not _f18(x):
+        return False
+    if not _f20(x):
+        return False
+    return True
+
+
+def _complete_expconf_v0_check_data_layer_cache(x: Any) -> bool:
+    if not _f18(x):
+        return False
+    if not _f20(x):
+        return False
+    return True
+
+
+def _f21(x: Any) -> bool:
+    if not _is_number(x):
+        return False
+    return True
+
+
+def _f22(x: Any) -> bool:
+    if _f21(x):
+        return False
+    return True
+
+
+def _f23(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "epochs" in x and not _f22(x["epochs"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_check_epoch_not_used(x: Any) -> bool:
+    if not _f23(x):
+        return False
+    if isinstance(x, list):
+        if not all(map(_sane_expconf_v0_check_epoch_not_used, x)):
+            return False
+    if isinstance(x, dict):
+        if not all(map(_sane_expconf_v0_check_epoch_not_used, x.values())):
+            return False
+    return True
+
+
+def _complete_expconf_v0_check_epoch_not_used(x: Any) -> bool:
+    if not _f23(x):
+        return False
+    if isinstance(x, list):
+        if not all(map(_complete_expconf_v0_check_epoch_not_used, x)):
+            return False
+    if isinstance(x, dict):
+        if not all(map(_complete_expconf_v0_check_epoch_not_used, x.values())):
+            return False
+    return True
+
+
+def _f24(x: Any) -> bool:
+    if not _is_number(x):
+        return False
+    if _is_number(x):
+        if x < 1:
+            return False
+    return True
+
+
+def _f25(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "minval" in x and not _f24(x["minval"]):
+            return False
+    return True
+
+
+def _f26(x: Any) -> bool:
+    if not _sane_expconf_v0_hyperparameter_int(x):
+        return False
+    if not _f25(x):
+        return False
+    return True
+
+
+def _f27(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "val" in x and not _f24(x["val"]):
+            return False
+    return True
+
+
+def _f28(x: Any) -> bool:
+    if not _sane_expconf_v0_hyperparameter_const(x):
+        return False
+    if not _f27(x):
+        return False
+    return True
+
+
+def _f29(x: Any) -> bool:
+    if not _is_integer(x):
+        return False
+    if _is_number(x):
+        if x < 1:
+            return False
+    return True
+
+
+def _f30(x: Any) -> bool:
+    if not isinstance(x, list):
+        return False
+    if isinstance(x, list):
+        if not all(map(_f29, x)):
+            return False
+    return True
+
+
+def _f31(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "vals" in x and not _f30(x["vals"]):
+            return False
+    return True
+
+
+def _f32(x: Any) -> bool:
+    if not _sane_expconf_v0_hyperparameter_categorical(x):
+        return False
+    if not _f31(x):
+        return False
+    return True
+
+
+def _sane_expconf_v0_check_global_batch_size(x: Any) -> bool:
+    if (_f26(x) + _f28(x) + _f32(x) + _f29(x)) != 1:
+        return False
+    return True
+
+
+def _f33(x: Any) -> bool:
+    if not _complete_expconf_v0_hyperparameter_int(x):
+        return False
+    if not _f25(x):
+        return False
+    return True
+
+
+def _f34(x: Any) -> bool:
+    if not _complete_expconf_v0_hyperparameter_const(x):
+        return False
+    if not _f27(x):
+        return False
+    return True
+
+
+def _f35(x: Any) -> bool:
+    if not _complete_expconf_v0_hyperparameter_categorical(x):
+        return False
+    if not _f31(x):
+        return False
+    return True
+
+
+def _complete_expconf_v0_check_global_batch_size(x: Any) -> bool:
+    if (_f33(x) + _f34(x) + _f35(x) + _f29(x)) != 1:
+        return False
+    return True
+
+
+def _f36(x: Any) -> bool:
+    if not isinstance(x, list):
+        return False
+    if isinstance(x, list):
+        if not all(map(_sane_expconf_v0_check_grid_hyperparameter, x)):
+            return False
+    return True
+
+
+def _f37(x: Any) -> bool:
+    return False
+    return True
+
+
+def _f38(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if "type" in x and not _f37(x["type"]):
+            return False
+        if any(k not in _C3 and not _sane_expconf_v0_check_grid_hyperparameter(v) for k, v in x.items()):
+            return False
+    return True
+
+
+def _f39(x: Any) -> bool:
+    if not (isinstance(x, dict) or isinstance(x, list)):
+        return False
+    return True
+
+
+def _f40(x: Any) -> bool:
+    if _f39(x):
+        return False
+    return True
+
+
+def _f41(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "count" in x and not _f16(x["count"]):
+            return False
+    return True
+
+
+def _f42(x: Any) -> bool:
+    if _f41(x):
+        return False
+    return True
+
+
+def _f43(x: Any) -> bool:
+    if x not in _C4:
+        return False
+    return True
+
+
+def _f44(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "type" in x and not _f43(x["type"]):
+            return False
+    return True
+
+
+def _f45(x: Any) -> bool:
+    if _f44(x):
+        return False
+    return True
+
+
+def _f46(x: Any) -> bool:
+    if not _f45(x) and not _f42(x):
+        return False
+    return True
+
+
+def _f47(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _f46(x):
+        return False
+    if isinstance(x, dict):
+        if "type" not in x:
+            return False
+        if "type" in x and not _f0(x["type"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_check_grid_hyperparameter(x: Any) -> bool:
+    if (_f36(x) + _f38(x) + _f40(x) + _f47(x)) != 1:
+        return False
+    return True
+
+
+def _f48(x: Any) -> bool:
+    if not isinstance(x, list):
+        return False
+    if isinstance(x, list):
+        if not all(map(_complete_expconf_v0_check_grid_hyperparameter, x)):
+            return False
+    return True
+
+
+def _f49(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if "type" in x and not _f37(x["type"]):
+            return False
+        if any(k not in _C3 and not _complete_expconf_v0_check_grid_hyperparameter(v) for k, v in x.items()):
+            return False
+    return True
+
+
+def _complete_expconf_v0_check_grid_hyperparameter(x: Any) -> bool:
+    if (_f48(x) + _f49(x) + _f40(x) + _f47(x)) != 1:
+        return False
+    return True
+
+
+def _f50(x: Any) -> bool:
+    if isinstance(x, dict):
+        if not all(map(_f29, x.values())):
+            return False
+    return True
+
+
+def _sane_expconf_v0_check_positive_length(x: Any) -> bool:
+    if not _sane_expconf_v0_length(x):
+        return False
+    if not _f50(x):
+        return False
+    return True
+
+
+def _complete_expconf_v0_check_positive_length(x: Any) -> bool:
+    if not _complete_expconf_v0_length(x):
+        return False
+    if not _f50(x):
+        return False
+    return True
+
+
+def _f51(x: Any) -> bool:
+    if (_sane_expconf_v0_shared_fs(x) + _sane_expconf_v0_hdfs(x) + _sane_expconf_v0_s3(x) + _sane_expconf_v0_gcs(x) + _sane_expconf_v0_azure(x)) != 1:
+        return False
+    return True
+
+
+def _f52(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "type" not in x:
+            return False
+    return True
+
+
+def _sane_expconf_v0_checkpoint_storage(x: Any) -> bool:
+    if _f52(x) and not _f51(x):
+        return False
+    if isinstance(x, dict):
+        if not _C5.issuperset(x):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _f53(x: Any) -> bool:
+    if (_complete_expconf_v0_shared_fs(x) + _complete_expconf_v0_hdfs(x) + _complete_expconf_v0_s3(x) + _complete_expconf_v0_gcs(x) + _complete_expconf_v0_azure(x)) != 1:
+        return False
+    return True
+
+
+def _complete_expconf_v0_checkpoint_storage(x: Any) -> bool:
+    if _f52(x) and not _f53(x):
+        return False
+    if not _has_all(x, ("type",)):
+        return False
+    if isinstance(x, dict):
+        if not _C5.issuperset(x):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _f54(x: Any) -> bool:
+    if x != "gcs":
+        return False
+    return True
+
+
+def _f55(x: Any) -> bool:
+    if not (isinstance(x, str) or x is None):
+        return False
+    if not _f10(x):
+        return False
+    return True
+
+
+def _sane_expconf_v0_data_layer_gcs(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _sane_expconf_v0_check_data_layer_cache(x):
+        return False
+    if isinstance(x, dict):
+        if not _C6.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f54(x["type"]):
+            return False
+        if "bucket" in x and not _f4(x["bucket"]):
+            return False
+        if "bucket_directory_path" in x and not _f4(x["bucket_directory_path"]):
+            return False
+        if "local_cache_host_path" in x and not _f55(x["local_cache_host_path"]):
+            return False
+        if "local_cache_container_path" in x and not _f55(x["local_cache_container_path"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_data_layer_gcs(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("bucket", "bucket_directory_path")):
+        return False
+    if not _complete_expconf_v0_check_data_layer_cache(x):
+        return False
+    if isinstance(x, dict):
+        if not _C6.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f54(x["type"]):
+            return False
+        if "bucket" in x and not _f4(x["bucket"]):
+            return False
+        if "bucket_directory_path" in x and not _f4(x["bucket_directory_path"]):
+            return False
+        if "local_cache_host_path" in x and not _f55(x["local_cache_host_path"]):
+            return False
+        if "local_cache_container_path" in x and not _f55(x["local_cache_container_path"]):
+            return False
+    return True
+
+
+def _f56(x: Any) -> bool:
+    if x != "s3":
+        return False
+    return True
+
+
+def _sane_expconf_v0_data_layer_s3(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _sane_expconf_v0_check_data_layer_cache(x):
+        return False
+    if isinstance(x, dict):
+        if not _C7.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f56(x["type"]):
+            return False
+        if "bucket" in x and not _f4(x["bucket"]):
+            return False
+        if "bucket_directory_path" in x and not _f4(x["bucket_directory_path"]):
+            return False
+        if "local_cache_host_path" in x and not _f55(x["local_cache_host_path"]):
+            return False
+        if "local_cache_container_path" in x and not _f55(x["local_cache_container_path"]):
+            return False
+        if "access_key" in x and not _f4(x["access_key"]):
+            return False
+        if "secret_key" in x and not _f4(x["secret_key"]):
+            return False
+        if "endpoint_url" in x and not _f4(x["endpoint_url"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_data_layer_s3(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("bucket", "bucket_directory_path")):
+        return False
+    if not _complete_expconf_v0_check_data_layer_cache(x):
+        return False
+    if isinstance(x, dict):
+        if not _C7.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f56(x["type"]):
+            return False
+        if "bucket" in x and not _f4(x["bucket"]):
+            return False
+        if "bucket_directory_path" in x and not _f4(x["bucket_directory_path"]):
+            return False
+        if "local_cache_host_path" in x and not _f55(x["local_cache_host_path"]):
+            return False
+        if "local_cache_container_path" in x and not _f55(x["local_cache_container_path"]):
+            return False
+        if "access_key" in x and not _f4(x["access_key"]):
+            return False
+        if "secret_key" in x and not _f4(x["secret_key"]):
+            return False
+        if "endpoint_url" in x and not _f4(x["endpoint_url"]):
+            return False
+    return True
+
+
+def _f57(x: Any) -> bool:
+    if x != "shared_fs":
+        return False
+    return True
+
+
+def _sane_expconf_v0_data_layer_shared_fs(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C8.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f57(x["type"]):
+            return False
+        if "host_storage_path" in x and not _f55(x["host_storage_path"]):
+            return False
+        if "container_storage_path" in x and not _f55(x["container_storage_path"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_data_layer_shared_fs(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C8.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f57(x["type"]):
+            return False
+        if "host_storage_path" in x and not _f55(x["host_storage_path"]):
+            return False
+        if "container_storage_path" in x and not _f55(x["container_storage_path"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_data_layer(x: Any) -> bool:
+    if (_sane_expconf_v0_data_layer_shared_fs(x) + _sane_expconf_v0_data_layer_gcs(x) + _sane_expconf_v0_data_layer_s3(x)) != 1:
+        return False
+    return True
+
+
+def _complete_expconf_v0_data_layer(x: Any) -> bool:
+    if (_complete_expconf_v0_data_layer_shared_fs(x) + _complete_expconf_v0_data_layer_gcs(x) + _complete_expconf_v0_data_layer_s3(x)) != 1:
+        return False
+    return True
+
+
+def _sane_expconf_v0_device(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C9.issuperset(x):
+            return False
+        if "host_path" not in x or "container_path" not in x:
+            return False
+        if "host_path" in x and not _f0(x["host_path"]):
+            return False
+        if "container_path" in x and not _f0(x["container_path"]):
+            return False
+        if "mode" in x and not _f4(x["mode"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_device(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C9.issuperset(x):
+            return False
+        if "host_path" not in x or "container_path" not in x:
+            return False
+        if "host_path" in x and not _f0(x["host_path"]):
+            return False
+        if "container_path" in x and not _f0(x["container_path"]):
+            return False
+        if "mode" in x and not _f4(x["mode"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_devices(x: Any) -> bool:
+    if not isinstance(x, list):
+        return False
+    if isinstance(x, list):
+        if not all(map(_sane_expconf_v0_device, x)):
+            return False
+    return True
+
+
+def _complete_expconf_v0_devices(x: Any) -> bool:
+    if not isinstance(x, list):
+        return False
+    if isinstance(x, list):
+        if not all(map(_complete_expconf_v0_device, x)):
+            return False
+    return True
+
+
+def _sane_expconf_v0_environment_image_map(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C10.issuperset(x):
+            return False
+        if "cpu" in x and not _f4(x["cpu"]):
+            return False
+        if "gpu" in x and not _f4(x["gpu"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_environment_image_map(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("cpu", "gpu")):
+        return False
+    if isinstance(x, dict):
+        if not _C10.issuperset(x):
+            return False
+        if "cpu" in x and not _f4(x["cpu"]):
+            return False
+        if "gpu" in x and not _f4(x["gpu"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_environment_image(x: Any) -> bool:
+    if (_sane_expconf_v0_environment_image_map(x) + _f0(x)) != 1:
+        return False
+    return True
+
+
+def _complete_expconf_v0_environment_image(x: Any) -> bool:
+    if (_complete_expconf_v0_environment_image_map(x) + _f0(x)) != 1:
+        return False
+    return True
+
+
+def _f58(x: Any) -> bool:
+    if not (isinstance(x, list) or x is None):
+        return False
+    if isinstance(x, list):
+        if not all(map(_f0, x)):
+            return False
+    return True
+
+
+def _sane_expconf_v0_environment_variables_map(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C10.issuperset(x):
+            return False
+        if "cpu" in x and not _f58(x["cpu"]):
+            return False
+        if "gpu" in x and not _f58(x["gpu"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_environment_variables_map(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C10.issuperset(x):
+            return False
+        if "cpu" in x and not _f58(x["cpu"]):
+            return False
+        if "gpu" in x and not _f58(x["gpu"]):
+            return False
+    return True
+
+
+def _f59(x: Any) -> bool:
+    if not isinstance(x, list):
+        return False
+    if isinstance(x, list):
+        if not all(map(_f0, x)):
+            return False
+    return True
+
+
+def _sane_expconf_v0_environment_variables(x: Any) -> bool:
+    if (_sane_expconf_v0_environment_variables_map(x) + _f59(x)) != 1:
+        return False
+    return True
+
+
+def _complete_expconf_v0_environment_variables(x: Any) -> bool:
+    if (_complete_expconf_v0_environment_variables_map(x) + _f59(x)) != 1:
+        return False
+    return True
+
+
+def _f60(x: Any) -> bool:
+    if not (isinstance(x, dict) or isinstance(x, str) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_environment_image(x):
+        return False
+    return True
+
+
+def _f61(x: Any) -> bool:
+    if not (isinstance(x, dict) or isinstance(x, list) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_environment_variables(x):
+        return False
+    return True
+
+
+def _f62(x: Any) -> bool:
+    if not _is_integer(x):
+        return False
+    return True
+
+
+def _f63(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if isinstance(x, dict):
+        if not all(map(_f62, x.values())):
+            return False
+    return True
+
+
+def _f64(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_registry_auth(x):
+        return False
+    return True
+
+
+def _f65(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if "image" in x or "command" in x or "args" in x or "working_dir" in x or "ports" in x or "env_from" in x or "env" in x or "liveness_probe" in x or "readiness_probe" in x or "startup_probe" in x or "lifecycle" in x or "termination_message_path" in x or "termination_message_policy" in x or "image_pull_policy" in x or "security_context" in x:
+            return False
+    return True
+
+
+def _f66(x: Any) -> bool:
+    if not (isinstance(x, list) or x is None):
+        return False
+    if isinstance(x, list):
+        if not all(map(_f65, x)):
+            return False
+    return True
+
+
+def _f67(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if isinstance(x, dict):
+        if "containers" in x and not _f66(x["containers"]):
+            return False
+    return True
+
+
+def _f68(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if isinstance(x, dict):
+        if "name" in x or "name_space" in x:
+            return False
+        if "spec" in x and not _f67(x["spec"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_environment(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C11.issuperset(x):
+            return False
+        if "image" in x and not _f60(x["image"]):
+            return False
+        if "environment_variables" in x and not _f61(x["environment_variables"]):
+            return False
+        if "ports" in x and not _f63(x["ports"]):
+            return False
+        if "force_pull_image" in x and not _f15(x["force_pull_image"]):
+            return False
+        if "registry_auth" in x and not _f64(x["registry_auth"]):
+            return False
+        if "add_capabilities" in x and not _f58(x["add_capabilities"]):
+            return False
+        if "drop_capabilities" in x and not _f58(x["drop_capabilities"]):
+            return False
+        if "pod_spec" in x and not _f68(x["pod_spec"]):
+            return False
+    return True
+
+
+def _f69(x: Any) -> bool:
+    if not (isinstance(x, dict) or isinstance(x, str) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_environment_image(x):
+        return False
+    return True
+
+
+def _f70(x: Any) -> bool:
+    if not (isinstance(x, dict) or isinstance(x, list) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_environment_variables(x):
+        return False
+    return True
+
+
+def _f71(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_registry_auth(x):
+        return False
+    return True
+
+
+def _complete_expconf_v0_environment(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("image",)):
+        return False
+    if isinstance(x, dict):
+        if not _C11.issuperset(x):
+            return False
+        if "image" in x and not _f69(x["image"]):
+            return False
+        if "environment_variables" in x and not _f70(x["environment_variables"]):
+            return False
+        if "ports" in x and not _f63(x["ports"]):
+            return False
+        if "force_pull_image" in x and not _f15(x["force_pull_image"]):
+            return False
+        if "registry_auth" in x and not _f71(x["registry_auth"]):
+            return False
+        if "add_capabilities" in x and not _f58(x["add_capabilities"]):
+            return False
+        if "drop_capabilities" in x and not _f58(x["drop_capabilities"]):
+            return False
+        if "pod_spec" in x and not _f68(x["pod_spec"]):
+            return False
+    return True
+
+
+def _f72(x: Any) -> bool:
+    if not (isinstance(x, list) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_bind_mounts(x):
+        return False
+    return True
+
+
+def _f73(x: Any) -> bool:
+    if x not in _C13:
+        return False
+    return True
+
+
+def _f74(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_checkpoint_storage(x):
+        return False
+    return True
+
+
+def _f75(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    return True
+
+
+def _f76(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_data_layer(x):
+        return False
+    return True
+
+
+def _f77(x: Any) -> bool:
+    if isinstance(x, str):
+        if not _C14.search(x):
+            return False
+    return True
+
+
+def _f78(x: Any) -> bool:
+    if not (isinstance(x, str) or x is None):
+        return False
+    if not _f77(x):
+        return False
+    return True
+
+
+def _f79(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_environment(x):
+        return False
+    return True
+
+
+def _f80(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_hyperparameters(x):
+        return False
+    return True
+
+
+def _f81(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_internal(x):
+        return False
+    return True
+
+
+def _f82(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_length(x):
+        return False
+    return True
+
+
+def _f83(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_optimizations(x):
+        return False
+    return True
+
+
+def _f84(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_profiling(x):
+        return False
+    return True
+
+
+def _f85(x: Any) -> bool:
+    if not (_is_integer(x) or x is None):
+        return False
+    return True
+
+
+def _f86(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_reproducibility(x):
+        return False
+    return True
+
+
+def _f87(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_resources(x):
+        return False
+    return True
+
+
+def _f88(x: Any) -> bool:
+    if not (_is_integer(x) or x is None):
+        return False
+    if _is_number(x):
+        if x < 1:
+            return False
+    return True
+
+
+def _f89(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_searcher(x):
+        return False
+    return True
+
+
+def _f90(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_security(x):
+        return False
+    return True
+
+
+def _f91(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_tensorboard_storage(x):
+        return False
+    return True
+
+
+def _f92(x: Any) -> bool:
+    if isinstance(x, dict):
+        if not all(map(_sane_expconf_v0_check_grid_hyperparameter, x.values())):
+            return False
+    return True
+
+
+def _f93(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "hyperparameters" in x and not _f92(x["hyperparameters"]):
+            return False
+    return True
+
+
+def _f94(x: Any) -> bool:
+    if x != "grid":
+        return False
+    return True
+
+
+def _f95(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "name" in x and not _f94(x["name"]):
+            return False
+    return True
+
+
+def _f96(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "searcher" in x and not _f95(x["searcher"]):
+            return False
+    return True
+
+
+def _f97(x: Any) -> bool:
+    if _f96(x) and not _f93(x):
+        return False
+    return True
+
+
+def _f98(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "min_validation_period" in x and not _sane_expconf_v0_check_epoch_not_used(x["min_validation_period"]):
+            return False
+        if "min_checkpoint_period" in x and not _sane_expconf_v0_check_epoch_not_used(x["min_checkpoint_period"]):
+            return False
+        if "searcher" in x and not _sane_expconf_v0_check_epoch_not_used(x["searcher"]):
+            return False
+    return True
+
+
+def _f99(x: Any) -> bool:
+    if _is_number(x):
+        if x > 0:
+            return False
+    return True
+
+
+def _f100(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "records_per_epoch" in x and not _f99(x["records_per_epoch"]):
+            return False
+    return True
+
+
+def _f101(x: Any) -> bool:
+    if _f100(x) and not _f98(x):
+        return False
+    return True
+
+
+def _f102(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "entrypoint" in x and not _f16(x["entrypoint"]):
+            return False
+    return True
+
+
+def _f103(x: Any) -> bool:
+    if _f102(x):
+        return False
+    return True
+
+
+def _f104(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "native" in x and not _f16(x["native"]):
+            return False
+    return True
+
+
+def _f105(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "internal" in x and not _f104(x["internal"]):
+            return False
+    return True
+
+
+def _f106(x: Any) -> bool:
+    if _f105(x) and not _f103(x):
+        return False
+    return True
+
+
+def _sane_expconf_v0_experiment(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _f97(x):
+        return False
+    if not _f101(x):
+        return False
+    if not _f106(x):
+        return False
+    if isinstance(x, dict):
+        if not _C12.issuperset(x):
+            return False
+        if "bind_mounts" in x and not _f72(x["bind_mounts"]):
+            return False
+        if "checkpoint_policy" in x and not _f73(x["checkpoint_policy"]):
+            return False
+        if "checkpoint_storage" in x and not _f74(x["checkpoint_storage"]):
+            return False
+        if "data" in x and not _f75(x["data"]):
+            return False
+        if "data_layer" in x and not _f76(x["data_layer"]):
+            return False
+        if "debug" in x and not _f15(x["debug"]):
+            return False
+        if "description" in x and not _f4(x["description"]):
+            return False
+        if "entrypoint" in x and not _f78(x["entrypoint"]):
+            return False
+        if "environment" in x and not _f79(x["environment"]):
+            return False
+        if "hyperparameters" in x and not _f80(x["hyperparameters"]):
+            return False
+        if "internal" in x and not _f81(x["internal"]):
+            return False
+        if "labels" in x and not _f58(x["labels"]):
+            return False
+        if "max_restarts" in x and not _f5(x["max_restarts"]):
+            return False
+        if "min_checkpoint_period" in x and not _f82(x["min_checkpoint_period"]):
+            return False
+        if "min_validation_period" in x and not _f82(x["min_validation_period"]):
+            return False
+        if "name" in x and not _f4(x["name"]):
+            return False
+        if "optimizations" in x and not _f83(x["optimizations"]):
+            return False
+        if "perform_initial_validation" in x and not _f15(x["perform_initial_validation"]):
+            return False
+        if "profiling" in x and not _f84(x["profiling"]):
+            return False
+        if "records_per_epoch" in x and not _f85(x["records_per_epoch"]):
+            return False
+        if "reproducibility" in x and not _f86(x["reproducibility"]):
+            return False
+        if "resources" in x and not _f87(x["resources"]):
+            return False
+        if "scheduling_unit" in x and not _f88(x["scheduling_unit"]):
+            return False
+        if "searcher" in x and not _f89(x["searcher"]):
+            return False
+        if "security" in x and not _f90(x["security"]):
+            return False
+        if "tensorboard_storage" in x and not _f91(x["tensorboard_storage"]):
+            return False
+    return True
+
+
+def _f107(x: Any) -> bool:
+    if not (isinstance(x, list) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_bind_mounts(x):
+        return False
+    return True
+
+
+def _f108(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_checkpoint_storage(x):
+        return False
+    return True
+
+
+def _f109(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_data_layer(x):
+        return False
+    return True
+
+
+def _f110(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_environment(x):
+        return False
+    return True
+
+
+def _f111(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_hyperparameters(x):
+        return False
+    return True
+
+
+def _f112(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_internal(x):
+        return False
+    return True
+
+
+def _f113(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_length(x):
+        return False
+    return True
+
+
+def _f114(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_optimizations(x):
+        return False
+    return True
+
+
+def _f115(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_profiling(x):
+        return False
+    return True
+
+
+def _f116(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_reproducibility(x):
+        return False
+    return True
+
+
+def _f117(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_resources(x):
+        return False
+    return True
+
+
+def _f118(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_searcher(x):
+        return False
+    return True
+
+
+def _f119(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_security(x):
+        return False
+    return True
+
+
+def _f120(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_tensorboard_storage(x):
+        return False
+    return True
+
+
+def _f121(x: Any) -> bool:
+    if isinstance(x, dict):
+        if not all(map(_complete_expconf_v0_check_grid_hyperparameter, x.values())):
+            return False
+    return True
+
+
+def _f122(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "hyperparameters" in x and not _f121(x["hyperparameters"]):
+            return False
+    return True
+
+
+def _f123(x: Any) -> bool:
+    if _f96(x) and not _f122(x):
+        return False
+    return True
+
+
+def _f124(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "min_validation_period" in x and not _complete_expconf_v0_check_epoch_not_used(x["min_validation_period"]):
+            return False
+        if "min_checkpoint_period" in x and not _complete_expconf_v0_check_epoch_not_used(x["min_checkpoint_period"]):
+            return False
+        if "searcher" in x and not _complete_expconf_v0_check_epoch_not_used(x["searcher"]):
+            return False
+    return True
+
+
+def _f125(x: Any) -> bool:
+    if _f100(x) and not _f124(x):
+        return False
+    return True
+
+
+def _complete_expconf_v0_experiment(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("checkpoint_storage", "name", "hyperparameters", "reproducibility", "searcher")):
+        return False
+    if not _f123(x):
+        return False
+    if not _f125(x):
+        return False
+    if not _f106(x):
+        return False
+    if isinstance(x, dict):
+        if not _C12.issuperset(x):
+            return False
+        if "bind_mounts" in x and not _f107(x["bind_mounts"]):
+            return False
+        if "checkpoint_policy" in x and not _f73(x["checkpoint_policy"]):
+            return False
+        if "checkpoint_storage" in x and not _f108(x["checkpoint_storage"]):
+            return False
+        if "data" in x and not _f75(x["data"]):
+            return False
+        if "data_layer" in x and not _f109(x["data_layer"]):
+            return False
+        if "debug" in x and not _f15(x["debug"]):
+            return False
+        if "description" in x and not _f4(x["description"]):
+            return False
+        if "entrypoint" in x and not _f78(x["entrypoint"]):
+            return False
+        if "environment" in x and not _f110(x["environment"]):
+            return False
+        if "hyperparameters" in x and not _f111(x["hyperparameters"]):
+            return False
+        if "internal" in x and not _f112(x["internal"]):
+            return False
+        if "labels" in x and not _f58(x["labels"]):
+            return False
+        if "max_restarts" in x and not _f5(x["max_restarts"]):
+            return False
+        if "min_checkpoint_period" in x and not _f113(x["min_checkpoint_period"]):
+            return False
+        if "min_validation_period" in x and not _f113(x["min_validation_period"]):
+            return False
+        if "name" in x and not _f4(x["name"]):
+            return False
+        if "optimizations" in x and not _f114(x["optimizations"]):
+            return False
+        if "perform_initial_validation" in x and not _f15(x["perform_initial_validation"]):
+            return False
+        if "profiling" in x and not _f115(x["profiling"]):
+            return False
+        if "records_per_epoch" in x and not _f85(x["records_per_epoch"]):
+            return False
+        if "reproducibility" in x and not _f116(x["reproducibility"]):
+            return False
+        if "resources" in x and not _f117(x["resources"]):
+            return False
+        if "scheduling_unit" in x and not _f88(x["scheduling_unit"]):
+            return False
+        if "searcher" in x and not _f118(x["searcher"]):
+            return False
+        if "security" in x and not _f119(x["security"]):
+            return False
+        if "tensorboard_storage" in x and not _f120(x["tensorboard_storage"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_gcs(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C15.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f54(x["type"]):
+            return False
+        if "bucket" in x and not _f4(x["bucket"]):
+            return False
+        if "content_addressed" in x and not _f15(x["content_addressed"]):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_gcs(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("bucket",)):
+        return False
+    if isinstance(x, dict):
+        if not _C15.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f54(x["type"]):
+            return False
+        if "bucket" in x and not _f4(x["bucket"]):
+            return False
+        if "content_addressed" in x and not _f15(x["content_addressed"]):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _f126(x: Any) -> bool:
+    if x != "hdfs":
+        return False
+    return True
+
+
+def _sane_expconf_v0_hdfs(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C16.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f126(x["type"]):
+            return False
+        if "hdfs_url" in x and not _f4(x["hdfs_url"]):
+            return False
+        if "hdfs_path" in x and not _f55(x["hdfs_path"]):
+            return False
+        if "user" in x and not _f4(x["user"]):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_hdfs(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("hdfs_url", "hdfs_path")):
+        return False
+    if isinstance(x, dict):
+        if not _C16.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f126(x["type"]):
+            return False
+        if "hdfs_url" in x and not _f4(x["hdfs_url"]):
+            return False
+        if "hdfs_path" in x and not _f55(x["hdfs_path"]):
+            return False
+        if "user" in x and not _f4(x["user"]):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _f127(x: Any) -> bool:
+    if x != "categorical":
+        return False
+    return True
+
+
+def _f128(x: Any) -> bool:
+    if not isinstance(x, list):
+        return False
+    if isinstance(x, str):
+        if len(x) < 1:
+            return False
+    return True
+
+
+def _sane_expconf_v0_hyperparameter_categorical(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C17.issuperset(x):
+            return False
+        if "type" not in x or "vals" not in x:
+            return False
+        if "type" in x and not _f127(x["type"]):
+            return False
+        if "vals" in x and not _f128(x["vals"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_hyperparameter_categorical(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C17.issuperset(x):
+            return False
+        if "type" not in x or "vals" not in x:
+            return False
+        if "type" in x and not _f127(x["type"]):
+            return False
+        if "vals" in x and not _f128(x["vals"]):
+            return False
+    return True
+
+
+def _f129(x: Any) -> bool:
+    if x != "const":
+        return False
+    return True
+
+
+def _sane_expconf_v0_hyperparameter_const(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C18.issuperset(x):
+            return False
+        if "type" not in x or "val" not in x:
+            return False
+        if "type" in x and not _f129(x["type"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_hyperparameter_const(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C18.issuperset(x):
+            return False
+        if "type" not in x or "val" not in x:
+            return False
+        if "type" in x and not _f129(x["type"]):
+            return False
+    return True
+
+
+def _f130(x: Any) -> bool:
+    if x != "double":
+        return False
+    return True
+
+
+def _sane_expconf_v0_hyperparameter_double(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C19.issuperset(x):
+            return False
+        if "type" not in x or "minval" not in x or "maxval" not in x:
+            return False
+        if "type" in x and not _f130(x["type"]):
+            return False
+        if "minval" in x and not _f21(x["minval"]):
+            return False
+        if "maxval" in x and not _f21(x["maxval"]):
+            return False
+        if "count" in x and not _f88(x["count"]):
+            return False
+        if not _compare(_C20, x):
+            return False
+    return True
+
+
+def _complete_expconf_v0_hyperparameter_double(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C19.issuperset(x):
+            return False
+        if "type" not in x or "minval" not in x or "maxval" not in x:
+            return False
+        if "type" in x and not _f130(x["type"]):
+            return False
+        if "minval" in x and not _f21(x["minval"]):
+            return False
+        if "maxval" in x and not _f21(x["maxval"]):
+            return False
+        if "count" in x and not _f88(x["count"]):
+            return False
+        if not _compare(_C20, x):
+            return False
+    return True
+
+
+def _f131(x: Any) -> bool:
+    if x != "int":
+        return False
+    return True
+
+
+def _sane_expconf_v0_hyperparameter_int(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C19.issuperset(x):
+            return False
+        if "type" not in x or "minval" not in x or "maxval" not in x:
+            return False
+        if "type" in x and not _f131(x["type"]):
+            return False
+        if "minval" in x and not _f62(x["minval"]):
+            return False
+        if "maxval" in x and not _f62(x["maxval"]):
+            return False
+        if "count" in x and not _f88(x["count"]):
+            return False
+        if not _compare(_C20, x):
+            return False
+    return True
+
+
+def _complete_expconf_v0_hyperparameter_int(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C19.issuperset(x):
+            return False
+        if "type" not in x or "minval" not in x or "maxval" not in x:
+            return False
+        if "type" in x and not _f131(x["type"]):
+            return False
+        if "minval" in x and not _f62(x["minval"]):
+            return False
+        if "maxval" in x and not _f62(x["maxval"]):
+            return False
+        if "count" in x and not _f88(x["count"]):
+            return False
+        if not _compare(_C20, x):
+            return False
+    return True
+
+
+def _f132(x: Any) -> bool:
+    if x != "log":
+        return False
+    return True
+
+
+def _f133(x: Any) -> bool:
+    if not _is_number(x):
+        return False
+    if _is_number(x):
+        if x <= 0:
+            return False
+    return True
+
+
+def _sane_expconf_v0_hyperparameter_log(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C21.issuperset(x):
+            return False
+        if "type" not in x or "minval" not in x or "maxval" not in x or "base" not in x:
+            return False
+        if "type" in x and not _f132(x["type"]):
+            return False
+        if "minval" in x and not _f21(x["minval"]):
+            return False
+        if "maxval" in x and not _f21(x["maxval"]):
+            return False
+        if "base" in x and not _f133(x["base"]):
+            return False
+        if "count" in x and not _f88(x["count"]):
+            return False
+        if not _compare(_C20, x):
+            return False
+    return True
+
+
+def _complete_expconf_v0_hyperparameter_log(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C21.issuperset(x):
+            return False
+        if "type" not in x or "minval" not in x or "maxval" not in x or "base" not in x:
+            return False
+        if "type" in x and not _f132(x["type"]):
+            return False
+        if "minval" in x and not _f21(x["minval"]):
+            return False
+        if "maxval" in x and not _f21(x["maxval"]):
+            return False
+        if "base" in x and not _f133(x["base"]):
+            return False
+        if "count" in x and not _f88(x["count"]):
+            return False
+        if not _compare(_C20, x):
+            return False
+    return True
+
+
+def _f134(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "type" in x and not _f37(x["type"]):
+            return False
+    return True
+
+
+def _f135(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _f134(x):
+        return False
+    if isinstance(x, dict):
+        if not all(map(_sane_expconf_v0_hyperparameter, x.values())):
+            return False
+    return True
+
+
+def _f136(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    return True
+
+
+def _f137(x: Any) -> bool:
+    if _f136(x):
+        return False
+    return True
+
+
+def _sane_expconf_v0_hyperparameter(x: Any) -> bool:
+    if (_sane_expconf_v0_hyperparameter_int(x) + _sane_expconf_v0_hyperparameter_double(x) + _sane_expconf_v0_hyperparameter_log(x) + _sane_expconf_v0_hyperparameter_const(x) + _sane_expconf_v0_hyperparameter_categorical(x) + _f135(x) + _f137(x)) != 1:
+        return False
+    return True
+
+
+def _f138(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _f134(x):
+        return False
+    if isinstance(x, dict):
+        if not all(map(_complete_expconf_v0_hyperparameter, x.values())):
+            return False
+    return True
+
+
+def _complete_expconf_v0_hyperparameter(x: Any) -> bool:
+    if (_complete_expconf_v0_hyperparameter_int(x) + _complete_expconf_v0_hyperparameter_double(x) + _complete_expconf_v0_hyperparameter_log(x) + _complete_expconf_v0_hyperparameter_const(x) + _complete_expconf_v0_hyperparameter_categorical(x) + _f138(x) + _f137(x)) != 1:
+        return False
+    return True
+
+
+def _f139(x: Any) -> bool:
+    if not (_is_integer(x) or isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_check_global_batch_size(x):
+        return False
+    return True
+
+
+def _sane_expconf_v0_hyperparameters(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if "global_batch_size" in x and not _f139(x["global_batch_size"]):
+            return False
+        if any(k not in _C22 and not _sane_expconf_v0_hyperparameter(v) for k, v in x.items()):
+            return False
+    return True
+
+
+def _f140(x: Any) -> bool:
+    if not (_is_integer(x) or isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_check_global_batch_size(x):
+        return False
+    return True
+
+
+def _complete_expconf_v0_hyperparameters(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("global_batch_size",)):
+        return False
+    if isinstance(x, dict):
+        if "global_batch_size" in x and not _f140(x["global_batch_size"]):
+            return False
+        if any(k not in _C22 and not _complete_expconf_v0_hyperparameter(v) for k, v in x.items()):
+            return False
+    return True
+
+
+def _sane_expconf_v0_internal(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C23.issuperset(x):
+            return False
+        if "native" not in x:
+            return False
+        if "native" in x and not _sane_expconf_v0_native(x["native"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_internal(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C23.issuperset(x):
+            return False
+        if "native" not in x:
+            return False
+        if "native" in x and not _complete_expconf_v0_native(x["native"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_kerberos(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C24.issuperset(x):
+            return False
+        if "config_file" not in x:
+            return False
+        if "config_file" in x and not _f0(x["config_file"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_kerberos(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C24.issuperset(x):
+            return False
+        if "config_file" not in x:
+            return False
+        if "config_file" in x and not _f0(x["config_file"]):
+            return False
+    return True
+
+
+def _f141(x: Any) -> bool:
+    if not _is_integer(x):
+        return False
+    if _is_number(x):
+        if x < 0:
+            return False
+    return True
+
+
+def _f142(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C25.issuperset(x):
+            return False
+        if "batches" not in x:
+            return False
+        if "batches" in x and not _f141(x["batches"]):
+            return False
+    return True
+
+
+def _f143(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C26.issuperset(x):
+            return False
+        if "records" not in x:
+            return False
+        if "records" in x and not _f141(x["records"]):
+            return False
+    return True
+
+
+def _f144(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C27.issuperset(x):
+            return False
+        if "epochs" not in x:
+            return False
+        if "epochs" in x and not _f141(x["epochs"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_length(x: Any) -> bool:
+    if (_f142(x) + _f143(x) + _f144(x)) != 1:
+        return False
+    return True
+
+
+def _complete_expconf_v0_length(x: Any) -> bool:
+    if (_f142(x) + _f143(x) + _f144(x)) != 1:
+        return False
+    return True
+
+
+def _sane_expconf_v0_native(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C28.issuperset(x):
+            return False
+        if "command" not in x:
+            return False
+        if "command" in x and not _f59(x["command"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_native(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C28.issuperset(x):
+            return False
+        if "command" not in x:
+            return False
+        if "command" in x and not _f59(x["command"]):
+            return False
+    return True
+
+
+def _f145(x: Any) -> bool:
+    if x not in _C30:
+        return False
+    return True
+
+
+def _f146(x: Any) -> bool:
+    if not (_is_number(x) or x is None):
+        return False
+    if _is_number(x):
+        if x <= 0:
+            return False
+        if x > 1:
+            return False
+    return True
+
+
+def _f147(x: Any) -> bool:
+    if isinstance(x, str):
+        if not _C32.search(x):
+            return False
+    return True
+
+
+def _f148(x: Any) -> bool:
+    if x not in _C31:
+        return False
+    if not _f147(x):
+        return False
+    return True
+
+
+def _sane_expconf_v0_optimizations(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C29.issuperset(x):
+            return False
+        if "aggregation_frequency" in x and not _f88(x["aggregation_frequency"]):
+            return False
+        if "auto_tune_tensor_fusion" in x and not _f15(x["auto_tune_tensor_fusion"]):
+            return False
+        if "average_aggregated_gradients" in x and not _f15(x["average_aggregated_gradients"]):
+            return False
+        if "average_training_metrics" in x and not _f15(x["average_training_metrics"]):
+            return False
+        if "gradient_compression" in x and not _f15(x["gradient_compression"]):
+            return False
+        if "gradient_compression_method" in x and not _f145(x["gradient_compression_method"]):
+            return False
+        if "gradient_compression_rank" in x and not _f88(x["gradient_compression_rank"]):
+            return False
+        if "gradient_compression_topk_ratio" in x and not _f146(x["gradient_compression_topk_ratio"]):
+            return False
+        if "grad_updates_size_file" in x and not _f4(x["grad_updates_size_file"]):
+            return False
+        if "mixed_precision" in x and not _f148(x["mixed_precision"]):
+            return False
+        if "tensor_fusion_cycle_time" in x and not _f5(x["tensor_fusion_cycle_time"]):
+            return False
+        if "tensor_fusion_threshold" in x and not _f5(x["tensor_fusion_threshold"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_optimizations(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C29.issuperset(x):
+            return False
+        if "aggregation_frequency" in x and not _f88(x["aggregation_frequency"]):
+            return False
+        if "auto_tune_tensor_fusion" in x and not _f15(x["auto_tune_tensor_fusion"]):
+            return False
+        if "average_aggregated_gradients" in x and not _f15(x["average_aggregated_gradients"]):
+            return False
+        if "average_training_metrics" in x and not _f15(x["average_training_metrics"]):
+            return False
+        if "gradient_compression" in x and not _f15(x["gradient_compression"]):
+            return False
+        if "gradient_compression_method" in x and not _f145(x["gradient_compression_method"]):
+            return False
+        if "gradient_compression_rank" in x and not _f88(x["gradient_compression_rank"]):
+            return False
+        if "gradient_compression_topk_ratio" in x and not _f146(x["gradient_compression_topk_ratio"]):
+            return False
+        if "grad_updates_size_file" in x and not _f4(x["grad_updates_size_file"]):
+            return False
+        if "mixed_precision" in x and not _f148(x["mixed_precision"]):
+            return False
+        if "tensor_fusion_cycle_time" in x and not _f5(x["tensor_fusion_cycle_time"]):
+            return False
+        if "tensor_fusion_threshold" in x and not _f5(x["tensor_fusion_threshold"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_profiling(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C33.issuperset(x):
+            return False
+        if "enabled" in x and not _f15(x["enabled"]):
+            return False
+        if "begin_on_batch" in x and not _f5(x["begin_on_batch"]):
+            return False
+        if "end_after_batch" in x and not _f5(x["end_after_batch"]):
+            return False
+        if "continuous" in x and not _f15(x["continuous"]):
+            return False
+        if "sample_every_n_batches" in x and not _f88(x["sample_every_n_batches"]):
+            return False
+        if "max_samples_per_series" in x and not _f88(x["max_samples_per_series"]):
+            return False
+        if not _compare(_C34, x):
+            return False
+    return True
+
+
+def _complete_expconf_v0_profiling(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C33.issuperset(x):
+            return False
+        if "enabled" in x and not _f15(x["enabled"]):
+            return False
+        if "begin_on_batch" in x and not _f5(x["begin_on_batch"]):
+            return False
+        if "end_after_batch" in x and not _f5(x["end_after_batch"]):
+            return False
+        if "continuous" in x and not _f15(x["continuous"]):
+            return False
+        if "sample_every_n_batches" in x and not _f88(x["sample_every_n_batches"]):
+            return False
+        if "max_samples_per_series" in x and not _f88(x["max_samples_per_series"]):
+            return False
+        if not _compare(_C34, x):
+            return False
+    return True
+
+
+def _sane_expconf_v0_registry_auth(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C35.issuperset(x):
+            return False
+        if "username" in x and not _f4(x["username"]):
+            return False
+        if "password" in x and not _f4(x["password"]):
+            return False
+        if "auth" in x and not _f4(x["auth"]):
+            return False
+        if "email" in x and not _f4(x["email"]):
+            return False
+        if "serveraddress" in x and not _f4(x["serveraddress"]):
+            return False
+        if "identitytoken" in x and not _f4(x["identitytoken"]):
+            return False
+        if "registrytoken" in x and not _f4(x["registrytoken"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_registry_auth(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C35.issuperset(x):
+            return False
+        if "username" in x and not _f4(x["username"]):
+            return False
+        if "password" in x and not _f4(x["password"]):
+            return False
+        if "auth" in x and not _f4(x["auth"]):
+            return False
+        if "email" in x and not _f4(x["email"]):
+            return False
+        if "serveraddress" in x and not _f4(x["serveraddress"]):
+            return False
+        if "identitytoken" in x and not _f4(x["identitytoken"]):
+            return False
+        if "registrytoken" in x and not _f4(x["registrytoken"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_reproducibility(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C36.issuperset(x):
+            return False
+        if "experiment_seed" in x and not _f5(x["experiment_seed"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_reproducibility(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("experiment_seed",)):
+        return False
+    if isinstance(x, dict):
+        if not _C36.issuperset(x):
+            return False
+        if "experiment_seed" in x and not _f5(x["experiment_seed"]):
+            return False
+    return True
+
+
+def _f149(x: Any) -> bool:
+    if not (isinstance(x, list) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_devices(x):
+        return False
+    return True
+
+
+def _f150(x: Any) -> bool:
+    if x not in _C38:
+        return False
+    return True
+
+
+def _f151(x: Any) -> bool:
+    if not (_is_integer(x) or x is None):
+        return False
+    if _is_number(x):
+        if x < 1:
+            return False
+        if x > 99:
+            return False
+    return True
+
+
+def _f152(x: Any) -> bool:
+    if not (_is_number(x) or x is None):
+        return False
+    return True
+
+
+def _sane_expconf_v0_resources(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C37.issuperset(x):
+            return False
+        if "agent_label" in x and not _f4(x["agent_label"]):
+            return False
+        if "devices" in x and not _f149(x["devices"]):
+            return False
+        if "distributed_backend" in x and not _f150(x["distributed_backend"]):
+            return False
+        if "max_slots" in x and not _f85(x["max_slots"]):
+            return False
+        if "native_parallel" in x and not _f15(x["native_parallel"]):
+            return False
+        if "priority" in x and not _f151(x["priority"]):
+            return False
+        if "resource_pool" in x and not _f4(x["resource_pool"]):
+            return False
+        if "shm_size" in x and not _f85(x["shm_size"]):
+            return False
+        if "slots" in x and not _f85(x["slots"]):
+            return False
+        if "slots_per_trial" in x and not _f5(x["slots_per_trial"]):
+            return False
+        if "weight" in x and not _f152(x["weight"]):
+            return False
+    return True
+
+
+def _f153(x: Any) -> bool:
+    if not (isinstance(x, list) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_devices(x):
+        return False
+    return True
+
+
+def _complete_expconf_v0_resources(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C37.issuperset(x):
+            return False
+        if "agent_label" in x and not _f4(x["agent_label"]):
+            return False
+        if "devices" in x and not _f153(x["devices"]):
+            return False
+        if "distributed_backend" in x and not _f150(x["distributed_backend"]):
+            return False
+        if "max_slots" in x and not _f85(x["max_slots"]):
+            return False
+        if "native_parallel" in x and not _f15(x["native_parallel"]):
+            return False
+        if "priority" in x and not _f151(x["priority"]):
+            return False
+        if "resource_pool" in x and not _f4(x["resource_pool"]):
+            return False
+        if "shm_size" in x and not _f85(x["shm_size"]):
+            return False
+        if "slots" in x and not _f85(x["slots"]):
+            return False
+        if "slots_per_trial" in x and not _f5(x["slots_per_trial"]):
+            return False
+        if "weight" in x and not _f152(x["weight"]):
+            return False
+    return True
+
+
+def _f154(x: Any) -> bool:
+    if not (_is_integer(x) or x is None):
+        return False
+    if _is_number(x):
+        if x < 5242880:
+            return False
+    return True
+
+
+def _sane_expconf_v0_s3(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C39.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f56(x["type"]):
+            return False
+        if "access_key" in x and not _f4(x["access_key"]):
+            return False
+        if "bucket" in x and not _f4(x["bucket"]):
+            return False
+        if "secret_key" in x and not _f4(x["secret_key"]):
+            return False
+        if "endpoint_url" in x and not _f4(x["endpoint_url"]):
+            return False
+        if "concurrency" in x and not _f88(x["concurrency"]):
+            return False
+        if "multipart_chunk_size" in x and not _f154(x["multipart_chunk_size"]):
+            return False
+        if "max_retries" in x and not _f5(x["max_retries"]):
+            return False
+        if "content_addressed" in x and not _f15(x["content_addressed"]):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_s3(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("bucket",)):
+        return False
+    if isinstance(x, dict):
+        if not _C39.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f56(x["type"]):
+            return False
+        if "access_key" in x and not _f4(x["access_key"]):
+            return False
+        if "bucket" in x and not _f4(x["bucket"]):
+            return False
+        if "secret_key" in x and not _f4(x["secret_key"]):
+            return False
+        if "endpoint_url" in x and not _f4(x["endpoint_url"]):
+            return False
+        if "concurrency" in x and not _f88(x["concurrency"]):
+            return False
+        if "multipart_chunk_size" in x and not _f154(x["multipart_chunk_size"]):
+            return False
+        if "max_retries" in x and not _f5(x["max_retries"]):
+            return False
+        if "content_addressed" in x and not _f15(x["content_addressed"]):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _f155(x: Any) -> bool:
+    if x != "adaptive_asha":
+        return False
+    return True
+
+
+def _f156(x: Any) -> bool:
+    if not (isinstance(x, list) or x is None):
+        return False
+    if isinstance(x, list):
+        if not all(map(_f62, x)):
+            return False
+    return True
+
+
+def _f157(x: Any) -> bool:
+    if x not in _C41:
+        return False
+    return True
+
+
+def _f158(x: Any) -> bool:
+    if not (_is_number(x) or x is None):
+        return False
+    if _is_number(x):
+        if x <= 1:
+            return False
+    return True
+
+
+def _f159(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_check_positive_length(x):
+        return False
+    return True
+
+
+def _sane_expconf_v0_searcher_adaptive_asha(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C40.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f155(x["name"]):
+            return False
+        if "bracket_rungs" in x and not _f156(x["bracket_rungs"]):
+            return False
+        if "max_trials" in x and not _f88(x["max_trials"]):
+            return False
+        if "mode" in x and not _f157(x["mode"]):
+            return False
+        if "divisor" in x and not _f158(x["divisor"]):
+            return False
+        if "max_rungs" in x and not _f88(x["max_rungs"]):
+            return False
+        if "max_concurrent_trials" in x and not _f5(x["max_concurrent_trials"]):
+            return False
+        if "max_length" in x and not _f159(x["max_length"]):
+            return False
+        if "stop_once" in x and not _f15(x["stop_once"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f160(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_check_positive_length(x):
+        return False
+    return True
+
+
+def _complete_expconf_v0_searcher_adaptive_asha(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("max_length", "max_trials", "metric")):
+        return False
+    if isinstance(x, dict):
+        if not _C40.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f155(x["name"]):
+            return False
+        if "bracket_rungs" in x and not _f156(x["bracket_rungs"]):
+            return False
+        if "max_trials" in x and not _f88(x["max_trials"]):
+            return False
+        if "mode" in x and not _f157(x["mode"]):
+            return False
+        if "divisor" in x and not _f158(x["divisor"]):
+            return False
+        if "max_rungs" in x and not _f88(x["max_rungs"]):
+            return False
+        if "max_concurrent_trials" in x and not _f5(x["max_concurrent_trials"]):
+            return False
+        if "max_length" in x and not _f160(x["max_length"]):
+            return False
+        if "stop_once" in x and not _f15(x["stop_once"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f161(x: Any) -> bool:
+    if x != "adaptive_simple":
+        return False
+    return True
+
+
+def _f162(x: Any) -> bool:
+    if not (_is_integer(x) or x is None):
+        return False
+    if _is_number(x):
+        if x < 1:
+            return False
+        if x > 2000:
+            return False
+    return True
+
+
+def _sane_expconf_v0_searcher_adaptive_simple(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C42.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f161(x["name"]):
+            return False
+        if "max_trials" in x and not _f162(x["max_trials"]):
+            return False
+        if "mode" in x and not _f157(x["mode"]):
+            return False
+        if "divisor" in x and not _f158(x["divisor"]):
+            return False
+        if "max_rungs" in x and not _f88(x["max_rungs"]):
+            return False
+        if "max_length" in x and not _f159(x["max_length"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_searcher_adaptive_simple(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("max_trials", "max_length", "metric")):
+        return False
+    if isinstance(x, dict):
+        if not _C42.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f161(x["name"]):
+            return False
+        if "max_trials" in x and not _f162(x["max_trials"]):
+            return False
+        if "mode" in x and not _f157(x["mode"]):
+            return False
+        if "divisor" in x and not _f158(x["divisor"]):
+            return False
+        if "max_rungs" in x and not _f88(x["max_rungs"]):
+            return False
+        if "max_length" in x and not _f160(x["max_length"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f163(x: Any) -> bool:
+    if x != "adaptive":
+        return False
+    return True
+
+
+def _sane_expconf_v0_searcher_adaptive(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C43.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f163(x["name"]):
+            return False
+        if "budget" in x and not _f82(x["budget"]):
+            return False
+        if "bracket_rungs" in x and not _f156(x["bracket_rungs"]):
+            return False
+        if "mode" in x and not _f157(x["mode"]):
+            return False
+        if "divisor" in x and not _f158(x["divisor"]):
+            return False
+        if "max_rungs" in x and not _f88(x["max_rungs"]):
+            return False
+        if "max_length" in x and not _f159(x["max_length"]):
+            return False
+        if "train_stragglers" in x and not _f15(x["train_stragglers"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_searcher_adaptive(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("budget", "max_length", "metric")):
+        return False
+    if isinstance(x, dict):
+        if not _C43.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f163(x["name"]):
+            return False
+        if "budget" in x and not _f113(x["budget"]):
+            return False
+        if "bracket_rungs" in x and not _f156(x["bracket_rungs"]):
+            return False
+        if "mode" in x and not _f157(x["mode"]):
+            return False
+        if "divisor" in x and not _f158(x["divisor"]):
+            return False
+        if "max_rungs" in x and not _f88(x["max_rungs"]):
+            return False
+        if "max_length" in x and not _f160(x["max_length"]):
+            return False
+        if "train_stragglers" in x and not _f15(x["train_stragglers"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f164(x: Any) -> bool:
+    if x != "async_halving":
+        return False
+    return True
+
+
+def _sane_expconf_v0_searcher_async_halving(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C44.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f164(x["name"]):
+            return False
+        if "num_rungs" in x and not _f88(x["num_rungs"]):
+            return False
+        if "max_length" in x and not _f159(x["max_length"]):
+            return False
+        if "max_trials" in x and not _f88(x["max_trials"]):
+            return False
+        if "divisor" in x and not _f158(x["divisor"]):
+            return False
+        if "max_concurrent_trials" in x and not _f5(x["max_concurrent_trials"]):
+            return False
+        if "stop_once" in x and not _f15(x["stop_once"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_searcher_async_halving(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("num_rungs", "max_length", "max_trials", "metric")):
+        return False
+    if isinstance(x, dict):
+        if not _C44.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f164(x["name"]):
+            return False
+        if "num_rungs" in x and not _f88(x["num_rungs"]):
+            return False
+        if "max_length" in x and not _f160(x["max_length"]):
+            return False
+        if "max_trials" in x and not _f88(x["max_trials"]):
+            return False
+        if "divisor" in x and not _f158(x["divisor"]):
+            return False
+        if "max_concurrent_trials" in x and not _f5(x["max_concurrent_trials"]):
+            return False
+        if "stop_once" in x and not _f15(x["stop_once"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_searcher_grid(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C45.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f94(x["name"]):
+            return False
+        if "max_concurrent_trials" in x and not _f5(x["max_concurrent_trials"]):
+            return False
+        if "max_length" in x and not _f159(x["max_length"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_searcher_grid(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("max_length", "metric")):
+        return False
+    if isinstance(x, dict):
+        if not _C45.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f94(x["name"]):
+            return False
+        if "max_concurrent_trials" in x and not _f5(x["max_concurrent_trials"]):
+            return False
+        if "max_length" in x and not _f160(x["max_length"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f165(x: Any) -> bool:
+    if x != "pbt":
+        return False
+    return True
+
+
+def _f166(x: Any) -> bool:
+    if not _is_number(x):
+        return False
+    if _is_number(x):
+        if x < 0.0:
+            return False
+        if x > 0.5:
+            return False
+    return True
+
+
+def _f167(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C47.issuperset(x):
+            return False
+        if "truncate_fraction" not in x:
+            return False
+        if "truncate_fraction" in x and not _f166(x["truncate_fraction"]):
+            return False
+    return True
+
+
+def _f168(x: Any) -> bool:
+    if (_f167(x)) != 1:
+        return False
+    return True
+
+
+def _f169(x: Any) -> bool:
+    if x is not None:
+        return False
+    return True
+
+
+def _f170(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if not _f169(x) and not _f168(x):
+        return False
+    return True
+
+
+def _f171(x: Any) -> bool:
+    if not (_is_number(x) or x is None):
+        return False
+    if _is_number(x):
+        if x < 0.0:
+            return False
+        if x > 1.0:
+            return False
+    return True
+
+
+def _f172(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if isinstance(x, dict):
+        if not _C48.issuperset(x):
+            return False
+        if "resample_probability" in x and not _f171(x["resample_probability"]):
+            return False
+        if "perturb_factor" in x and not _f171(x["perturb_factor"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_searcher_pbt(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C46.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f165(x["name"]):
+            return False
+        if "population_size" in x and not _f88(x["population_size"]):
+            return False
+        if "length_per_round" in x and not _f159(x["length_per_round"]):
+            return False
+        if "num_rounds" in x and not _f88(x["num_rounds"]):
+            return False
+        if "replace_function" in x and not _f170(x["replace_function"]):
+            return False
+        if "explore_function" in x and not _f172(x["explore_function"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f173(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if not _has_all(x, ("resample_probability", "perturb_factor")):
+        return False
+    if isinstance(x, dict):
+        if not _C48.issuperset(x):
+            return False
+        if "resample_probability" in x and not _f171(x["resample_probability"]):
+            return False
+        if "perturb_factor" in x and not _f171(x["perturb_factor"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_searcher_pbt(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("metric", "population_size", "length_per_round", "num_rounds", "replace_function", "explore_function")):
+        return False
+    if isinstance(x, dict):
+        if not _C46.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f165(x["name"]):
+            return False
+        if "population_size" in x and not _f88(x["population_size"]):
+            return False
+        if "length_per_round" in x and not _f160(x["length_per_round"]):
+            return False
+        if "num_rounds" in x and not _f88(x["num_rounds"]):
+            return False
+        if "replace_function" in x and not _f170(x["replace_function"]):
+            return False
+        if "explore_function" in x and not _f173(x["explore_function"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f174(x: Any) -> bool:
+    if x != "random":
+        return False
+    return True
+
+
+def _sane_expconf_v0_searcher_random(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C49.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f174(x["name"]):
+            return False
+        if "max_concurrent_trials" in x and not _f5(x["max_concurrent_trials"]):
+            return False
+        if "max_trials" in x and not _f88(x["max_trials"]):
+            return False
+        if "max_length" in x and not _f159(x["max_length"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_searcher_random(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("max_trials", "max_length", "metric")):
+        return False
+    if isinstance(x, dict):
+        if not _C49.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f174(x["name"]):
+            return False
+        if "max_concurrent_trials" in x and not _f5(x["max_concurrent_trials"]):
+            return False
+        if "max_trials" in x and not _f88(x["max_trials"]):
+            return False
+        if "max_length" in x and not _f160(x["max_length"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f175(x: Any) -> bool:
+    if x != "single":
+        return False
+    return True
+
+
+def _sane_expconf_v0_searcher_single(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C50.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f175(x["name"]):
+            return False
+        if "max_length" in x and not _f159(x["max_length"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_searcher_single(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("max_length", "metric")):
+        return False
+    if isinstance(x, dict):
+        if not _C50.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f175(x["name"]):
+            return False
+        if "max_length" in x and not _f160(x["max_length"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f176(x: Any) -> bool:
+    if x != "sync_halving":
+        return False
+    return True
+
+
+def _sane_expconf_v0_searcher_sync_halving(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C51.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f176(x["name"]):
+            return False
+        if "budget" in x and not _f159(x["budget"]):
+            return False
+        if "num_rungs" in x and not _f88(x["num_rungs"]):
+            return False
+        if "max_length" in x and not _f159(x["max_length"]):
+            return False
+        if "divisor" in x and not _f158(x["divisor"]):
+            return False
+        if "train_stragglers" in x and not _f15(x["train_stragglers"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_searcher_sync_halving(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("num_rungs", "max_length", "budget", "metric")):
+        return False
+    if isinstance(x, dict):
+        if not _C51.issuperset(x):
+            return False
+        if "name" not in x:
+            return False
+        if "name" in x and not _f176(x["name"]):
+            return False
+        if "budget" in x and not _f160(x["budget"]):
+            return False
+        if "num_rungs" in x and not _f88(x["num_rungs"]):
+            return False
+        if "max_length" in x and not _f160(x["max_length"]):
+            return False
+        if "divisor" in x and not _f158(x["divisor"]):
+            return False
+        if "train_stragglers" in x and not _f15(x["train_stragglers"]):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f177(x: Any) -> bool:
+    if (_sane_expconf_v0_searcher_single(x) + _sane_expconf_v0_searcher_random(x) + _sane_expconf_v0_searcher_grid(x) + _sane_expconf_v0_searcher_adaptive_asha(x) + _sane_expconf_v0_searcher_pbt(x) + _sane_expconf_v0_searcher_async_halving(x) + _sane_expconf_v0_searcher_adaptive(x) + _sane_expconf_v0_searcher_adaptive_simple(x) + _sane_expconf_v0_searcher_sync_halving(x)) != 1:
+        return False
+    return True
+
+
+def _f178(x: Any) -> bool:
+    if isinstance(x, dict):
+        if "name" not in x:
+            return False
+    return True
+
+
+def _sane_expconf_v0_searcher(x: Any) -> bool:
+    if _f178(x) and not _f177(x):
+        return False
+    if isinstance(x, dict):
+        if not _C52.issuperset(x):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f179(x: Any) -> bool:
+    if (_complete_expconf_v0_searcher_single(x) + _complete_expconf_v0_searcher_random(x) + _complete_expconf_v0_searcher_grid(x) + _complete_expconf_v0_searcher_adaptive_asha(x) + _complete_expconf_v0_searcher_pbt(x) + _complete_expconf_v0_searcher_async_halving(x) + _complete_expconf_v0_searcher_adaptive(x) + _complete_expconf_v0_searcher_adaptive_simple(x) + _complete_expconf_v0_searcher_sync_halving(x)) != 1:
+        return False
+    return True
+
+
+def _complete_expconf_v0_searcher(x: Any) -> bool:
+    if _f178(x) and not _f179(x):
+        return False
+    if not _has_all(x, ("name", "metric")):
+        return False
+    if isinstance(x, dict):
+        if not _C52.issuperset(x):
+            return False
+        if "metric" in x and not _f4(x["metric"]):
+            return False
+        if "smaller_is_better" in x and not _f15(x["smaller_is_better"]):
+            return False
+        if "source_trial_id" in x and not _f85(x["source_trial_id"]):
+            return False
+        if "source_checkpoint_uuid" in x and not _f4(x["source_checkpoint_uuid"]):
+            return False
+    return True
+
+
+def _f180(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_kerberos(x):
+        return False
+    return True
+
+
+def _sane_expconf_v0_security(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C53.issuperset(x):
+            return False
+        if "kerberos" in x and not _f180(x["kerberos"]):
+            return False
+    return True
+
+
+def _f181(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_kerberos(x):
+        return False
+    return True
+
+
+def _complete_expconf_v0_security(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C53.issuperset(x):
+            return False
+        if "kerberos" in x and not _f181(x["kerberos"]):
+            return False
+    return True
+
+
+def _f182(x: Any) -> bool:
+    if isinstance(x, dict):
+        if not _compare(_C55, x):
+            return False
+    return True
+
+
+def _sane_expconf_v0_shared_fs(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _f182(x):
+        return False
+    if isinstance(x, dict):
+        if not _C54.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f57(x["type"]):
+            return False
+        if "host_path" in x and not _f4(x["host_path"]):
+            return False
+        if "storage_path" in x and not _f4(x["storage_path"]):
+            return False
+        if "propagation" in x and not _f4(x["propagation"]):
+            return False
+        if "container_path" in x and not _f4(x["container_path"]):
+            return False
+        if "checkpoint_path" in x and not _f4(x["checkpoint_path"]):
+            return False
+        if "tensorboard_path" in x and not _f4(x["tensorboard_path"]):
+            return False
+        if "content_addressed" in x and not _f15(x["content_addressed"]):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_shared_fs(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if not _has_all(x, ("host_path",)):
+        return False
+    if not _f182(x):
+        return False
+    if isinstance(x, dict):
+        if not _C54.issuperset(x):
+            return False
+        if "type" not in x:
+            return False
+        if "type" in x and not _f57(x["type"]):
+            return False
+        if "host_path" in x and not _f4(x["host_path"]):
+            return False
+        if "storage_path" in x and not _f4(x["storage_path"]):
+            return False
+        if "propagation" in x and not _f4(x["propagation"]):
+            return False
+        if "container_path" in x and not _f4(x["container_path"]):
+            return False
+        if "checkpoint_path" in x and not _f4(x["checkpoint_path"]):
+            return False
+        if "tensorboard_path" in x and not _f4(x["tensorboard_path"]):
+            return False
+        if "content_addressed" in x and not _f15(x["content_addressed"]):
+            return False
+        if "save_experiment_best" in x and not _f5(x["save_experiment_best"]):
+            return False
+        if "save_trial_best" in x and not _f5(x["save_trial_best"]):
+            return False
+        if "save_trial_latest" in x and not _f5(x["save_trial_latest"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_tensorboard_storage(x: Any) -> bool:
+    if (_sane_expconf_v0_shared_fs(x) + _sane_expconf_v0_hdfs(x) + _sane_expconf_v0_s3(x) + _sane_expconf_v0_gcs(x)) != 1:
+        return False
+    if isinstance(x, dict):
+        if "save_experiment_best" in x or "save_trial_best" in x or "save_trial_latest" in x:
+            return False
+    return True
+
+
+def _complete_expconf_v0_tensorboard_storage(x: Any) -> bool:
+    if (_complete_expconf_v0_shared_fs(x) + _complete_expconf_v0_hdfs(x) + _complete_expconf_v0_s3(x) + _complete_expconf_v0_gcs(x)) != 1:
+        return False
+    if isinstance(x, dict):
+        if "save_experiment_best" in x or "save_trial_best" in x or "save_trial_latest" in x:
+            return False
+    return True
+
+
+def _f183(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_test_sub(x):
+        return False
+    return True
+
+
+def _f184(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _sane_expconf_v0_test_union(x):
+        return False
+    return True
+
+
+def _sane_expconf_v0_test_root(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C56.issuperset(x):
+            return False
+        if "val_x" not in x:
+            return False
+        if "val_x" in x and not _f62(x["val_x"]):
+            return False
+        if "sub_obj" in x and not _f183(x["sub_obj"]):
+            return False
+        if "sub_union" in x and not _f184(x["sub_union"]):
+            return False
+        if "runtime_defaultable" in x and not _f85(x["runtime_defaultable"]):
+            return False
+        if "defaulted_array" in x and not _f58(x["defaulted_array"]):
+            return False
+        if "nodefault_array" in x and not _f58(x["nodefault_array"]):
+            return False
+    return True
+
+
+def _f185(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_test_sub(x):
+        return False
+    return True
+
+
+def _f186(x: Any) -> bool:
+    if not (isinstance(x, dict) or x is None):
+        return False
+    if x is not None and not _complete_expconf_v0_test_union(x):
+        return False
+    return True
+
+
+def _complete_expconf_v0_test_root(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C56.issuperset(x):
+            return False
+        if "val_x" not in x:
+            return False
+        if "val_x" in x and not _f62(x["val_x"]):
+            return False
+        if "sub_obj" in x and not _f185(x["sub_obj"]):
+            return False
+        if "sub_union" in x and not _f186(x["sub_union"]):
+            return False
+        if "runtime_defaultable" in x and not _f85(x["runtime_defaultable"]):
+            return False
+        if "defaulted_array" in x and not _f58(x["defaulted_array"]):
+            return False
+        if "nodefault_array" in x and not _f58(x["nodefault_array"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_test_sub(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C57.issuperset(x):
+            return False
+        if "val_y" in x and not _f4(x["val_y"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_test_sub(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C57.issuperset(x):
+            return False
+        if "val_y" in x and not _f4(x["val_y"]):
+            return False
+    return True
+
+
+def _f187(x: Any) -> bool:
+    if x != "a":
+        return False
+    return True
+
+
+def _sane_expconf_v0_test_union_a(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C58.issuperset(x):
+            return False
+        if "type" not in x or "val_a" not in x:
+            return False
+        if "type" in x and not _f187(x["type"]):
+            return False
+        if "val_a" in x and not _f62(x["val_a"]):
+            return False
+        if "common_val" in x and not _f4(x["common_val"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_test_union_a(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C58.issuperset(x):
+            return False
+        if "type" not in x or "val_a" not in x:
+            return False
+        if "type" in x and not _f187(x["type"]):
+            return False
+        if "val_a" in x and not _f62(x["val_a"]):
+            return False
+        if "common_val" in x and not _f4(x["common_val"]):
+            return False
+    return True
+
+
+def _f188(x: Any) -> bool:
+    if x != "b":
+        return False
+    return True
+
+
+def _sane_expconf_v0_test_union_b(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C59.issuperset(x):
+            return False
+        if "type" not in x or "val_b" not in x:
+            return False
+        if "type" in x and not _f188(x["type"]):
+            return False
+        if "val_b" in x and not _f62(x["val_b"]):
+            return False
+        if "common_val" in x and not _f4(x["common_val"]):
+            return False
+    return True
+
+
+def _complete_expconf_v0_test_union_b(x: Any) -> bool:
+    if not isinstance(x, dict):
+        return False
+    if isinstance(x, dict):
+        if not _C59.issuperset(x):
+            return False
+        if "type" not in x or "val_b" not in x:
+            return False
+        if "type" in x and not _f188(x["type"]):
+            return False
+        if "val_b" in x and not _f62(x["val_b"]):
+            return False
+        if "common_val" in x and not _f4(x["common_val"]):
+            return False
+    return True
+
+
+def _sane_expconf_v0_test_union(x: Any) -> bool:
+    if (_sane_expconf_v0_test_union_a(x) + _sane_expconf_v0_test_union_b(x)) != 1:
+        return False
+    return True
+
+
+def _complete_expconf_v0_test_union(x: Any) -> bool:
+    if (_complete_expconf_v0_test_union_a(x) + _complete_expconf_v0_test_union_b(x)) != 1:
+        return False
+    return True
+
+
+sanity = {
+    "http://determined.ai/schemas/expconf/v0/azure.json": _sane_expconf_v0_azure,
+    "http://determined.ai/schemas/expconf/v0/bind-mount.json": _sane_expconf_v0_bind_mount,
+    "http://determined.ai/schemas/expconf/v0/bind-mounts.json": _sane_expconf_v0_bind_mounts,
+    "http://determined.ai/schemas/expconf/v0/check-data-layer-cache.json": _sane_expconf_v0_check_data_layer_cache,
+    "http://determined.ai/schemas/expconf/v0/check-epoch-not-used.json": _sane_expconf_v0_check_epoch_not_used,
+    "http://determined.ai/schemas/expconf/v0/check-global-batch-size.json": _sane_expconf_v0_check_global_batch_size,
+    "http://determined.ai/schemas/expconf/v0/check-grid-hyperparameter.json": _sane_expconf_v0_check_grid_hyperparameter,
+    "http://determined.ai/schemas/expconf/v0/check-positive-length.json": _sane_expconf_v0_check_positive_length,
+    "http://determined.ai/schemas/expconf/v0/checkpoint-storage.json": _sane_expconf_v0_checkpoint_storage,
+    "http://determined.ai/schemas/expconf/v0/data-layer-gcs.json": _sane_expconf_v0_data_layer_gcs,
+    "http://determined.ai/schemas/expconf/v0/data-layer-s3.json": _sane_expconf_v0_data_layer_s3,
+    "http://determined.ai/schemas/expconf/v0/data-layer-shared-fs.json": _sane_expconf_v0_data_layer_shared_fs,
+    "http://determined.ai/schemas/expconf/v0/data-layer.json": _sane_expconf_v0_data_layer,
+    "http://determined.ai/schemas/expconf/v0/device.json": _sane_expconf_v0_device,
+    "http://determined.ai/schemas/expconf/v0/devices.json": _sane_expconf_v0_devices,
+    "http://determined.ai/schemas/expconf/v0/environment-image-map.json": _sane_expconf_v0_environment_image_map,
+    "http://determined.ai/schemas/expconf/v0/environment-image.json": _sane_expconf_v0_environment_image,
+    "http://determined.ai/schemas/expconf/v0/environment-variables-map.json": _sane_expconf_v0_environment_variables_map,
+    "http://determined.ai/schemas/expconf/v0/environment-variables.json": _sane_expconf_v0_environment_variables,
+    "http://determined.ai/schemas/expconf/v0/environment.json": _sane_expconf_v0_environment,
+    "http://determined.ai/schemas/expconf/v0/experiment.json": _sane_expconf_v0_experiment,
+    "http://determined.ai/schemas/expconf/v0/gcs.json": _sane_expconf_v0_gcs,
+    "http://determined.ai/schemas/expconf/v0/hdfs.json": _sane_expconf_v0_hdfs,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-categorical.json": _sane_expconf_v0_hyperparameter_categorical,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-const.json": _sane_expconf_v0_hyperparameter_const,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-double.json": _sane_expconf_v0_hyperparameter_double,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-int.json": _sane_expconf_v0_hyperparameter_int,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-log.json": _sane_expconf_v0_hyperparameter_log,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter.json": _sane_expconf_v0_hyperparameter,
+    "http://determined.ai/schemas/expconf/v0/hyperparameters.json": _sane_expconf_v0_hyperparameters,
+    "http://determined.ai/schemas/expconf/v0/internal.json": _sane_expconf_v0_internal,
+    "http://determined.ai/schemas/expconf/v0/kerberos.json": _sane_expconf_v0_kerberos,
+    "http://determined.ai/schemas/expconf/v0/length.json": _sane_expconf_v0_length,
+    "http://determined.ai/schemas/expconf/v0/native.json": _sane_expconf_v0_native,
+    "http://determined.ai/schemas/expconf/v0/optimizations.json": _sane_expconf_v0_optimizations,
+    "http://determined.ai/schemas/expconf/v0/profiling.json": _sane_expconf_v0_profiling,
+    "http://determined.ai/schemas/expconf/v0/registry-auth.json": _sane_expconf_v0_registry_auth,
+    "http://determined.ai/schemas/expconf/v0/reproducibility.json": _sane_expconf_v0_reproducibility,
+    "http://determined.ai/schemas/expconf/v0/resources.json": _sane_expconf_v0_resources,
+    "http://determined.ai/schemas/expconf/v0/s3.json": _sane_expconf_v0_s3,
+    "http://determined.ai/schemas/expconf/v0/searcher-adaptive-asha.json": _sane_expconf_v0_searcher_adaptive_asha,
+    "http://determined.ai/schemas/expconf/v0/searcher-adaptive-simple.json": _sane_expconf_v0_searcher_adaptive_simple,
+    "http://determined.ai/schemas/expconf/v0/searcher-adaptive.json": _sane_expconf_v0_searcher_adaptive,
+    "http://determined.ai/schemas/expconf/v0/searcher-async-halving.json": _sane_expconf_v0_searcher_async_halving,
+    "http://determined.ai/schemas/expconf/v0/searcher-grid.json": _sane_expconf_v0_searcher_grid,
+    "http://determined.ai/schemas/expconf/v0/searcher-pbt.json": _sane_expconf_v0_searcher_pbt,
+    "http://determined.ai/schemas/expconf/v0/searcher-random.json": _sane_expconf_v0_searcher_random,
+    "http://determined.ai/schemas/expconf/v0/searcher-single.json": _sane_expconf_v0_searcher_single,
+    "http://determined.ai/schemas/expconf/v0/searcher-sync-halving.json": _sane_expconf_v0_searcher_sync_halving,
+    "http://determined.ai/schemas/expconf/v0/searcher.json": _sane_expconf_v0_searcher,
+    "http://determined.ai/schemas/expconf/v0/security.json": _sane_expconf_v0_security,
+    "http://determined.ai/schemas/expconf/v0/shared-fs.json": _sane_expconf_v0_shared_fs,
+    "http://determined.ai/schemas/expconf/v0/tensorboard-storage.json": _sane_expconf_v0_tensorboard_storage,
+    "http://determined.ai/schemas/expconf/v0/test-root.json": _sane_expconf_v0_test_root,
+    "http://determined.ai/schemas/expconf/v0/test-sub.json": _sane_expconf_v0_test_sub,
+    "http://determined.ai/schemas/expconf/v0/test-union-a.json": _sane_expconf_v0_test_union_a,
+    "http://determined.ai/schemas/expconf/v0/test-union-b.json": _sane_expconf_v0_test_union_b,
+    "http://determined.ai/schemas/expconf/v0/test-union.json": _sane_expconf_v0_test_union,
+}  # type: Dict[str, Callable[[Any], bool]]
+
+
+completeness = {
+    "http://determined.ai/schemas/expconf/v0/azure.json": _complete_expconf_v0_azure,
+    "http://determined.ai/schemas/expconf/v0/bind-mount.json": _complete_expconf_v0_bind_mount,
+    "http://determined.ai/schemas/expconf/v0/bind-mounts.json": _complete_expconf_v0_bind_mounts,
+    "http://determined.ai/schemas/expconf/v0/check-data-layer-cache.json": _complete_expconf_v0_check_data_layer_cache,
+    "http://determined.ai/schemas/expconf/v0/check-epoch-not-used.json": _complete_expconf_v0_check_epoch_not_used,
+    "http://determined.ai/schemas/expconf/v0/check-global-batch-size.json": _complete_expconf_v0_check_global_batch_size,
+    "http://determined.ai/schemas/expconf/v0/check-grid-hyperparameter.json": _complete_expconf_v0_check_grid_hyperparameter,
+    "http://determined.ai/schemas/expconf/v0/check-positive-length.json": _complete_expconf_v0_check_positive_length,
+    "http://determined.ai/schemas/expconf/v0/checkpoint-storage.json": _complete_expconf_v0_checkpoint_storage,
+    "http://determined.ai/schemas/expconf/v0/data-layer-gcs.json": _complete_expconf_v0_data_layer_gcs,
+    "http://determined.ai/schemas/expconf/v0/data-layer-s3.json": _complete_expconf_v0_data_layer_s3,
+    "http://determined.ai/schemas/expconf/v0/data-layer-shared-fs.json": _complete_expconf_v0_data_layer_shared_fs,
+    "http://determined.ai/schemas/expconf/v0/data-layer.json": _complete_expconf_v0_data_layer,
+    "http://determined.ai/schemas/expconf/v0/device.json": _complete_expconf_v0_device,
+    "http://determined.ai/schemas/expconf/v0/devices.json": _complete_expconf_v0_devices,
+    "http://determined.ai/schemas/expconf/v0/environment-image-map.json": _complete_expconf_v0_environment_image_map,
+    "http://determined.ai/schemas/expconf/v0/environment-image.json": _complete_expconf_v0_environment_image,
+    "http://determined.ai/schemas/expconf/v0/environment-variables-map.json": _complete_expconf_v0_environment_variables_map,
+    "http://determined.ai/schemas/expconf/v0/environment-variables.json": _complete_expconf_v0_environment_variables,
+    "http://determined.ai/schemas/expconf/v0/environment.json": _complete_expconf_v0_environment,
+    "http://determined.ai/schemas/expconf/v0/experiment.json": _complete_expconf_v0_experiment,
+    "http://determined.ai/schemas/expconf/v0/gcs.json": _complete_expconf_v0_gcs,
+    "http://determined.ai/schemas/expconf/v0/hdfs.json": _complete_expconf_v0_hdfs,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-categorical.json": _complete_expconf_v0_hyperparameter_categorical,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-const.json": _complete_expconf_v0_hyperparameter_const,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-double.json": _complete_expconf_v0_hyperparameter_double,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-int.json": _complete_expconf_v0_hyperparameter_int,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter-log.json": _complete_expconf_v0_hyperparameter_log,
+    "http://determined.ai/schemas/expconf/v0/hyperparameter.json": _complete_expconf_v0_hyperparameter,
+    "http://determined.ai/schemas/expconf/v0/hyperparameters.json": _complete_expconf_v0_hyperparameters,
+    "http://determined.ai/schemas/expconf/v0/internal.json": _complete_expconf_v0_internal,
+    "http://determined.ai/schemas/expconf/v0/kerberos.json": _complete_expconf_v0_kerberos,
+    "http://determined.ai/schemas/expconf/v0/length.json": _complete_expconf_v0_length,
+    "http://determined.ai/schemas/expconf/v0/native.json": _complete_expconf_v0_native,
+    "http://determined.ai/schemas/expconf/v0/optimizations.json": _complete_expconf_v0_optimizations,
+    "http://determined.ai/schemas/expconf/v0/profiling.json": _complete_expconf_v0_profiling,
+    "http://determined.ai/schemas/expconf/v0/registry-auth.json": _complete_expconf_v0_registry_auth,
+    "http://determined.ai/schemas/expconf/v0/reproducibility.json": _complete_expconf_v0_reproducibility,
+    "http://determined.ai/schemas/expconf/v0/resources.json": _complete_expconf_v0_resources,
+    "http://determined.ai/schemas/expconf/v0/s3.json": _complete_expconf_v0_s3,
+    "http://determined.ai/schemas/expconf/v0/searcher-adaptive-asha.json": _complete_expconf_v0_searcher_adaptive_asha,
+    "http://determined.ai/schemas/expconf/v0/searcher-adaptive-simple.json": _complete_expconf_v0_searcher_adaptive_simple,
+    "http://determined.ai/schemas/expconf/v0/searcher-adaptive.json": _complete_expconf_v0_searcher_adaptive,
+    "http://determined.ai/schemas/expconf/v0/searcher-async-halving.json": _complete_expconf_v0_searcher_async_halving,
+    "http://determined.ai/schemas/expconf/v0/searcher-grid.json": _complete_expconf_v0_searcher_grid,
+    "http://determined.ai/schemas/expconf/v0/searcher-pbt.json": _complete_expconf_v0_searcher_pbt,
+    "http://determined.ai/schemas/expconf/v0/searcher-random.json": _complete_expconf_v0_searcher_random,
+    "http://determined.ai/schemas/expconf/v0/searcher-single.json": _complete_expconf_v0_searcher_single,
+    "http://determined.ai/schemas/expconf/v0/searcher-sync-halving.json": _complete_expconf_v0_searcher_sync_halving,
+    "http://determined.ai/schemas/expconf/v0/searcher.json": _complete_expconf_v0_searcher,
+    "http://determined.ai/schemas/expconf/v0/security.json": _complete_expconf_v0_security,
+    "http://determined.ai/schemas/expconf/v0/shared-fs.json": _complete_expconf_v0_shared_fs,
+    "http://determined.ai/schemas/expconf/v0/tensorboard-storage.json": _complete_expconf_v0_tensorboard_storage,
+    "http://determined.ai/schemas/expconf/v0/test-root.json": _complete_expconf_v0_test_root,
+    "http://determined.ai/schemas/expconf/v0/test-sub.json": _complete_expconf_v0_test_sub,
+    "http://determined.ai/schemas/expconf/v0/test-union-a.json": _complete_expconf_v0_test_union_a,
+    "http://determined.ai/schemas/expconf/v0/test-union-b.json": _complete_expconf_v0_test_union_b,
+    "http://determined.ai/schemas/expconf/v0/test-union.json": _complete_expconf_v0_test_union,
+}  # type: Dict[str, Callable[[Any], bool]]
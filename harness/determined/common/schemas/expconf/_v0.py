@@ -25,6 +25,7 @@ class ResourcesConfigV0(schemas.SchemaBase):
     _id = "http://determined.ai/schemas/expconf/v0/resources.json"
     agent_label: Optional[str] = None
     devices: Optional[List[DeviceV0]] = None
+    distributed_backend: Optional[str] = None
     max_slots: Optional[int] = None
     native_parallel: Optional[bool] = None
     priority: Optional[int] = None
@@ -38,6 +39,7 @@ class ResourcesConfigV0(schemas.SchemaBase):
         self,
         agent_label: Optional[str] = None,
         devices: Optional[List[DeviceV0]] = None,
+        distributed_backend: Optional[str] = None,
         max_slots: Optional[int] = None,
         native_parallel: Optional[bool] = None,
         priority: Optional[int] = None,
@@ -56,6 +58,9 @@ class OptimizationsConfigV0(schemas.SchemaBase):
     average_aggregated_gradients: Optional[bool] = None
     average_training_metrics: Optional[bool] = None
     gradient_compression: Optional[bool] = None
+    gradient_compression_method: Optional[str] = None
+    gradient_compression_rank: Optional[int] = None
+    gradient_compression_topk_ratio: Optional[float] = None
     grad_updates_size_file: Optional[str] = None
     mixed_precision: Optional[str] = None
     tensor_fusion_cycle_time: Optional[int] = None
@@ -69,6 +74,9 @@ class OptimizationsConfigV0(schemas.SchemaBase):
         average_aggregated_gradients: Optional[bool] = None,
         average_training_metrics: Optional[bool] = None,
         gradient_compression: Optional[bool] = None,
+        gradient_compression_method: Optional[str] = None,
+        gradient_compression_rank: Optional[int] = None,
+        gradient_compression_topk_ratio: Optional[float] = None,
         grad_updates_size_file: Optional[str] = None,
         mixed_precision: Optional[str] = None,
         tensor_fusion_cycle_time: Optional[int] = None,
@@ -116,6 +124,9 @@ class ProfilingConfigV0(schemas.SchemaBase):
     enabled: Optional[bool] = None
     begin_on_batch: Optional[int] = None
     end_after_batch: Optional[int] = None
+    continuous: Optional[bool] = None
+    sample_every_n_batches: Optional[int] = None
+    max_samples_per_series: Optional[int] = None
 
     @schemas.auto_init
     def __init__(
@@ -123,6 +134,9 @@ class ProfilingConfigV0(schemas.SchemaBase):
         enabled: Optional[bool] = None,
         begin_on_batch: Optional[int] = None,
         end_after_batch: Optional[int] = None,
+        continuous: Optional[bool] = None,
+        sample_every_n_batches: Optional[int] = None,
+        max_samples_per_series: Optional[int] = None,
     ) -> None:
         pass
 
@@ -751,6 +765,7 @@ class SharedFSConfigV0(schemas.SchemaBase):
     host_path: str
     checkpoint_path: Optional[str] = None
     container_path: Optional[str] = None
+    content_addressed: Optional[bool] = None
     propagation: Optional[str] = None
     save_experiment_best: Optional[int] = None
     save_trial_best: Optional[int] = None
@@ -764,6 +779,7 @@ class SharedFSConfigV0(schemas.SchemaBase):
         host_path: str,
         checkpoint_path: Optional[str] = None,
         container_path: Optional[str] = None,
+        content_addressed: Optional[bool] = None,
         propagation: Optional[str] = None,
         save_experiment_best: Optional[int] = None,
         save_trial_best: Optional[int] = None,
@@ -802,7 +818,11 @@ class S3ConfigV0(schemas.SchemaBase):
     _id = "http://determined.ai/schemas/expconf/v0/s3.json"
     bucket: str
     access_key: Optional[str] = None
+    concurrency: Optional[int] = None
+    content_addressed: Optional[bool] = None
     endpoint_url: Optional[str] = None
+    max_retries: Optional[int] = None
+    multipart_chunk_size: Optional[int] = None
     save_experiment_best: Optional[int] = None
     save_trial_best: Optional[int] = None
     save_trial_latest: Optional[int] = None
@@ -813,7 +833,11 @@ class S3ConfigV0(schemas.SchemaBase):
         self,
         bucket: str,
         access_key: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        content_addressed: Optional[bool] = None,
         endpoint_url: Optional[str] = None,
+        max_retries: Optional[int] = None,
+        multipart_chunk_size: Optional[int] = None,
         save_experiment_best: Optional[int] = None,
         save_trial_best: Optional[int] = None,
         save_trial_latest: Optional[int] = None,
@@ -826,6 +850,7 @@ class S3ConfigV0(schemas.SchemaBase):
 class GCSConfigV0(schemas.SchemaBase):
     _id = "http://determined.ai/schemas/expconf/v0/gcs.json"
     bucket: str
+    content_addressed: Optional[bool] = None
     save_experiment_best: Optional[int] = None
     save_trial_best: Optional[int] = None
     save_trial_latest: Optional[int] = None
@@ -834,6 +859,7 @@ class GCSConfigV0(schemas.SchemaBase):
     def __init__(
         self,
         bucket: str,
+        content_addressed: Optional[bool] = None,
         save_experiment_best: Optional[int] = None,
         save_trial_best: Optional[int] = None,
         save_trial_latest: Optional[int] = None,
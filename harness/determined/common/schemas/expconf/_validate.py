@@ -1,23 +1,43 @@
 from typing import Any, Dict, List, Optional
 
-import jsonschema
+from determined.common.schemas import util
+from determined.common.schemas.expconf import _gen, _gen_validators
 
-from determined.common.schemas import extensions, util
-from determined.common.schemas.expconf import _gen
+# Use the experiment config schema by default.
+DEFAULT_URL = "http://determined.ai/schemas/expconf/v1/experiment.json"
 
+_validator_classes = {}  # type: Dict[str, Any]
 _validators = {"sanity": {}, "completeness": {}}  # type: Dict[str, Any]
 
 
 def make_validator(url: Optional[str] = None, complete: Optional[bool] = False) -> Any:
-    # Use the experiment config schema by default.
     if url is None:
-        url = "http://determined.ai/schemas/expconf/v1/experiment.json"
+        url = DEFAULT_URL
 
     global _validators
     key = "completeness" if complete else "sanity"
     if url in _validators[key]:
         return _validators[key][url]
 
+    # jsonschema is slow to import, and it is only needed to report the errors of invalid configs.
+    import jsonschema
+
+    from determined.common.schemas import extensions
+
+    if key not in _validator_classes:
+        ext = {
+            "disallowProperties": extensions.disallowProperties,
+            "union": extensions.union,
+            "checks": extensions.checks,
+            "compareProperties": extensions.compareProperties,
+            "conditional": extensions.conditional,
+            "optionalRef": extensions.optionalRef,
+        }
+        if complete:
+            ext["eventuallyRequired"] = extensions.eventuallyRequired
+            ext["eventually"] = extensions.eventually
+        _validator_classes[key] = jsonschema.validators.extend(jsonschema.Draft7Validator, ext)
+
     schema = _gen.schemas[url]
 
     resolver = jsonschema.RefResolver(
@@ -26,31 +46,38 @@ def make_validator(url: Optional[str] = None, complete: Optional[bool] = False)
         handlers={"http": lambda url: _gen.schemas[url]},
     )
 
-    validator = jsonschema.Draft7Validator(schema=schema, resolver=resolver)
-    ext = {
-        "disallowProperties": extensions.disallowProperties,
-        "union": extensions.union,
-        "checks": extensions.checks,
-        "compareProperties": extensions.compareProperties,
-        "conditional": extensions.conditional,
-        "optionalRef": extensions.optionalRef,
-    }
-    if complete:
-        ext["eventuallyRequired"] = extensions.eventuallyRequired
-        ext["eventually"] = extensions.eventually
-
-    cls = jsonschema.validators.extend(validator, ext)
-    _validators[key][url] = cls(schema=schema, resolver=resolver)
+    _validators[key][url] = _validator_classes[key](schema=schema, resolver=resolver)
 
     return _validators[key][url]
 
 
+def _is_valid(instance: Any, url: Optional[str], complete: bool) -> bool:
+    """
+    Check an instance with the validators which schemas/gen.py compiles into python.  They agree
+    with jsonschema on which instances are valid but cannot say why, so an instance they reject is
+    validated again with jsonschema to report its errors.
+    """
+    compiled = _gen_validators.completeness if complete else _gen_validators.sanity
+    is_valid = compiled.get(url or DEFAULT_URL)
+    if is_valid is None:
+        return False
+    try:
+        return is_valid(instance)
+    except Exception:
+        # Leave it to jsonschema to fail on the instance however it does.
+        return False
+
+
 def sanity_validation_errors(instance: Any, url: Optional[str] = None) -> List[str]:
+    if _is_valid(instance, url, complete=False):
+        return []
     validator = make_validator(url)
     return _validate(instance, validator)
 
 
 def completeness_validation_errors(instance: Any, url: Optional[str] = None) -> List[str]:
+    if _is_valid(instance, url, complete=True):
+        return []
     validator = make_validator(url, complete=True)
     return _validate(instance, validator)
 
@@ -1,4 +1,5 @@
-from typing import Any, List
+import json
+from typing import Any, Dict, Iterator, List, Mapping
 
 
 def _path_string(json_path: str) -> str:
@@ -12,3 +13,26 @@ def _fmt_msg(e: Any) -> str:
 
 def format_validation_errors(errors: List) -> List[str]:
     return sorted(_fmt_msg(e) for e in errors)
+
+
+class LazySchemas(Mapping[str, Any]):
+    """
+    A read-only mapping of urls to json schemas, which parses each schema from its text the first
+    time that it is used.
+    """
+
+    def __init__(self, texts: Dict[str, str]) -> None:
+        self._texts = texts
+        self._parsed = {}  # type: Dict[str, Any]
+
+    def __getitem__(self, url: str) -> Any:
+        schema = self._parsed.get(url)
+        if schema is None:
+            schema = self._parsed[url] = json.loads(self._texts[url])
+        return schema
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._texts)
+
+    def __len__(self) -> int:
+        return len(self._texts)
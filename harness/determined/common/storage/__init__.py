@@ -1,34 +1,61 @@
 import copy
+import importlib
 import os
+import sys
 import uuid
-from typing import Any, Dict, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
 from determined.common.check import check_eq, check_in, check_type
 
-from .base import StorageManager, StorageMetadata
-from .azure import AzureStorageManager
-from .gcs import GCSStorageManager
-from .hdfs import HDFSStorageManager
-from .s3 import S3StorageManager
+from .base import ObjectStore, StorageManager, StorageMetadata
+from .cache import CheckpointCache, cached_restore_path
+from .cas import ContentAddressedStorageManager
 from .shared import SharedFSStorageManager
 
 __all__ = [
     "AzureStorageManager",
+    "CheckpointCache",
+    "ContentAddressedStorageManager",
     "GCSStorageManager",
+    "ObjectStore",
     "StorageManager",
     "StorageMetadata",
     "S3StorageManager",
     "SharedFSStorageManager",
 ]
 
+# The managers of cloud storage import the SDK of their provider, which is slow, so their modules
+# are only imported once they are used, e.g. by build() or by accessing storage.S3StorageManager.
+_LAZY_MANAGERS = {
+    "AzureStorageManager": ".azure",
+    "GCSStorageManager": ".gcs",
+    "HDFSStorageManager": ".hdfs",
+    "S3StorageManager": ".s3",
+}
+
+if TYPE_CHECKING or sys.version_info < (3, 7):
+    # Module __getattr__ is new in Python 3.7.
+    from .azure import AzureStorageManager
+    from .gcs import GCSStorageManager
+    from .hdfs import HDFSStorageManager
+    from .s3 import S3StorageManager
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_MANAGERS:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    manager = getattr(importlib.import_module(_LAZY_MANAGERS[name], __name__), name)
+    globals()[name] = manager
+    return manager
+
 
 _STORAGE_MANAGERS = {
-    "azure": AzureStorageManager,
-    "gcs": GCSStorageManager,
-    "s3": S3StorageManager,
-    "shared_fs": SharedFSStorageManager,
-    "hdfs": HDFSStorageManager,
-}  # type: Dict[str, Type[StorageManager]]
+    "azure": "AzureStorageManager",
+    "gcs": "GCSStorageManager",
+    "s3": "S3StorageManager",
+    "shared_fs": "SharedFSStorageManager",
+    "hdfs": "HDFSStorageManager",
+}  # type: Dict[str, str]
 
 
 def build(config: Dict[str, Any], container_path: Optional[str]) -> StorageManager:
@@ -46,9 +73,10 @@ def build(config: Dict[str, Any], container_path: Optional[str]) -> StorageManag
     check_type(identifier, str, "`type` parameter of storage configuration must be a string")
 
     try:
-        subclass = _STORAGE_MANAGERS[identifier]
+        subclass_name = _STORAGE_MANAGERS[identifier]
     except KeyError:
         raise TypeError("Unknown storage type: {}".format(identifier))
+    subclass = getattr(sys.modules[__name__], subclass_name)  # type: Type[StorageManager]
 
     # Remove configurations that should not be directly passed to
     # subclasses. Keeping these would result in the subclass __init__()
@@ -56,6 +84,12 @@ def build(config: Dict[str, Any], container_path: Optional[str]) -> StorageManag
     config.pop("save_experiment_best", None)
     config.pop("save_trial_best", None)
     config.pop("save_trial_latest", None)
+    content_addressed = config.pop("content_addressed", False)
+    # Content-addressed storage is built on the object access methods of ObjectStore.
+    if content_addressed and not issubclass(subclass, ObjectStore):
+        raise ValueError(
+            "content_addressed is not supported for {} checkpoint storage".format(identifier)
+        )
 
     # For shared_fs maintain backwards compatibility by folding old keys into
     # storage_path.
@@ -77,12 +111,16 @@ def build(config: Dict[str, Any], container_path: Optional[str]) -> StorageManag
     config.pop("checkpoint_path", None)
 
     try:
-        return subclass.from_config(config, container_path)
+        manager = subclass.from_config(config, container_path)
     except TypeError as e:
         raise TypeError(
             "Failed to instantiate {} checkpoint storage: {}".format(identifier, str(e))
         )
 
+    if content_addressed:
+        return ContentAddressedStorageManager(manager, concurrency=config.get("concurrency") or 1)
+    return manager
+
 
 def validate_manager(manager: StorageManager) -> None:
     """
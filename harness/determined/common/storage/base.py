@@ -3,7 +3,7 @@ import contextlib
 import os
 import shutil
 import uuid
-from typing import Any, Dict, Iterator, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from determined.common.check import check_gt, check_not_none, check_true, check_type
 
@@ -165,3 +165,32 @@ class StorageManager:
                 result[rel_path] = os.path.getsize(abs_path)
 
         return result
+
+
+class ObjectStore(metaclass=abc.ABCMeta):
+    """
+    Mixin for storage managers that give direct access to individual objects in persistent storage,
+    by key relative to the root of the storage. ContentAddressedStorageManager is built on these
+    methods, and may call them from several threads at once.
+    """
+
+    @abc.abstractmethod
+    def _upload_object(self, key: str, data: bytes) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _download_object(self, key: str) -> bytes:
+        pass
+
+    @abc.abstractmethod
+    def _object_exists(self, key: str) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def _list_objects(self, prefix: str) -> List[str]:
+        pass
+
+    @abc.abstractmethod
+    def _delete_objects(self, keys: List[str]) -> None:
+        """Delete objects by key, ignoring keys that do not exist."""
+        pass
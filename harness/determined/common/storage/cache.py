@@ -0,0 +1,326 @@
+import contextlib
+import fcntl
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from typing import IO, Any, Callable, Iterator, List, Optional, Tuple
+
+from determined.common import check
+from determined.common.storage.base import StorageManager, StorageMetadata
+from determined.common.storage.cas import ContentAddressedStorageManager
+from determined.common.storage.shared import SharedFSStorageManager
+
+# The checkpoint cache is only enabled if this points to a directory. To share the cache between
+# the containers of an agent, it should be a bind mount of the same directory on the host.
+CACHE_DIR_ENV_VAR = "DET_CHECKPOINT_CACHE_DIR"
+CACHE_MAX_BYTES_ENV_VAR = "DET_CHECKPOINT_CACHE_MAX_BYTES"
+DEFAULT_CACHE_MAX_BYTES = 20 * 1024 * 1024 * 1024
+
+# A function that tries to copy a checkpoint into the given directory from somewhere other than
+# checkpoint storage, such as another machine, and returns whether it succeeded.
+FetchFnType = Callable[[str], bool]
+
+
+def _is_linked(f: IO[Any], path: str) -> bool:
+    """Return True if the open file f is still the file at path."""
+    try:
+        return os.fstat(f.fileno()).st_ino == os.stat(path).st_ino
+    except FileNotFoundError:
+        return False
+
+
+def _flock(path: str, operation: int) -> Optional[IO[Any]]:
+    """
+    Open and lock the file at path, creating it if needed. Return None if operation includes
+    LOCK_NB and the lock is held elsewhere.
+
+    The lock files of entries are unlinked when entries are evicted, so a lock is only returned
+    once it is held on the file that is still linked at path.
+    """
+    while True:
+        f = open(path, "a+")
+        try:
+            fcntl.flock(f, operation)
+        except BlockingIOError:
+            f.close()
+            return None
+        except BaseException:
+            f.close()
+            raise
+        if _is_linked(f, path):
+            return f
+        f.close()
+
+
+def _verify(path: str, metadata: StorageMetadata) -> bool:
+    """Return True if every file of the checkpoint is present at path with the expected size."""
+    for rel_path, size in metadata.resources.items():
+        abs_path = os.path.join(path, rel_path)
+        try:
+            if rel_path.endswith("/"):
+                if not os.path.isdir(abs_path):
+                    return False
+            elif os.stat(abs_path).st_size != size:
+                return False
+        except OSError:
+            return False
+    return os.path.isdir(path)
+
+
+def _directory_size(path: str) -> int:
+    size = 0
+    for cur_path, _, files in os.walk(path):
+        for f in files:
+            try:
+                size += os.lstat(os.path.join(cur_path, f)).st_size
+            except FileNotFoundError:
+                pass
+    return size
+
+
+# The managers which can download a checkpoint directly into a directory. Those of cloud storage
+# are named rather than imported, since importing them is slow; an instance of one can only exist
+# once its module has been imported.
+_DOWNLOADING_MANAGERS = [
+    ("determined.common.storage.s3", "S3StorageManager"),
+    ("determined.common.storage.gcs", "GCSStorageManager"),
+    ("determined.common.storage.azure", "AzureStorageManager"),
+]
+
+
+@contextlib.contextmanager
+def _fetched_restore_path(
+    storage_mgr: StorageManager, metadata: StorageMetadata, fetch: Optional[FetchFnType]
+) -> Iterator[str]:
+    """Like storage_mgr.restore_path(), but try to fetch the checkpoint first."""
+    if fetch is not None:
+        with tempfile.TemporaryDirectory() as path:
+            if fetch(path):
+                yield path
+                return
+    with storage_mgr.restore_path(metadata) as path:
+        yield path
+
+
+def _downloads_directly(storage_mgr: StorageManager) -> bool:
+    if isinstance(storage_mgr, ContentAddressedStorageManager):
+        return True
+    for module_name, class_name in _DOWNLOADING_MANAGERS:
+        module = sys.modules.get(module_name)
+        if module is not None and isinstance(storage_mgr, getattr(module, class_name)):
+            return True
+    return False
+
+
+class CheckpointCache:
+    """
+    A node-local cache of restored checkpoints, keyed by storage ID and bounded in size by evicting
+    the least recently used checkpoints.
+
+    Several processes, including those of different containers, may use the same cache directory
+    at once; they coordinate with flock(2) locks on files in that directory:
+
+        <root>/.lock                 held while evicting checkpoints
+        <root>/entries/<uuid>/       the files of a cached checkpoint
+        <root>/entries/<uuid>.lock   shared while the checkpoint is in use, exclusive while it is
+                                     being downloaded or evicted; its mtime is its last use
+        <root>/staging/<uuid>/       a checkpoint that is being downloaded
+
+    Cached checkpoints are checked against the file sizes in StorageMetadata.resources every time
+    they are used, and downloaded again if they do not match. Callers must not modify them.
+    """
+
+    def __init__(self, root: str, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        check.gt(max_bytes, 0, "max_bytes must be positive")
+        self.root = root
+        self.max_bytes = max_bytes
+        self._entries_dir = os.path.join(root, "entries")
+        self._staging_dir = os.path.join(root, "staging")
+        # Like StorageManager.store_path(), allow containers of any owner to share the cache.
+        old_umask = os.umask(0)
+        try:
+            os.makedirs(self._entries_dir, exist_ok=True, mode=0o777)
+            os.makedirs(self._staging_dir, exist_ok=True, mode=0o777)
+        finally:
+            os.umask(old_umask)
+
+    @staticmethod
+    def from_env() -> Optional["CheckpointCache"]:
+        """Return the cache configured by environment variables, or None if it is not enabled."""
+        root = os.environ.get(CACHE_DIR_ENV_VAR)
+        if not root:
+            return None
+        max_bytes = int(os.environ.get(CACHE_MAX_BYTES_ENV_VAR) or DEFAULT_CACHE_MAX_BYTES)
+        try:
+            return CheckpointCache(root, max_bytes)
+        except OSError as e:
+            logging.warning("Not using the checkpoint cache at {}: {}".format(root, e))
+            return None
+
+    @staticmethod
+    def is_cacheable(storage_mgr: StorageManager) -> bool:
+        # Checkpoints on a shared file system are already local, unless they are split into
+        # content-addressed chunks.
+        return not isinstance(storage_mgr, SharedFSStorageManager)
+
+    def _entry_paths(self, storage_id: str) -> Tuple[str, str]:
+        check.true(
+            bool(storage_id) and os.sep not in storage_id and not storage_id.startswith("."),
+            "Invalid storage ID: {}".format(storage_id),
+        )
+        entry = os.path.join(self._entries_dir, storage_id)
+        return entry, entry + ".lock"
+
+    @contextlib.contextmanager
+    def restore_path(
+        self,
+        storage_mgr: StorageManager,
+        metadata: StorageMetadata,
+        fetch: Optional[FetchFnType] = None,
+    ) -> Iterator[str]:
+        """
+        Like storage_mgr.restore_path(), but yield the path of a cached copy of the checkpoint,
+        downloading it into the cache first if it is not cached already. If fetch is given, it is
+        tried before downloading the checkpoint from storage_mgr.
+        """
+        size = sum(metadata.resources.values())
+        if not self.is_cacheable(storage_mgr) or size > self.max_bytes:
+            with _fetched_restore_path(storage_mgr, metadata, fetch) as path:
+                yield path
+            return
+
+        entry, lock_path = self._entry_paths(metadata.storage_id)
+        while True:
+            lock = _flock(lock_path, fcntl.LOCK_SH)
+            assert lock is not None
+            with lock:
+                if not _verify(entry, metadata):
+                    # Converting the lock is not atomic, so the entry is checked again afterwards.
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                    if not _is_linked(lock, lock_path):
+                        continue
+                    if not _verify(entry, metadata):
+                        self._download(storage_mgr, metadata, entry, fetch)
+                        self._evict(keep=metadata.storage_id, incoming=size)
+                    fcntl.flock(lock, fcntl.LOCK_SH)
+                    if not _is_linked(lock, lock_path) or not _verify(entry, metadata):
+                        continue
+                else:
+                    logging.info("Using cached checkpoint {}".format(metadata.storage_id))
+                os.utime(lock_path)
+                yield entry
+                return
+
+    def download(
+        self, storage_mgr: StorageManager, metadata: StorageMetadata, storage_dir: str
+    ) -> None:
+        """Copy the checkpoint into storage_dir, through the cache."""
+        with self.restore_path(storage_mgr, metadata) as path:
+            for rel_path in metadata.resources:
+                abs_path = os.path.join(storage_dir, rel_path)
+                if rel_path.endswith("/"):
+                    os.makedirs(abs_path, exist_ok=True)
+                    continue
+                os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+                shutil.copy2(os.path.join(path, rel_path), abs_path)
+
+    def _download(
+        self,
+        storage_mgr: StorageManager,
+        metadata: StorageMetadata,
+        entry: str,
+        fetch: Optional[FetchFnType] = None,
+    ) -> None:
+        """Download the checkpoint into entry. The caller must hold the entry's exclusive lock."""
+        # Only the holder of the exclusive lock writes to the staging directory of an entry, so
+        # anything there was left behind by a process that died.
+        staging = os.path.join(self._staging_dir, metadata.storage_id)
+        shutil.rmtree(staging, ignore_errors=True)
+        shutil.rmtree(entry, ignore_errors=True)
+        os.makedirs(staging)
+        try:
+            if fetch is not None and fetch(staging) and _verify(staging, metadata):
+                os.rename(staging, entry)
+                return
+            shutil.rmtree(staging)
+            os.makedirs(staging)
+            logging.info("Downloading checkpoint {} into the cache".format(metadata.storage_id))
+            if _downloads_directly(storage_mgr):
+                storage_mgr.download(metadata, staging)  # type: ignore
+            else:
+                with storage_mgr.restore_path(metadata) as path:
+                    shutil.rmtree(staging)
+                    shutil.copytree(path, staging, symlinks=True)
+            check.true(
+                _verify(staging, metadata),
+                "Downloaded checkpoint {} does not match its metadata".format(metadata.storage_id),
+            )
+            os.rename(staging, entry)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    def _entries(self) -> List[Tuple[float, str]]:
+        """Return the (last use, storage ID) of cached checkpoints, least recently used first."""
+        entries = []  # type: List[Tuple[float, str]]
+        for name in os.listdir(self._entries_dir):
+            if name.endswith(".lock"):
+                continue
+            try:
+                last_use = os.stat(os.path.join(self._entries_dir, name + ".lock")).st_mtime
+            except FileNotFoundError:
+                last_use = 0.0
+            entries.append((last_use, name))
+        return sorted(entries)
+
+    def _evict(self, keep: str, incoming: int = 0) -> None:
+        """
+        Delete the least recently used checkpoints that are not in use, other than keep, until the
+        cache is within max_bytes.
+        """
+        lock = _flock(os.path.join(self.root, ".lock"), fcntl.LOCK_EX)
+        assert lock is not None
+        with lock:
+            entries = self._entries()
+            sizes = {
+                name: _directory_size(os.path.join(self._entries_dir, name))
+                for _, name in entries
+                if name != keep
+            }
+            total = sum(sizes.values()) + incoming
+            for _, name in entries:
+                if total <= self.max_bytes:
+                    break
+                if name == keep:
+                    continue
+                entry, lock_path = self._entry_paths(name)
+                entry_lock = _flock(lock_path, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                if entry_lock is None:
+                    # The checkpoint is in use.
+                    continue
+                with entry_lock:
+                    logging.info("Evicting checkpoint {} from the cache".format(name))
+                    shutil.rmtree(entry, ignore_errors=True)
+                    os.unlink(lock_path)
+                total -= sizes[name]
+
+
+@contextlib.contextmanager
+def cached_restore_path(
+    storage_mgr: StorageManager,
+    metadata: StorageMetadata,
+    fetch: Optional[FetchFnType] = None,
+) -> Iterator[str]:
+    """
+    Like storage_mgr.restore_path(), through the checkpoint cache if it is enabled. If fetch is
+    given, it is tried before restoring the checkpoint from storage_mgr.
+    """
+    checkpoint_cache = CheckpointCache.from_env()
+    if checkpoint_cache is None:
+        with _fetched_restore_path(storage_mgr, metadata, fetch) as path:
+            yield path
+    else:
+        with checkpoint_cache.restore_path(storage_mgr, metadata, fetch) as path:
+            yield path
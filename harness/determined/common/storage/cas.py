@@ -0,0 +1,299 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Tuple, cast
+
+from determined.common import check, util
+from determined.common.storage import transfer
+from determined.common.storage.base import ObjectStore, StorageManager, StorageMetadata
+from determined.common.storage.shared import SharedFSStorageManager
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+MANIFEST_VERSION = 1
+
+
+def _manifest_key(storage_id: str) -> str:
+    return "cas/manifests/{}.json".format(storage_id)
+
+
+def _chunk_key(digest: str) -> str:
+    return "cas/chunks/{}/{}".format(digest[:2], digest)
+
+
+def _refs_prefix(digest: str) -> str:
+    return "cas/refs/{}/".format(digest)
+
+
+def _ref_key(digest: str, storage_id: str) -> str:
+    return _refs_prefix(digest) + storage_id
+
+
+class ContentAddressedStorageManager(StorageManager):
+    """
+    Store checkpoints in a content-addressed layout on top of another storage manager.
+
+    Every checkpoint file is split into fixed-size chunks, and each chunk is stored once under the
+    SHA-256 digest of its contents. Chunks that are shared between checkpoints, such as the copied
+    model code or the weights of frozen layers, are only uploaded and stored once. A checkpoint is
+    a manifest that lists the chunks of each of its files:
+
+        cas/manifests/<storage_id>.json
+        cas/chunks/<digest[:2]>/<digest>
+        cas/refs/<digest>/<storage_id>
+
+    Chunks are reference counted with one empty marker object per chunk and checkpoint, rather than
+    with a shared counter, so that concurrent writers never read-modify-write shared state. A chunk
+    is deleted along with the last checkpoint that references it. Checkpoints that were saved
+    before content-addressed storage was enabled have no manifest, and are restored and deleted by
+    the underlying storage manager as usual.
+
+    The backend must be an ObjectStore.
+    """
+
+    def __init__(
+        self, backend: StorageManager, chunk_size: int = DEFAULT_CHUNK_SIZE, concurrency: int = 1
+    ) -> None:
+        if not isinstance(backend, ObjectStore):
+            raise ValueError(
+                "{} does not support content-addressed storage".format(type(backend).__name__)
+            )
+        # Checkpoints are staged in the local directory the backend would use, except that the
+        # base path of shared_fs storage is the shared storage itself.
+        if isinstance(backend, SharedFSStorageManager):
+            super().__init__(tempfile.gettempdir())
+        else:
+            super().__init__(backend._base_path)
+        check.gt(chunk_size, 0, "chunk_size must be positive")
+        self.backend = backend
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+
+    def post_store_path(self, storage_id: str, storage_dir: str, metadata: StorageMetadata) -> None:
+        """post_store_path stores new chunks and the manifest, then deletes the local files."""
+        try:
+            logging.info("Storing content-addressed checkpoint {}".format(storage_id))
+            self.upload(metadata, storage_dir)
+        finally:
+            self._remove_checkpoint_directory(storage_id)
+
+    @contextlib.contextmanager
+    def restore_path(self, metadata: StorageMetadata) -> Iterator[str]:
+        if not self.backend._object_exists(_manifest_key(metadata.storage_id)):
+            with self.backend.restore_path(metadata) as path:
+                yield path
+            return
+
+        # Restore into a unique directory so that concurrent restores of the same checkpoint do
+        # not collide.
+        os.makedirs(self._base_path, exist_ok=True)
+        storage_dir = tempfile.mkdtemp(prefix="restore-", dir=self._base_path)
+        try:
+            logging.info("Restoring content-addressed checkpoint {}".format(metadata.storage_id))
+            self.download(metadata, storage_dir)
+            yield storage_dir
+        finally:
+            shutil.rmtree(storage_dir, ignore_errors=True)
+
+    @util.preserve_random_state
+    def upload(self, metadata: StorageMetadata, storage_dir: str) -> transfer.TransferStats:
+        """
+        Store the chunks of the checkpoint in storage_dir that are not already stored, followed by
+        its manifest. Return stats about the chunks that were actually uploaded.
+        """
+        files = {}  # type: Dict[str, List[str]]
+        # Where to read each distinct chunk from: (rel_path, offset, length).
+        chunks = {}  # type: Dict[str, Tuple[str, int, int]]
+        for rel_path in sorted(metadata.resources):
+            if rel_path.endswith("/"):
+                continue
+            digests = []  # type: List[str]
+            with open(os.path.join(storage_dir, rel_path), "rb") as f:
+                offset = 0
+                while True:
+                    data = f.read(self.chunk_size)
+                    if not data:
+                        break
+                    digest = hashlib.sha256(data).hexdigest()
+                    digests.append(digest)
+                    chunks.setdefault(digest, (rel_path, offset, len(data)))
+                    offset += len(data)
+            files[rel_path] = digests
+
+        uploaded = {}  # type: Dict[str, int]
+        lock = threading.Lock()
+
+        def _store_chunk(digest: str) -> None:
+            # Add the reference before checking whether the chunk exists, so that a concurrent
+            # delete() of another checkpoint sharing the chunk either sees the reference and keeps
+            # the chunk, removes it before the check below so that it is uploaded again, or sees
+            # the reference once it has removed the chunk and puts it back.
+            self.backend._upload_object(_ref_key(digest, metadata.storage_id), b"")
+            if self.backend._object_exists(_chunk_key(digest)):
+                return
+
+            rel_path, offset, length = chunks[digest]
+            with open(os.path.join(storage_dir, rel_path), "rb") as f:
+                f.seek(offset)
+                data = f.read(length)
+            self.backend._upload_object(_chunk_key(digest), data)
+            with lock:
+                uploaded[digest] = length
+
+        start = time.time()
+        stats = transfer.parallel_transfer(
+            _store_chunk,
+            {digest: length for digest, (_, _, length) in chunks.items()},
+            concurrency=self.concurrency,
+        )
+
+        # Write the manifest last, so that a checkpoint is never visible before all of its chunks.
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "chunk_size": self.chunk_size,
+            "resources": metadata.resources,
+            "files": files,
+        }
+        self.backend._upload_object(
+            _manifest_key(metadata.storage_id), json.dumps(manifest).encode("utf-8")
+        )
+
+        stats = transfer.TransferStats(
+            num_files=len(uploaded),
+            num_bytes=sum(uploaded.values()),
+            seconds=time.time() - start,
+            retries=stats.retries,
+        )
+        logging.info(
+            "Stored checkpoint {}: {} of {} chunks ({} of {}) were new, in {:.2f}s".format(
+                metadata.storage_id,
+                len(uploaded),
+                len(chunks),
+                util.sizeof_fmt(stats.num_bytes),
+                util.sizeof_fmt(sum(metadata.resources.values())),
+                stats.seconds,
+            )
+        )
+        return stats
+
+    @util.preserve_random_state
+    def download(self, metadata: StorageMetadata, storage_dir: str) -> transfer.TransferStats:
+        """
+        Reassemble the checkpoint into storage_dir, verifying the digest of every chunk.
+        """
+        manifest_key = _manifest_key(metadata.storage_id)
+        if not self.backend._object_exists(manifest_key):
+            return self._download_legacy(metadata, storage_dir)
+
+        manifest = self._read_manifest(metadata.storage_id)
+        resources = manifest["resources"]  # type: Dict[str, int]
+        files = manifest["files"]  # type: Dict[str, List[str]]
+
+        for rel_path in resources:
+            os.makedirs(os.path.dirname(os.path.join(storage_dir, rel_path)), exist_ok=True)
+
+        def _restore_file(rel_path: str) -> None:
+            with open(os.path.join(storage_dir, rel_path), "wb") as f:
+                for digest in files[rel_path]:
+                    data = self.backend._download_object(_chunk_key(digest))
+                    check.eq(
+                        hashlib.sha256(data).hexdigest(),
+                        digest,
+                        "Chunk {} of checkpoint {} is corrupt".format(digest, metadata.storage_id),
+                    )
+                    f.write(data)
+
+        stats = transfer.parallel_transfer(
+            _restore_file,
+            {rel_path: resources[rel_path] for rel_path in files},
+            concurrency=self.concurrency,
+        )
+        logging.info("Restored checkpoint {}: {}".format(metadata.storage_id, stats))
+        return stats
+
+    @util.preserve_random_state
+    def delete(self, metadata: StorageMetadata) -> None:
+        """
+        Delete the checkpoint's manifest and references, and every chunk it referenced that no
+        other checkpoint still references.
+        """
+        manifest_key = _manifest_key(metadata.storage_id)
+        if not self.backend._object_exists(manifest_key):
+            self.backend.delete(metadata)
+            return
+
+        manifest = self._read_manifest(metadata.storage_id)
+        digests = sorted({d for file_digests in manifest["files"].values() for d in file_digests})
+
+        # Delete the manifest last, so that a delete that is interrupted part-way through can simply
+        # be run again.
+        self.backend._delete_objects([_ref_key(d, metadata.storage_id) for d in digests])
+
+        freed = []  # type: List[str]
+        lock = threading.Lock()
+
+        def _free_chunk(digest: str) -> None:
+            if self.backend._list_objects(_refs_prefix(digest)):
+                return
+            key = _chunk_key(digest)
+            if not self.backend._object_exists(key):
+                return
+            # An upload of another checkpoint may reference the chunk after the listing above, and
+            # skip uploading it because it still exists. Such a reference is visible once the chunk
+            # has been deleted, so check again and put the chunk back if it was referenced.
+            data = self.backend._download_object(key)
+            self.backend._delete_objects([key])
+            if self.backend._list_objects(_refs_prefix(digest)):
+                self.backend._upload_object(key, data)
+                return
+            with lock:
+                freed.append(digest)
+
+        # A retry could not put back a chunk that a failed attempt had already deleted.
+        transfer.parallel_transfer(
+            _free_chunk,
+            {digest: 0 for digest in digests},
+            concurrency=self.concurrency,
+            max_retries=0,
+        )
+        self.backend._delete_objects([manifest_key])
+
+        logging.info(
+            "Deleted checkpoint {}: freed {} of its {} chunks".format(
+                metadata.storage_id, len(freed), len(digests)
+            )
+        )
+
+    def _read_manifest(self, storage_id: str) -> Dict[str, Any]:
+        manifest = json.loads(self.backend._download_object(_manifest_key(storage_id)))
+        check.eq(
+            manifest.get("version"),
+            MANIFEST_VERSION,
+            "Unsupported manifest version for checkpoint {}".format(storage_id),
+        )
+        return cast(Dict[str, Any], manifest)
+
+    def _download_legacy(
+        self, metadata: StorageMetadata, storage_dir: str
+    ) -> transfer.TransferStats:
+        """Copy a checkpoint that was not stored content-addressed into storage_dir."""
+        start = time.time()
+        with self.backend.restore_path(metadata) as path:
+            for rel_path in metadata.resources:
+                dst = os.path.join(storage_dir, rel_path)
+                if rel_path.endswith("/"):
+                    os.makedirs(dst, exist_ok=True)
+                    continue
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                shutil.copyfile(os.path.join(path, rel_path), dst)
+        return transfer.TransferStats(
+            num_files=len([p for p in metadata.resources if not p.endswith("/")]),
+            num_bytes=sum(metadata.resources.values()),
+            seconds=time.time() - start,
+            retries=0,
+        )
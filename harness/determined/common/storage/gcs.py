@@ -2,7 +2,7 @@ import contextlib
 import logging
 import os
 import tempfile
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional, cast
 
 import google.api_core.exceptions
 import requests.exceptions
@@ -11,7 +11,7 @@ from google.api_core import retry
 from google.cloud import storage
 
 from determined.common import util
-from determined.common.storage.base import StorageManager, StorageMetadata
+from determined.common.storage.base import ObjectStore, StorageManager, StorageMetadata
 
 retry_network_errors = retry.Retry(
     retry.if_exception_type(
@@ -23,7 +23,7 @@ retry_network_errors = retry.Retry(
 )
 
 
-class GCSStorageManager(StorageManager):
+class GCSStorageManager(StorageManager, ObjectStore):
     """
     Store and load checkpoints on GCS. Although GCS is similar to S3, some
     S3 APIs are not supported on GCS and vice versa. Moreover, Google
@@ -112,3 +112,22 @@ class GCSStorageManager(StorageManager):
             blob_name = "{}/{}".format(metadata.storage_id, rel_path)
             blob = self.bucket.blob(blob_name)
             blob.delete()
+
+    def _upload_object(self, key: str, data: bytes) -> None:
+        retry_network_errors(self.bucket.blob(key).upload_from_string)(data)
+
+    def _download_object(self, key: str) -> bytes:
+        return cast(bytes, retry_network_errors(self.bucket.blob(key).download_as_string)())
+
+    def _object_exists(self, key: str) -> bool:
+        return cast(bool, retry_network_errors(self.bucket.blob(key).exists)())
+
+    def _list_objects(self, prefix: str) -> List[str]:
+        return [blob.name for blob in self.bucket.list_blobs(prefix=prefix)]
+
+    def _delete_objects(self, keys: List[str]) -> None:
+        for key in keys:
+            try:
+                self.bucket.blob(key).delete()
+            except google.api_core.exceptions.NotFound:
+                pass
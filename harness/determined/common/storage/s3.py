@@ -2,18 +2,40 @@ import contextlib
 import logging
 import os
 import tempfile
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional, cast
 
 import boto3
+import botocore.config
+import botocore.exceptions
 import requests
+from boto3.s3.transfer import TransferConfig
 
 from determined.common import util
-from determined.common.storage.base import StorageManager, StorageMetadata
+from determined.common.storage import transfer
+from determined.common.storage.base import ObjectStore, StorageManager, StorageMetadata
 
+# Errors that are worth retrying at the level of a whole file, after boto3's own per-request
+# retries have been exhausted.
+_RETRYABLE_ERRORS = (
+    ConnectionError,
+    botocore.exceptions.ConnectionError,
+    botocore.exceptions.HTTPClientError,
+)
 
-class S3StorageManager(StorageManager):
+# The number of parts of each multipart transfer that are transferred at once. Files are already
+# transferred concurrently, so this is kept small to bound the total number of requests.
+_MULTIPART_CONCURRENCY = 4
+
+
+class S3StorageManager(StorageManager, ObjectStore):
     """
     Store and load checkpoints from S3.
+
+    Files are transferred concurrently by a pool of up to ``concurrency`` threads, and files
+    larger than ``multipart_chunk_size`` bytes are split into multipart transfers of that size,
+    which transfer a few parts of each file at once.
+    Failed transfers of individual files are retried up to ``max_retries`` times with exponential
+    backoff.
     """
 
     def __init__(
@@ -23,14 +45,28 @@ class S3StorageManager(StorageManager):
         secret_key: Optional[str] = None,
         endpoint_url: Optional[str] = None,
         temp_dir: Optional[str] = None,
+        concurrency: int = 8,
+        multipart_chunk_size: int = 64 * 1024 * 1024,
+        max_retries: int = 3,
     ) -> None:
         super().__init__(temp_dir if temp_dir is not None else tempfile.gettempdir())
         self.bucket = bucket
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_chunk_size,
+            multipart_chunksize=multipart_chunk_size,
+            max_concurrency=_MULTIPART_CONCURRENCY,
+        )
         self.client = boto3.client(
             "s3",
             endpoint_url=endpoint_url,
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
+            # Every part of every file that is being transferred needs its own connection.
+            config=botocore.config.Config(
+                max_pool_connections=max(10, concurrency * _MULTIPART_CONCURRENCY)
+            ),
         )
 
         # Detect if we are talking to minio, because boto3 has a client-side bug parsing the output
@@ -70,8 +106,8 @@ class S3StorageManager(StorageManager):
             self._remove_checkpoint_directory(metadata.storage_id)
 
     @util.preserve_random_state
-    def upload(self, metadata: StorageMetadata, storage_dir: str) -> None:
-        for rel_path in metadata.resources.keys():
+    def upload(self, metadata: StorageMetadata, storage_dir: str) -> transfer.TransferStats:
+        def _upload(rel_path: str) -> None:
             key_name = "{}/{}".format(metadata.storage_id, rel_path)
             url = "s3://{}/{}".format(self.bucket, key_name)
 
@@ -91,25 +127,49 @@ class S3StorageManager(StorageManager):
                     pass
             else:
                 abs_path = os.path.join(storage_dir, rel_path)
-                self.client.upload_file(abs_path, self.bucket, key_name)
+                self.client.upload_file(
+                    abs_path, self.bucket, key_name, Config=self.transfer_config
+                )
+
+        stats = transfer.parallel_transfer(
+            _upload,
+            metadata.resources,
+            concurrency=self.concurrency,
+            max_retries=self.max_retries,
+            retry_on=_RETRYABLE_ERRORS,
+        )
+        logging.info("Uploaded checkpoint {} to S3: {}".format(metadata.storage_id, stats))
+        return stats
 
     @util.preserve_random_state
-    def download(self, metadata: StorageMetadata, storage_dir: str) -> None:
+    def download(self, metadata: StorageMetadata, storage_dir: str) -> transfer.TransferStats:
+        # Create every directory up front so that concurrent downloads never race on makedirs.
         for rel_path in metadata.resources.keys():
             abs_path = os.path.join(storage_dir, rel_path)
-
             os.makedirs(os.path.dirname(abs_path), exist_ok=True)
 
+        def _download(rel_path: str) -> None:
             # Only create empty directory for keys that end with "/".
             # See `upload` method for more context.
             if rel_path.endswith("/"):
-                continue
+                return
 
+            abs_path = os.path.join(storage_dir, rel_path)
             key_name = "{}/{}".format(metadata.storage_id, rel_path)
             url = "s3://{}/{}".format(self.bucket, key_name)
             logging.debug("Downloading {} from {}".format(url, rel_path))
 
-            self.client.download_file(self.bucket, key_name, abs_path)
+            self.client.download_file(self.bucket, key_name, abs_path, Config=self.transfer_config)
+
+        stats = transfer.parallel_transfer(
+            _download,
+            metadata.resources,
+            concurrency=self.concurrency,
+            max_retries=self.max_retries,
+            retry_on=_RETRYABLE_ERRORS,
+        )
+        logging.info("Downloaded checkpoint {} from S3: {}".format(metadata.storage_id, stats))
+        return stats
 
     @util.preserve_random_state
     def delete(self, metadata: StorageMetadata) -> None:
@@ -124,3 +184,30 @@ class S3StorageManager(StorageManager):
         for chunk in util.chunks(objects, 1000):
             logging.debug("Deleting {} objects from S3".format(len(chunk)))
             self.client.delete_objects(Bucket=self.bucket, Delete={"Objects": chunk})
+
+    def _upload_object(self, key: str, data: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=data)
+
+    def _download_object(self, key: str) -> bytes:
+        return cast(bytes, self.client.get_object(Bucket=self.bucket, Key=key)["Body"].read())
+
+    def _object_exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+        except botocore.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+    def _list_objects(self, prefix: str) -> List[str]:
+        keys = []  # type: List[str]
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            keys.extend(obj["Key"] for obj in page.get("Contents", []))
+        return keys
+
+    def _delete_objects(self, keys: List[str]) -> None:
+        # S3 delete_objects has a limit of 1000 objects, and ignores keys that do not exist.
+        for chunk in util.chunks([{"Key": key} for key in keys], 1000):
+            self.client.delete_objects(Bucket=self.bucket, Delete={"Objects": chunk})
@@ -1,9 +1,10 @@
 import contextlib
 import os
-from typing import Any, Dict, Iterator, Optional
+import uuid
+from typing import Any, Dict, Iterator, List, Optional
 
 from determined.common import check
-from determined.common.storage.base import StorageManager, StorageMetadata
+from determined.common.storage.base import ObjectStore, StorageManager, StorageMetadata
 
 
 def _full_storage_path(
@@ -29,7 +30,7 @@ def _full_storage_path(
     return os.path.join(host_path if container_path is None else container_path, storage_path)
 
 
-class SharedFSStorageManager(StorageManager):
+class SharedFSStorageManager(StorageManager, ObjectStore):
     """
     Store and load storages from a shared file system. Each agent should
     have this shared file system mounted in the same location defined by the
@@ -65,3 +66,35 @@ class SharedFSStorageManager(StorageManager):
             os.path.isdir(storage_dir), "Checkpoint path is not a directory: {}".format(storage_dir)
         )
         yield storage_dir
+
+    def _upload_object(self, key: str, data: bytes) -> None:
+        path = os.path.join(self._base_path, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a unique temporary name and rename it into place, so that readers never see a
+        # partially written object, even if several containers upload the same key at once.
+        tmp_path = "{}.tmp-{}".format(path, uuid.uuid4())
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _download_object(self, key: str) -> bytes:
+        with open(os.path.join(self._base_path, key), "rb") as f:
+            return f.read()
+
+    def _object_exists(self, key: str) -> bool:
+        return os.path.exists(os.path.join(self._base_path, key))
+
+    def _list_objects(self, prefix: str) -> List[str]:
+        # Keys are grouped into directories, so only prefixes ending in "/" are supported.
+        check.true(prefix.endswith("/"), "prefix must name a directory: {}".format(prefix))
+        try:
+            return [prefix + name for name in os.listdir(os.path.join(self._base_path, prefix))]
+        except FileNotFoundError:
+            return []
+
+    def _delete_objects(self, keys: List[str]) -> None:
+        for key in keys:
+            try:
+                os.remove(os.path.join(self._base_path, key))
+            except FileNotFoundError:
+                pass
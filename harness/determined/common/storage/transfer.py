@@ -0,0 +1,104 @@
+import concurrent.futures
+import logging
+import random
+import time
+from typing import Any, Callable, Dict, Tuple, Type
+
+from determined.common import util
+
+
+class TransferStats:
+    """
+    TransferStats summarizes a batch of file transfers made by parallel_transfer().
+    """
+
+    def __init__(self, num_files: int, num_bytes: int, seconds: float, retries: int) -> None:
+        self.num_files = num_files
+        self.num_bytes = num_bytes
+        self.seconds = seconds
+        self.retries = retries
+
+    @property
+    def bytes_per_second(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.num_bytes / self.seconds
+
+    def __json__(self) -> Dict[str, Any]:
+        return {
+            "num_files": self.num_files,
+            "num_bytes": self.num_bytes,
+            "seconds": self.seconds,
+            "bytes_per_second": self.bytes_per_second,
+            "retries": self.retries,
+        }
+
+    def __str__(self) -> str:
+        return "{} files, {} in {:.2f}s ({}/s, {} retries)".format(
+            self.num_files,
+            util.sizeof_fmt(self.num_bytes),
+            self.seconds,
+            util.sizeof_fmt(self.bytes_per_second),
+            self.retries,
+        )
+
+
+def parallel_transfer(
+    transfer_fn: Callable[[str], None],
+    resources: Dict[str, int],
+    concurrency: int = 8,
+    max_retries: int = 3,
+    max_backoff: float = 32.0,
+    retry_on: Tuple[Type[BaseException], ...] = (ConnectionError,),
+) -> TransferStats:
+    """
+    Call transfer_fn once for every relative path in resources, using a bounded pool of at most
+    concurrency threads.
+
+    Each call that raises one of the retry_on exceptions is retried up to max_retries times with
+    jittered exponential backoff. Any other exception, or a retryable exception once the retries
+    are exhausted, is re-raised after outstanding transfers are cancelled. The resources dict
+    should map paths to sizes in bytes, as in StorageMetadata.resources.
+    """
+    rel_paths = list(resources.keys())
+    retries = 0
+    # Use a private generator for backoff jitter so that transfers, which may run in background
+    # threads, never draw from the global random state that trials rely on for reproducibility.
+    rng = random.Random()
+
+    def _transfer_with_retries(rel_path: str) -> int:
+        for n in range(max_retries + 1):
+            try:
+                transfer_fn(rel_path)
+                return n
+            except retry_on as e:
+                if n == max_retries:
+                    raise
+                delay = min(2 ** n + rng.random(), max_backoff)
+                logging.warning(
+                    "Transfer of {} failed ({}), retrying in {:.1f}s".format(rel_path, e, delay)
+                )
+                time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    start = time.time()
+    if concurrency <= 1 or len(rel_paths) <= 1:
+        for rel_path in rel_paths:
+            retries += _transfer_with_retries(rel_path)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [pool.submit(_transfer_with_retries, p) for p in rel_paths]
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    retries += future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    return TransferStats(
+        num_files=len([p for p in rel_paths if not p.endswith("/")]),
+        num_bytes=sum(resources.values()),
+        seconds=time.time() - start,
+        retries=retries,
+    )
@@ -5,6 +5,7 @@ import pathlib
 import platform
 import random
 import sys
+import threading
 from typing import IO, Any, Callable, Iterator, Sequence, TypeVar, Union, overload
 
 from determined.common import yaml
@@ -53,10 +54,17 @@ def debug_mode() -> bool:
 
 
 def preserve_random_state(fn: Callable) -> Callable:
-    """A decorator to run a function with a fork of the random state."""
+    """
+    A decorator to run a function with a fork of the random state.
+
+    Outside of the main thread this is a noop: restoring the state from a background thread would
+    rewind whatever the main thread drew from the random module in the meantime.
+    """
 
     @functools.wraps(fn)
     def wrapped(*arg: Any, **kwarg: Any) -> Any:
+        if threading.current_thread() is not threading.main_thread():
+            return fn(*arg, **kwarg)
         state = random.getstate()
         try:
             return fn(*arg, **kwarg)
@@ -47,6 +47,21 @@ HOROVOD_GLOO_RENDEZVOUS_PORT = 12355
 INTER_TRAIN_PROCESS_COMM_PORT_1 = 12360
 INTER_TRAIN_PROCESS_COMM_PORT_2 = INTER_TRAIN_PROCESS_COMM_PORT_1 + MAX_SLOTS_PER_AGENT
 
+# Port on which the chief machine serves a restored checkpoint to the other machines of a trial.
+CHECKPOINT_FANOUT_PORT = INTER_TRAIN_PROCESS_COMM_PORT_2 + MAX_SLOTS_PER_AGENT
+
+# Port on which the chief machine serves the torch.distributed rendezvous of the training processes
+# of a trial, when the trial uses the torch distributed backend instead of Horovod.
+TORCH_DISTRIBUTED_PORT = CHECKPOINT_FANOUT_PORT + MAX_SLOTS_PER_AGENT
+
+# How many seconds the other machines wait for the chief to download a checkpoint before
+# downloading it themselves. They give up sooner if the chief does not answer them within
+# CHECKPOINT_FANOUT_HEARTBEAT_TIMEOUT_SECONDS, either while it downloads or during the transfer.
+CHECKPOINT_FANOUT_DOWNLOAD_TIMEOUT_SECONDS = 3600
+CHECKPOINT_FANOUT_HEARTBEAT_TIMEOUT_SECONDS = 30
+# How many seconds the chief keeps serving a checkpoint while no machine requests any of it.
+CHECKPOINT_FANOUT_TIMEOUT_SECONDS = 300
+
 # Default trial runner interface. For distributed training this
 # specifies that the network interface must be auto-detected.
 AUTO_DETECT_TRIAL_RUNNER_NETWORK_INTERFACE = "DET_AUTO_DETECT_NETWORK_INTERFACE"
@@ -63,6 +78,14 @@ HOROVOD_AUTOTUNE_LOG_FILEPATH = "/tmp/autotune_log.csv"
 # large number of machines.
 HOROVOD_GLOO_TIMEOUT_SECONDS = 240
 
+# How many lines per second, and how many lines in a burst, each stream of a training process may
+# log before further lines are dropped by worker_process_wrapper. A rate of 0, the default, disables
+# the limit, so no output is dropped unless a limit is requested.
+# They can be overridden with the DET_WORKER_LOG_RATE_LIMIT and DET_WORKER_LOG_BURST environment
+# variables, and DET_WORKER_LOG_FORMAT=json makes the wrapper log one JSON object per line.
+WORKER_LOG_RATE_LIMIT_LINES_PER_SECOND = 0
+WORKER_LOG_BURST_LINES = 20000
+
 # The well-known locations of the executing container's STDOUT and STDERR.
 CONTAINER_STDOUT = "/run/determined/train/logs/stdout.log"
 CONTAINER_STDERR = "/run/determined/train/logs/stderr.log"
@@ -20,6 +20,9 @@ def delete_checkpoints(
     Delete some of the checkpoints associated with a single
     experiment. `to_delete` is a list of two-element dicts,
     {"uuid": str, "resources": List[str]}.
+
+    With content-addressed checkpoint storage, the chunks of a deleted
+    checkpoint are only deleted once no other checkpoint references them.
     """
     logging.info("Deleting {} checkpoints".format(len(to_delete)))
 
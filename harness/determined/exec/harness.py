@@ -37,7 +37,8 @@ import simplejson
 
 import determined as det
 import determined.common
-from determined import gpu, horovod, layers, load, workload
+from determined import constants as harness_constants
+from determined import gpu, horovod, ipc, layers, load, workload
 from determined.common import constants, storage
 from determined.common.api import certs
 
@@ -64,21 +65,77 @@ ENVIRONMENT_VARIABLE_KEYS = {
 
 @contextlib.contextmanager
 def maybe_load_checkpoint(
-    storage_mgr: storage.StorageManager, checkpoint: Optional[Dict[str, Any]]
+    storage_mgr: storage.StorageManager,
+    checkpoint: Optional[Dict[str, Any]],
+    rendezvous_info: Optional[det.RendezvousInfo] = None,
+    fanout_port: Optional[int] = None,
 ) -> Iterator[Optional[pathlib.Path]]:
     """
     Either wrap a storage_mgr.restore_path() context manager, or be a noop
-    context manager if there is no checkpoint to load.
+    context manager if there is no checkpoint to load. Checkpoints are restored through the
+    node-local checkpoint cache if it is enabled (see storage.CheckpointCache).
+
+    If a fanout_port is given and the trial spans several machines, only the chief machine
+    restores the checkpoint from storage_mgr, and then serves it to the other machines on that
+    port. The other machines fall back to restoring it themselves if the chief does not serve it,
+    or stops answering for CHECKPOINT_FANOUT_HEARTBEAT_TIMEOUT_SECONDS.
     """
 
     if checkpoint is None:
         yield None
+        return
+
+    metadata = storage.StorageMetadata.from_json(checkpoint)
+    logging.info("Restoring trial from checkpoint {}".format(metadata.storage_id))
+
+    if fanout_port is None or rendezvous_info is None or rendezvous_info.get_size() == 1:
+        with storage.cached_restore_path(storage_mgr, metadata) as path:
+            yield pathlib.Path(path)
+
+    elif rendezvous_info.get_rank() == 0:
+        num_peers = rendezvous_info.get_size() - 1
+        with contextlib.ExitStack() as restore_stack:
+            with ipc.ZMQFileServer(metadata.resources, fanout_port) as server:
+                # Tell the peers that the chief is alive while it restores the checkpoint.
+                with server.preparing():
+                    path = restore_stack.enter_context(
+                        storage.cached_restore_path(storage_mgr, metadata)
+                    )
+                logging.info(f"Serving checkpoint {metadata.storage_id} to {num_peers} peers")
+                server.serve(
+                    path, num_peers, timeout=harness_constants.CHECKPOINT_FANOUT_TIMEOUT_SECONDS
+                )
+            yield pathlib.Path(path)
 
     else:
-        metadata = storage.StorageMetadata.from_json(checkpoint)
-        logging.info("Restoring trial from checkpoint {}".format(metadata.storage_id))
+        chief_ip_address = rendezvous_info.get_ip_addresses()[0]
+        with contextlib.ExitStack() as restore_stack:
+            with ipc.ZMQFileClient(chief_ip_address, fanout_port) as client:
+
+                def receive_from_chief(dest: str) -> bool:
+                    received = client.receive(
+                        dest,
+                        metadata.resources,
+                        wait_timeout=harness_constants.CHECKPOINT_FANOUT_DOWNLOAD_TIMEOUT_SECONDS,
+                        timeout=harness_constants.CHECKPOINT_FANOUT_HEARTBEAT_TIMEOUT_SECONDS,
+                    )
+                    if received:
+                        logging.info(f"Received checkpoint {metadata.storage_id} from the chief")
+                    else:
+                        logging.warning(
+                            f"Did not receive checkpoint {metadata.storage_id} from the chief, "
+                            "restoring it from checkpoint storage instead"
+                        )
+                    return received
 
-        with storage_mgr.restore_path(metadata) as path:
+                # Checkpoints are received into the node-local checkpoint cache, if it is enabled.
+                path = restore_stack.enter_context(
+                    storage.cached_restore_path(storage_mgr, metadata, fetch=receive_from_chief)
+                )
+                # The chief need not wait for a machine that had the checkpoint cached already.
+                client.decline(
+                    timeout=harness_constants.CHECKPOINT_FANOUT_HEARTBEAT_TIMEOUT_SECONDS
+                )
             yield pathlib.Path(path)
 
 
@@ -126,8 +183,16 @@ def build_and_run_training_pipeline(env: det.EnvContext) -> None:
         logging.info(f"Horovod config: {hvd_config.__dict__}.")
 
         # Load the checkpoint, if necessary. Any possible sinks to this pipeline will need access
-        # to this checkpoint.
-        with maybe_load_checkpoint(storage_mgr, env.latest_checkpoint) as load_path:
+        # to this checkpoint. Unless every machine can read it from a shared filesystem, only the
+        # chief machine downloads it and then copies it to the other machines.
+        fanout_port = None
+        if env.experiment_config["checkpoint_storage"]["type"] != "shared_fs":
+            fanout_port = (
+                harness_constants.CHECKPOINT_FANOUT_PORT + env.det_trial_unique_port_offset
+            )
+        with maybe_load_checkpoint(
+            storage_mgr, env.latest_checkpoint, socket_mgr.get_rendezvous_info(), fanout_port
+        ) as load_path:
 
             # Horovod distributed training is done inside subprocesses.
             if hvd_config.use:
@@ -185,6 +250,7 @@ def main() -> None:
     det_trial_unique_port_offset = int(os.environ["DET_TRIAL_UNIQUE_PORT_OFFSET"])
     det_trial_runner_network_interface = os.environ["DET_TRIAL_RUNNER_NETWORK_INTERFACE"]
     det_trial_id = os.environ["DET_TRIAL_ID"]
+    det_trial_run_id = int(os.environ["DET_TRIAL_RUN_ID"])
     det_experiment_id = os.environ["DET_EXPERIMENT_ID"]
     det_agent_id = os.environ["DET_AGENT_ID"]
     det_cluster_id = os.environ["DET_CLUSTER_ID"]
@@ -213,6 +279,7 @@ def main() -> None:
         det_trial_unique_port_offset,
         det_trial_runner_network_interface,
         det_trial_id,
+        det_trial_run_id,
         det_experiment_id,
         det_agent_id,
         det_cluster_id,
@@ -1,21 +1,156 @@
 """
-worker_process_wrapper.py is the entrypoint for Horovod worker processes.
+worker_process_wrapper.py is the entrypoint for Horovod and torch.distributed worker processes.
 It exists to redirect stdout/stderr to the docker logging without needing
 to package a shell script.
+
+Output is read in large chunks rather than line by line, and all the complete lines of a chunk are
+written with a single vectored write. Each stream is forwarded by its own thread to its own file,
+so no locking is needed. Floods of output can be rate-limited: lines beyond the limit are dropped
+and counted, and a line reporting how many were dropped is written once output is accepted again.
+
+Environment variables:
+    DET_WORKER_LOG_FORMAT: "text" (the default) prefixes every line with the rank of the worker;
+        "json" writes one JSON object per line, with the rank, stream, timestamp and log line.
+    DET_WORKER_LOG_RATE_LIMIT: the average number of lines per second forwarded per stream. The
+        default of 0 forwards every line.
+    DET_WORKER_LOG_BURST: the number of lines which may be forwarded at once before the rate limit
+        applies.
 """
+import json
 import os
 import subprocess
 import sys
 import threading
-from typing import BinaryIO, List
+import time
+from typing import BinaryIO, List, Optional
 
 from determined import constants
 
+# How many bytes to read from a stream at once, and the longest line that is forwarded whole;
+# longer lines are split.
+READ_SIZE = 1 << 16
+MAX_LINE_SIZE = 1 << 20
+# How many buffers to pass to one vectored write.
+MAX_WRITE_BUFFERS = 512
+
+
+class RateLimiter:
+    """A token bucket allowing rate lines per second on average, in bursts of up to burst lines."""
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = self.burst
+        self.last = time.monotonic()
+
+    def take(self, num_lines: int) -> int:
+        """Return how many of num_lines may be forwarded now."""
+        if self.rate <= 0:
+            return num_lines
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        allowed = min(num_lines, int(self.tokens))
+        self.tokens -= allowed
+        return allowed
+
+
+class LineFormatter:
+    def __init__(self, rank: Optional[str], stream_name: str, log_format: str) -> None:
+        self.rank = rank
+        self.stream_name = stream_name
+        self.json = log_format == "json"
+        self.prefix = f"[rank={rank}] ".encode()
+
+    def format(self, line: bytes) -> List[bytes]:
+        if not self.json:
+            return [self.prefix, line]
+        record = {
+            "rank": None if self.rank is None else int(self.rank),
+            "stream": self.stream_name,
+            "timestamp": time.time(),
+            "log": line.rstrip(b"\n").decode("utf-8", errors="replace"),
+        }
+        return [json.dumps(record).encode() + b"\n"]
+
+    def format_dropped(self, num_dropped: int) -> List[bytes]:
+        message = f"{num_dropped} lines of output were dropped by the log rate limit.\n"
+        return self.format(message.encode())
+
 
-def forward_stream(src_stream: BinaryIO, dst_stream: BinaryIO, rank: str) -> None:
-    for line in iter(src_stream.readline, b""):
-        line = f"[rank={rank}] ".encode() + line
-        os.write(dst_stream.fileno(), line)
+def write_all(fd: int, buffers: List[bytes]) -> None:
+    """Write every buffer to fd, with as few system calls as possible."""
+    while buffers:
+        chunk = buffers[:MAX_WRITE_BUFFERS]
+        if hasattr(os, "writev"):
+            written = os.writev(fd, chunk)
+        else:
+            written = os.write(fd, b"".join(chunk))
+        # Drop whatever was written; a short write leaves the rest of a buffer to retry.
+        consumed = 0
+        while consumed < len(chunk) and written >= len(chunk[consumed]):
+            written -= len(chunk[consumed])
+            consumed += 1
+        remaining = buffers[consumed:]
+        if written and remaining:
+            remaining[0] = remaining[0][written:]
+        buffers = remaining
+
+
+class ForwardingStats:
+    def __init__(self) -> None:
+        self.lines_forwarded = 0
+        self.lines_dropped = 0
+        self.writes = 0
+
+
+def forward_stream(
+    src_stream: BinaryIO,
+    dst_stream: BinaryIO,
+    rank: Optional[str],
+    stream_name: str = "stdout",
+    log_format: str = "text",
+    limiter: Optional[RateLimiter] = None,
+    stats: Optional[ForwardingStats] = None,
+) -> None:
+    formatter = LineFormatter(rank, stream_name, log_format)
+    stats = stats or ForwardingStats()
+    src_fd, dst_fd = src_stream.fileno(), dst_stream.fileno()
+    pending = b""
+    unreported_drops = 0
+
+    while True:
+        data = os.read(src_fd, READ_SIZE)
+        if data:
+            parts = (pending + data).split(b"\n")
+            # The last part is the start of a line which has not been completed yet.
+            pending = parts.pop()
+            lines = [part + b"\n" for part in parts]
+            if len(pending) >= MAX_LINE_SIZE:
+                lines.append(pending + b"\n")
+                pending = b""
+        else:
+            # The process closed the stream; forward any final line without a newline.
+            lines = [pending] if pending else []
+
+        allowed = limiter.take(len(lines)) if limiter is not None else len(lines)
+        buffers = []  # type: List[bytes]
+        if unreported_drops and allowed:
+            buffers.extend(formatter.format_dropped(unreported_drops))
+            unreported_drops = 0
+        for line in lines[:allowed]:
+            buffers.extend(formatter.format(line))
+        stats.lines_forwarded += allowed
+        stats.lines_dropped += len(lines) - allowed
+        unreported_drops += len(lines) - allowed
+        if not data and unreported_drops:
+            buffers.extend(formatter.format_dropped(unreported_drops))
+        if buffers:
+            write_all(dst_fd, buffers)
+            stats.writes += 1
+
+        if not data:
+            return
 
 
 def run_all(ts: List[threading.Thread]) -> None:
@@ -26,7 +161,16 @@ def run_all(ts: List[threading.Thread]) -> None:
 
 
 def main() -> int:
-    rank = os.environ.get("HOROVOD_RANK")
+    # Horovod sets HOROVOD_RANK; the SubprocessLauncher sets RANK for torch.distributed.
+    rank = os.environ.get("HOROVOD_RANK", os.environ.get("RANK"))
+    log_format = os.environ.get("DET_WORKER_LOG_FORMAT", "text")
+    rate = float(
+        os.environ.get(
+            "DET_WORKER_LOG_RATE_LIMIT", constants.WORKER_LOG_RATE_LIMIT_LINES_PER_SECOND
+        )
+    )
+    burst = float(os.environ.get("DET_WORKER_LOG_BURST", constants.WORKER_LOG_BURST_LINES))
+
     proc = subprocess.Popen(
         [
             sys.executable,
@@ -42,8 +186,28 @@ def main() -> int:
     ) as cstderr, proc:
         run_all(
             [
-                threading.Thread(target=forward_stream, args=(proc.stdout, cstdout, rank)),
-                threading.Thread(target=forward_stream, args=(proc.stderr, cstderr, rank)),
+                threading.Thread(
+                    target=forward_stream,
+                    args=(
+                        proc.stdout,
+                        cstdout,
+                        rank,
+                        "stdout",
+                        log_format,
+                        RateLimiter(rate, burst),
+                    ),
+                ),
+                threading.Thread(
+                    target=forward_stream,
+                    args=(
+                        proc.stderr,
+                        cstderr,
+                        rank,
+                        "stderr",
+                        log_format,
+                        RateLimiter(rate, burst),
+                    ),
+                ),
             ]
         )
 
@@ -21,6 +21,10 @@ class _PolyHorovod:
 
     After require_horovod_type() is called once, horovod is imported, and _PolyHorovod passes all
     other calls to the real horovod module.
+
+    The "torch.distributed" type stands in for horovod.torch when a trial uses the torch
+    distributed backend: it imports determined.pytorch._torch_distributed, which implements the
+    parts of the horovod.torch API that Determined uses on top of torch.distributed.
     """
 
     def __init__(self) -> None:
@@ -37,7 +41,7 @@ class _PolyHorovod:
         time but with a different type.
         """
 
-        known_types = {"tensorflow", "tensorflow.keras", "torch"}
+        known_types = {"tensorflow", "tensorflow.keras", "torch", "torch.distributed"}
         check.is_in(horovod_type, known_types, "Unknown horovod type requested.")
 
         if self._poly_hvd_type is not None:
@@ -53,6 +57,11 @@ class _PolyHorovod:
             self._poly_hvd_type = horovod_type
             self._poly_hvd_first_reason = reason
             # If horovod has not been imported yet, do it now.
+            if horovod_type == "torch.distributed":
+                self._poly_hvd_module = importlib.import_module(
+                    "determined.pytorch._torch_distributed"
+                )
+                return
             try:
                 self._poly_hvd_module = importlib.import_module(f"horovod.{horovod_type}")
             except ImportError:
@@ -172,6 +181,10 @@ class HorovodContext:
         grad_updates_size_file: str,
         average_aggregated_gradients: bool,
         average_training_metrics: bool,
+        gradient_compression_method: Optional[str] = None,
+        gradient_compression_rank: int = 4,
+        gradient_compression_topk_ratio: float = 0.01,
+        backend: str = "horovod",
     ) -> None:
         self.use = use
         self.aggregation_frequency = aggregation_frequency
@@ -179,6 +192,12 @@ class HorovodContext:
         self.grad_updates_size_file = grad_updates_size_file
         self.average_aggregated_gradients = average_aggregated_gradients
         self.average_training_metrics = average_training_metrics
+        self.gradient_compression_method = gradient_compression_method
+        self.gradient_compression_rank = gradient_compression_rank
+        self.gradient_compression_topk_ratio = gradient_compression_topk_ratio
+        # Which library trains the processes of a distributed trial: "horovod" (launched with
+        # horovodrun over sshd) or "torch" (torch.distributed, launched on every machine).
+        self.backend = backend
 
     @staticmethod
     def from_configs(
@@ -229,10 +248,16 @@ class HorovodContext:
             error_message_removed_from_hparams("grad_updates_size_file"),
         )
 
+        # Setting a compression method enables gradient compression; `gradient_compression` alone
+        # selects fp16 compression, as it did before methods could be chosen.
+        compression_method = optimizations_config.get("gradient_compression_method")
+        if compression_method is None and optimizations_config.get("gradient_compression"):
+            compression_method = "fp16"
+
         hvd_config = HorovodContext(
             use=use_horovod,
             aggregation_frequency=cast(int, optimizations_config.get("aggregation_frequency")),
-            fp16_compression=cast(bool, optimizations_config.get("gradient_compression")),
+            fp16_compression=compression_method == "fp16",
             grad_updates_size_file=optimizations_config.get("grad_updates_size_file", None),
             average_aggregated_gradients=cast(
                 bool, optimizations_config.get("average_aggregated_gradients")
@@ -240,6 +265,14 @@ class HorovodContext:
             average_training_metrics=cast(
                 bool, optimizations_config.get("average_training_metrics")
             ),
+            gradient_compression_method=compression_method,
+            gradient_compression_rank=cast(
+                int, optimizations_config.get("gradient_compression_rank", 4)
+            ),
+            gradient_compression_topk_ratio=cast(
+                float, optimizations_config.get("gradient_compression_topk_ratio", 0.01)
+            ),
+            backend=experiment_config.distributed_backend(),
         )
 
         if hvd_config.use and hvd_config.aggregation_frequency > 1:
@@ -248,7 +281,13 @@ class HorovodContext:
                 "to optimize training."
             )
 
-        if hvd_config.use and hvd_config.fp16_compression:
-            logging.info("Enabling `gradient_compression` to optimize training.")
+        if hvd_config.use and hvd_config.gradient_compression_method is not None:
+            logging.info(
+                f"Enabling `gradient_compression` with method "
+                f"{hvd_config.gradient_compression_method} to optimize training."
+            )
+
+        if hvd_config.use and hvd_config.backend != "horovod":
+            logging.info(f"Using the {hvd_config.backend} distributed backend instead of Horovod.")
 
         return hvd_config
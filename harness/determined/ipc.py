@@ -1,5 +1,11 @@
+import contextlib
+import logging
+import os
+import pickle
+import struct
+import threading
 import time
-from typing import Any, Callable, List, Optional, Tuple, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
 
 import zmq
 from zmq.error import ZMQBindError, ZMQError
@@ -49,6 +55,66 @@ class _ExceptionMessage:
     pass
 
 
+class _FileChunkRequest:
+    """
+    _FileChunkRequest is sent by a ZMQFileClient to ask for the bytes of a file starting at offset.
+    A request with rel_path=None indicates that the client has received every file.
+    """
+
+    def __init__(self, rel_path: Optional[str], offset: int = 0) -> None:
+        self.rel_path = rel_path
+        self.offset = offset
+
+
+class _ReadyRequest:
+    """
+    _ReadyRequest is sent by a ZMQFileClient to ask whether the ZMQFileServer is ready to serve
+    the files. The server replies _READY or _NOT_READY.
+    """
+
+    pass
+
+
+_READY = b"ready"
+_NOT_READY = b"not ready"
+
+
+def _send_framed(socket: zmq.Socket, obj: Any, copy: bool) -> None:
+    """
+    Send obj as a small pickled header frame followed by one frame for each out-of-band buffer
+    (such as the data of a NumPy array), so that large buffers are never copied into or out of
+    the pickle stream. With copy=False, ZMQ also sends the buffers without copying them, so they
+    must not be modified until the message has been received.
+    """
+    if pickle.HIGHEST_PROTOCOL < 5:
+        # Out-of-band buffers require pickle protocol 5 (Python 3.8+).
+        frames = [pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)]  # type: List[Any]
+    else:
+        buffers = []  # type: List[pickle.PickleBuffer]
+        frames = [pickle.dumps(obj, protocol=5, buffer_callback=buffers.append), *buffers]
+    socket.send_multipart(frames, copy=copy)
+
+
+# An empty response from a ZMQBroadcastClient is sent as a single frame of this tag followed by
+# its serial number, rather than as a pickled _SerialMessage. Pickles never start with this byte.
+_EMPTY_RESPONSE_TAG = b"e"
+_EMPTY_RESPONSE_FORMAT = "<cq"
+
+
+def _recv_framed(socket: zmq.Socket) -> Any:
+    """
+    Receive an object sent by _send_framed(). Out-of-band buffers are unpickled in place, backed by
+    the memory of the received frames.
+    """
+    frames = socket.recv_multipart(copy=False)
+    if len(frames) == 1 and bytes(frames[0].buffer[:1]) == _EMPTY_RESPONSE_TAG:
+        _, serial = struct.unpack(_EMPTY_RESPONSE_FORMAT, frames[0].buffer)
+        return _SerialMessage(serial, None)
+    if len(frames) == 1:
+        return pickle.loads(frames[0].buffer)
+    return pickle.loads(frames[0].buffer, buffers=[frame.buffer for frame in frames[1:]])
+
+
 class ZMQBroadcastServer:
     """
     Similar to ZMQServer except with broadcast/gather semantics on exactly two ports.
@@ -77,6 +143,13 @@ class ZMQBroadcastServer:
     See ZMQ documentation for a related discussion on PUB-SUB sockets:
     http://zguide.zeromq.org/page:all#Getting-the-Message-Out (look for "one more important thing")
     http://zguide.zeromq.org/page:all#Node-Coordination
+
+    Messages are sent as multipart ZMQ messages with _send_framed(), so that NumPy arrays are
+    neither pickled nor unpickled by copy. Empty responses are sent as a few bytes instead.
+
+    gather_with_polling() can return as soon as the message it is waiting for has arrived; the
+    other messages answering the same broadcast must then be gathered by another call before the
+    next broadcast, which lets the caller process the first message in the meantime.
     """
 
     def __init__(
@@ -101,6 +174,8 @@ class ZMQBroadcastServer:
 
         self._send_serial = 0
         self._recv_serial = 0
+        # How many messages answering the latest broadcast have been gathered so far.
+        self._num_gathered = 0
 
     def __enter__(self) -> "ZMQBroadcastServer":
         return self
@@ -123,38 +198,56 @@ class ZMQBroadcastServer:
         Broadcast a message object to each connection.
         """
 
-        self._pub_socket.send_pyobj(_SerialMessage(self._send_serial, obj))
+        # Broadcasts are not acknowledged, so the caller could modify the buffers of obj while they
+        # are still being sent; ZMQ copies them to prevent that.
+        _send_framed(self._pub_socket, _SerialMessage(self._send_serial, obj), copy=True)
         self._send_serial += 1
 
-    def gather_with_polling(self, health_check: Callable[[], None]) -> Tuple[List[Any], bool]:
+    def gather_with_polling(
+        self, health_check: Callable[[], None], until: Optional[Callable[[Any], bool]] = None
+    ) -> Tuple[List[Any], bool]:
         """
         Gather a response message from each connection, with a health_check callback that can raise
         an error if something goes wrong. Returns list of messages and whether any of the senders
         indicate an exception.
+
+        If until is set, return as soon as a message for which until(message) is true has been
+        gathered. The remaining messages must be gathered by calling gather_with_polling() again
+        before the next broadcast (see has_pending_messages()).
         """
         messages = []  # type: List[Any]
-        while len(messages) < self._num_connections:
+        while self._num_gathered < self._num_connections:
             if self._pull_socket.poll(1000) == 0:
                 # Call the polling function (probably check if a subprocess is alive).
                 health_check()
                 continue
 
             message, message_type = self._recv_one()
+            self._num_gathered += 1
             messages.append(message)
 
             if message_type is _ExceptionMessage:
                 return messages, True
 
-        self._recv_serial += 1
+            if until is not None and until(message):
+                break
+
+        if self._num_gathered == self._num_connections:
+            self._recv_serial += 1
+            self._num_gathered = 0
 
         return messages, False
 
+    def has_pending_messages(self) -> bool:
+        """Return True if some messages answering the latest broadcast have not been gathered."""
+        return self._num_gathered > 0
+
     def _recv_one(self) -> Tuple[Any, type]:
         """
         Receive one _SerialMessage from the socket and confirm that it is in-order.
         """
 
-        obj = self._pull_socket.recv_pyobj()
+        obj = _recv_framed(self._pull_socket)
 
         if isinstance(obj, _ExceptionMessage):
             return None, _ExceptionMessage
@@ -192,17 +285,31 @@ class ZMQBroadcastClient:
         self._push_socket.close()
 
     def send(self, obj: Any) -> None:
+        """
+        Send a message object to the server. The buffers of NumPy arrays in obj are sent without
+        being copied, so they must not be modified until the server's next broadcast is received
+        (by which time the server has gathered this message).
+        """
         message = _SerialMessage(self._send_serial, obj)
         self._send_serial += 1
-        self._push_socket.send_pyobj(message)
+        _send_framed(self._push_socket, message, copy=False)
+
+    def send_empty(self) -> None:
+        """
+        Send an empty message to the server, which receives it as None. Unlike send(None), this
+        does not pickle anything.
+        """
+        message = struct.pack(_EMPTY_RESPONSE_FORMAT, _EMPTY_RESPONSE_TAG, self._send_serial)
+        self._send_serial += 1
+        self._push_socket.send(message)
 
     def send_exception_message(self) -> None:
         message = _ExceptionMessage()
-        self._push_socket.send_pyobj(message)
+        _send_framed(self._push_socket, message, copy=False)
 
     def recv(self) -> Any:
 
-        obj = self._sub_socket.recv_pyobj()
+        obj = _recv_framed(self._sub_socket)
 
         if isinstance(obj, _SerialMessage):
             check.eq(obj.serial, self._recv_serial, "Out-of-order server message detected")
@@ -375,3 +482,197 @@ class ZMQClient:
 
     def close(self) -> None:
         self.socket.close()
+
+
+class ZMQFileServer:
+    """
+    ZMQFileServer serves the files of a local directory to ZMQFileClients in chunks, so that a
+    directory downloaded once (e.g., a checkpoint restored by the chief) can be copied to the
+    other machines of a trial without each of them downloading it from persistent storage.
+
+    Only the files listed in resources (in the format of StorageMetadata.resources) are served.
+    The server binds its port as soon as it is created, so that it can tell clients that it is
+    still preparing the files (see preparing()) instead of leaving them to guess whether it died.
+    """
+
+    def __init__(
+        self,
+        resources: Dict[str, int],
+        port: int,
+        chunk_size: int = 16 * 1024 * 1024,
+    ) -> None:
+        self._resources = resources
+        self._chunk_size = chunk_size
+        self._num_done = 0
+        self._context = zmq.Context()  # type: ignore
+        self._socket = self._context.socket(zmq.REP)
+        self._socket.setsockopt(zmq.LINGER, 0)
+        try:
+            self._socket.bind(f"tcp://*:{port}")
+        except ZMQError as e:
+            self.close()
+            raise det.errors.InternalException(f"Failed to bind to port {port}.") from e
+
+    def __enter__(self) -> "ZMQFileServer":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._socket.close()
+        # Terminate the context so that the port is released before this returns.
+        self._context.term()
+
+    @contextlib.contextmanager
+    def preparing(self) -> Iterator[None]:
+        """
+        Reply to clients that the files are not ready from a background thread until the context
+        exits, e.g. while they are being downloaded.
+        """
+        stop = threading.Event()
+        thread = threading.Thread(target=self._reply_not_ready, args=(stop,), daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _reply_not_ready(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            if self._socket.poll(100) == 0:
+                continue
+            request = self._socket.recv_pyobj()
+            if isinstance(request, _FileChunkRequest) and request.rel_path is None:
+                # A client that does not need the files may finish before they are ready.
+                self._num_done += 1
+                self._socket.send(b"")
+            else:
+                self._socket.send(_NOT_READY)
+
+    def serve(self, root: str, num_clients: int, timeout: int) -> int:
+        """
+        Serve the files in root until num_clients clients have received every file or declined
+        them, or until no request arrives for timeout seconds. Returns the number of clients that
+        did so.
+        """
+        files = {}  # type: Dict[str, Any]
+        try:
+            while self._num_done < num_clients:
+                if self._socket.poll(timeout * 1000) == 0:
+                    logging.warning(
+                        f"Only {self._num_done} of {num_clients} peers received the files before "
+                        f"timing out after {timeout} seconds."
+                    )
+                    break
+                request = self._socket.recv_pyobj()
+                if isinstance(request, _ReadyRequest):
+                    self._socket.send(_READY)
+                    continue
+                check.is_instance(request, _FileChunkRequest)
+                if request.rel_path is None:
+                    self._num_done += 1
+                    self._socket.send(b"")
+                    continue
+                if request.rel_path not in self._resources or request.rel_path.endswith("/"):
+                    raise AssertionError(f"Request for unexpected file {request.rel_path}")
+                f = files.get(request.rel_path)
+                if f is None:
+                    f = open(os.path.join(root, request.rel_path), "rb")
+                    files[request.rel_path] = f
+                f.seek(request.offset)
+                self._socket.send(f.read(self._chunk_size), copy=False)
+        finally:
+            for f in files.values():
+                f.close()
+        return self._num_done
+
+
+class ZMQFileClient:
+    """
+    ZMQFileClient receives the files served by a ZMQFileServer into a local directory.
+    """
+
+    # How many seconds to wait between asking a server that is preparing the files if it is ready.
+    READY_POLL_INTERVAL = 1.0
+
+    def __init__(self, ip_address: str, port: int) -> None:
+        self._finished = False
+        self._context = zmq.Context()  # type: ignore
+        self._socket = self._context.socket(zmq.REQ)
+        self._socket.setsockopt(zmq.LINGER, 0)
+        self._socket.connect(f"tcp://{ip_address}:{port}")
+
+    def __enter__(self) -> "ZMQFileClient":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._socket.close()
+        self._context.term()
+
+    def _request(self, request: Any, timeout: int) -> Optional[zmq.Frame]:
+        self._socket.send_pyobj(request)
+        if self._socket.poll(timeout * 1000) == 0:
+            return None
+        return self._socket.recv(copy=False)
+
+    def _wait_until_ready(self, wait_timeout: int, timeout: int) -> bool:
+        deadline = time.time() + wait_timeout
+        while True:
+            reply = self._request(_ReadyRequest(), timeout)
+            if reply is None:
+                return False
+            if reply.bytes == _READY:
+                return True
+            if time.time() >= deadline:
+                # Let the server stop waiting for this client.
+                self._request(_FileChunkRequest(None), timeout)
+                return False
+            time.sleep(self.READY_POLL_INTERVAL)
+
+    def receive(
+        self, dest: str, resources: Dict[str, int], wait_timeout: int, timeout: int
+    ) -> bool:
+        """
+        Receive every file listed in resources into dest, checking their sizes. The server may
+        still be preparing the files, so it is waited for up to wait_timeout seconds. The server is
+        considered gone if any reply, including its replies while it is preparing the files, takes
+        more than timeout seconds. Returns False if the server is gone or was not ready in time, in
+        which case the files in dest are incomplete.
+        """
+        self._finished = True
+        if not self._wait_until_ready(wait_timeout, timeout):
+            return False
+
+        for rel_path, size in sorted(resources.items()):
+            abs_path = os.path.join(dest, rel_path)
+            if rel_path.endswith("/"):
+                os.makedirs(abs_path, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+            with open(abs_path, "wb") as f:
+                offset = 0
+                while offset < size:
+                    chunk = self._request(_FileChunkRequest(rel_path, offset), timeout)
+                    if chunk is None:
+                        return False
+                    if len(chunk) == 0:
+                        break
+                    f.write(chunk.buffer)
+                    offset += len(chunk)
+            check.eq(offset, size, f"Received file {rel_path} has an unexpected size")
+
+        return self._request(_FileChunkRequest(None), timeout) is not None
+
+    def decline(self, timeout: int) -> None:
+        """
+        Tell the server that this client does not need the files, e.g. because it has them
+        cached already. Does nothing once receive() has been called.
+        """
+        if not self._finished:
+            self._finished = True
+            self._request(_FileChunkRequest(None), timeout)
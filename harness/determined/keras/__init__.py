@@ -7,7 +7,13 @@ from determined.keras._data import (
     SequenceAdapter,
     InputData,
 )
-from determined.keras._enqueuer import _Enqueuer, _Sampler, _build_enqueuer
+from determined.keras._enqueuer import (
+    _Enqueuer,
+    _Sampler,
+    _WorkerPool,
+    _build_enqueuer,
+    _build_worker_pool,
+)
 from determined.keras._tensorboard_callback import TFKerasTensorBoard
 from determined.keras._tf_keras_context import (
     TFKerasNativeContext,
@@ -18,5 +24,7 @@ from determined.keras._tf_keras_context import (
 )
 from determined.keras._tf_keras_multi_gpu import (
     _check_if_aggregation_frequency_will_work,
+    _fused_allreduce,
+    _is_fusable,
 )
 from determined.keras._tf_keras_trial import TFKerasTrial, TFKerasTrialController
@@ -4,13 +4,34 @@ import multiprocessing
 import multiprocessing.queues
 import queue
 import threading
-from typing import Any, Deque, Dict, Iterator, Optional, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import numpy as np
 import tensorflow as tf
 
 from determined.common import check
 
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # multiprocessing.shared_memory is new in Python 3.8; batches are pickled without it.
+    shared_memory = None  # type: ignore
+
 Queue = Union[queue.Queue, multiprocessing.Queue]
 Worker = Union[threading.Thread, multiprocessing.Process]
 
@@ -35,9 +56,10 @@ class _Sampler:
         shuffle_seed: int,
         prior_batches_trained: int,
     ) -> None:
-        self.indices = list(range(length))
+        self.length = length
         self.num_shards = num_shards
         self.shuffle = shuffle
+        self.shuffle_seed = shuffle_seed
 
         check.gt_eq(
             length,
@@ -45,6 +67,8 @@ class _Sampler:
             "please provide a Sequence that has at least as many batches as the number of slots "
             "used for training",
         )
+        if self.shuffle:
+            assert shuffle_seed is not None
 
         # Each shard has a certain offset from which it yields data.  When the dataset length is
         # not evenly divisible by the shard size, that offset will change every epoch.
@@ -55,21 +79,21 @@ class _Sampler:
         #   epoch 3: 1, 4, 7
         #   epoch 4: (same as epoch 1)
         # In this example, the offset in the first three epochs is 0, then 2, then 1.
-        # The initial offset is always shard_rank, and the offest is recalculated in _end_epoch().
-        self.offset = shard_rank
-
-        if self.shuffle:
-            assert shuffle_seed is not None
-            self.rng = np.random.RandomState(shuffle_seed)
-            self.rng.shuffle(self.indices)
-
-        # Start in the correct epoch of shuffle.
-        batches_to_skip = prior_batches_trained
-        while len(self._this_epoch_indices()) <= batches_to_skip:
-            batches_to_skip -= len(self._this_epoch_indices())
-            self._end_epoch()
-
-        self.offset += self.num_shards * batches_to_skip
+        #
+        # In other words, the shards take turns reading from one stream of indices made of every
+        # epoch in turn, and this shard reads positions shard_rank, shard_rank + num_shards, etc.
+        # That lets us start in the correct epoch and offset directly, rather than replaying every
+        # epoch trained before; the offset is then recalculated in _end_epoch().
+        position = shard_rank + num_shards * prior_batches_trained
+        self.epoch, self.offset = divmod(position, length)
+        self.indices = self._epoch_indices(self.epoch)
+
+    def _epoch_indices(self, epoch: int) -> List[int]:
+        if not self.shuffle:
+            return list(range(self.length))
+        # Every epoch is shuffled with its own seed, so any epoch can be generated on its own.
+        rng = np.random.RandomState([self.shuffle_seed, epoch])
+        return cast(List[int], rng.permutation(self.length).tolist())
 
     def _this_epoch_indices(self) -> range:
         return range(self.offset, len(self.indices), self.num_shards)
@@ -80,9 +104,9 @@ class _Sampler:
         """
         # Recalculate this shard's offset.
         self.offset = (self.offset - len(self.indices)) % self.num_shards
-        # Reshuffle indices.
-        if self.shuffle:
-            self.rng.shuffle(self.indices)
+        # Move on to the indices of the next epoch.
+        self.epoch += 1
+        self.indices = self._epoch_indices(self.epoch)
 
     def yield_epoch(self) -> Iterator:
         for i in self._this_epoch_indices():
@@ -148,16 +172,17 @@ class _WorkerlessEnqueuer(_Enqueuer):
                 return
 
 
-def _worker(sequence: tf.keras.utils.Sequence, queries: Queue, answers: Queue) -> None:
+def _worker(sequences: List[tf.keras.utils.Sequence], queries: Queue, answers: Queue) -> None:
     """
     _worker defines a data loader worker's primary loop.  This loop runs in either a
-    threading.Thread or a multiprocessing.Process; the caller (a _ParallelEnqueuer) is responsible
-    for passing in the appropriate type of Queue.
+    threading.Thread or a multiprocessing.Process; the caller (a _WorkerPool) is responsible for
+    passing in the appropriate type of Queue.
 
     Parameters:
-        sequence: the user-provided Keras Sequence.
-        queries: a queue of tuples of (indices, order) that need to be read from the sequence.
-        answers: a queue of tuples of (data, order) that workers fill with data from the sequence.
+        sequences: the user-provided Keras Sequences.
+        queries: a queue of tuples of (sequence, index, order) that need to be read from the
+            sequences, where sequence is the position of the sequence in sequences.
+        answers: a queue of tuples of (data, order) that workers fill with data from the sequences.
     """
 
     try:
@@ -165,68 +190,183 @@ def _worker(sequence: tf.keras.utils.Sequence, queries: Queue, answers: Queue) -
             query = queries.get()
             if query is None:
                 return
-            i, order = query
-            data = sequence[i]
+            s, i, order = query
+            data = sequences[s][i]
             answers.put((data, order))
     finally:
         answers.put(None)
 
 
-class _ParallelEnqueuer(_Enqueuer):
+# Arrays are placed in shared memory at offsets aligned to this many bytes.
+_SHARED_MEMORY_ALIGNMENT = 64
+
+
+class _ArraySpec(NamedTuple):
+    """_ArraySpec stands in for an array of a batch which was written to shared memory."""
+
+    offset: int
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+class _SharedBatch(NamedTuple):
+    """
+    _SharedBatch is what a worker sends in place of a batch whose arrays it wrote to the shared
+    memory segment of a slot. The layout is the batch with every array replaced by an _ArraySpec.
     """
-    _ParallelEnqueuer defines the semantics for either a threading-based or multiprocessing-based
-    enqueuer (threading and multiprocessing are intentionally designed to be API compatible).  The
-    implementation-specific details are defined in the child classes.
 
-    Generally, the strategy is:
-      - in start(): start a bunch of workers with access to a pair of queues.
+    slot: int
+    segment: str
+    layout: Any
 
-      - in data(): fill the query queue with tuples of (index, order) tuples.  The index comes from
-        the _Sampler, and the order just defines in what order we put things into the queue.
 
-        Workers will pop (index, order) tuples fram the query queue and put tuples of (data, order)
-        in the answers queue.
+def _replace_arrays(data: Any, fn: Callable[[Any], Any]) -> Any:
+    """Rebuild the tuples, lists and dicts of data, replacing every leaf with fn(leaf)."""
+    if type(data) in (tuple, list):
+        return type(data)(_replace_arrays(d, fn) for d in data)
+    if type(data) is dict:
+        return {k: _replace_arrays(v, fn) for k, v in data.items()}
+    return fn(data)
 
-        The main thread will gather the (data, order) tuples, and reorder the data elements to
-        match the order they were requested.  Whenever the next-requested data is available, it
-        will pass yield that data through the generator.
 
-      - in close(): shut down all the workers and clean up resources.
+def _layout_batch(data: Any) -> Tuple[Any, List[Tuple[np.ndarray, int]], int]:
     """
+    Return the layout of data in shared memory, the arrays to write there with their offsets, and
+    the number of bytes they need. Arrays of Python objects, and anything which is not an array,
+    stay in the layout and are pickled along with it.
+    """
+    arrays = []  # type: List[Tuple[np.ndarray, int]]
+    size = 0
 
-    def __init__(
-        self,
-        sequence: tf.keras.utils.Sequence,
-        sampler: _Sampler,
-        repeat: bool,
-        workers: int,
-        max_queue_size: int,
-    ):
-        self.sequence = sequence
-        self.sampler = sampler
-        self.repeat = repeat
-        self.max_queue_size = max_queue_size
-        check.gt(max_queue_size, 0, "max_queue_size must be greater than zero")
+    def place(leaf: Any) -> Any:
+        nonlocal size
+        if not isinstance(leaf, np.ndarray) or leaf.dtype.hasobject:
+            return leaf
+        offset = -(-size // _SHARED_MEMORY_ALIGNMENT) * _SHARED_MEMORY_ALIGNMENT
+        size = offset + leaf.nbytes
+        arrays.append((leaf, offset))
+        return _ArraySpec(offset, leaf.shape, leaf.dtype.str)
 
-        # Coordination logic.
-        self.order = 0
-        self.requested = collections.deque()  # type: Deque[int]
-        self.received = {}  # type: Dict[int, Any]
+    layout = _replace_arrays(data, place)
+    return layout, arrays, size
+
+
+def _stop_tracking_shared_memory() -> None:
+    """
+    Keep the shared memory segments which this process creates or attaches from being registered
+    with the resource tracker, which would unlink them when this process exits. Segments are created
+    by the worker processes but then owned by the main process, which is the only one to unlink
+    them. The resource tracker may be shared with the main process, so the workers cannot simply
+    unregister them either.
+    """
+    register, unregister = resource_tracker.register, resource_tracker.unregister
+
+    def track(fn: Callable[[str, str], None]) -> Callable[[str, str], None]:
+        def wrapper(name: str, rtype: str) -> None:
+            if rtype != "shared_memory":
+                fn(name, rtype)
+
+        return wrapper
+
+    resource_tracker.register = track(register)  # type: ignore
+    resource_tracker.unregister = track(unregister)  # type: ignore
+
+
+def _shared_memory_worker(
+    sequences: List[tf.keras.utils.Sequence], queries: Queue, answers: Queue
+) -> None:
+    """
+    _shared_memory_worker is the loop of a data loader worker process which writes the arrays of
+    each batch into the shared memory segment of a slot, so that only a small _SharedBatch has to
+    be pickled through the answers queue.
+
+    Parameters:
+        sequences: the user-provided Keras Sequences.
+        queries: a queue of tuples of (sequence, index, order, slot, segment), where segment is the
+            name of the shared memory segment of the slot, or None if it has none yet.
+        answers: a queue of tuples of (_SharedBatch or data, order).
+    """
+
+    _stop_tracking_shared_memory()
+    attached = {}  # type: Dict[int, shared_memory.SharedMemory]
+    try:
+        while True:
+            query = queries.get()
+            if query is None:
+                return
+            s, i, order, slot, name = query
+            data = sequences[s][i]
+            layout, arrays, size = _layout_batch(data)
+            if not arrays:
+                answers.put((data, order))
+                continue
+
+            segment = attached.get(slot)
+            if segment is not None and segment.name != name:
+                # The main process replaced the segment of this slot.
+                segment.close()
+                segment = None
+            if segment is None and name is not None:
+                segment = shared_memory.SharedMemory(name=name)
+            if segment is None or segment.size < size:
+                # Grow the slot into a new segment, which the main process adopts when it reads
+                # this batch. Leave some room for batches of varying size.
+                if segment is not None:
+                    segment.close()
+                segment = shared_memory.SharedMemory(create=True, size=max(size + size // 4, 1))
+            attached[slot] = segment
+
+            for array, offset in arrays:
+                view = np.ndarray(array.shape, array.dtype, buffer=segment.buf, offset=offset)
+                view[...] = array
+                del view
+            answers.put((_SharedBatch(slot, segment.name, layout), order))
+    finally:
+        answers.put(None)
+        for segment in attached.values():
+            segment.close()
+
+
+class _WorkerPool(metaclass=abc.ABCMeta):
+    """
+    _WorkerPool is a set of data loader workers which read batches from several Keras Sequences for
+    any number of _ParallelEnqueuers, so that the workers are started only once for, e.g., the
+    training data and every validation run of a trial. The implementation-specific details of
+    threading-based or multiprocessing-based workers are defined in the child classes (threading
+    and multiprocessing are intentionally designed to be API compatible).
+
+    Every query is tagged with an order that is unique within the pool, which the workers return
+    with the data. The answers of every enqueuer arrive on one queue, so answers which arrive while
+    waiting for another are kept until their enqueuer asks for them, and the answers of queries
+    which an enqueuer cancelled are discarded as they arrive.
+    """
+
+    def __init__(self, sequences: List[tf.keras.utils.Sequence], workers: int) -> None:
+        check.gt(workers, 0, "a worker pool needs at least one worker")
+        self.sequences = sequences
         self.started = False
         self.stopped = False
-        self.index_iter = None  # type: Optional[Iterator]
+
+        # Coordination logic. Enqueuers may be read from different threads, e.g. when Keras reads
+        # the training data in the background during a validation run.
+        self.lock = threading.Lock()
+        self.order = 0
+        self.received = {}  # type: Dict[int, Any]
+        self.cancelled = set()  # type: Set[int]
 
         # Interthread/interprocess communications.
         self.queries = self.queue_class()()
         self.answers = self.queue_class()()
 
         self.workers = [
-            self.worker_class()(target=_worker, args=(self.sequence, self.queries, self.answers))
+            self.worker_class()(
+                target=self.worker_target(), args=(self.sequences, self.queries, self.answers)
+            )
             for _ in range(workers)
         ]
 
     def start(self) -> None:
-        assert not self.started and not self.stopped, "restarting an enqueuer is not allowed"
+        assert not self.started and not self.stopped, "restarting a worker pool is not allowed"
         self.started = True
         for workers in self.workers:
             workers.start()
@@ -242,43 +382,53 @@ class _ParallelEnqueuer(_Enqueuer):
             workers.join()
         self.stopped = True
 
-    def data(self) -> Iterator:
-        while True:
-            yield from self.one_epoch()
-            if not self.repeat:
-                return
+    def sequence_index(self, sequence: tf.keras.utils.Sequence) -> int:
+        for s, pool_sequence in enumerate(self.sequences):
+            if pool_sequence is sequence:
+                return s
+        raise ValueError("the worker pool does not read from this sequence")
 
-    def fill_requests(self) -> None:
-        if self.index_iter is None:
-            # No data left this epoch.
-            return
-        while len(self.requested) < self.max_queue_size:
-            try:
-                i = next(self.index_iter)
-            except StopIteration:
-                self.index_iter = None
-                return
-            puttable = (i, self.order)
-            self.queries.put(puttable)
-            self.requested.append(self.order)
+    def request(self, sequence: int, i: int) -> int:
+        """Ask the workers for batch i of a sequence and return the order of the query."""
+        with self.lock:
+            order = self.order
             self.order += 1
+            self.queries.put(self.make_query(sequence, i, order))
+            return order
 
-    def one_epoch(self) -> Iterator:
-        self.index_iter = self.sampler.yield_epoch()
-        self.fill_requests()
-        while len(self.requested):
-            # Block on recieving the next in-order data.
-            target = self.requested.popleft()
-            while target not in self.received:
+    def result(self, order: int) -> Any:
+        """Block until the data of the query of the given order has been answered, and return it."""
+        with self.lock:
+            while order not in self.received:
                 answer = self.get_answer()
                 if answer is None:
                     raise ValueError("data loading worker finished unexpectedly")
-                data, order = answer
-                self.received[order] = data
-            data = self.received.pop(target)
-            self.fill_requests()
-            yield data
-        self.sequence.on_epoch_end()
+                data, answer_order = answer
+                if answer_order in self.cancelled:
+                    self.cancelled.remove(answer_order)
+                    self.read_answer(answer_order, data)
+                    continue
+                self.received[answer_order] = data
+            return self.read_answer(order, self.received.pop(order))
+
+    def cancel(self, orders: Iterable[int]) -> None:
+        """Discard the answers of queries whose data will not be asked for."""
+        with self.lock:
+            for order in orders:
+                if order in self.received:
+                    self.read_answer(order, self.received.pop(order))
+                else:
+                    self.cancelled.add(order)
+
+    def worker_target(self) -> Callable[[List[tf.keras.utils.Sequence], Queue, Queue], None]:
+        return _worker
+
+    def make_query(self, sequence: int, i: int, order: int) -> Any:
+        return sequence, i, order
+
+    def read_answer(self, order: int, data: Any) -> Any:
+        """Turn what a worker answered for the query of the given order into the data to yield."""
+        return data
 
     @abc.abstractmethod
     def queue_class(self) -> Type[Queue]:
@@ -293,7 +443,7 @@ class _ParallelEnqueuer(_Enqueuer):
         pass
 
 
-class _ThreadingEnqueuer(_ParallelEnqueuer):
+class _ThreadingWorkerPool(_WorkerPool):
     """threading.Thread-specific implementation details."""
 
     def queue_class(self) -> Type[Queue]:
@@ -306,8 +456,105 @@ class _ThreadingEnqueuer(_ParallelEnqueuer):
         return self.answers.get()
 
 
-class _MultiprocessingEnqueuer(_ParallelEnqueuer):
-    """multiprocessing.Process-specific implementation details."""
+class _MultiprocessingWorkerPool(_WorkerPool):
+    """
+    multiprocessing.Process-specific implementation details.
+
+    Rather than pickling every batch through the answers queue, workers write the arrays of each
+    batch into a ring of shared memory slots. Every query is assigned a free slot, and the slot is
+    freed once its arrays have been copied out by read_answer(); a new slot is added whenever none
+    is free, so there are as many slots as batches that were ever requested at once. Slots start
+    without a segment; a worker creates a new segment for a slot whenever the batch it read does
+    not fit in the current one, and the main process adopts it from then on. The main process owns
+    every segment and unlinks them in stop().
+
+    Each worker process reads from the copies of the Sequences that it got when it was started, so
+    it does not see changes made to them in the main process later.
+    """
+
+    shared_memory_transport = shared_memory is not None
+
+    def __init__(self, sequences: List[tf.keras.utils.Sequence], workers: int) -> None:
+        super().__init__(sequences, workers)
+        self.segments = []  # type: List[Optional[Any]]
+        self.free_slots = collections.deque()  # type: Deque[int]
+        self.slot_of = {}  # type: Dict[int, int]
+
+    def worker_target(self) -> Callable[[List[tf.keras.utils.Sequence], Queue, Queue], None]:
+        return _shared_memory_worker if self.shared_memory_transport else _worker
+
+    def make_query(self, sequence: int, i: int, order: int) -> Any:
+        if not self.shared_memory_transport:
+            return sequence, i, order
+        if not self.free_slots:
+            self.free_slots.append(len(self.segments))
+            self.segments.append(None)
+        slot = self.free_slots.popleft()
+        self.slot_of[order] = slot
+        segment = self.segments[slot]
+        return sequence, i, order, slot, segment.name if segment is not None else None
+
+    def adopt_segment(self, batch: _SharedBatch) -> Any:
+        segment = self.segments[batch.slot]
+        if segment is None or segment.name != batch.segment:
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+            segment = shared_memory.SharedMemory(name=batch.segment)
+            self.segments[batch.slot] = segment
+        return segment
+
+    def read_answer(self, order: int, data: Any) -> Any:
+        if not self.shared_memory_transport:
+            return data
+        self.free_slots.append(self.slot_of.pop(order))
+        if not isinstance(data, _SharedBatch):
+            return data
+        segment = self.adopt_segment(data)
+
+        def copy(leaf: Any) -> Any:
+            if not isinstance(leaf, _ArraySpec):
+                return leaf
+            # Copy the array out, since the slot may be reused as soon as this returns.
+            view = np.ndarray(leaf.shape, leaf.dtype, buffer=segment.buf, offset=leaf.offset)
+            return view.copy()
+
+        return _replace_arrays(data.layout, copy)
+
+    def stop(self) -> None:
+        if not self.started:
+            self.stopped = True
+        if self.stopped:
+            return
+        for _ in self.workers:
+            self.queries.put(None)
+        # A worker process cannot exit until the answers it put have been flushed into the pipe of
+        # the answers queue, so keep reading them while waiting for the workers.
+        unread = list(self.received.values())
+        while True:
+            alive = any(worker.is_alive() for worker in self.workers)
+            try:
+                answer = self.answers.get(timeout=0.1) if alive else self.answers.get_nowait()
+            except multiprocessing.queues.Empty:  # type: ignore
+                if not alive:
+                    break
+                continue
+            if answer is not None:
+                unread.append(answer[0])
+        for worker in self.workers:
+            worker.join()
+        self.stopped = True
+
+        # Adopt the segments of any batches which were answered but never read, so that they are
+        # unlinked too.
+        for data in unread:
+            if isinstance(data, _SharedBatch):
+                self.adopt_segment(data)
+        for segment in self.segments:
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+        self.segments = [None] * len(self.segments)
 
     def queue_class(self) -> Type[Queue]:
         return multiprocessing.Queue
@@ -329,6 +576,108 @@ class _MultiprocessingEnqueuer(_ParallelEnqueuer):
                 raise ValueError("data loading worker died unexpectedly")
 
 
+class _ParallelEnqueuer(_Enqueuer):
+    """
+    _ParallelEnqueuer reads a Keras Sequence with the workers of a _WorkerPool, which it either
+    owns, in which case it starts and stops the pool, or shares with other enqueuers.
+
+    Generally, the strategy is:
+      - in data(): request up to max_queue_size batches from the pool at a time.  The index of
+        each batch comes from the _Sampler, and the pool returns an order for each request, which
+        defines in what order the data must be yielded.
+
+        Workers will read the requested batches and answer them in any order.  The pool keeps the
+        answers until they are asked for, and whenever the next-requested data is available, this
+        will pass yield that data through the generator.
+
+      - in stop(): cancel any requests whose data was not yielded, so that the pool can discard
+        their answers, and shut down the pool if this enqueuer owns it.
+    """
+
+    def __init__(
+        self,
+        sequence: tf.keras.utils.Sequence,
+        sampler: _Sampler,
+        repeat: bool,
+        pool: _WorkerPool,
+        max_queue_size: int,
+        owns_pool: bool,
+    ):
+        self.sequence = sequence
+        self.sampler = sampler
+        self.repeat = repeat
+        self.pool = pool
+        self.sequence_index = pool.sequence_index(sequence)
+        self.owns_pool = owns_pool
+        self.max_queue_size = max_queue_size
+        check.gt(max_queue_size, 0, "max_queue_size must be greater than zero")
+
+        # Coordination logic.
+        self.requested = collections.deque()  # type: Deque[int]
+        self.started = False
+        self.stopped = False
+        self.index_iter = None  # type: Optional[Iterator]
+
+    def start(self) -> None:
+        assert not self.started and not self.stopped, "restarting an enqueuer is not allowed"
+        self.started = True
+        if self.owns_pool:
+            self.pool.start()
+
+    def stop(self) -> None:
+        if not self.started:
+            self.stopped = True
+        if self.stopped:
+            return
+        self.stopped = True
+        if self.owns_pool:
+            self.pool.stop()
+        elif not self.pool.stopped:
+            self.pool.cancel(self.requested)
+        self.requested.clear()
+
+    def data(self) -> Iterator:
+        while True:
+            yield from self.one_epoch()
+            if not self.repeat:
+                return
+
+    def fill_requests(self) -> None:
+        if self.index_iter is None:
+            # No data left this epoch.
+            return
+        while len(self.requested) < self.max_queue_size:
+            try:
+                i = next(self.index_iter)
+            except StopIteration:
+                self.index_iter = None
+                return
+            self.requested.append(self.pool.request(self.sequence_index, i))
+
+    def one_epoch(self) -> Iterator:
+        self.index_iter = self.sampler.yield_epoch()
+        self.fill_requests()
+        while len(self.requested):
+            # Block on recieving the next in-order data.
+            data = self.pool.result(self.requested[0])
+            self.requested.popleft()
+            self.fill_requests()
+            yield data
+        self.sequence.on_epoch_end()
+
+
+def _build_worker_pool(
+    sequences: List[tf.keras.utils.Sequence],
+    workers: int,
+    use_multiprocessing: bool,
+) -> Optional[_WorkerPool]:
+    """Return a _WorkerPool to read the sequences with, or None if workers < 1."""
+    if workers < 1:
+        return None
+    pool_cls = _MultiprocessingWorkerPool if use_multiprocessing else _ThreadingWorkerPool
+    return pool_cls(sequences, workers)
+
+
 def _build_enqueuer(
     sequence: tf.keras.utils.Sequence,
     workers: int,
@@ -340,7 +689,12 @@ def _build_enqueuer(
     shuffle: bool,
     shuffle_seed: int,
     prior_batches_trained: int,
+    pool: Optional[_WorkerPool] = None,
 ) -> _Enqueuer:
+    """
+    Build an _Enqueuer for the sequence. If a pool is passed, the enqueuer reads the sequence with
+    its workers, and workers and use_multiprocessing are ignored.
+    """
     sampler = _Sampler(
         len(sequence),
         shard_rank,
@@ -349,7 +703,11 @@ def _build_enqueuer(
         shuffle_seed,
         prior_batches_trained,
     )
+    if pool is not None:
+        return _ParallelEnqueuer(sequence, sampler, repeat, pool, max_queue_size, owns_pool=False)
     if workers < 1:
         return _WorkerlessEnqueuer(sequence, sampler, repeat)
-    enqueuer_cls = _MultiprocessingEnqueuer if use_multiprocessing else _ThreadingEnqueuer
-    return enqueuer_cls(sequence, sampler, repeat, workers, max_queue_size)
+    pool_cls = _MultiprocessingWorkerPool if use_multiprocessing else _ThreadingWorkerPool
+    return _ParallelEnqueuer(
+        sequence, sampler, repeat, pool_cls([sequence], workers), max_queue_size, owns_pool=True
+    )
@@ -80,6 +80,12 @@ class TFKerasContext:
         not provided in the second call will not overwrite any settings configured by the first
         call.
 
+        Note that the data loader workers are started once per trial and read from both the
+        training and the validation ``Sequence``. With ``use_multiprocessing=True``, each worker
+        process has the copy of each ``Sequence`` that it was started with, so changes that are
+        made to a ``Sequence`` later, including by its ``on_epoch_end()``, are not seen by the
+        workers.
+
         **Usage Example**
 
         .. code:: python
@@ -1,10 +1,13 @@
 import logging
+from typing import Any, Callable, List, Tuple
 
+import numpy as np
 import tensorflow as tf
 from packaging import version
 from tensorflow.python.keras.engine import sequential
 
 from determined import horovod, util
+from determined.common import check
 
 
 def _check_if_aggregation_frequency_will_work(
@@ -30,3 +33,31 @@ def _check_if_aggregation_frequency_will_work(
             "`optimizer.apply_gradients(zip(aggregated_gradients, vars), "
             " experimental_aggregate_gradients=False)`."
         )
+
+
+def _is_fusable(value: Any) -> bool:
+    """Return whether value is a numeric scalar, which can be allreduced as part of a buffer."""
+    if isinstance(value, (bool, np.bool_)):
+        return False
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return True
+    return isinstance(value, np.ndarray) and value.ndim == 0 and value.dtype.kind in "iuf"
+
+
+def _fused_allreduce(
+    sums: List[Any],
+    averages: List[Any],
+    allreduce_sum: Callable[[np.ndarray], Any],
+    size: int,
+) -> Tuple[List[float], List[float]]:
+    """
+    Reduce numeric scalars across all workers with a single allreduce. The values of sums are
+    summed and those of averages are averaged. They are packed, in order, into one float64 buffer,
+    which allreduce_sum must sum across all workers.
+    """
+    buffer = np.array(sums + averages, dtype=np.float64)
+    reduced = np.asarray(allreduce_sum(buffer), dtype=np.float64)
+    check.eq(reduced.shape, buffer.shape, "The fused allreduce returned a buffer of another shape.")
+    summed = reduced[: len(sums)].tolist()
+    averaged = (reduced[len(sums) :] / size).tolist()
+    return summed, averaged
@@ -5,7 +5,7 @@ import pickle
 import random
 import sys
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Mapping, Optional, Tuple, cast
 
 import h5py
 import numpy as np
@@ -331,6 +331,11 @@ class TFKerasTrialController(det.LoopTrialController):
         self._check_validation_data()
 
         self.enqueuers = []  # type: List[keras._Enqueuer]
+        self._hvd_allreduce_parameters = None  # type: Optional[Mapping[str, Any]]
+        # The data loader workers are shared by the training data and every validation run, and
+        # are only started once, by _get_worker_pool(). Worker processes therefore never see
+        # changes made to the Sequences afterwards, e.g. by the validation data's on_epoch_end().
+        self.worker_pool = None  # type: Optional[keras._WorkerPool]
 
         # If a load path is provided, load weights and restore the data location.
         self._load()
@@ -641,6 +646,7 @@ class TFKerasTrialController(det.LoopTrialController):
                 shuffle=self.context._fit_shuffle,
                 shuffle_seed=self.context.get_trial_seed(),
                 prior_batches_trained=self.env.initial_workload.total_batches_processed,
+                pool=self._get_worker_pool(),
             )
             enqueuer.start()
             self.enqueuers.append(enqueuer)
@@ -690,6 +696,7 @@ class TFKerasTrialController(det.LoopTrialController):
                 shuffle=False,
                 shuffle_seed=0,
                 prior_batches_trained=0,
+                pool=self._get_worker_pool(),
             )
             enqueuer.start()
             self.enqueuers.append(enqueuer)
@@ -790,31 +797,57 @@ class TFKerasTrialController(det.LoopTrialController):
             else:
                 raise AssertionError(f"Unknown workload kind {wkld.kind}.")
 
-    def _allreduce_logs(self, logs: Dict) -> Dict:
-        if not self.hvd_config.use:
-            return logs
-        # Reduce logs in key-sorted to be deterministic across workers.
+    def _allreduce_logs(self, logs: Dict, num_inputs: Any, name: str) -> Tuple[Dict, Any]:
+        """
+        Average logs and sum num_inputs across all workers. Every numeric scalar is packed into one
+        buffer in key-sorted order, to be deterministic across workers, and reduced with a single
+        allreduce; any other logs are reduced one by one.
+        """
         keys = sorted(logs)
         logging.debug(f"all-reducing logs on worker {hvd.rank()} for {len(keys)} keys {keys}.")
-        return {
-            key: np.array(self._hvd_allreduce(logs[key], average=True, name=key)) for key in keys
+        fused_keys = [key for key in keys if keras._is_fusable(logs[key])]
+        reduced = {
+            key: np.array(self._hvd_allreduce(logs[key], average=True, name=key))
+            for key in keys
+            if key not in fused_keys
         }
 
+        sums = [num_inputs] if keras._is_fusable(num_inputs) else []
+        if not sums:
+            num_inputs = self._hvd_allreduce(num_inputs, average=False, name=f"{name}_num_inputs")
+            num_inputs = self._convert_possible_tensor(num_inputs)
+
+        def allreduce_sum(buffer: np.ndarray) -> Any:
+            summed = self._hvd_allreduce(buffer, average=False, name=f"{name}_fused_logs")
+            return self._convert_possible_tensor(summed)
+
+        if sums or fused_keys:
+            summed, averaged = keras._fused_allreduce(
+                sums, [logs[key] for key in fused_keys], allreduce_sum, hvd.size()
+            )
+            if sums:
+                num_inputs = int(round(summed[0]))
+            reduced.update({key: np.array(value) for key, value in zip(fused_keys, averaged)})
+        return {key: reduced[key] for key in keys}, num_inputs
+
     def _hvd_allreduce(self, value: Any, average: bool, name: str) -> Any:
-        # The signature of our horovod allreduce changed after we rebased onto 0.21.
-        hvd_sig = inspect.signature(hvd.allreduce)
+        # The signature of our horovod allreduce changed after we rebased onto 0.21. It does not
+        # change after horovod is imported, so it is only inspected once.
+        if self._hvd_allreduce_parameters is None:
+            self._hvd_allreduce_parameters = inspect.signature(hvd.allreduce).parameters
+        hvd_params = self._hvd_allreduce_parameters
         horovod_kwargs = {
             "value": value,
             "name": name,
         }  # type: Dict[str, Any]
 
-        if "op" in hvd_sig.parameters:
+        if "op" in hvd_params:
             horovod_kwargs["op"] = hvd.Average if average else hvd.Sum
 
             # average has not yet been removed but it's deprecated. It defaults
             # to true and horovod does not support specifying an op while having
             # average be not None.
-            if "average" in hvd_sig.parameters:
+            if "average" in hvd_params:
                 horovod_kwargs["average"] = None
         else:
             horovod_kwargs["average"] = average
@@ -847,15 +880,16 @@ class TFKerasTrialController(det.LoopTrialController):
                 "as this will affect Determined training behavior",
             )
 
-        if self.hvd_config.use:
-            num_inputs = self._hvd_allreduce(num_inputs, average=False, name="train_num_inputs")
-            num_inputs = self._convert_possible_tensor(num_inputs)
-
         # Return only the latest metrics, which is the running average for all trained batches in
         # the step (Keras does not report individual logs, only running averages at any point).
         final_metrics = self.train_workload_metrics[-1]
-        if self.env.experiment_config.averaging_training_metrics_enabled():
-            final_metrics = self._allreduce_logs(final_metrics)
+        if self.hvd_config.use:
+            averaging = self.env.experiment_config.averaging_training_metrics_enabled()
+            averaged_metrics, num_inputs = self._allreduce_logs(
+                final_metrics if averaging else {}, num_inputs, name="train"
+            )
+            if averaging:
+                final_metrics = averaged_metrics
 
         self.multiplexer._train_workload_end(final_metrics)
         self._stop_training_check()
@@ -894,12 +928,7 @@ class TFKerasTrialController(det.LoopTrialController):
             # workers complete evaluation at different speeds.
             _ = self.context.distributed._zmq_gather(None)
 
-            num_inputs = hvd.allreduce(num_inputs, average=False, name="validation_num_inputs")
-            if isinstance(num_inputs, EagerTensor):
-                # Horovod will promote an int to a tensor in eager mode.
-                num_inputs = num_inputs.numpy()
-
-        metrics = self._allreduce_logs(metrics)
+            metrics, num_inputs = self._allreduce_logs(metrics, num_inputs, name="validation")
         check.gt(len(metrics), 0)
 
         self.multiplexer._test_end(metrics)
@@ -919,9 +948,27 @@ class TFKerasTrialController(det.LoopTrialController):
                 logging.debug("cancelling model.stop_training on non-chief worker")
                 self.multiplexer.model.stop_training = True
 
+    def _get_worker_pool(self) -> Optional[keras._WorkerPool]:
+        if self.worker_pool is None:
+            sequences = [
+                data
+                for data in (self.training_data, self.validation_data)
+                if isinstance(data, tf.keras.utils.Sequence)
+            ]
+            self.worker_pool = keras._build_worker_pool(
+                sequences=sequences,
+                workers=self.context._fit_workers,
+                use_multiprocessing=self.context._fit_use_multiprocessing,
+            )
+            if self.worker_pool is not None:
+                self.worker_pool.start()
+        return self.worker_pool
+
     def _stop_enqueuers(self) -> None:
         for enqueuer in self.enqueuers:
             enqueuer.stop()
+        if self.worker_pool is not None:
+            self.worker_pool.stop()
 
 
 class TFKerasTrial(det.Trial):
@@ -1,32 +1,65 @@
 import threading
 import time
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 import psutil
 import simplejson
 
 import determined.gpu
+from determined import profiler
 
 MeasurementHistory = List[Tuple[float, Any]]
 
+# The default number of seconds between samples, which can be overridden with this environment
+# variable.
+DEFAULT_INTERVAL = 0.1
+INTERVAL_ENV_VAR = "DET_HARNESS_PROFILER_INTERVAL"
+
+# The number of most recent samples that each measurement keeps.
+DEFAULT_MAX_SAMPLES = 10000
+
+# The sampling interval is lengthened as needed to keep the CPU time spent sampling below this
+# fraction of one core.
+DEFAULT_MAX_OVERHEAD = 0.01
+
+# nvidia-smi is only used if NVML is not available, and it forks a process for every query, so
+# GPUs are not queried through it more often than this many seconds.
+NVIDIA_SMI_MIN_INTERVAL = 1.0
+
+# thread_time() was added in Python 3.7.
+_thread_time = getattr(time, "thread_time", time.perf_counter)
+
 
 class Measurement(object):
     """
-    Tracks the history of a scalar measurement.
+    Tracks the history of a scalar measurement, keeping the most recent max_samples samples in a
+    preallocated ring buffer.
     """
 
-    def __init__(self, display_name: str, multiplier: float = 1.0) -> None:
+    def __init__(
+        self, display_name: str, multiplier: float = 1.0, max_samples: int = DEFAULT_MAX_SAMPLES
+    ) -> None:
         self._display_name = display_name
         self._multiplier = multiplier
-        self._history = []  # type: MeasurementHistory
+        # Each row is a (timestamp, value) sample.
+        self._samples = np.zeros((max_samples, 2), dtype=np.float64)
+        self._num_samples = 0
 
     def add_measurement(self, measurement: Any) -> None:
-        pt = (time.time(), measurement * self._multiplier)
-        self._history.append(pt)
+        row = self._samples[self._num_samples % len(self._samples)]
+        row[0] = time.time()
+        row[1] = measurement * self._multiplier
+        self._num_samples += 1
 
     def history(self) -> MeasurementHistory:
-        return self._history
+        if self._num_samples <= len(self._samples):
+            samples = self._samples[: self._num_samples]
+        else:
+            oldest = self._num_samples % len(self._samples)
+            samples = np.concatenate([self._samples[oldest:], self._samples[:oldest]])
+        return [(t, value) for t, value in samples.tolist()]
 
     def display_name(self) -> str:
         return self._display_name
@@ -38,9 +71,13 @@ class ThroughputMeasurement(Measurement):
     """
 
     def __init__(
-        self, display_name: str, initial_measurement: float, multiplier: float = 1.0
+        self,
+        display_name: str,
+        initial_measurement: float,
+        multiplier: float = 1.0,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
     ) -> None:
-        super().__init__(display_name, multiplier)
+        super().__init__(display_name, multiplier, max_samples)
         self._prev_measurement = initial_measurement
         self._prev_time = time.time()
 
@@ -53,84 +90,146 @@ class ThroughputMeasurement(Measurement):
 
 
 class HarnessProfiler(object):
-    """Monitors utilization of the process in a seperate thread."""
+    """
+    Monitors utilization of the process in a seperate thread.
+
+    A sample of every measurement is taken every interval seconds, unless sampling takes more CPU
+    time than max_overhead of the interval, in which case samples are taken less often. GPUs are
+    sampled through NVML where it is available.
+    """
 
-    def __init__(self, interval: float = 0.1, use_gpu: bool = False) -> None:
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        use_gpu: bool = False,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        max_overhead: float = DEFAULT_MAX_OVERHEAD,
+    ) -> None:
         self._use_gpu = use_gpu
         self._interval = interval
+        self._max_samples = max_samples
+        self._max_overhead = max_overhead
         self._stop_signal = threading.Event()
         self._process = psutil.Process()
         self._monitor_thread = threading.Thread(
             target=self._monitor, name="DeterminedProfileMonitor"
         )
+        self._pynvml = None  # type: Optional[profiler.PynvmlWrapper]
+        self._last_nvidia_smi = 0.0
+
+    def _measurement(self, display_name: str, multiplier: float = 1.0) -> Measurement:
+        return Measurement(display_name, multiplier, self._max_samples)
+
+    def _throughput(
+        self, display_name: str, initial_measurement: float, multiplier: float = 1.0
+    ) -> ThroughputMeasurement:
+        return ThroughputMeasurement(
+            display_name, initial_measurement, multiplier, self._max_samples
+        )
 
     def _initialize_measurements(self) -> None:
-        self._cpu_percent = Measurement("CPU Utilization (%)")
-        self._memory_utilization = Measurement("Physical Memory (KB)", multiplier=1.0 / 1000.0)
+        self._cpu_percent = self._measurement("CPU Utilization (%)")
+        self._memory_utilization = self._measurement(
+            "Physical Memory (KB)", multiplier=1.0 / 1000.0
+        )
 
         disk_stats = psutil.disk_io_counters()
-        self._disk_read = ThroughputMeasurement(
+        self._disk_read = self._throughput(
             "Disk Read (KB/s)", disk_stats.read_bytes, multiplier=1.0 / 1000.0
         )
-        self._disk_write = ThroughputMeasurement(
+        self._disk_write = self._throughput(
             "Disk Write (KB/s)", disk_stats.write_bytes, multiplier=1.0 / 1000.0
         )
 
         net_stats = psutil.net_io_counters()
-        self._net_read = ThroughputMeasurement(
+        self._net_read = self._throughput(
             "Network Read (KB/s)", net_stats.bytes_recv, multiplier=1.0 / 1000.0
         )
-        self._net_write = ThroughputMeasurement(
+        self._net_write = self._throughput(
             "Network Write (KB/s)", net_stats.bytes_sent, multiplier=1.0 / 1000.0
         )
 
         process_io_stats = self._process.io_counters()
-        self._process_read = ThroughputMeasurement(
+        self._process_read = self._throughput(
             "Process Read (KB/s)", process_io_stats.read_bytes, multiplier=1.0 / 1000.0
         )
-        self._process_read_chars = ThroughputMeasurement(
+        self._process_read_chars = self._throughput(
             "Process Read (char/s)", process_io_stats.read_chars
         )
-        self._process_write = ThroughputMeasurement(
+        self._process_write = self._throughput(
             "Process Write (KB/s)", process_io_stats.write_bytes, multiplier=1.0 / 1000.0
         )
-        self._process_write_chars = ThroughputMeasurement(
+        self._process_write_chars = self._throughput(
             "Process Write (char/s)", process_io_stats.write_chars
         )
 
         if self._use_gpu:
-            gpu_list = determined.gpu.get_gpus()
-            self._gpu_loads = {g.id: Measurement("GPU {} Load (%)".format(g.id)) for g in gpu_list}
+            self._pynvml = profiler.PynvmlWrapper()
+            if self._pynvml.pynvml_is_available:
+                gpu_ids = list(range(self._pynvml.device_count))
+            else:
+                self._pynvml = None
+                gpu_ids = [g.id for g in determined.gpu.get_gpus()]
+                self._last_nvidia_smi = time.time()
+            self._gpu_loads = {
+                gpu_id: self._measurement("GPU {} Load (%)".format(gpu_id)) for gpu_id in gpu_ids
+            }
             self._gpu_utilizations = {
-                g.id: Measurement("GPU {} Memory Utilization (%)".format(g.id)) for g in gpu_list
+                gpu_id: self._measurement("GPU {} Memory Utilization (%)".format(gpu_id))
+                for gpu_id in gpu_ids
             }
 
     def _monitor(self) -> None:
         self._initialize_measurements()
-        while not self._stop_signal.is_set():
-            time.sleep(self._interval)
-
-            self._cpu_percent.add_measurement(self._process.cpu_percent())
-            self._memory_utilization.add_measurement(self._process.memory_info().rss)
-
-            disk_stats = psutil.disk_io_counters()
-            self._disk_read.add_measurement(disk_stats.read_bytes)
-            self._disk_write.add_measurement(disk_stats.write_bytes)
-
-            net_stats = psutil.net_io_counters()
-            self._net_read.add_measurement(net_stats.bytes_recv)
-            self._net_write.add_measurement(net_stats.bytes_sent)
-
-            process_io_stats = self._process.io_counters()
-            self._process_read.add_measurement(process_io_stats.read_bytes)
-            self._process_write.add_measurement(process_io_stats.write_bytes)
-            self._process_read_chars.add_measurement(process_io_stats.read_chars)
-            self._process_write_chars.add_measurement(process_io_stats.write_chars)
-
-            if self._use_gpu:
-                for g in determined.gpu.get_gpus():
-                    self._gpu_loads[g.id].add_measurement(g.load)
-                    self._gpu_utilizations[g.id].add_measurement(g.memoryUtil)
+        interval = self._interval
+        sample_cost = None  # type: Optional[float]
+        while not self._stop_signal.wait(interval):
+            start = _thread_time()
+            self._sample()
+            cost = _thread_time() - start
+
+            # Lengthen the interval if the (smoothed) CPU time spent per sample is too high.
+            sample_cost = cost if sample_cost is None else 0.9 * sample_cost + 0.1 * cost
+            interval = max(self._interval, sample_cost / self._max_overhead)
+
+    def _sample(self) -> None:
+        self._cpu_percent.add_measurement(self._process.cpu_percent())
+        self._memory_utilization.add_measurement(self._process.memory_info().rss)
+
+        disk_stats = psutil.disk_io_counters()
+        self._disk_read.add_measurement(disk_stats.read_bytes)
+        self._disk_write.add_measurement(disk_stats.write_bytes)
+
+        net_stats = psutil.net_io_counters()
+        self._net_read.add_measurement(net_stats.bytes_recv)
+        self._net_write.add_measurement(net_stats.bytes_sent)
+
+        process_io_stats = self._process.io_counters()
+        self._process_read.add_measurement(process_io_stats.read_bytes)
+        self._process_write.add_measurement(process_io_stats.write_bytes)
+        self._process_read_chars.add_measurement(process_io_stats.read_chars)
+        self._process_write_chars.add_measurement(process_io_stats.write_chars)
+
+        if self._use_gpu:
+            self._sample_gpus()
+
+    def _sample_gpus(self) -> None:
+        if self._pynvml is not None:
+            for gpu_id in self._gpu_loads:
+                load = self._pynvml.nvml_get_gpu_utilization_by_index(gpu_id) / 100
+                self._gpu_loads[gpu_id].add_measurement(load)
+                memory_util = self._pynvml.nvml_get_memory_utilization_by_index(gpu_id)
+                self._gpu_utilizations[gpu_id].add_measurement(memory_util)
+            return
+
+        now = time.time()
+        if now - self._last_nvidia_smi < NVIDIA_SMI_MIN_INTERVAL:
+            return
+        self._last_nvidia_smi = now
+        for g in determined.gpu.get_gpus():
+            if g.id in self._gpu_loads:
+                self._gpu_loads[g.id].add_measurement(g.load)
+                self._gpu_utilizations[g.id].add_measurement(g.memoryUtil)
 
     def start(self) -> None:
         self._monitor_thread.start()
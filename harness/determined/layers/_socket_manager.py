@@ -1,4 +1,5 @@
 import logging
+import os
 import socket
 import ssl
 from typing import Any, Optional
@@ -176,7 +177,11 @@ class SocketManager(workload.Source):
     def yield_workload(self, wkld: workload.Workload) -> workload.Stream:
         if self.env.debug:
             logging.debug("Starting profiler...")
-            profiler = layers.HarnessProfiler(use_gpu=self.env.use_gpu)
+            interval = os.environ.get(layers._harness_profiler.INTERVAL_ENV_VAR)
+            profiler = layers.HarnessProfiler(
+                interval=float(interval) if interval else layers._harness_profiler.DEFAULT_INTERVAL,
+                use_gpu=self.env.use_gpu,
+            )
             profiler.start()
 
         # When the workload manager responds, forward the message to the master.
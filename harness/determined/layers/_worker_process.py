@@ -45,11 +45,17 @@ class WorkerProcessContext:
             pickle.dump(self, f)
 
 
+def _is_metrics_response(response: Any) -> bool:
+    return response is not None and not isinstance(response, workload.Skipped)
+
+
 class SubprocessReceiver(workload.Source):
     """
     SubprocessReceiver is a lightweight wrapper around the ZMQBroadcastClient. ZMQ details are
     handled automatically, while any received workloads are passed along blindly, resulting in a
     network-transparent WorkloadIterator.
+
+    Skipped responses, which all workers but the chief send, are sent as empty messages.
     """
 
     def __init__(self, broadcast_client: ipc.ZMQBroadcastClient):
@@ -67,7 +73,10 @@ class SubprocessReceiver(workload.Source):
             wkld, args = cast(Tuple[workload.Workload, List[Any]], obj)
 
             def _respond(message: Any) -> None:
-                self._broadcast_client.send(message)
+                if isinstance(message, workload.Skipped):
+                    self._broadcast_client.send_empty()
+                else:
+                    self._broadcast_client.send(message)
 
             yield wkld, args, _respond
 
@@ -96,7 +105,10 @@ class SubprocessLauncher:
         # from the main horovod process and sshd processes.
         self._worker_process_ids = []  # type: List[int]
 
-        # Horovod will have a separate training process for each slot.
+        # The response of the chief worker to the latest workload, if it has been received.
+        self._chief_worker_response = None  # type: Optional[Dict[str, Any]]
+
+        # Horovod and torch.distributed will have a separate training process for each slot.
         self.num_proc = len(self.env.slot_ids) if self.hvd_config.use else 1
 
         # Step 1: Establish the server for communicating with the subprocess.
@@ -109,7 +121,13 @@ class SubprocessLauncher:
         chief_addr = self.rendezvous_info.get_ip_addresses()[0]
         chief_port = self.rendezvous_info.get_ports()[0]
 
-        if self.is_chief_machine:
+        if self.hvd_config.use and self.hvd_config.backend == "torch":
+            # Step 3 (torch.distributed): every machine launches its own training processes, which
+            # find each other through the rendezvous served by the first process of the chief, so
+            # there is no need for sshd or for a barrier between the machines.
+            self._subprocs = self._launch_torch_distributed()
+
+        elif self.is_chief_machine:
             # Step 3 (chief): Wait for any peer machines to launch sshd, then launch horovodrun.
             if self.rendezvous_info.get_size() > 1:
                 with ipc.ZMQServer(ports=[chief_port], num_connections=1) as server:
@@ -123,13 +141,13 @@ class SubprocessLauncher:
                     logging.debug("Chief finished sshd barrier.")
 
             if self.hvd_config.use:
-                self._subproc = self._launch_horovodrun()
+                self._subprocs = [self._launch_horovodrun()]
             else:
-                self._subproc = self._launch_python_subprocess()
+                self._subprocs = [self._launch_python_subprocess()]
 
         else:
             # Step 3 (non-chief): launch sshd, wait for it to come up, then signal to the chief.
-            self._subproc = self._launch_sshd()
+            self._subprocs = [self._launch_sshd()]
 
             self._wait_for_sshd_to_start()
 
@@ -182,6 +200,54 @@ class SubprocessLauncher:
         }
         return subprocess.Popen(horovod_process_cmd, env=subprocess_env)
 
+    def _torch_distributed_envs(self) -> List[Dict[str, str]]:
+        """
+        Return the environment variables with which torch.distributed initializes each of the
+        training processes of this machine.
+        """
+        machine_rank = self.rendezvous_info.get_rank()
+        num_machines = self.rendezvous_info.get_size()
+        # The chief's own address may be "0.0.0.0", which can be listened on but not connected to.
+        master_addr = (
+            "localhost" if self.is_chief_machine else self.rendezvous_info.get_ip_addresses()[0]
+        )
+        master_port = constants.TORCH_DISTRIBUTED_PORT + self.env.det_trial_unique_port_offset
+
+        envs = []
+        for local_rank in range(self.num_proc):
+            env = {
+                "RANK": str(machine_rank * self.num_proc + local_rank),
+                "WORLD_SIZE": str(num_machines * self.num_proc),
+                "LOCAL_RANK": str(local_rank),
+                "LOCAL_WORLD_SIZE": str(self.num_proc),
+                "MASTER_ADDR": master_addr,
+                "MASTER_PORT": str(master_port),
+                "NCCL_DEBUG": "INFO",
+            }
+            if (
+                self.env.det_trial_runner_network_interface
+                != constants.AUTO_DETECT_TRIAL_RUNNER_NETWORK_INTERFACE
+            ):
+                env["NCCL_SOCKET_IFNAME"] = str(self.env.det_trial_runner_network_interface)
+                env["GLOO_SOCKET_IFNAME"] = str(self.env.det_trial_runner_network_interface)
+            envs.append(env)
+        return envs
+
+    def _launch_torch_distributed(self) -> List[subprocess.Popen]:
+        check.true(self.hvd_config.use)
+        logging.debug(
+            f"Starting {self.num_proc} torch.distributed training processes on: "
+            f"{self.rendezvous_info.get_rank()}."
+        )
+
+        # The python_subprocess_entrypoint replaces the worker process wrapper in tests.
+        entrypoint = self._python_subprocess_entrypoint or "determined.exec.worker_process_wrapper"
+        python_cmd = [sys.executable, "-m", entrypoint, str(self._worker_process_env_path)]
+        return [
+            subprocess.Popen(python_cmd, env={**os.environ, **env})
+            for env in self._torch_distributed_envs()
+        ]
+
     def _launch_sshd(self) -> subprocess.Popen:
         run_sshd_command = [
             "/usr/sbin/sshd",
@@ -283,8 +349,9 @@ class SubprocessLauncher:
         prevent hanging in case of a dead worker.
         """
 
-        if self._subproc.poll() is not None:
-            raise det.errors.WorkerError("Training process died.")
+        for subproc in self._subprocs:
+            if subproc.poll() is not None:
+                raise det.errors.WorkerError("Training process died.")
 
         for subprocess_id in self._worker_process_ids:
             if not psutil.pid_exists(subprocess_id):
@@ -294,16 +361,30 @@ class SubprocessLauncher:
                 raise det.errors.WorkerError("Detected that worker process died.")
 
     def _send_recv_workload(self, wkld: workload.Workload, args: List[Any]) -> workload.Response:
+        # Gather the responses to the previous workload which were not needed to answer it.
+        if self.broadcast_server.has_pending_messages():
+            responses, exception_received = self.broadcast_server.gather_with_polling(
+                self._health_check
+            )
+            if exception_received:
+                raise det.errors.WorkerError("Training process died.")
+            self._check_responses(responses)
+
         # Broadcast every workload to every worker on this machine.
         self.broadcast_server.broadcast((wkld, args))
+        self._chief_worker_response = None
 
         if wkld.kind == workload.Workload.Kind.TERMINATE:
             # Do not perform health checks once worker have been instructed to terminate.
             self._worker_process_ids = []
 
+        # Only the response of the chief is needed to answer the workload, so the responses of the
+        # other workers are gathered before the next broadcast instead, while the caller processes
+        # this response. Every worker must have responded before a TERMINATE returns.
+        until = None if wkld.kind == workload.Workload.Kind.TERMINATE else _is_metrics_response
         try:
             responses, exception_received = self.broadcast_server.gather_with_polling(
-                self._health_check
+                self._health_check, until=until
             )
         except det.errors.WorkerError:
             if wkld.kind == workload.Workload.Kind.TERMINATE:
@@ -313,35 +394,41 @@ class SubprocessLauncher:
         if exception_received:
             raise det.errors.WorkerError("Training process died.")
 
+        self._check_responses(responses)
+
+        # Confirm that if we have did not see a chief response then we are not the chief machine.
+        if self._chief_worker_response is None:
+            check.gt(
+                self.rendezvous_info.get_rank(),
+                0,
+                "Received SkippedWorkload message from chief worker.",
+            )
+
+        return (
+            workload.Skipped()
+            if self._chief_worker_response is None
+            else self._chief_worker_response
+        )
+
+    def _check_responses(self, responses: List[Any]) -> None:
         # Find the response from the chief worker for the trial (the only non-SkippedWorkload). The
         # chief may report to another container, in which case we will only have SkippedWorkloads.
-        chief_worker_response = None  # Optional[workload.Metrics]
         for response in responses:
-            if isinstance(response, workload.Skipped):
+            if not _is_metrics_response(response):
                 continue
             # Any other response must be a Dict[str, Any]-like object.
             check.is_instance(
-                response, dict, f"Received non-metrics object from worker: {response}"
+                response, dict, f"Received non-metrics object from worker: {type(response)}"
             )
             # There should only be one chief response.
             # Special case InvalidHP messages
-            if chief_worker_response != {
+            if self._chief_worker_response != {
                 "metrics": {},
                 "stop_requested": False,
                 "invalid_hp": True,
                 "init_invalid_hp": False,
             }:
                 check.is_none(
-                    chief_worker_response, "Received multiple non-SkippedWorkload messages."
+                    self._chief_worker_response, "Received multiple non-SkippedWorkload messages."
                 )
-            chief_worker_response = cast(Dict[str, Any], response)
-
-        # Confirm that if we have did not see a chief response then we are not the chief machine.
-        if chief_worker_response is None:
-            check.gt(
-                self.rendezvous_info.get_rank(),
-                0,
-                "Received SkippedWorkload message from chief worker.",
-            )
-
-        return workload.Skipped() if chief_worker_response is None else chief_worker_response
+            self._chief_worker_response = cast(Dict[str, Any], response)
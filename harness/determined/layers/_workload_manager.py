@@ -1,6 +1,8 @@
 import logging
 import math
 import pathlib
+import threading
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, cast
 
@@ -62,6 +64,81 @@ def build_workload_manager(
     raise ValueError("Unexpected workload manager type: {}", env.workload_manager_type)
 
 
+def _checkpoint_transfer(metadata: storage.StorageMetadata, seconds: float) -> Dict[str, Any]:
+    num_bytes = sum(metadata.resources.values())
+    return {
+        "num_bytes": num_bytes,
+        "seconds": seconds,
+        "bytes_per_second": num_bytes / seconds if seconds > 0 else 0.0,
+    }
+
+
+class _BackgroundTensorboardSync:
+    """
+    _BackgroundTensorboardSync runs TensorboardManager.sync() on a background thread, so that the
+    trial never waits for Tensorboard files to be persisted. Syncs that are requested while a sync
+    is already running are coalesced into a single follow-up sync.
+    """
+
+    def __init__(self, tensorboard_mgr: tensorboard.TensorboardManager) -> None:
+        self.tensorboard_mgr = tensorboard_mgr
+        self._cond = threading.Condition()
+        self._requested = False
+        self._closing = False
+        self._thread = None  # type: Optional[threading.Thread]
+        self._error = None  # type: Optional[BaseException]
+
+    def request(self) -> None:
+        """Request a sync without waiting for it, and re-raise any error an earlier sync hit."""
+        with self._cond:
+            self._raise_error()
+            self._requested = True
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="tensorboard-sync", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def close(self) -> None:
+        """
+        Wait for any requested sync to finish, close the TensorboardManager, and re-raise any error
+        the sync hit.
+        """
+        with self._cond:
+            thread = self._thread
+            self._closing = True
+            self._cond.notify()
+        if thread is not None:
+            thread.join()
+        self.tensorboard_mgr.close()
+        with self._cond:
+            self._thread = None
+            self._closing = False
+            self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._requested and not self._closing:
+                    self._cond.wait()
+                if not self._requested:
+                    return
+                self._requested = False
+            try:
+                self.tensorboard_mgr.sync()
+            except BaseException as e:
+                with self._cond:
+                    self._error = e
+                    self._thread = None
+                return
+
+
 class _TrialWorkloadManager(WorkloadManager):
     def __init__(
         self,
@@ -82,7 +159,15 @@ class _TrialWorkloadManager(WorkloadManager):
         )
         self.workload = None  # type: Optional[workload.Workload]
 
+        self.tensorboard_sync = _BackgroundTensorboardSync(tensorboard_mgr)
+
     def __iter__(self) -> workload.Stream:
+        try:
+            yield from self._run_workloads()
+        finally:
+            self.tensorboard_sync.close()
+
+    def _run_workloads(self) -> workload.Stream:
         for w, _, response_func in self.workloads:
             if self.rendezvous_info.get_rank() == 0:
                 logging.info("Running workload {}".format(w))
@@ -179,7 +264,7 @@ class _TrialWorkloadManager(WorkloadManager):
                     wkld.step_id, wkld.num_batches, wkld.total_batches_processed, metrics
                 )
 
-            self.tensorboard_mgr.sync()
+            self.tensorboard_sync.request()
 
             out_response = {
                 "type": "WORKLOAD_COMPLETED",
@@ -244,7 +329,7 @@ class _TrialWorkloadManager(WorkloadManager):
                     wkld.step_id, wkld.total_batches_processed, v_metrics
                 )
 
-            self.tensorboard_mgr.sync()
+            self.tensorboard_sync.request()
 
             # Check that the validation metrics computed by the model code
             # includes the metric used by the search method.
@@ -341,7 +426,7 @@ class _TrialWorkloadManager(WorkloadManager):
             )
 
             logging.info("Saved trial to checkpoint {}".format(metadata.storage_id))
-            self.tensorboard_mgr.sync()
+            self.tensorboard_sync.request()
 
             nonlocal message
             message = {
@@ -354,10 +439,15 @@ class _TrialWorkloadManager(WorkloadManager):
 
         with self.storage_mgr.store_path() as (storage_id, path):
             yield wkld, [pathlib.Path(path)], _respond
+            # Exiting store_path() is where remote storage managers upload the checkpoint.
+            upload_start = time.time()
+        upload_seconds = time.time() - upload_start
 
         # Because the messaging is synchronous, the layer below us must have called _respond.
         check_not_none(message, "response function did not get called")
-        message = cast(workload.Response, message)
+        message = cast(Dict[str, Any], message)
+
+        message["checkpoint_transfer"] = _checkpoint_transfer(message["metrics"], upload_seconds)
 
         respond(message)
 
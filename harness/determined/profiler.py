@@ -1,6 +1,8 @@
+import array
 import contextlib
 import logging
 import queue
+import random
 import threading
 import time
 from datetime import datetime, timedelta, timezone
@@ -15,6 +17,15 @@ from determined.common import api, check
 from determined.common.api import TrialProfilerMetricsBatch
 
 MAX_COLLECTION_SECONDS = 300
+# Bounds on the number of measurements waiting to be batched and of batches waiting to be sent.
+# Measurements beyond these bounds are dropped rather than blocking training or growing without
+# bound while the master is slow.
+MAX_QUEUED_MEASUREMENTS = 10_000
+MAX_QUEUED_BATCHES = 32
+# Once the measurement queue is half full, only one in this many new measurements is queued.
+SAMPLE_RATE_UNDER_PRESSURE = 4
+# How often system metrics are measured when profiling continuously.
+CONTINUOUS_MEASUREMENT_INTERVAL = 1.0
 LOG_NAMESPACE = "determined-profiler"
 
 
@@ -34,6 +45,7 @@ class PynvmlWrapper:
         self._pynvml = None  # type: Optional[Any]
         self._device_count = None  # type: Optional[int]
         self._index_to_uuid_map = {}  # type: Dict[int, str]
+        self._handles = {}  # type: Dict[int, Any]
         try:
             import pynvml
 
@@ -46,6 +58,7 @@ class PynvmlWrapper:
                     pynvml.nvmlDeviceGetMemoryInfo(handle)
                     pynvml.nvmlDeviceGetUtilizationRates(handle)
                     self._index_to_uuid_map[i] = uuid
+                    self._handles[i] = handle
                 self._pynvml = pynvml
                 self._device_count = num_gpus
             except Exception as e:
@@ -99,18 +112,34 @@ class PynvmlWrapper:
         self._safety_check()
         self._pynvml = cast(Any, self._pynvml)
 
-        handle = self._pynvml.nvmlDeviceGetHandleByIndex(index)
+        handle = self._handle(index)
         free_memory = self._pynvml.nvmlDeviceGetMemoryInfo(handle).free  # type: float
         return free_memory
 
+    def nvml_get_memory_utilization_by_index(self, index: int) -> float:
+        """Return the fraction of the memory of the GPU that is in use."""
+        self._safety_check()
+        self._pynvml = cast(Any, self._pynvml)
+
+        memory_info = self._pynvml.nvmlDeviceGetMemoryInfo(self._handle(index))
+        return float(memory_info.used) / float(memory_info.total or 1)
+
     def nvml_get_gpu_utilization_by_index(self, index: int) -> float:
         self._safety_check()
         self._pynvml = cast(Any, self._pynvml)
 
-        handle = self._pynvml.nvmlDeviceGetHandleByIndex(index)
+        handle = self._handle(index)
         gpu_util = self._pynvml.nvmlDeviceGetUtilizationRates(handle).gpu  # type: float
         return gpu_util
 
+    def _handle(self, index: int) -> Any:
+        """Return the device handle of a GPU, which is looked up once rather than per call."""
+        handle = self._handles.get(index)
+        if handle is None:
+            handle = cast(Any, self._pynvml).nvmlDeviceGetHandleByIndex(index)
+            self._handles[index] = handle
+        return handle
+
 
 class MetricType(Enum):
     SYSTEM = "PROFILER_METRIC_TYPE_SYSTEM"
@@ -201,6 +230,34 @@ class ShutdownMessage:
     pass
 
 
+class DropCounter:
+    """
+    Thread-safe counts of the measurements that were dropped instead of being sent to the master,
+    by the reason they were dropped.
+    """
+
+    QUEUE_FULL = "queue_full"
+    SAMPLED = "sampled"
+    SEND_BACKLOG = "send_backlog"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = {}  # type: Dict[str, int]
+
+    def add(self, reason: str, count: int = 1) -> None:
+        with self._lock:
+            self._counts[reason] = self._counts.get(reason, 0) + count
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    @property
+    def total(self) -> int:
+        with self._lock:
+            return sum(self._counts.values())
+
+
 def profiling_metrics_exist(master_url: str, trial_id: str) -> bool:
     """
     Return True if there are already profiling metrics for the trial.
@@ -233,10 +290,22 @@ class ProfilerAgent:
     profiling in that case introduces issues around multiple data points for the same batch_idx,
     difficult-to-render graphs due to large time gaps, and misleading data due to GPU warmup.
 
+    In continuous mode, profiling is not shut down after MAX_COLLECTION_SECONDS. To keep the
+    overhead low, system metrics are measured every CONTINUOUS_MEASUREMENT_INTERVAL seconds,
+    timings and other metrics are only recorded for every sample_every_n_batches-th batch, and at
+    most max_samples_per_series of them are kept per series and flush, by reservoir sampling.
+    Continuous profiling is not disabled after a restart either: the metrics of every run are
+    instead reported with a runEpoch label, which counts the restarts of the trial.
+
+    Recording a measurement never blocks. If the master falls behind, measurements are first
+    sampled and then dropped, and whole batches are dropped if too many are waiting to be sent;
+    drop_counter counts every measurement that was dropped.
+
     If is_enabled=False, every method in this class should be a no-op.
 
-    send_batch_fn and check_data_exists_fn are the pieces of code that communicate with the
-    master API. They can be replaced with dummy functions to enable testing without a master.
+    send_batch_fn and check_data_exists_fn are the pieces of code that
+    communicate with the master API. They can be replaced with dummy functions to enable testing
+    without a master.
     """
 
     # dev note: We optimize this code by only creating threads if they will be used.
@@ -256,6 +325,10 @@ class ProfilerAgent:
         end_after_batch: Optional[int] = None,
         send_batch_fn: SendBatchFnType = api.post_trial_profiler_metrics_batches,
         check_data_exists_fn: CheckDataExistsFnType = profiling_metrics_exist,
+        continuous: bool = False,
+        sample_every_n_batches: int = 1,
+        max_samples_per_series: Optional[int] = None,
+        run_epoch: int = 0,
     ):
         self.current_batch_idx = 0
         self.trial_id = trial_id
@@ -268,21 +341,28 @@ class ProfilerAgent:
         self.end_after_batch = end_after_batch
         self.send_batch_fn = send_batch_fn
         self.check_data_already_exists_fn = check_data_exists_fn
+        self.continuous = continuous
+        self.sample_every_n_batches = sample_every_n_batches
+        self.max_samples_per_series = max_samples_per_series if continuous else None
+        self.run_epoch = run_epoch if continuous else 0
 
         self.has_started = False
         self.has_finished = False
         self.disabled_due_to_preexisting_metrics = False
 
         self.shutdown_lock = threading.Lock()
+        self.drop_counter = DropCounter()
+        self._num_under_pressure = 0
 
         # If the ProfilingAgent is disabled, don't waste resources by creating useless threads
         # or making API calls
         if self.is_enabled:
             self.pynvml_wrapper = PynvmlWrapper()
 
-            self.disabled_due_to_preexisting_metrics = self.check_data_already_exists_fn(
-                self.master_url, self.trial_id
-            )
+            if not self.continuous:
+                self.disabled_due_to_preexisting_metrics = self.check_data_already_exists_fn(
+                    self.master_url, self.trial_id
+                )
             if self.disabled_due_to_preexisting_metrics and self.global_rank == 0:
                 logging.warning(
                     f"{LOG_NAMESPACE}: ProfilerAgent is disabled because profiling data for "
@@ -293,8 +373,8 @@ class ProfilerAgent:
             # Set up timer thread to stop collecting after MAX_COLLECTION_SECONDS
             self.shutdown_timer = PreemptibleTimer(MAX_COLLECTION_SECONDS, self._end_collection)
 
-            self.send_queue = (
-                queue.Queue()
+            self.send_queue = queue.Queue(
+                maxsize=MAX_QUEUED_BATCHES
             )  # type: """queue.Queue[Union[List[TrialProfilerMetricsBatch], ShutdownMessage]]"""
 
             num_producers = 0
@@ -302,15 +382,27 @@ class ProfilerAgent:
             if self.sysmetrics_is_enabled:
                 num_producers += 1
                 self.sys_metric_collector_thread = SysMetricCollectorThread(
-                    trial_id, agent_id, self.send_queue, self.pynvml_wrapper
+                    trial_id,
+                    agent_id,
+                    self.send_queue,
+                    self.pynvml_wrapper,
+                    self.drop_counter,
+                    CONTINUOUS_MEASUREMENT_INTERVAL if self.continuous else None,
+                    self.run_epoch,
                 )
 
             num_producers += 1
-            self.metrics_batcher_queue = (
-                queue.Queue()
+            self.metrics_batcher_queue = queue.Queue(
+                maxsize=MAX_QUEUED_MEASUREMENTS
             )  # type: """queue.Queue[Union[NamedMeasurement, StartMessage, ShutdownMessage]]"""
             self.metrics_batcher_thread = MetricsBatcherThread(
-                trial_id, agent_id, self.metrics_batcher_queue, self.send_queue
+                trial_id,
+                agent_id,
+                self.metrics_batcher_queue,
+                self.send_queue,
+                self.drop_counter,
+                self.max_samples_per_series,
+                self.run_epoch,
             )
 
             self.sender_thread = ProfilerSenderThread(
@@ -320,6 +412,7 @@ class ProfilerAgent:
     @staticmethod
     def from_env(env: det.EnvContext, global_rank: int, local_rank: int) -> "ProfilerAgent":
         begin_on_batch, end_after_batch = env.experiment_config.profiling_interval()
+        sample_every_n_batches, max_samples_per_series = env.experiment_config.profiling_sampling()
         return ProfilerAgent(
             trial_id=env.det_trial_id,
             agent_id=env.det_agent_id,
@@ -329,6 +422,11 @@ class ProfilerAgent:
             local_rank=local_rank,
             begin_on_batch=begin_on_batch,
             end_after_batch=end_after_batch,
+            continuous=env.experiment_config.profiling_continuous(),
+            sample_every_n_batches=sample_every_n_batches,
+            max_samples_per_series=max_samples_per_series,
+            # The master counts the runs of a trial from 1.
+            run_epoch=max(env.det_trial_run_id - 1, 0),
         )
 
     # Launch the children threads. This does not mean 'start collecting metrics'
@@ -399,6 +497,13 @@ class ProfilerAgent:
             return False
         return self.has_started and not self.has_finished
 
+    @property
+    def is_sampled_batch(self) -> bool:
+        """
+        Should timings and other metrics be recorded for the current batch?
+        """
+        return not self.continuous or self.current_batch_idx % self.sample_every_n_batches == 0
+
     def update_batch_idx(self, new_batch_idx: int) -> None:
         if not self.is_enabled:
             return
@@ -425,10 +530,10 @@ class ProfilerAgent:
             self.shutdown_timer.send_shutdown_signal()
 
     def record_metric(self, metric_name: str, value: float) -> None:
-        if not self.is_enabled:
+        if not self.is_enabled or not self.is_sampled_batch:
             return
 
-        self.metrics_batcher_queue.put(
+        self._enqueue_measurement(
             NamedMeasurement(
                 MetricType.MISC,
                 metric_name,
@@ -440,7 +545,12 @@ class ProfilerAgent:
 
     @contextlib.contextmanager
     def record_timing(self, metric_name: str) -> Iterator[None]:
-        if not self.is_enabled or not self.timings_is_enabled or not self.is_active:
+        if (
+            not self.is_enabled
+            or not self.timings_is_enabled
+            or not self.is_active
+            or not self.is_sampled_batch
+        ):
             yield
             return
 
@@ -448,7 +558,23 @@ class ProfilerAgent:
         timing.start()
         yield
         timing.end()
-        self.metrics_batcher_queue.put(timing.to_measurement())
+        self._enqueue_measurement(timing.to_measurement())
+
+    def _enqueue_measurement(self, measurement: NamedMeasurement) -> None:
+        """
+        Queue a measurement for the MetricsBatcherThread without blocking. Once the queue is half
+        full, only every SAMPLE_RATE_UNDER_PRESSURE-th measurement is queued, and once it is full,
+        every measurement is dropped until the MetricsBatcherThread catches up.
+        """
+        if self.metrics_batcher_queue.qsize() >= MAX_QUEUED_MEASUREMENTS // 2:
+            self._num_under_pressure += 1
+            if self._num_under_pressure % SAMPLE_RATE_UNDER_PRESSURE != 0:
+                self.drop_counter.add(DropCounter.SAMPLED)
+                return
+        try:
+            self.metrics_batcher_queue.put_nowait(measurement)
+        except queue.Full:
+            self.drop_counter.add(DropCounter.QUEUE_FULL)
 
     def cleanup_timer(self) -> None:
         if not self.is_enabled:
@@ -466,7 +592,8 @@ class ProfilerAgent:
 
         self.metrics_batcher_thread.activate()
 
-        self.shutdown_timer.activate()
+        if not self.continuous:
+            self.shutdown_timer.activate()
         self.has_started = True
 
     def _end_collection(self) -> None:
@@ -498,6 +625,13 @@ class ProfilerAgent:
 
             self.has_finished = True
 
+            dropped = self.drop_counter.counts()
+            if dropped:
+                logging.warning(
+                    f"{LOG_NAMESPACE}: dropped {sum(dropped.values())} measurements that could "
+                    f"not be sent to the master quickly enough: {dropped}"
+                )
+
 
 class PreemptibleTimer(threading.Thread):
     """
@@ -564,12 +698,21 @@ class SysMetricCollectorThread(threading.Thread):
     MEASUREMENT_INTERVAL = 0.1
 
     def __init__(
-        self, trial_id: str, agent_id: str, send_queue: queue.Queue, pynvml_wrapper: PynvmlWrapper
+        self,
+        trial_id: str,
+        agent_id: str,
+        send_queue: queue.Queue,
+        pynvml_wrapper: PynvmlWrapper,
+        drop_counter: DropCounter,
+        measurement_interval: Optional[float] = None,
+        run_epoch: int = 0,
     ):
         self.current_batch_idx = 0
         self.send_queue = send_queue
+        self.drop_counter = drop_counter
+        self.measurement_interval = measurement_interval or self.MEASUREMENT_INTERVAL
         self.control_queue: "queue.Queue[Union['StartMessage', 'ShutdownMessage']]" = queue.Queue()
-        self.current_batch = MetricBatch(trial_id, agent_id)
+        self.current_batch = MetricBatch(trial_id, agent_id, run_epoch=run_epoch)
         self.pynvml_wrapper = pynvml_wrapper
 
         super().__init__(daemon=True)
@@ -603,7 +746,7 @@ class SysMetricCollectorThread(threading.Thread):
         disk_collector.reset()
 
         batch_start_time = time.time()
-        next_collection = time.time() + self.MEASUREMENT_INTERVAL
+        next_collection = time.time() + self.measurement_interval
 
         while True:
             # This code is using a trick with the control_queue to sleep/block until the next
@@ -617,13 +760,15 @@ class SysMetricCollectorThread(threading.Thread):
                 try:
                     msg = self.control_queue.get(timeout=sleep_time)
                     if isinstance(msg, ShutdownMessage):
-                        self.send_queue.put(self.current_batch.consume())
+                        enqueue_batch(
+                            self.send_queue, self.current_batch.consume(), self.drop_counter
+                        )
                         self.send_queue.put(ShutdownMessage())
                         return
                 except queue.Empty:
                     pass
 
-            next_collection += self.MEASUREMENT_INTERVAL
+            next_collection += self.measurement_interval
 
             cpu_util = cpu_util_collector.measure(self.current_batch_idx)
             self.current_batch.append(
@@ -670,7 +815,7 @@ class SysMetricCollectorThread(threading.Thread):
 
             # Check if it is time to flush the batch and start a new batch
             if time.time() - batch_start_time > self.FLUSH_INTERVAL:
-                self.send_queue.put(self.current_batch.consume())
+                enqueue_batch(self.send_queue, self.current_batch.consume(), self.drop_counter)
                 batch_start_time = time.time()
 
 
@@ -688,10 +833,14 @@ class MetricsBatcherThread(threading.Thread):
         agent_id: str,
         inbound_queue: queue.Queue,
         send_queue: queue.Queue,
+        drop_counter: DropCounter,
+        max_samples_per_series: Optional[int] = None,
+        run_epoch: int = 0,
     ) -> None:
         self.inbound_queue = inbound_queue
         self.send_queue = send_queue
-        self.metrics_batch = MetricBatch(trial_id, agent_id)
+        self.drop_counter = drop_counter
+        self.metrics_batch = MetricBatch(trial_id, agent_id, max_samples_per_series, run_epoch)
         super().__init__(daemon=True)
 
     def activate(self) -> None:
@@ -726,7 +875,7 @@ class MetricsBatcherThread(threading.Thread):
             try:
                 message = self.inbound_queue.get(timeout=timeout)
                 if isinstance(message, ShutdownMessage):
-                    self.send_queue.put(self.metrics_batch.consume())
+                    enqueue_batch(self.send_queue, self.metrics_batch.consume(), self.drop_counter)
                     self.send_queue.put(ShutdownMessage())
                     return
                 elif isinstance(message, NamedMeasurement):
@@ -754,15 +903,58 @@ class MetricsBatcherThread(threading.Thread):
             )
             batch_start_time = cast(float, batch_start_time)
             if time.time() - batch_start_time > self.FLUSH_INTERVAL:
-                self.send_queue.put(self.metrics_batch.consume())
+                enqueue_batch(self.send_queue, self.metrics_batch.consume(), self.drop_counter)
                 batch_start_time = time.time()
 
 
+def enqueue_batch(
+    send_queue: queue.Queue, batch: List[TrialProfilerMetricsBatch], drop_counter: DropCounter
+) -> None:
+    """
+    Hand a batch to the ProfilerSenderThread without blocking, or drop it if too many batches are
+    already waiting to be sent.
+    """
+    if not batch:
+        return
+    try:
+        send_queue.put_nowait(batch)
+    except queue.Full:
+        drop_counter.add(DropCounter.SEND_BACKLOG, sum(len(b.values) for b in batch))
+
+
+# The values, batch indices and POSIX timestamps of the measurements of one series.
+Columns = Tuple["array.array[float]", "array.array[int]", "array.array[float]"]
+
+
 class MetricBatch:
-    def __init__(self, trial_id: str, agent_id: str) -> None:
+    """
+    MetricBatch accumulates measurements for each series until the batch is consumed. Each series
+    is kept in typed arrays, one per field, rather than as a list of Measurement objects, so that
+    appending is cheap and the timestamps are only formatted once the batch is sent.
+
+    If max_samples_per_series is set, at most that many measurements of each series are kept until
+    the batch is consumed, chosen uniformly at random by reservoir sampling.
+
+    A nonzero run_epoch is reported as the runEpoch label of every series, to tell apart the
+    metrics of different runs of a continuously profiled trial.
+    """
+
+    def __init__(
+        self,
+        trial_id: str,
+        agent_id: str,
+        max_samples_per_series: Optional[int] = None,
+        run_epoch: int = 0,
+    ) -> None:
         self.trial_id = trial_id
         self.agent_id = agent_id
-        self.batch = {}  # type: Dict[Tuple[MetricType, str, str], List[Measurement]]
+        self.run_epoch = run_epoch
+        self.max_samples_per_series = max_samples_per_series
+        self.batch = {}  # type: Dict[Tuple[MetricType, str, str], Columns]
+        # The number of measurements appended to each series, including those that were not kept.
+        self.num_appended = {}  # type: Dict[Tuple[MetricType, str, str], int]
+        # Use a private RNG so that sampling does not disturb the user's random state.
+        self._rng = random.Random()
 
     def append(
         self,
@@ -771,50 +963,102 @@ class MetricBatch:
         measurement: Measurement,
         gpu_uuid: str = "",
     ) -> None:
-        if (metric_type, metric_name, gpu_uuid) not in self.batch.keys():
-            self.batch[(metric_type, metric_name, gpu_uuid)] = []
-        self.batch[(metric_type, metric_name, gpu_uuid)].append(measurement)
+        key = (metric_type, metric_name, gpu_uuid)
+        columns = self.batch.get(key)
+        if columns is None:
+            columns = (array.array("d"), array.array("q"), array.array("d"))
+            self.batch[key] = columns
+        values, batches, timestamps = columns
+
+        num_appended = self.num_appended.get(key, 0) + 1
+        self.num_appended[key] = num_appended
+        if self.max_samples_per_series is not None and len(values) >= self.max_samples_per_series:
+            i = self._rng.randrange(num_appended)
+            if i < len(values):
+                values[i] = measurement.measurement
+                batches[i] = measurement.batch_idx
+                timestamps[i] = measurement.timestamp.timestamp()
+            return
+
+        values.append(measurement.measurement)
+        batches.append(measurement.batch_idx)
+        timestamps.append(measurement.timestamp.timestamp())
+
+    def __len__(self) -> int:
+        return sum(len(values) for values, _, _ in self.batch.values())
 
     def consume(self) -> List[TrialProfilerMetricsBatch]:
         trial_profiler_metrics_batches = []
 
-        for (metric_type, metric_name, gpu_uuid), measurements in self.batch.items():
-            if len(measurements) > 0:
+        for key, columns in self.batch.items():
+            if len(columns[0]) > 0:
+                metric_type, metric_name, gpu_uuid = key
                 labels = MetricBatch.make_labels(
-                    metric_name, self.trial_id, self.agent_id, metric_type.value, gpu_uuid
+                    metric_name,
+                    self.trial_id,
+                    self.agent_id,
+                    metric_type.value,
+                    gpu_uuid,
+                    self.run_epoch,
                 )
-                batch = MetricBatch.to_post_format(measurements, labels)
+                if self.num_appended[key] > len(columns[0]):
+                    # Sampled measurements are out of order.
+                    columns = MetricBatch.sort_by_timestamp(columns)
+                batch = MetricBatch.to_post_format(columns, labels)
                 trial_profiler_metrics_batches.append(batch)
 
         self.clear()
         return trial_profiler_metrics_batches
 
     def clear(self) -> None:
-        for key in self.batch.keys():
-            self.batch[key] = []
+        for values, batches, timestamps in self.batch.values():
+            del values[:]
+            del batches[:]
+            del timestamps[:]
+        self.num_appended.clear()
+
+    @staticmethod
+    def sort_by_timestamp(columns: Columns) -> Columns:
+        values, batches, timestamps = columns
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        return (
+            array.array("d", (values[i] for i in order)),
+            array.array("q", (batches[i] for i in order)),
+            array.array("d", (timestamps[i] for i in order)),
+        )
 
     @staticmethod
-    def to_post_format(
-        measurements: List[Measurement], labels: Dict[str, Any]
-    ) -> TrialProfilerMetricsBatch:
-        values, batches, timestamps = [], [], []
-        for m in measurements:
-            values.append(m.measurement)
-            batches.append(m.batch_idx)
-            timestamps.append(MetricBatch.convert_to_timestamp_str(m.timestamp))
-        return TrialProfilerMetricsBatch(values, batches, timestamps, labels)
+    def to_post_format(columns: Columns, labels: Dict[str, Any]) -> TrialProfilerMetricsBatch:
+        values, batches, timestamps = columns
+        return TrialProfilerMetricsBatch(
+            values.tolist(),
+            batches.tolist(),
+            [
+                MetricBatch.convert_to_timestamp_str(datetime.fromtimestamp(t, timezone.utc))
+                for t in timestamps
+            ],
+            labels,
+        )
 
     @staticmethod
     def make_labels(
-        name: str, trial_id: str, agent_id: str, metric_type: str, gpu_uuid_label: str
+        name: str,
+        trial_id: str,
+        agent_id: str,
+        metric_type: str,
+        gpu_uuid_label: str,
+        run_epoch: int = 0,
     ) -> Dict[str, Any]:
-        return {
+        labels = {
             "trialId": trial_id,
             "name": name,
             "agentId": agent_id,
             "gpuUuid": gpu_uuid_label,
             "metricType": metric_type,
-        }
+        }  # type: Dict[str, Any]
+        if run_epoch:
+            labels["runEpoch"] = run_epoch
+        return labels
 
     @staticmethod
     def convert_to_timestamp_str(timestamp: datetime) -> str:
@@ -0,0 +1,258 @@
+import abc
+import numbers
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from determined.horovod import hvd
+from determined.pytorch._reducer import Reducer, _reduce_metrics
+
+# Integers beyond this magnitude can not be represented exactly as float64 values.
+_MAX_EXACT_INT = 2 ** 53
+
+# Kinds of per-slot values that can be gathered as tensors, see _value_signature().
+_NOT_NUMERIC = 0
+_PYTHON_INT = 1
+_PYTHON_FLOAT = 2
+_NUMPY = 3
+
+
+class _TensorCollective(metaclass=abc.ABCMeta):
+    """
+    _TensorCollective communicates flat float64 arrays between all the slots of a trial.
+
+    Unlike the pickled gathers of DistributedContext, which funnel every slot's objects through the
+    chief, tensor collectives are executed by the distributed backend itself (e.g. as a ring), so
+    the cost at any one slot does not grow linearly with the number of slots.
+    """
+
+    @abc.abstractmethod
+    def allgather(self, array: np.ndarray) -> np.ndarray:
+        """Return a (num_slots, len(array)) array of the arrays of every slot, in rank order."""
+        pass
+
+    @abc.abstractmethod
+    def allreduce_sum(self, array: np.ndarray) -> np.ndarray:
+        """Return the elementwise sum of the arrays of every slot."""
+        pass
+
+
+class _HorovodCollective(_TensorCollective):
+    def allgather(self, array: np.ndarray) -> np.ndarray:
+        import torch
+
+        tensor = torch.from_numpy(np.ascontiguousarray(array, dtype=np.float64)).reshape(1, -1)
+        return hvd.allgather(tensor, name="det_metrics_allgather").numpy()
+
+    def allreduce_sum(self, array: np.ndarray) -> np.ndarray:
+        import torch
+
+        tensor = torch.from_numpy(np.ascontiguousarray(array, dtype=np.float64))
+        return hvd.allreduce(tensor, op=hvd.Sum, name="det_metrics_allreduce").numpy()
+
+
+def _names_checksum(names: Sequence[str]) -> int:
+    # Python's hash() is salted per process, so it can not be compared across slots.
+    return zlib.crc32("\0".join(names).encode("utf8"))
+
+
+def _agree(collective: _TensorCollective, signature: List[float]) -> bool:
+    """
+    Return True on every slot if every slot passed the same signature, or False on every slot
+    otherwise. This lets all slots consistently decide between a tensor collective and a pickled
+    fallback, which would deadlock if only some of the slots chose it.
+    """
+    gathered = collective.allgather(np.array(signature, dtype=np.float64))
+    return bool(np.all(gathered == gathered[0]))
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Return a numeric scalar (or single-element array) as a float, or None otherwise."""
+    if isinstance(value, np.ndarray):
+        if value.size != 1 or value.dtype.kind not in "biuf":
+            return None
+        return float(value.reshape(-1)[0])
+    if isinstance(value, (numbers.Real, np.bool_)):
+        return float(value)
+    return None
+
+
+def _allreduce_mean_batch_metrics(
+    collective: _TensorCollective, per_batch_metrics: List[Dict[str, Any]]
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Average each training metric of each batch across all slots with a single allreduce, ignoring
+    None values.  Return None on every slot if the metrics can not be averaged this way, e.g. if
+    they are not numeric scalars or if the slots do not agree on the metric names.
+    """
+    names = sorted(per_batch_metrics[0]) if per_batch_metrics else []
+    values = np.zeros((len(per_batch_metrics), len(names)), dtype=np.float64)
+    counts = np.zeros_like(values)
+    array_metrics = {
+        name: isinstance(per_batch_metrics[0][name], np.ndarray) for name in names
+    }  # type: Dict[str, bool]
+
+    numeric = True
+    for batch_idx, metrics in enumerate(per_batch_metrics):
+        if sorted(metrics) != names:
+            numeric = False
+            break
+        for name_idx, name in enumerate(names):
+            value = metrics[name]
+            if value is None:
+                continue
+            as_float = _as_float(value)
+            if as_float is None:
+                numeric = False
+                break
+            values[batch_idx, name_idx] = as_float
+            counts[batch_idx, name_idx] = 1
+        if not numeric:
+            break
+
+    signature = [float(numeric), len(per_batch_metrics), _names_checksum(names)]
+    if not _agree(collective, signature) or not numeric:
+        return None
+    if not per_batch_metrics:
+        return []
+
+    reduced = collective.allreduce_sum(np.concatenate([values.reshape(-1), counts.reshape(-1)]))
+    sums, totals = np.split(reduced, 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = (sums / totals).reshape(values.shape)
+
+    averaged = []  # type: List[Dict[str, Any]]
+    for batch_means in means:
+        averaged.append(
+            {
+                name: np.array(mean) if array_metrics[name] else mean
+                for name, mean in zip(names, batch_means)
+            }
+        )
+    return averaged
+
+
+def _allreduce_reduced_metrics(
+    collective: _TensorCollective,
+    metrics: Dict[str, Any],
+    num_batches: int,
+    metrics_reducers: Dict[str, Reducer],
+) -> Optional[Dict[str, Any]]:
+    """
+    Combine the per-slot reductions of validation metrics across all slots, weighting averages by
+    the number of batches of each slot. Sums and averages are combined with a single allreduce;
+    a single allgather is used instead if any metric is reduced with MAX or MIN. Return None on
+    every slot if the metrics are not numeric scalars or if the slots do not agree on them.
+    """
+    names = sorted(metrics)
+    reducers = [metrics_reducers[name] for name in names]
+    values = [_as_float(metrics[name]) for name in names]
+    numeric = all(value is not None for value in values)
+
+    signature = [
+        float(numeric),
+        _names_checksum(names),
+        *(float(reducer.value) for reducer in reducers),
+    ]
+    if not _agree(collective, signature) or not numeric:
+        return None
+
+    packed = np.array([*values, num_batches], dtype=np.float64)
+    if all(reducer in (Reducer.AVG, Reducer.SUM) for reducer in reducers):
+        weights = np.array(
+            [num_batches if reducer == Reducer.AVG else 1 for reducer in reducers] + [1],
+            dtype=np.float64,
+        )
+        reduced = collective.allreduce_sum(packed * weights)
+        total_batches = reduced[-1]
+        return {
+            name: np.float64(value / total_batches if reducer == Reducer.AVG else value)
+            for name, reducer, value in zip(names, reducers, reduced[:-1])
+        }
+
+    gathered = collective.allgather(packed)
+    batches_per_slot = [int(n) for n in gathered[:, -1]]
+    return {
+        name: _reduce_metrics(reducer, gathered[:, idx], batches_per_slot)
+        for idx, (name, reducer) in enumerate(zip(names, reducers))
+    }
+
+
+def _value_signature(value: Any) -> Tuple[int, int, int]:
+    """
+    Return (kind, dtype checksum, number of elements) for a value returned by per_slot_reduce(),
+    where kind is _NOT_NUMERIC unless the value can be gathered exactly as float64 elements.
+    """
+    if isinstance(value, bool) or isinstance(value, np.ndarray) and value.dtype.kind == "b":
+        # Booleans would be gathered as 0.0 or 1.0, so keep them pickled to preserve their type.
+        return _NOT_NUMERIC, 0, 0
+    if isinstance(value, int):
+        if abs(value) >= _MAX_EXACT_INT:
+            return _NOT_NUMERIC, 0, 0
+        return _PYTHON_INT, 0, 1
+    if isinstance(value, float):
+        return _PYTHON_FLOAT, 0, 1
+    if isinstance(value, np.ndarray):
+        exact = value.dtype.kind == "f" and value.dtype.itemsize <= 8
+        exact = exact or value.dtype.kind in "iu" and value.dtype.itemsize <= 4
+        if exact:
+            dtype_checksum = zlib.crc32(f"{value.dtype.str}{value.shape}".encode("utf8"))
+            return _NUMPY, dtype_checksum, value.size
+    return _NOT_NUMERIC, 0, 0
+
+
+def _allgather_per_slot_metrics(
+    collective: _TensorCollective,
+    per_slot_metrics: List[Any],
+    allgather_fn: Callable[[Any], List[Any]],
+) -> List[List[Any]]:
+    """
+    Gather the per_slot_reduce() values of every reducer from every slot, returning a list (over
+    slots) of lists (over reducers), like allgather_fn(per_slot_metrics) would.
+
+    Values which are Python numbers or numpy arrays of the same dtype and shape on every slot are
+    gathered with a single tensor allgather. Only the remaining values are pickled and gathered
+    with allgather_fn, and only if there are any.
+    """
+    signatures = [_value_signature(value) for value in per_slot_metrics]
+    gathered_signatures = collective.allgather(np.array(signatures, dtype=np.float64).reshape(-1))
+    gathered_signatures = gathered_signatures.reshape(len(gathered_signatures), -1, 3)
+    num_slots = len(gathered_signatures)
+
+    # Every slot makes the same decision for each value, since it is based on gathered signatures.
+    is_tensor = [
+        bool(np.all(slot_signatures == slot_signatures[0]) and slot_signatures[0][0] != 0)
+        for slot_signatures in np.transpose(gathered_signatures, (1, 0, 2))
+    ]
+
+    out = [[None] * len(per_slot_metrics) for _ in range(num_slots)]  # type: List[List[Any]]
+
+    tensor_idxs = [idx for idx, tensor in enumerate(is_tensor) if tensor]
+    if tensor_idxs:
+        packed = np.concatenate(
+            [np.asarray(per_slot_metrics[idx], dtype=np.float64).reshape(-1) for idx in tensor_idxs]
+        )
+        gathered = collective.allgather(packed)
+        offset = 0
+        for idx in tensor_idxs:
+            template = per_slot_metrics[idx]
+            kind, _, size = signatures[idx]
+            for slot in range(num_slots):
+                flat = gathered[slot, offset : offset + size]
+                if kind == _PYTHON_INT:
+                    out[slot][idx] = int(flat[0])
+                elif kind == _PYTHON_FLOAT:
+                    out[slot][idx] = float(flat[0])
+                else:
+                    out[slot][idx] = flat.astype(template.dtype).reshape(template.shape)
+            offset += size
+
+    pickled_idxs = [idx for idx, tensor in enumerate(is_tensor) if not tensor]
+    if pickled_idxs:
+        pickled = allgather_fn([per_slot_metrics[idx] for idx in pickled_idxs])
+        for slot, slot_values in enumerate(pickled):
+            for idx, value in zip(pickled_idxs, slot_values):
+                out[slot][idx] = value
+
+    return out
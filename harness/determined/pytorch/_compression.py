@@ -0,0 +1,251 @@
+import abc
+from typing import Any, Dict, List, Optional, Tuple
+
+import torch
+
+from determined.horovod import hvd
+
+# Gradients with fewer elements than this are not worth compressing with PowerSGD; they are
+# exchanged in full, together with the gradients of biases and other vectors.
+_POWERSGD_MIN_NUMEL = 4096
+
+# All slots must draw the same initial PowerSGD factors.
+_POWERSGD_SEED = 0
+
+
+class _GradientCollective(metaclass=abc.ABCMeta):
+    """_GradientCollective communicates gradient tensors between all the slots of a trial."""
+
+    @abc.abstractmethod
+    def size(self) -> int:
+        pass
+
+    @abc.abstractmethod
+    def allreduce_sum(self, tensor: torch.Tensor, name: str) -> torch.Tensor:
+        """Return the elementwise sum of the tensors of every slot."""
+        pass
+
+    @abc.abstractmethod
+    def allgather(self, tensor: torch.Tensor, name: str) -> torch.Tensor:
+        """Return the tensors of every slot concatenated along dimension 0, in rank order."""
+        pass
+
+
+class _HorovodGradientCollective(_GradientCollective):
+    def size(self) -> int:
+        return int(hvd.size())
+
+    def allreduce_sum(self, tensor: torch.Tensor, name: str) -> torch.Tensor:
+        return hvd.allreduce(tensor, op=hvd.Sum, name=name)
+
+    def allgather(self, tensor: torch.Tensor, name: str) -> torch.Tensor:
+        return hvd.allgather(tensor, name=name)
+
+
+class _BF16Compression:
+    """
+    Compress tensors to bfloat16 when they are exchanged by hvd.DistributedOptimizer, like
+    hvd.Compression.fp16 does for float16. Unlike float16, bfloat16 has the range of float32, so
+    large gradients do not overflow.
+    """
+
+    @staticmethod
+    def compress(tensor: torch.Tensor) -> Tuple[torch.Tensor, Any]:
+        if tensor.dtype.is_floating_point:
+            return tensor.type(torch.bfloat16), tensor.dtype
+        return tensor, None
+
+    @staticmethod
+    def decompress(tensor: torch.Tensor, ctx: Any) -> torch.Tensor:
+        return tensor if ctx is None else tensor.type(ctx)
+
+
+def _cast_dtype(method: Optional[str]) -> Optional[torch.dtype]:
+    """Return the type that gradients are cast to by a cast compression method, if any."""
+    return {"fp16": torch.float16, "bf16": torch.bfloat16}.get(method or "")
+
+
+def _horovod_compression(method: Optional[str]) -> Any:
+    """Return the compression of hvd.DistributedOptimizer for a cast compression method."""
+    if method == "fp16":
+        return hvd.Compression.fp16
+    if method == "bf16":
+        return _BF16Compression
+    return hvd.Compression.none
+
+
+class _GradientCompressor(metaclass=abc.ABCMeta):
+    """
+    _GradientCompressor averages gradients across all slots, exchanging less data than the
+    gradients themselves. The compression is lossy; the error of each step is kept and added to
+    the gradients of the next step (error feedback), so that it is not lost but only delayed.
+    """
+
+    def __init__(self, collective: _GradientCollective) -> None:
+        self._collective = collective
+        self._errors = {}  # type: Dict[int, torch.Tensor]
+
+    @abc.abstractmethod
+    def allreduce_mean(self, grads: List[torch.Tensor]) -> float:
+        """
+        Replace each of grads with its mean across all slots, in place, and return the compression
+        ratio: the number of elements of grads over the number of elements sent by this slot.
+        """
+        pass
+
+    def _compensate(self, idx: int, grad: torch.Tensor) -> torch.Tensor:
+        """Return grad as float32 with the error of the previous step added to it."""
+        compensated = grad.detach().float()
+        error = self._errors.get(idx)
+        if error is not None:
+            compensated = compensated + error
+        return compensated
+
+
+class _TopKCompressor(_GradientCompressor):
+    """
+    _TopKCompressor exchanges only the largest gradients by magnitude, ratio of them in total,
+    as (index, value) pairs. The selected gradients of all slots are gathered with one allgather
+    for the values and one for the indices, and summed where the slots selected the same index.
+    """
+
+    def __init__(self, collective: _GradientCollective, ratio: float) -> None:
+        super().__init__(collective)
+        self._ratio = ratio
+
+    def allreduce_mean(self, grads: List[torch.Tensor]) -> float:
+        if not grads:
+            return 1.0
+        flat = torch.cat(
+            [self._compensate(idx, grad).reshape(-1) for idx, grad in enumerate(grads)]
+        )
+        numel = flat.numel()
+        k = max(1, int(numel * self._ratio))
+
+        _, indices = torch.topk(flat.abs(), k, sorted=False)
+        values = flat[indices]
+
+        # The gradients that are not sent this step are the error of this step.
+        flat[indices] = 0
+        offset = 0
+        for idx, grad in enumerate(grads):
+            self._errors[idx] = flat[offset : offset + grad.numel()].view_as(grad)
+            offset += grad.numel()
+
+        index_dtype = torch.int32 if numel < 2 ** 31 else torch.int64
+        all_values = self._collective.allgather(values, name="det_topk_values")
+        all_indices = self._collective.allgather(indices.to(index_dtype), name="det_topk_indices")
+
+        mean = torch.zeros(numel, dtype=flat.dtype, device=flat.device)
+        mean.index_add_(0, all_indices.long(), all_values)
+        mean.div_(self._collective.size())
+
+        offset = 0
+        for grad in grads:
+            grad.copy_(mean[offset : offset + grad.numel()].view_as(grad))
+            offset += grad.numel()
+
+        return numel / (2 * k)
+
+
+def _orthogonalize(matrix: torch.Tensor, eps: float = 1e-8) -> None:
+    """Orthonormalize the columns of matrix in place, with Gram-Schmidt."""
+    for i in range(matrix.shape[1]):
+        col = matrix[:, i : i + 1]
+        col.div_(col.norm() + eps)
+        if i + 1 < matrix.shape[1]:
+            rest = matrix[:, i + 1 :]
+            rest.sub_(col * torch.sum(col * rest, dim=0, keepdim=True))
+
+
+class _PowerSGDCompressor(_GradientCompressor):
+    """
+    _PowerSGDCompressor exchanges a rank-r approximation P @ Q.T of each gradient matrix, computed
+    with one step of power iteration from the Q of the previous step (PowerSGD, Vogels et al.,
+    2019). The P of every matrix are averaged with a single allreduce, and then so are the Q.
+    Gradients that are too small to compress are averaged in full with one more allreduce.
+    """
+
+    def __init__(self, collective: _GradientCollective, rank: int) -> None:
+        super().__init__(collective)
+        self._rank = rank
+        self._qs = {}  # type: Dict[int, torch.Tensor]
+        self._generator = torch.Generator().manual_seed(_POWERSGD_SEED)
+
+    def _compressible(self, grad: torch.Tensor) -> bool:
+        if grad.dim() < 2 or grad.numel() < _POWERSGD_MIN_NUMEL:
+            return False
+        n, m = grad.shape[0], grad.numel() // grad.shape[0]
+        # Otherwise P and Q together would be at least as large as the matrix.
+        return self._rank * (n + m) < n * m
+
+    def _q(self, idx: int, matrix: torch.Tensor) -> torch.Tensor:
+        q = self._qs.get(idx)
+        if q is None:
+            q = torch.randn(matrix.shape[1], self._rank, generator=self._generator)
+            q = q.to(matrix.device)
+            self._qs[idx] = q
+        return q
+
+    def allreduce_mean(self, grads: List[torch.Tensor]) -> float:
+        size = self._collective.size()
+        matrices = {}  # type: Dict[int, torch.Tensor]
+        uncompressed = []  # type: List[int]
+        for idx, grad in enumerate(grads):
+            if self._compressible(grad):
+                compensated = self._compensate(idx, grad)
+                matrices[idx] = compensated.reshape(grad.shape[0], -1)
+            else:
+                uncompressed.append(idx)
+
+        sent = 0
+        if uncompressed:
+            flat = torch.cat([grads[idx].detach().reshape(-1).float() for idx in uncompressed])
+            flat = self._collective.allreduce_sum(flat, name="det_powersgd_uncompressed")
+            flat.div_(size)
+            offset = 0
+            for idx in uncompressed:
+                grad = grads[idx]
+                grad.copy_(flat[offset : offset + grad.numel()].view_as(grad))
+                offset += grad.numel()
+            sent += flat.numel()
+
+        if matrices:
+            ps = {idx: matrix @ self._q(idx, matrix) for idx, matrix in matrices.items()}
+            self._allreduce_mean_factors(ps, "det_powersgd_p")
+            for p in ps.values():
+                _orthogonalize(p)
+
+            qs = {idx: matrix.t() @ ps[idx] for idx, matrix in matrices.items()}
+            # The error is what this slot's own approximation misses, before Q is averaged.
+            for idx, matrix in matrices.items():
+                self._errors[idx] = (matrix - ps[idx] @ qs[idx].t()).view_as(grads[idx])
+            self._allreduce_mean_factors(qs, "det_powersgd_q")
+
+            for idx in matrices:
+                grads[idx].copy_((ps[idx] @ qs[idx].t()).view_as(grads[idx]))
+                self._qs[idx] = qs[idx]
+                sent += ps[idx].numel() + qs[idx].numel()
+
+        return sum(grad.numel() for grad in grads) / max(sent, 1)
+
+    def _allreduce_mean_factors(self, factors: Dict[int, torch.Tensor], name: str) -> None:
+        flat = torch.cat([factor.reshape(-1) for factor in factors.values()])
+        flat = self._collective.allreduce_sum(flat, name=name)
+        flat.div_(self._collective.size())
+        offset = 0
+        for factor in factors.values():
+            factor.copy_(flat[offset : offset + factor.numel()].view_as(factor))
+            offset += factor.numel()
+
+
+def _make_compressor(
+    method: Optional[str], rank: int, topk_ratio: float, collective: _GradientCollective
+) -> Optional[_GradientCompressor]:
+    """Return the compressor of a compression method, or None if hvd.DistributedOptimizer can
+    compress gradients with that method itself."""
+    if method == "topk":
+        return _TopKCompressor(collective, topk_ratio)
+    if method == "powersgd":
+        return _PowerSGDCompressor(collective, rank)
+    return None
@@ -1,3 +1,4 @@
+import itertools
 import logging
 from typing import (
     Any,
@@ -9,6 +10,7 @@ from typing import (
     Optional,
     Sequence,
     Set,
+    Sized,
     Type,
     TypeVar,
     Union,
@@ -158,7 +160,9 @@ class DataLoader:
             #    else:
             #        sampler = SequentialSampler(dataset)
             if shuffle:
-                sampler = RandomSampler(dataset)  # type: ignore
+                # Unlike RandomSampler, _EpochRandomSampler can start from any epoch, which lets
+                # SkipBatchSampler resume training without replaying every prior epoch.
+                sampler = _EpochRandomSampler(dataset)  # type: ignore
             else:
                 sampler = SequentialSampler(dataset)  # type: ignore
 
@@ -246,6 +250,74 @@ def adapt_batch_sampler(
     return batch_sampler
 
 
+class _EpochRandomSampler(RandomSampler):
+    """
+    _EpochRandomSampler samples the elements of a dataset in a random order, like RandomSampler,
+    reshuffling them every time it is iterated over. Each epoch is shuffled by a generator seeded
+    with the seed of the sampler plus the number of the epoch, so that set_epoch() can jump to any
+    epoch without drawing the orders of the ones before it.
+    """
+
+    def __init__(self, data_source: Sized, seed: Optional[int] = None) -> None:
+        super().__init__(data_source)  # type: ignore
+        if seed is None:
+            # Draw the seed from the global generator, which is seeded with the trial seed, so that
+            # the orders are reproducible across restarts of the trial.
+            seed = int(torch.empty((), dtype=torch.int64).random_().item())
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch that the next iteration over the sampler yields."""
+        self.epoch = epoch
+
+    def __iter__(self) -> Iterator[int]:
+        generator = torch.Generator()
+        generator.manual_seed(self.seed + self.epoch)
+        self.epoch += 1
+        yield from torch.randperm(len(self.data_source), generator=generator).tolist()
+
+    def __len__(self) -> int:
+        return len(self.data_source)
+
+
+def _seekable_epochs(batch_sampler: torch.utils.data.BatchSampler) -> bool:
+    """
+    Return True if each pass over batch_sampler yields batches that depend only on the number of
+    the pass, so that _seek() can start at any pass.
+    """
+    if type(batch_sampler) is not BatchSampler or len(batch_sampler) == 0:
+        return False
+    return type(batch_sampler.sampler) in (SequentialSampler, _EpochRandomSampler)
+
+
+def _seek(batch_sampler: torch.utils.data.BatchSampler, skip: int) -> Optional[Iterator]:
+    """
+    Return an iterator over the batches of batch_sampler that follow the first skip batches, like
+    SkipBatchSampler, but without generating the skipped epochs. Return None if batch_sampler is
+    not made of samplers whose position can be computed, in which case the skipped batches must be
+    generated one by one.
+    """
+    if isinstance(batch_sampler, DistributedBatchSampler):
+        # A replica takes every num_replicas-th batch of the wrapped sampler, from its rank onward.
+        inner = _seek(batch_sampler.batch_sampler, skip * batch_sampler.num_replicas)
+        if inner is None:
+            return None
+        return itertools.islice(inner, batch_sampler.rank, None, batch_sampler.num_replicas)
+
+    if isinstance(batch_sampler, RepeatBatchSampler):
+        base = batch_sampler.batch_sampler
+        if not _seekable_epochs(base):
+            return None
+        epoch, offset = divmod(skip, len(base))
+        if isinstance(base.sampler, _EpochRandomSampler):
+            base.sampler.set_epoch(base.sampler.epoch + epoch)
+        # Only the batches of the epoch being resumed are generated, and later epochs follow on.
+        return itertools.chain(itertools.islice(iter(base), offset, None), iter(batch_sampler))
+
+    return None
+
+
 class RepeatBatchSampler(torch.utils.data.BatchSampler):
     """
     RepeatBatchSampler yields infinite batches indices by repeatedly iterating
@@ -319,6 +391,11 @@ class SkipBatchSampler(torch.utils.data.BatchSampler):
     RepeatBatchSampler, it makes more sense to report the full length of the
     base BatchSampler. This behavior is controlled using the same_length
     parameter.
+
+    If the base BatchSampler repeats a BatchSampler over a SequentialSampler or
+    over the shuffled sampler of a det.pytorch.DataLoader (possibly wrapped in a
+    DistributedBatchSampler), the skipped batches are not generated: iteration
+    starts directly at the right offset of the right epoch.
     """
 
     def __init__(
@@ -334,6 +411,11 @@ class SkipBatchSampler(torch.utils.data.BatchSampler):
         return self.length
 
     def __iter__(self) -> Generator:
+        seeked = _seek(self.batch_sampler, self.skip)
+        if seeked is not None:
+            yield from seeked
+            return
+
         iterator = iter(self.batch_sampler)
         for _ in range(self.skip):
             try:
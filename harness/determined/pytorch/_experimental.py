@@ -1,6 +1,8 @@
 from typing import Any, Callable, Dict, Optional, Union, cast
 
 from determined import pytorch, util
+from determined.common import check
+from determined.pytorch import _gradient_buckets
 
 # AMP is only available in PyTorch 1.6+
 try:
@@ -14,6 +16,8 @@ class PyTorchExperimentalContext:
     def __init__(self, parent: Any) -> None:
         self._parent = parent
         self._auto_amp = False
+        self._bucket_cap_mb = None  # type: Optional[float]
+        self._metric_flush_batches = None  # type: Optional[int]
 
     def use_amp(self) -> None:
         """
@@ -28,6 +32,40 @@ class PyTorchExperimentalContext:
         self._parent.wrap_scaler(amp.GradScaler())  # type: ignore
         self._auto_amp = True
 
+    def overlap_gradient_communication(
+        self, bucket_cap_mb: float = _gradient_buckets.DEFAULT_BUCKET_CAP_MB
+    ) -> None:
+        """
+        Communicates gradients during the backward pass in distributed training, rather than after
+        it. Gradients are grouped into buckets of about ``bucket_cap_mb`` megabytes, and each bucket
+        is averaged across slots as soon as all of its gradients have been computed, while the
+        backward pass continues. With :ref:`optimizations.aggregation_frequency
+        <config-aggregation-frequency>` greater than 1, gradients are only communicated during the
+        backward pass of the last batch before each optimizer step.
+
+        This must be called before
+        :meth:`~determined.pytorch.PyTorchTrialContext.wrap_optimizer`. It can not be combined
+        with the ``topk`` or ``powersgd`` methods of ``optimizations.gradient_compression_method``.
+        """
+        check.gt(bucket_cap_mb, 0, "bucket_cap_mb must be positive")
+        check.eq(
+            len(self._parent.optimizers),
+            0,
+            "Please call overlap_gradient_communication() before wrap_optimizer().",
+        )
+        self._bucket_cap_mb = bucket_cap_mb
+
+    def defer_metric_transfer(self, flush_batches: int = 100) -> None:
+        """
+        Keeps the tensor metrics returned by ``train_batch`` and ``evaluate_batch`` on the device
+        instead of copying them to the host after every batch, which waits for the device to
+        finish the batch. The metrics of up to ``flush_batches`` batches are kept on the device and
+        then copied to the host together. Metrics that include per-sample outputs use device memory
+        for every batch that is kept, so lower ``flush_batches`` for them.
+        """
+        check.gt(flush_batches, 0, "flush_batches must be positive")
+        self._metric_flush_batches = flush_batches
+
     @util.deprecated(
         "context.experimental.reset_reducers() is deprecated since 0.15.2 and will be removed in a "
         "future version; use context.reset_reducers() directly."
@@ -0,0 +1,193 @@
+import abc
+from typing import Any, Dict, List, Optional
+
+import torch
+
+from determined.common import check
+from determined.horovod import hvd
+
+DEFAULT_BUCKET_CAP_MB = 25.0
+
+
+class _AsyncCollective(metaclass=abc.ABCMeta):
+    """_AsyncCollective sums tensors across all the slots of a trial without blocking."""
+
+    @abc.abstractmethod
+    def size(self) -> int:
+        pass
+
+    @abc.abstractmethod
+    def allreduce_sum_async(self, tensor: torch.Tensor, name: str) -> Any:
+        """Start summing tensor in place across all slots and return a handle to wait() on."""
+        pass
+
+    @abc.abstractmethod
+    def wait(self, handle: Any) -> None:
+        pass
+
+
+class _HorovodAsyncCollective(_AsyncCollective):
+    def size(self) -> int:
+        return int(hvd.size())
+
+    def allreduce_sum_async(self, tensor: torch.Tensor, name: str) -> Any:
+        return hvd.allreduce_async_(tensor, op=hvd.Sum, name=name)
+
+    def wait(self, handle: Any) -> None:
+        hvd.synchronize(handle)
+
+
+class _TorchDistributedAsyncCollective(_AsyncCollective):
+    def size(self) -> int:
+        return int(torch.distributed.get_world_size())
+
+    def allreduce_sum_async(self, tensor: torch.Tensor, name: str) -> Any:
+        return torch.distributed.all_reduce(tensor, async_op=True)
+
+    def wait(self, handle: Any) -> None:
+        handle.wait()
+
+
+class _Bucket:
+    def __init__(self, params: List[torch.nn.Parameter]) -> None:
+        self.params = params
+        self.pending = len(params)
+        self.buffer = None  # type: Optional[torch.Tensor]
+        self.handle = None  # type: Any
+
+
+class _GradientBucketReducer:
+    """
+    _GradientBucketReducer averages the gradients of parameters across all slots, overlapping the
+    communication with the backward pass.
+
+    Parameters are grouped into buckets of about bucket_cap_bytes each, in the reverse of the order
+    they were given in, which is roughly the order their gradients are computed in by the backward
+    pass. A hook on each parameter counts the backward passes that reached it; in the last of the
+    passes_per_step backward passes before a step, the gradients of a bucket are flattened and an
+    asynchronous allreduce is started as soon as every gradient of the bucket is ready, while the
+    backward pass continues with the remaining layers. synchronize() waits for the allreduces and
+    copies the averaged gradients back.
+
+    Buckets are always started in the same order, so that collectives which must be started in
+    the same order on every slot, like those of torch.distributed, do not deadlock.
+    """
+
+    def __init__(
+        self,
+        params: List[torch.nn.Parameter],
+        collective: _AsyncCollective,
+        bucket_cap_bytes: int,
+        passes_per_step: int = 1,
+        dtype: Optional[torch.dtype] = None,
+    ) -> None:
+        check.gt_eq(passes_per_step, 1, "passes_per_step must be >= 1")
+        self._collective = collective
+        self._passes_per_step = passes_per_step
+        # Gradients are communicated as this type, if it is set (e.g. for fp16 compression).
+        self._dtype = dtype
+
+        unique = {}  # type: Dict[torch.nn.Parameter, None]
+        for p in params:
+            if p.requires_grad:
+                unique[p] = None
+
+        self._buckets = []  # type: List[_Bucket]
+        self._bucket_of = {}  # type: Dict[torch.nn.Parameter, _Bucket]
+        bucket_params = []  # type: List[torch.nn.Parameter]
+        bucket_bytes = 0
+        for p in reversed(list(unique)):
+            # Only gradients of the same type on the same device can be flattened together.
+            if bucket_params and (
+                bucket_bytes >= bucket_cap_bytes
+                or p.dtype != bucket_params[0].dtype
+                or p.device != bucket_params[0].device
+            ):
+                self._add_bucket(bucket_params)
+                bucket_params, bucket_bytes = [], 0
+            bucket_params.append(p)
+            bucket_bytes += p.numel() * p.element_size()
+        if bucket_params:
+            self._add_bucket(bucket_params)
+
+        self._countdown = {p: passes_per_step for p in unique}  # type: Dict[Any, int]
+        self._next_bucket = 0
+        # The gradient accumulators must be kept alive for their hooks to be called.
+        self._grad_accs = []  # type: List[Any]
+        for p in unique:
+            self._register_hook(p)
+
+    def _add_bucket(self, params: List[torch.nn.Parameter]) -> None:
+        bucket = _Bucket(params)
+        self._buckets.append(bucket)
+        for p in params:
+            self._bucket_of[p] = bucket
+
+    def _register_hook(self, p: torch.nn.Parameter) -> None:
+        # Hooks on the gradient accumulator of a parameter are called after its gradient has been
+        # accumulated into p.grad, unlike hooks on the parameter itself.
+        grad_acc = p.expand_as(p).grad_fn.next_functions[0][0]
+        grad_acc.register_hook(lambda *_: self._on_grad_ready(p))
+        self._grad_accs.append(grad_acc)
+
+    def _on_grad_ready(self, p: torch.nn.Parameter) -> None:
+        check.gt(
+            self._countdown[p],
+            0,
+            "Gradients were computed more than backward_passes_per_step times before the "
+            "optimizer was stepped.",
+        )
+        self._countdown[p] -= 1
+        if self._countdown[p] > 0:
+            return
+        bucket = self._bucket_of[p]
+        bucket.pending -= 1
+        if bucket.pending == 0:
+            self._start_ready_buckets()
+
+    def _start_ready_buckets(self) -> None:
+        while self._next_bucket < len(self._buckets):
+            bucket = self._buckets[self._next_bucket]
+            if bucket.pending > 0:
+                return
+            self._start(self._next_bucket)
+
+    def _start(self, idx: int) -> None:
+        bucket = self._buckets[idx]
+        grads = [p.grad if p.grad is not None else torch.zeros_like(p) for p in bucket.params]
+        buffer = torch.cat([grad.detach().reshape(-1) for grad in grads])
+        if self._dtype is not None:
+            buffer = buffer.to(self._dtype)
+        bucket.buffer = buffer
+        bucket.handle = self._collective.allreduce_sum_async(buffer, name=f"det_grad_bucket_{idx}")
+        self._next_bucket = idx + 1
+
+    def synchronize(self) -> None:
+        """
+        Wait for the gradients of every bucket to be averaged and copy them back into p.grad.
+        Buckets whose gradients were not all computed, e.g. because some parameters were not used,
+        are started now, with zeros in place of the missing gradients.
+        """
+        while self._next_bucket < len(self._buckets):
+            self._start(self._next_bucket)
+
+        size = self._collective.size()
+        for bucket in self._buckets:
+            assert bucket.buffer is not None
+            self._collective.wait(bucket.handle)
+            bucket.buffer.div_(size)
+            offset = 0
+            for p in bucket.params:
+                averaged = bucket.buffer[offset : offset + p.numel()].view_as(p)
+                if p.grad is None:
+                    p.grad = averaged.to(p.dtype).clone()
+                else:
+                    p.grad.data.copy_(averaged)
+                offset += p.numel()
+            bucket.pending = len(bucket.params)
+            bucket.buffer = None
+            bucket.handle = None
+
+        for p in self._countdown:
+            self._countdown[p] = self._passes_per_step
+        self._next_bucket = 0
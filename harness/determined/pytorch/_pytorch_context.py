@@ -1,3 +1,5 @@
+import contextlib
+import functools
 import logging
 from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
 
@@ -5,9 +7,10 @@ import torch
 import torch.nn as nn
 
 import determined as det
-from determined import pytorch
+from determined import profiler, pytorch
 from determined.common import check
 from determined.horovod import hvd
+from determined.pytorch import _collective, _compression, _gradient_buckets
 from determined.tensorboard import get_base_path
 
 # Apex is included only for GPU trials.
@@ -49,7 +52,19 @@ class PyTorchTrialContext(det.TrialContext, pytorch._PyTorchReducerContext):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         det.TrialContext.__init__(self, *args, **kwargs)
-        pytorch._PyTorchReducerContext.__init__(self, self.distributed._zmq_allgather)
+
+        # Numeric metrics are reduced across slots with tensor collectives, rather than pickled
+        # through the chief.
+        self._collective = None  # type: Optional[_collective._TensorCollective]
+        allgather_fn = self.distributed._zmq_allgather  # type: Callable[[Any], List[Any]]
+        if self.hvd_config.use:
+            self._collective = _collective._HorovodCollective()
+            allgather_fn = functools.partial(
+                _collective._allgather_per_slot_metrics,
+                self._collective,
+                allgather_fn=self.distributed._zmq_allgather,
+            )
+        pytorch._PyTorchReducerContext.__init__(self, allgather_fn)
 
         self._init_device()
 
@@ -77,6 +92,18 @@ class PyTorchTrialContext(det.TrialContext, pytorch._PyTorchReducerContext):
         self._last_backward_batch_idx = None  # type: Optional[int]
         self._current_batch_idx = None  # type: Optional[int]
 
+        # Gradients of optimizers that are not wrapped in a horovod.DistributedOptimizer, because
+        # their compression method is not supported by it, are compressed and averaged by these
+        # compressors, using the parameters of each optimizer at the time it was wrapped.
+        self._compressors = {}  # type: Dict[Any, Tuple[_compression._GradientCompressor, List]]
+
+        # Gradients of optimizers that are not wrapped in a horovod.DistributedOptimizer, because
+        # their communication is overlapped with the backward pass, are averaged by these reducers.
+        self._bucket_reducers = {}  # type: Dict[Any, _gradient_buckets._GradientBucketReducer]
+
+        # The ProfilerAgent of the trial, which is set by the PyTorchTrialController.
+        self._prof = None  # type: Optional[profiler.ProfilerAgent]
+
         self.experimental = pytorch.PyTorchExperimentalContext(self)
         self._reducers = pytorch._PyTorchReducerContext()
 
@@ -195,14 +222,61 @@ class PyTorchTrialContext(det.TrialContext, pytorch._PyTorchReducerContext):
                 "backward_passes_per_step for local gradient aggregation must be >= 1",
             )
 
+            compressor = None
             if self.hvd_config.use:
-                use_compression = self.hvd_config.fp16_compression
+                compressor = _compression._make_compressor(
+                    self.hvd_config.gradient_compression_method,
+                    self.hvd_config.gradient_compression_rank,
+                    self.hvd_config.gradient_compression_topk_ratio,
+                    _compression._HorovodGradientCollective(),
+                )
+
+            if compressor is not None:
+                check.is_none(
+                    self.experimental._bucket_cap_mb,
+                    "overlap_gradient_communication() can not be used with "
+                    f"{self.hvd_config.gradient_compression_method} gradient compression.",
+                )
+                params = [p for _, p in self._filter_named_parameters(optimizer)]
+                self._compressors[optimizer] = (compressor, params)
+                logging.debug(
+                    "Initialized optimizer for distributed training with "
+                    f"{self.hvd_config.gradient_compression_method} gradient compression."
+                )
+            elif self.hvd_config.use and (
+                self.experimental._bucket_cap_mb is not None or self.hvd_config.backend == "torch"
+            ):
+                # There is no DistributedOptimizer for the torch distributed backend, so its
+                # gradients are always averaged in buckets.
+                collective = (
+                    _gradient_buckets._TorchDistributedAsyncCollective()
+                    if self.hvd_config.backend == "torch"
+                    else _gradient_buckets._HorovodAsyncCollective()
+                )  # type: _gradient_buckets._AsyncCollective
+                bucket_cap_mb = self.experimental._bucket_cap_mb
+                if bucket_cap_mb is None:
+                    bucket_cap_mb = _gradient_buckets.DEFAULT_BUCKET_CAP_MB
+                self._bucket_reducers[optimizer] = _gradient_buckets._GradientBucketReducer(
+                    [p for _, p in self._filter_named_parameters(optimizer)],
+                    collective,
+                    bucket_cap_bytes=int(bucket_cap_mb * 1024 * 1024),
+                    passes_per_step=backward_passes_per_step
+                    * self.hvd_config.aggregation_frequency,
+                    dtype=_compression._cast_dtype(self.hvd_config.gradient_compression_method),
+                )
+                logging.debug(
+                    "Initialized optimizer for distributed training with overlapped gradient "
+                    "communication."
+                )
+            elif self.hvd_config.use:
                 optimizer = hvd.DistributedOptimizer(
                     optimizer,
                     named_parameters=self._filter_named_parameters(optimizer),
                     backward_passes_per_step=backward_passes_per_step
                     * self.hvd_config.aggregation_frequency,
-                    compression=hvd.Compression.fp16 if use_compression else hvd.Compression.none,
+                    compression=_compression._horovod_compression(
+                        self.hvd_config.gradient_compression_method
+                    ),
                 )
                 logging.debug(
                     "Initialized optimizer for distributed and optimized parallel training."
@@ -538,7 +612,7 @@ class PyTorchTrialContext(det.TrialContext, pytorch._PyTorchReducerContext):
                     # to integrate torch native AMP (https://pytorch.org/docs/stable/amp.html),
                     # which will come out soon.
                     for optimizer in self.optimizers:
-                        optimizer.synchronize()  # type: ignore
+                        self._synchronize(optimizer)
         else:
             if self._scaler and self.experimental._auto_amp:
                 loss = self._scaler.scale(loss)
@@ -549,6 +623,36 @@ class PyTorchTrialContext(det.TrialContext, pytorch._PyTorchReducerContext):
                 create_graph=create_graph,
             )
 
+    def _synchronize(self, optimizer: torch.optim.Optimizer) -> None:
+        """Finish communicating the gradients of an optimizer across all slots."""
+        if optimizer in self._bucket_reducers:
+            with self._record_timing("gradient_communication"):
+                self._bucket_reducers[optimizer].synchronize()
+            return
+        if optimizer not in self._compressors:
+            with self._record_timing("gradient_communication"):
+                optimizer.synchronize()  # type: ignore
+            return
+
+        compressor, params = self._compressors[optimizer]
+        for p in params:
+            # Like horovod.DistributedOptimizer, treat missing gradients as zeros so that every
+            # slot exchanges the same gradients.
+            if p.grad is None:
+                p.grad = torch.zeros_like(p)
+        with self._record_timing("gradient_communication"):
+            ratio = compressor.allreduce_mean([p.grad.data for p in params])
+        if self._prof is not None:
+            self._prof.record_metric("gradient_compression_ratio", ratio)
+
+    @contextlib.contextmanager
+    def _record_timing(self, metric_name: str) -> Iterator[None]:
+        if self._prof is None:
+            yield
+            return
+        with self._prof.record_timing(metric_name):
+            yield
+
     def _average_gradients(self, parameters: Any, divisor: int) -> None:
         check.gt_eq(divisor, 1)
         if divisor == 1:
@@ -613,7 +717,7 @@ class PyTorchTrialContext(det.TrialContext, pytorch._PyTorchReducerContext):
         # this is called in backward() instead, so that it's inside the context
         # manager and before unscaling.
         if self.hvd_config.use and not self._use_apex:
-            optimizer.synchronize()  # type: ignore
+            self._synchronize(optimizer)
 
         parameters = (
             [p for group in optimizer.param_groups for p in group.get("params", [])]
@@ -643,7 +747,11 @@ class PyTorchTrialContext(det.TrialContext, pytorch._PyTorchReducerContext):
         else:
             step_fn = optimizer.step  # type: ignore
 
-        if self.hvd_config.use:
+        if (
+            self.hvd_config.use
+            and optimizer not in self._compressors
+            and optimizer not in self._bucket_reducers
+        ):
             with optimizer.skip_synchronize():  # type: ignore
                 step_fn()
         else:
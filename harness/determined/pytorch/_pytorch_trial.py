@@ -12,6 +12,7 @@ import determined as det
 from determined import horovod, pytorch, util, workload
 from determined.common import check
 from determined.horovod import hvd
+from determined.pytorch import _serialization
 from determined.util import has_param
 
 # Apex is included only for GPU trials.
@@ -29,6 +30,7 @@ class PyTorchTrialController(det.LoopTrialController):
         self.trial = cast(PyTorchTrial, trial_inst)
         self.context = cast(pytorch.PyTorchTrialContext, self.context)
         self.callbacks = self.trial.build_callbacks()
+        self.context._prof = self.prof
 
         check.gt_eq(
             len(self.context.models),
@@ -52,7 +54,12 @@ class PyTorchTrialController(det.LoopTrialController):
     @staticmethod
     def pre_execute_hook(env: det.EnvContext, hvd_config: horovod.HorovodContext) -> None:
         # Initialize the correct horovod.
-        if hvd_config.use:
+        if hvd_config.use and hvd_config.backend == "torch":
+            hvd.require_horovod_type(
+                "torch.distributed", "PyTorchTrial is in use with the torch distributed backend."
+            )
+            hvd.init()
+        elif hvd_config.use:
             hvd.require_horovod_type("torch", "PyTorchTrial is in use.")
             hvd.init()
 
@@ -83,6 +90,10 @@ class PyTorchTrialController(det.LoopTrialController):
     def supports_averaging_training_metrics() -> bool:
         return True
 
+    @staticmethod
+    def supports_torch_distributed() -> bool:
+        return True
+
     def _check_evaluate_implementation(self) -> None:
         """
         Check if the user has implemented evaluate_batch
@@ -218,6 +229,14 @@ class PyTorchTrialController(det.LoopTrialController):
     ) -> List[Dict[str, Any]]:
         """Average training metrics across GPUs"""
         check.true(self.hvd_config.use, "Can only average training metrics in multi-GPU training.")
+        assert self.context._collective is not None
+        averaged = pytorch._collective._allreduce_mean_batch_metrics(
+            self.context._collective, per_batch_metrics
+        )
+        if averaged is not None:
+            return averaged
+
+        # Fall back to gathering the metrics on the chief if they are not all numeric scalars.
         metrics_timeseries = util._list_to_dict(per_batch_metrics)
 
         # combined_timeseries is: dict[metric_name] -> 2d-array.
@@ -305,6 +324,8 @@ class PyTorchTrialController(det.LoopTrialController):
         end = start + num_batches
 
         per_batch_metrics = []  # type: List[Dict]
+        pending_metrics = []  # type: List[Dict]
+        flush_batches = self.context.experimental._metric_flush_batches
         num_inputs = 0
 
         for batch_idx in range(start, end):
@@ -358,19 +379,34 @@ class PyTorchTrialController(det.LoopTrialController):
                 for lr_scheduler in self.context.lr_schedulers:
                     self._auto_step_lr_scheduler_per_batch(batch_idx, lr_scheduler)
 
-            with self.prof.record_timing("from_device"):
-                for name, metric in tr_metrics.items():
-                    # Convert PyTorch metric values to NumPy, so that
-                    # `det.util.encode_json` handles them properly without
-                    # needing a dependency on PyTorch.
-                    if isinstance(metric, torch.Tensor):
-                        metric = metric.cpu().detach().numpy()
-                    tr_metrics[name] = metric
+            if flush_batches is None:
+                with self.prof.record_timing("from_device"):
+                    for name, metric in tr_metrics.items():
+                        # Convert PyTorch metric values to NumPy, so that
+                        # `det.util.encode_json` handles them properly without
+                        # needing a dependency on PyTorch.
+                        if isinstance(metric, torch.Tensor):
+                            metric = metric.cpu().detach().numpy()
+                        tr_metrics[name] = metric
+                per_batch_metrics.append(tr_metrics)
+            else:
+                pending_metrics.append(self._detach_metrics(tr_metrics))
+                if len(pending_metrics) >= flush_batches:
+                    with self.prof.record_timing("from_device"):
+                        per_batch_metrics += self._convert_batch_metrics_to_numpy(pending_metrics)
+                    pending_metrics = []
+                elif self.prof.is_enabled and self.prof.is_sampled_batch:
+                    # Nothing was copied from the device, so wait for it to finish the batch
+                    # before measuring the throughput.
+                    self._synchronize_device()
 
             batch_dur = time.time() - batch_start_time
             samples_per_second = batch_inputs / batch_dur
             self.prof.record_metric("samples_per_second", samples_per_second)
-            per_batch_metrics.append(tr_metrics)
+
+        if pending_metrics:
+            with self.prof.record_timing("from_device"):
+                per_batch_metrics += self._convert_batch_metrics_to_numpy(pending_metrics)
 
         # Aggregate and reduce training metrics from all the training processes.
         if self.hvd_config.use and self.hvd_config.average_training_metrics:
@@ -402,6 +438,49 @@ class PyTorchTrialController(det.LoopTrialController):
                 metrics[metric_name] = metric_val.cpu().numpy()
         return metrics
 
+    def _synchronize_device(self) -> None:
+        if self.context.device.type == "cuda":
+            torch.cuda.synchronize(self.context.device)
+
+    @staticmethod
+    def _detach_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Detach the tensor metrics of a batch from the autograd graph, leaving them on their device
+        so that they can be kept for later batches without synchronizing with the device. They are
+        copied in case the trial keeps updating a metric tensor in place.
+        """
+        return {
+            name: metric.detach().clone() if isinstance(metric, torch.Tensor) else metric
+            for name, metric in metrics.items()
+        }
+
+    @staticmethod
+    def _convert_batch_metrics_to_numpy(
+        batch_metrics: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert the tensor metrics of every batch to NumPy. The values that a metric takes across
+        batches are stacked on the device first, when they have the same shape, so that each
+        metric is transferred to the host only once for all of the batches.
+        """
+        converted = [dict(metrics) for metrics in batch_metrics]
+        names = {name for metrics in batch_metrics for name in metrics}
+        for name in names:
+            indices = [
+                i
+                for i, metrics in enumerate(batch_metrics)
+                if isinstance(metrics.get(name), torch.Tensor)
+            ]
+            tensors = [batch_metrics[i][name] for i in indices]
+            if len({(t.shape, t.dtype, t.device) for t in tensors}) == 1:
+                stacked = torch.stack(tensors).cpu().numpy()
+                for row, i in enumerate(indices):
+                    converted[i][name] = stacked[row, ...]
+            else:
+                for t, i in zip(tensors, indices):
+                    converted[i][name] = t.cpu().numpy()
+        return converted
+
     @torch.no_grad()  # type: ignore
     def _compute_validation_metrics(self) -> workload.Response:
         self.context.reset_reducers()
@@ -427,6 +506,8 @@ class PyTorchTrialController(det.LoopTrialController):
         if self._evaluate_batch_defined():
             keys = None
             batch_metrics = []
+            pending_metrics = []  # type: List[Dict]
+            flush_batches = self.context.experimental._metric_flush_batches
 
             self.validation_loader = cast(torch.utils.data.DataLoader, self.validation_loader)
             check.gt(len(self.validation_loader), 0)
@@ -456,11 +537,18 @@ class PyTorchTrialController(det.LoopTrialController):
                     "dictionary of string names to Tensor "
                     "metrics",
                 )
-                # TODO: For performance perform -> cpu() only at the end of validation.
-                batch_metrics.append(self._convert_metrics_to_numpy(vld_metrics))
+                if flush_batches is None:
+                    batch_metrics.append(self._convert_metrics_to_numpy(vld_metrics))
+                else:
+                    pending_metrics.append(self._detach_metrics(vld_metrics))
+                    if len(pending_metrics) >= flush_batches:
+                        batch_metrics += self._convert_batch_metrics_to_numpy(pending_metrics)
+                        pending_metrics = []
                 if self.env.test_mode:
                     break
 
+            batch_metrics += self._convert_batch_metrics_to_numpy(pending_metrics)
+
             for callback in self.callbacks.values():
                 callback.on_validation_epoch_end(batch_metrics)
 
@@ -559,6 +647,14 @@ class PyTorchTrialController(det.LoopTrialController):
             # Only the chief process will receive all the metrics.
             self.validation_loader = cast(torch.utils.data.DataLoader, self.validation_loader)
             num_batches = len(self.validation_loader)
+            assert self.context._collective is not None
+            reduced = pytorch._collective._allreduce_reduced_metrics(
+                self.context._collective, metrics, num_batches, metrics_reducers
+            )
+            if reduced is not None:
+                return reduced if self.is_chief else {}
+
+            # Fall back to gathering the metrics on the chief if they are not all numeric scalars.
             combined_metrics, batches_per_process = self._combine_metrics_across_processes(
                 metrics, num_batches
             )
@@ -617,7 +713,7 @@ class PyTorchTrialController(det.LoopTrialController):
         for ckpt_path in potential_paths:
             maybe_ckpt = self.load_path.joinpath(*ckpt_path)
             if maybe_ckpt.exists():
-                checkpoint = torch.load(str(maybe_ckpt), map_location="cpu")  # type: ignore
+                checkpoint = _serialization._load_checkpoint(str(maybe_ckpt))
                 break
         if checkpoint is None or not isinstance(checkpoint, dict):
             return
@@ -642,6 +738,8 @@ class PyTorchTrialController(det.LoopTrialController):
         else:
             for idx, optimizer in enumerate(self.context.optimizers):
                 optimizer.load_state_dict(checkpoint["optimizers_state_dict"][idx])
+        for optimizer in self.context.optimizers:
+            _serialization._clone_optimizer_state(optimizer)
 
         if "lr_scheduler" in checkpoint:
             # Backward compatible with older checkpoint format.
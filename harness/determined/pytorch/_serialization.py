@@ -0,0 +1,189 @@
+import inspect
+import logging
+import pickle
+import struct
+import sys
+import zipfile
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import torch
+from packaging import version
+
+# The fixed-size part of a zip local file header, which is followed by the file name and an extra
+# field before the data of the file.
+_LOCAL_FILE_HEADER = struct.Struct("<4sHHHHHLLLHH")
+
+_NUMPY_DTYPES = {
+    torch.float64: np.float64,
+    torch.float32: np.float32,
+    torch.float16: np.float16,
+    # numpy has no bfloat16, so bfloat16 data is mapped as int16 and viewed as bfloat16.
+    torch.bfloat16: np.int16,
+    torch.complex128: np.complex128,
+    torch.complex64: np.complex64,
+    torch.int64: np.int64,
+    torch.int32: np.int32,
+    torch.int16: np.int16,
+    torch.int8: np.int8,
+    torch.uint8: np.uint8,
+    torch.bool: np.bool_,
+}  # type: Dict[torch.dtype, Any]
+
+# torch.save() pickles every tensor as a call to this private function of torch, which
+# _MmapUnpickler replaces with _rebuild_tensor.
+_REBUILD_TENSOR = ("torch._utils", "_rebuild_tensor_v2")
+_REBUILD_TENSOR_PARAMS = [
+    "storage",
+    "storage_offset",
+    "size",
+    "stride",
+    "requires_grad",
+    "backward_hooks",
+]
+
+
+def _can_replace_rebuild_tensor() -> bool:
+    """
+    Return True if _rebuild_tensor can stand in for the _REBUILD_TENSOR of the installed torch:
+    checkpoints are only saved in the zip format by default since torch 1.6, and the parameters of
+    the function must be the known ones, followed by optional ones only.
+    """
+    if version.parse(torch.__version__) < version.parse("1.6.0"):
+        return False
+    module, name = _REBUILD_TENSOR
+    fn = getattr(sys.modules.get(module), name, None)
+    if fn is None:
+        return False
+    params = list(inspect.signature(fn).parameters.values())
+    n = len(_REBUILD_TENSOR_PARAMS)
+    return [p.name for p in params[:n]] == _REBUILD_TENSOR_PARAMS and all(
+        p.default is not inspect.Parameter.empty for p in params[n:]
+    )
+
+
+_CAN_MMAP = _can_replace_rebuild_tensor()
+
+
+def _storage_dtype(storage_type: Any) -> torch.dtype:
+    dtype = getattr(storage_type, "dtype", None)
+    if not isinstance(dtype, torch.dtype):
+        dtype = storage_type(0).dtype
+    return dtype
+
+
+def _rebuild_tensor(
+    storage: torch.Tensor,
+    storage_offset: int,
+    size: Tuple[int, ...],
+    stride: Tuple[int, ...],
+    requires_grad: bool,
+    backward_hooks: Any = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> torch.Tensor:
+    """Replaces torch._utils._rebuild_tensor_v2, with a flat tensor in place of the storage."""
+    if backward_hooks or metadata:
+        raise pickle.UnpicklingError("Tensors with hooks or metadata can not be memory mapped")
+    tensor = storage.as_strided(size, stride, storage_offset)
+    tensor.requires_grad = requires_grad
+    return tensor
+
+
+class _MmapUnpickler(pickle.Unpickler):
+    """
+    _MmapUnpickler unpickles the data.pkl record of a checkpoint in the zip format of torch.save(),
+    mapping every storage to a flat CPU tensor backed by a copy-on-write memory map of the
+    checkpoint file, instead of reading it into memory.
+    """
+
+    def __init__(self, data: Any, path: str, offsets: Dict[str, int]) -> None:
+        super().__init__(data, encoding="utf-8")
+        self._path = path
+        self._offsets = offsets
+        self._storages = {}  # type: Dict[str, torch.Tensor]
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) == _REBUILD_TENSOR:
+            return _rebuild_tensor
+        return super().find_class(module, name)
+
+    def persistent_load(self, pid: Any) -> torch.Tensor:
+        typename, storage_type, key, _, numel = pid
+        if typename != "storage":
+            raise pickle.UnpicklingError("Unsupported persistent ID: {}".format(typename))
+        if key in self._storages:
+            return self._storages[key]
+
+        dtype = _storage_dtype(storage_type)
+        np_dtype = _NUMPY_DTYPES[dtype]
+        if numel == 0:
+            storage = torch.empty(0, dtype=dtype)
+        else:
+            array = np.memmap(
+                self._path, dtype=np_dtype, mode="c", offset=self._offsets[key], shape=(numel,)
+            )
+            storage = torch.from_numpy(array)
+            if storage.dtype != dtype:
+                storage = storage.view(dtype)
+        self._storages[key] = storage
+        return storage
+
+
+def _load_mmapped(path: str) -> Any:
+    with zipfile.ZipFile(path) as zf:
+        data_pkl = [name for name in zf.namelist() if name.endswith("data.pkl")]
+        if len(data_pkl) != 1:
+            raise ValueError("Expected one data.pkl record, found {}".format(data_pkl))
+        prefix = data_pkl[0][: -len("data.pkl")]
+
+        byteorder = prefix + "byteorder"
+        if sys.byteorder != "little" or (
+            byteorder in zf.namelist() and zf.read(byteorder).decode() != sys.byteorder
+        ):
+            raise ValueError("Only little-endian checkpoints can be memory mapped")
+
+        offsets = {}  # type: Dict[str, int]
+        with open(path, "rb") as f:
+            for info in zf.infolist():
+                if not info.filename.startswith(prefix + "data/"):
+                    continue
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError("Compressed records can not be memory mapped")
+                f.seek(info.header_offset)
+                header = _LOCAL_FILE_HEADER.unpack(f.read(_LOCAL_FILE_HEADER.size))
+                name_len, extra_len = header[-2:]
+                key = info.filename[len(prefix + "data/") :]
+                offsets[key] = info.header_offset + _LOCAL_FILE_HEADER.size + name_len + extra_len
+
+        with zf.open(data_pkl[0]) as data:
+            return _MmapUnpickler(data, path, offsets).load()
+
+
+def _load_checkpoint(path: str) -> Any:
+    """
+    Load a checkpoint saved with torch.save() onto the CPU.
+
+    Checkpoints in the zip format of torch.save() are memory mapped rather than read, so that the
+    tensors of a checkpoint are only paged in as they are copied into the model and the optimizer,
+    and host memory is not needed to hold the entire checkpoint at once. Other checkpoints, and all
+    checkpoints if the installed torch rebuilds tensors in an unknown way, are loaded with
+    torch.load().
+    """
+    if _CAN_MMAP and zipfile.is_zipfile(path):
+        try:
+            return _load_mmapped(path)
+        except Exception as e:
+            logging.debug("Could not memory map {}, loading it instead: {}".format(path, e))
+    return torch.load(path, map_location="cpu")  # type: ignore
+
+
+def _clone_optimizer_state(optimizer: torch.optim.Optimizer) -> None:
+    """
+    Replace the CPU tensors in the state of the optimizer with copies. Optimizer.load_state_dict()
+    keeps the tensors of a state dict that are already on the right device, and those loaded by
+    _load_checkpoint() would otherwise stay backed by the memory map of the checkpoint file.
+    """
+    for state in optimizer.state.values():
+        for key, value in state.items():
+            if isinstance(value, torch.Tensor) and value.device.type == "cpu":
+                state[key] = value.clone()
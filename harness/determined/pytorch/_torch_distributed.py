@@ -0,0 +1,169 @@
+"""
+The parts of the horovod.torch API that Determined uses, implemented on top of torch.distributed.
+
+When a trial uses the torch distributed backend, det.horovod.hvd.require_horovod_type() imports
+this module in place of horovod.torch, so that the rest of the harness can keep calling hvd.rank(),
+hvd.allreduce(), hvd.broadcast_parameters(), etc. regardless of the backend. The training processes
+are launched by the SubprocessLauncher of each machine, which sets the usual torch.distributed
+environment variables (RANK, WORLD_SIZE, MASTER_ADDR, MASTER_PORT) and LOCAL_RANK and
+LOCAL_WORLD_SIZE, so neither horovodrun nor sshd is needed.
+"""
+import os
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+import torch
+import torch.distributed as dist
+
+from determined.common import check
+
+# Reduction ops, with the same meaning as horovod.torch.Sum and horovod.torch.Average.
+Sum = "sum"
+Average = "average"
+
+
+def init() -> None:
+    """Join the process group of the trial, using NCCL if there are GPUs and gloo otherwise."""
+    if dist.is_initialized():
+        return
+    if torch.cuda.is_available():
+        # Collectives of NCCL run on the current device, which must be different for every process
+        # of a machine.
+        torch.cuda.set_device(local_rank())
+        backend = "nccl"
+    else:
+        backend = "gloo"
+    dist.init_process_group(backend, init_method="env://")
+
+
+def size() -> int:
+    return int(dist.get_world_size())
+
+
+def rank() -> int:
+    return int(dist.get_rank())
+
+
+def local_rank() -> int:
+    return int(os.environ["LOCAL_RANK"])
+
+
+def local_size() -> int:
+    return int(os.environ["LOCAL_WORLD_SIZE"])
+
+
+def _uses_cuda() -> bool:
+    return bool(dist.get_backend() == "nccl")
+
+
+def _to_backend_device(tensor: torch.Tensor) -> torch.Tensor:
+    # NCCL can only communicate CUDA tensors, while gloo can communicate tensors on any device.
+    if _uses_cuda() and not tensor.is_cuda:
+        return tensor.to(torch.device("cuda", torch.cuda.current_device()))
+    return tensor
+
+
+def _op_averages(average: Optional[bool], op: Optional[str]) -> bool:
+    check.true(
+        average is None or op is None, "Only one of average and op may be passed to allreduce."
+    )
+    if op is None:
+        return average is None or bool(average)
+    check.is_in(op, (Sum, Average), "Unsupported allreduce op.")
+    return op == Average
+
+
+def allreduce_async_(
+    tensor: torch.Tensor,
+    average: Optional[bool] = None,
+    name: Optional[str] = None,
+    op: Optional[str] = None,
+) -> Tuple[Any, torch.Tensor, torch.Tensor, bool]:
+    """Start reducing tensor in place across all processes and return a handle to synchronize()."""
+    buffer = _to_backend_device(tensor)
+    work = dist.all_reduce(buffer, async_op=True)
+    return work, tensor, buffer, _op_averages(average, op)
+
+
+def synchronize(handle: Tuple[Any, torch.Tensor, torch.Tensor, bool]) -> torch.Tensor:
+    work, tensor, buffer, averages = handle
+    work.wait()
+    if averages:
+        buffer.div_(size())
+    if buffer is not tensor:
+        tensor.copy_(buffer)
+    return tensor
+
+
+def allreduce(
+    tensor: torch.Tensor,
+    average: Optional[bool] = None,
+    name: Optional[str] = None,
+    op: Optional[str] = None,
+) -> torch.Tensor:
+    """Return the reduction of tensor across all processes, leaving tensor unchanged."""
+    return synchronize(allreduce_async_(tensor.clone(), average=average, name=name, op=op))
+
+
+def allgather(tensor: torch.Tensor, name: Optional[str] = None) -> torch.Tensor:
+    """
+    Return the concatenation along the first dimension of the tensors of all processes, in rank
+    order. Like Horovod, the first dimension may differ between processes.
+    """
+    buffer = _to_backend_device(tensor.contiguous())
+    if buffer.dim() == 0:
+        buffer = buffer.reshape(1)
+
+    lengths = [torch.zeros(1, dtype=torch.int64, device=buffer.device) for _ in range(size())]
+    dist.all_gather(lengths, torch.tensor([buffer.shape[0]], device=buffer.device))
+    max_length = max(int(length.item()) for length in lengths)
+
+    # torch.distributed can only gather tensors of the same shape, so pad to the longest one.
+    padded = buffer.new_zeros((max_length,) + tuple(buffer.shape[1:]))
+    padded[: buffer.shape[0]] = buffer
+    gathered = [torch.empty_like(padded) for _ in range(size())]
+    dist.all_gather(gathered, padded)
+
+    out = torch.cat([g[: int(length.item())] for g, length in zip(gathered, lengths)])
+    return out.to(tensor.device)
+
+
+def broadcast_object(obj: Any, root_rank: int = 0, name: Optional[str] = None) -> Any:
+    objects = [obj if rank() == root_rank else None]
+    dist.broadcast_object_list(objects, src=root_rank)
+    return objects[0]
+
+
+def broadcast_parameters(
+    params: Union[Dict[str, torch.Tensor], Iterable[Tuple[str, torch.Tensor]]], root_rank: int
+) -> None:
+    """Overwrite the tensors of params in place with those of the root process."""
+    items = sorted(params.items()) if isinstance(params, dict) else list(params)
+    for _, tensor in items:
+        if tensor is None:
+            continue
+        data = tensor.data
+        buffer = _to_backend_device(data)
+        dist.broadcast(buffer, src=root_rank)
+        if buffer is not data:
+            data.copy_(buffer)
+
+
+def _to_cpu(obj: Any) -> Any:
+    if isinstance(obj, torch.Tensor):
+        return obj.cpu()
+    if isinstance(obj, dict):
+        return {k: _to_cpu(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_to_cpu(v) for v in obj)
+    return obj
+
+
+def broadcast_optimizer_state(optimizer: torch.optim.Optimizer, root_rank: int) -> None:
+    """
+    Load the state of the optimizer of the root process into the optimizer of every process.
+    load_state_dict() moves the state to the devices of the parameters of each process.
+    """
+    state = _to_cpu(optimizer.state_dict()) if rank() == root_rank else None
+    state = broadcast_object(state, root_rank=root_rank)
+    if rank() != root_rank:
+        optimizer.load_state_dict(state)
@@ -1,9 +1,9 @@
 import abc
 import pathlib
 import time
-from typing import List
+from typing import List, Optional, Tuple
 
-from determined.tensorboard import util
+from determined.tensorboard import sync_index, util
 
 
 class TensorboardManager(metaclass=abc.ABCMeta):
@@ -26,6 +26,7 @@ class TensorboardManager(metaclass=abc.ABCMeta):
         self.base_path = base_path
         self.sync_path = sync_path
         self.last_sync = 0.0
+        self._sync_index = None  # type: Optional[sync_index.SyncIndex]
 
     def list_tb_files(self, since: float) -> List[pathlib.Path]:
         """
@@ -35,18 +36,36 @@ class TensorboardManager(metaclass=abc.ABCMeta):
         If many files have been created, the syscall to stat on each of them can be quite
         expensive, taking on the order of 1ms for every 100 files. Each file gets stat'd every call
         to this function, which can be a bottleneck late in training or in local training when many
-        files exist but few or none need to be re-synced.
+        files exist but few or none need to be re-synced. to_sync() and changed_files() use an
+        incremental SyncIndex instead.
         """
 
         tb_files = util.find_tb_files(self.base_path)
         return list(filter(lambda file: file.stat().st_mtime > since, tb_files))
 
+    def changed_files(self) -> List[Tuple[pathlib.Path, int]]:
+        """
+        changed_files returns the Tensorboard files that are new or have changed since the last
+        call, each with the number of leading bytes of it that were already returned by a previous
+        call and are unchanged. The offset is only nonzero for tfevents files, which are only ever
+        appended to; subclasses whose storage supports appending can upload only the bytes after
+        it.
+        """
+        if self._sync_index is None:
+            self._sync_index = sync_index.SyncIndex(self.base_path)
+        self.last_sync = time.time()
+        return self._sync_index.changes()
+
     def to_sync(self) -> List[pathlib.Path]:
-        sync_start = time.time()
-        sync_paths = self.list_tb_files(self.last_sync)
-        self.last_sync = sync_start
+        return [path for path, _ in self.changed_files()]
 
-        return sync_paths
+    def close(self) -> None:
+        """
+        Release the resources used to track changed files, such as the inotify watcher.
+        """
+        if self._sync_index is not None:
+            self._sync_index.close()
+            self._sync_index = None
 
     @abc.abstractmethod
     def sync(self) -> None:
@@ -0,0 +1,231 @@
+import ctypes
+import ctypes.util
+import errno
+import fnmatch
+import logging
+import os
+import pathlib
+import struct
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from determined.tensorboard import util
+
+# Flags from <sys/inotify.h>.
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Directory listings are only trusted once the directory's mtime is older than this, because
+# entries created within one mtime tick of a listing would otherwise go unnoticed.
+_RACY_MTIME_NS = 1_000_000_000
+
+
+def is_tb_file(name: str) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) for pattern in util.tb_file_types)
+
+
+def is_append_only(name: str) -> bool:
+    """tfevents files are only ever appended to; other Tensorboard files may be rewritten."""
+    return fnmatch.fnmatch(name, "*tfevents*")
+
+
+class _InotifyWatcher:
+    """
+    _InotifyWatcher collects the paths of files that are created or modified anywhere under a
+    directory tree, using Linux inotify through ctypes.
+    """
+
+    def __init__(self, root: str) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}  # type: Dict[int, str]
+        self._dirty = set()  # type: Set[str]
+        self.overflowed = False
+        self._watch_tree(root)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+    def _watch_tree(self, root: str) -> None:
+        stack = [root]
+        while stack:
+            cur_dir = stack.pop()
+            # Watch each directory before listing it, so that no file created in between is missed.
+            wd = self._add_watch(self._fd, os.fsencode(cur_dir), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOENT:
+                    continue
+                raise OSError(err, "inotify_add_watch failed for " + cur_dir)
+            self._dirs[wd] = cur_dir
+            try:
+                with os.scandir(cur_dir) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            stack.append(entry.path)
+                        else:
+                            self._dirty.add(entry.path)
+            except FileNotFoundError:
+                continue
+
+    def drain(self) -> Set[str]:
+        """Return the paths that changed since the last call."""
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, name_len = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(buf[offset : offset + name_len].rstrip(b"\0"))
+                offset += name_len
+
+                if mask & _IN_Q_OVERFLOW:
+                    self.overflowed = True
+                    continue
+                if mask & _IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                parent = self._dirs.get(wd)
+                if parent is None or not name:
+                    continue
+                path = os.path.join(parent, name)
+                if mask & _IN_ISDIR:
+                    if mask & (_IN_CREATE | _IN_MOVED_TO):
+                        self._watch_tree(path)
+                else:
+                    self._dirty.add(path)
+
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+
+
+class SyncIndex:
+    """
+    SyncIndex tracks the size and mtime of every Tensorboard file under base_path, so that each
+    call to changes() only reports files that are new or were written to since the previous call.
+
+    Where inotify is available, only the files it reports are stat'd. Otherwise, the directory tree
+    is walked with a cached listing of each directory, which is only refreshed when the directory's
+    mtime changes, and only the Tensorboard files themselves are stat'd.
+    """
+
+    def __init__(self, base_path: pathlib.Path, use_inotify: bool = True) -> None:
+        self.base_path = base_path
+        self._use_inotify = use_inotify and sys.platform.startswith("linux")
+        self._watcher = None  # type: Optional[_InotifyWatcher]
+        # Maps file paths to the (size, mtime_ns) they had when they were last reported.
+        self._files = {}  # type: Dict[str, Tuple[int, int]]
+        # Maps directory paths to (mtime_ns, tb file names, subdirectory names).
+        self._dirs = {}  # type: Dict[str, Tuple[int, List[str], List[str]]]
+        self._warned_missing = False
+
+    def close(self) -> None:
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    def changes(self) -> List[Tuple[pathlib.Path, int]]:
+        """
+        Return each Tensorboard file that changed since the last call, along with the number of
+        leading bytes of it that were already reported and have not changed since. That offset is
+        0 unless the file is a tfevents file that has grown, in which case only the bytes after it
+        need to be synced.
+        """
+        root = str(self.base_path)
+        if not os.path.isdir(root):
+            if not self._warned_missing:
+                logging.warning(f"{root} directory does not exist.")
+                self._warned_missing = True
+            return []
+
+        if self._watcher is None and self._use_inotify:
+            try:
+                self._watcher = _InotifyWatcher(root)
+            except (OSError, AttributeError, TypeError) as e:
+                logging.debug(f"Not watching Tensorboard files with inotify: {e}")
+                self._use_inotify = False
+
+        if self._watcher is not None and not self._watcher.overflowed:
+            candidates = self._watcher.drain()
+            if self._watcher.overflowed:
+                logging.debug("inotify queue overflowed, falling back to directory scans")
+                self.close()
+                self._use_inotify = False
+                candidates = self._scan(root)
+        else:
+            candidates = self._scan(root)
+            # Forget files that no longer exist.
+            for path in set(self._files) - candidates:
+                del self._files[path]
+
+        result = []
+        for path in sorted(candidates):
+            if not is_tb_file(os.path.basename(path)):
+                continue
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                self._files.pop(path, None)
+                continue
+            state = (st.st_size, st.st_mtime_ns)
+            prev = self._files.get(path)
+            if prev == state:
+                continue
+            self._files[path] = state
+            offset = 0
+            if prev is not None and st.st_size > prev[0] and is_append_only(os.path.basename(path)):
+                offset = prev[0]
+            result.append((pathlib.Path(path), offset))
+        return result
+
+    def _scan(self, root: str) -> Set[str]:
+        now_ns = int(time.time() * 1e9)
+        found = set()  # type: Set[str]
+        seen_dirs = set()  # type: Set[str]
+        stack = [root]
+        while stack:
+            cur_dir = stack.pop()
+            try:
+                mtime_ns = os.stat(cur_dir).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            seen_dirs.add(cur_dir)
+
+            tb_files = []  # type: List[str]
+            sub_dirs = []  # type: List[str]
+            cached = self._dirs.get(cur_dir)
+            if cached is not None and cached[0] == mtime_ns:
+                _, tb_files, sub_dirs = cached
+            else:
+                with os.scandir(cur_dir) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            sub_dirs.append(entry.name)
+                        elif is_tb_file(entry.name):
+                            tb_files.append(entry.name)
+                if now_ns - mtime_ns > _RACY_MTIME_NS:
+                    self._dirs[cur_dir] = (mtime_ns, tb_files, sub_dirs)
+                else:
+                    self._dirs.pop(cur_dir, None)
+
+            found.update(os.path.join(cur_dir, f) for f in tb_files)
+            stack.extend(os.path.join(cur_dir, d) for d in sub_dirs)
+
+        for stale in set(self._dirs) - seen_dirs:
+            del self._dirs[stale]
+        return found
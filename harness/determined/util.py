@@ -2,6 +2,7 @@ import collections
 import datetime
 import enum
 import inspect
+import operator
 import os
 import pathlib
 import random
@@ -90,39 +91,55 @@ def _dict_to_list(dict_of_lists: Dict[str, List]) -> List[Dict[str, Any]]:
 
 
 def validate_batch_metrics(batch_metrics: List[Dict[str, Any]]) -> None:
-    metric_dict = _list_to_dict(batch_metrics)
-
     # We expect that all batches have the same set of metrics.
-    metric_dict_keys = metric_dict.keys()
-    for idx, metric_dict in zip(range(len(batch_metrics)), batch_metrics):
-        keys = metric_dict.keys()
-        if metric_dict_keys == keys:
+    if not batch_metrics:
+        return
+    expected_keys = batch_metrics[0].keys()
+    for idx, metrics in enumerate(batch_metrics):
+        keys = metrics.keys()
+        if expected_keys == keys:
             continue
 
-        check.eq(metric_dict_keys, keys, "inconsistent training metrics: index: {}".format(idx))
-
-
-def make_metrics(num_inputs: Optional[int], batch_metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Make metrics dict including aggregates given individual data points."""
+        check.eq(expected_keys, keys, "inconsistent training metrics: index: {}".format(idx))
 
-    metric_dict = _list_to_dict(batch_metrics)
-    validate_batch_metrics(batch_metrics)
 
-    avg_metrics = {}  # type: Dict[str, Optional[float]]
-    for name, values in metric_dict.items():
-        m = None  # type: Optional[float]
+def _average_metric(values: List[Any]) -> Optional[float]:
+    # Fast path: scalar values are converted straight into a preallocated float64 array, without
+    # first building an array of Python objects and filtering out the Nones. NumPy converts None
+    # to NaN, so any NaN sends the values down the slow path to be filtered as before.
+    if values and not isinstance(values[0], (str, bytes)) and getattr(values[0], "ndim", 0) == 0:
         try:
-            values = np.array(values)
-            filtered_values = values[values != None]  # noqa: E711
-            m = np.mean(filtered_values)
+            array = np.fromiter(values, dtype=np.float64, count=len(values))
+            if not np.isnan(array).any():
+                return cast(float, array.mean())
         except (TypeError, ValueError):
-            # If we get here, values are non-scalars, which cannot be averaged.
-            # We keep the key so consumers can see all the metric names but
-            # leave the value as None.
             pass
-        avg_metrics[name] = m
 
-    metrics = {"batch_metrics": batch_metrics, "avg_metrics": avg_metrics}
+    try:
+        array = np.array(values)
+        filtered_values = array[array != None]  # noqa: E711
+        return cast(float, np.mean(filtered_values))
+    except (TypeError, ValueError):
+        # If we get here, values are non-scalars, which cannot be averaged.
+        # We keep the key so consumers can see all the metric names but
+        # leave the value as None.
+        return None
+
+
+def make_metrics(num_inputs: Optional[int], batch_metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Make metrics dict including aggregates given individual data points."""
+
+    validate_batch_metrics(batch_metrics)
+    names = list(batch_metrics[0]) if batch_metrics else []
+    avg_metrics = {
+        name: _average_metric(list(map(operator.itemgetter(name), batch_metrics)))
+        for name in names
+    }  # type: Dict[str, Optional[float]]
+
+    metrics = {
+        "batch_metrics": batch_metrics,
+        "avg_metrics": avg_metrics,
+    }  # type: Dict[str, Any]
     if num_inputs is not None:
         metrics["num_inputs"] = num_inputs
 
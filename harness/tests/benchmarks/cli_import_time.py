@@ -0,0 +1,88 @@
+"""
+Benchmark the time it takes to import what the det CLI needs to run a command, as reported by
+`python -X importtime`, and fail if it exceeds a budget.
+
+Each command line is parsed the way the CLI does before running it, i.e. by importing
+determined.cli.cli and the modules of the subcommand the command line names. The modules that
+subcommands should not pay for, like the SDKs of cloud storage, are listed if they were imported.
+
+Usage: python -m tests.benchmarks.cli_import_time [--runs 5] [--budget-ms 600]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+COMMANDS = [
+    ["experiment", "list"],
+    ["trial", "logs", "1"],
+    ["--master", "localhost:8080", "agent", "list"],
+]
+
+HEAVY_MODULES = [
+    "OpenSSL",
+    "azure.storage.blob",
+    "boto3",
+    "determined.deploy",
+    "google.cloud.storage",
+    "hdfs",
+]
+
+SCRIPT = """
+import json, sys
+import determined.cli.cli as cli
+cli.subcommands_description({args!r})
+print(json.dumps([m for m in {heavy!r} if m in sys.modules]))
+"""
+
+
+def measure(args: List[str]) -> Tuple[float, List[str]]:
+    """Return the total import time in milliseconds and the heavy modules that were imported."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT.format(args=args, heavy=HEAVY_MODULES)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Only count modules imported at the top level, since their cumulative times include
+        # those of the modules they imported.
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000, json.loads(proc.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=600.0)
+    args = parser.parse_args()
+
+    over_budget = False
+    for command in COMMANDS:
+        results = [measure(command) for _ in range(args.runs)]
+        median_ms = statistics.median(ms for ms, _ in results)
+        heavy = results[-1][1]
+        over_budget = over_budget or median_ms > args.budget_ms or bool(heavy)
+        print(
+            "det {:<40} {:8.1f} ms{}".format(
+                " ".join(command),
+                median_ms,
+                ", imported {}".format(", ".join(heavy)) if heavy else "",
+            )
+        )
+    if over_budget:
+        print(f"over the budget of {args.budget_ms:.0f} ms, or imported heavy modules")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark experiment config validation: the time to import the expconf package, the first
+validation of a config (which includes any setup of validators) and later validations.
+
+Each run is a fresh interpreter, so that the first validation pays for whatever the expconf package
+builds lazily.
+
+Usage: python -m tests.benchmarks.expconf_validation [--runs 5] [--iterations 200]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+from determined.common import yaml
+
+CASES = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "schemas", "test_cases", "v0", "experiment.yaml"
+)
+
+SCRIPT = """
+import json, sys, time
+import determined
+start = time.perf_counter()
+from determined.common.schemas import expconf
+imported = time.perf_counter()
+config = json.loads(sys.stdin.read())
+url = "http://determined.ai/schemas/expconf/v0/experiment.json"
+assert not expconf.sanity_validation_errors(config, url)
+first = time.perf_counter()
+for _ in range({iterations}):
+    expconf.sanity_validation_errors(config, url)
+done = time.perf_counter()
+print(json.dumps({{
+    "import": imported - start,
+    "first": first - imported,
+    "later": (done - first) / {iterations},
+    "jsonschema": "jsonschema" in sys.modules,
+}}))
+"""
+
+
+def measure(config: Dict, iterations: int) -> Dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(iterations=iterations)],
+        input=json.dumps(config),
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)  # type: ignore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with open(CASES) as f:
+        config = yaml.safe_load(f)[0]["case"]
+
+    results = [measure(config, args.iterations) for _ in range(args.runs)]
+
+    def median_ms(key: str) -> float:
+        values = [r[key] for r in results]  # type: List[float]
+        return statistics.median(values) * 1000
+
+    print(f"import expconf        {median_ms('import'):8.3f} ms")
+    print(f"first validation      {median_ms('first'):8.3f} ms")
+    print(f"later validations     {median_ms('later'):8.3f} ms")
+    print(f"imported jsonschema   {results[-1]['jsonschema']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark overlapping gradient communication with the backward pass, on CPUs with gloo.
+
+Each step runs aggregation_frequency forward and backward passes and then averages the gradients
+across all processes, either with one allreduce after the last backward pass ("sequential"), or
+with a _GradientBucketReducer that starts an allreduce for each bucket as soon as its gradients are
+ready during the last backward pass ("overlapped").
+
+Usage: python -m tests.benchmarks.gradient_overlap [--world-size 2] [--layers 16] ...
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Dict, List
+
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+
+from determined.pytorch import _gradient_buckets
+
+
+def make_model(args: argparse.Namespace) -> torch.nn.Module:
+    torch.manual_seed(0)
+    layers = []  # type: List[torch.nn.Module]
+    for _ in range(args.layers):
+        layers.extend([torch.nn.Linear(args.width, args.width), torch.nn.ReLU()])
+    return torch.nn.Sequential(*layers)
+
+
+def run_steps(args: argparse.Namespace, overlapped: bool) -> Dict[str, List[float]]:
+    model = make_model(args)
+    params = list(model.parameters())
+    reducer = None
+    if overlapped:
+        reducer = _gradient_buckets._GradientBucketReducer(
+            params,
+            _gradient_buckets._TorchDistributedAsyncCollective(),
+            bucket_cap_bytes=int(args.bucket_cap_mb * 1024 * 1024),
+            passes_per_step=args.aggregation_frequency,
+        )
+    data = torch.randn(args.batch_size, args.width)
+
+    timings = {"step": [], "exposed_communication": []}  # type: Dict[str, List[float]]
+    for step in range(args.warmup_steps + args.steps):
+        dist.barrier()
+        start = time.perf_counter()
+        for _ in range(args.aggregation_frequency):
+            model(data).sum().backward()
+        backward_end = time.perf_counter()
+        if reducer is not None:
+            reducer.synchronize()
+        else:
+            flat = torch.cat([p.grad.reshape(-1) for p in params])
+            dist.all_reduce(flat)
+            flat.div_(dist.get_world_size())
+            offset = 0
+            for p in params:
+                p.grad.copy_(flat[offset : offset + p.numel()].view_as(p))
+                offset += p.numel()
+        end = time.perf_counter()
+        for p in params:
+            p.grad = None
+        if step >= args.warmup_steps:
+            timings["step"].append(end - start)
+            timings["exposed_communication"].append(end - backward_end)
+    return timings
+
+
+def worker(rank: int, args: argparse.Namespace, init_file: str) -> None:
+    torch.set_num_threads(args.threads)
+    dist.init_process_group(
+        "gloo", init_method=f"file://{init_file}", rank=rank, world_size=args.world_size
+    )
+    try:
+        for overlapped in (False, True):
+            timings = run_steps(args, overlapped)
+            if rank == 0:
+                print(
+                    "{:>12}: step {:8.2f} ms, exposed communication {:8.2f} ms".format(
+                        "overlapped" if overlapped else "sequential",
+                        statistics.median(timings["step"]) * 1000,
+                        statistics.median(timings["exposed_communication"]) * 1000,
+                    )
+                )
+    finally:
+        dist.destroy_process_group()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--world-size", type=int, default=2)
+    parser.add_argument("--layers", type=int, default=16)
+    parser.add_argument("--width", type=int, default=1024)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--aggregation-frequency", type=int, default=1)
+    parser.add_argument("--bucket-cap-mb", type=float, default=4.0)
+    parser.add_argument("--threads", type=int, default=1, help="torch threads per process")
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--warmup-steps", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{args.world_size} processes, {args.layers} layers of {args.width}x{args.width}, "
+        f"aggregation_frequency {args.aggregation_frequency}, {os.cpu_count()} CPUs"
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        init_file = os.path.join(tmpdir, "init")
+        mp.spawn(worker, args=(args, init_file), nprocs=args.world_size)
+
+
+if __name__ == "__main__":
+    main()
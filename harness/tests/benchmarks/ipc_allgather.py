@@ -0,0 +1,28 @@
+"""
+Benchmark allgathers through the ZMQBroadcastServer: the mean latency of gathering an array from
+every slot and broadcasting the gathered arrays back, by number of slots and payload size.
+
+Usage: python -m tests.benchmarks.ipc_allgather [--slots 2 4 8] [--iterations 10]
+"""
+
+import argparse
+
+from tests.test_ipc import run_array_allgather
+
+SIZES = [10, 10 ** 3, 10 ** 5, 10 ** 6]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slots", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    print("slots " + "".join(f"{size * 8:>14}B" for size in SIZES))
+    for num_slots in args.slots:
+        latencies = run_array_allgather(num_slots - 1, args.iterations, SIZES)
+        print(f"{num_slots:>5} " + "".join(f"{latency * 1000:>13.3f}ms" for latency in latencies))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark the multiprocessing data loader workers of TFKerasTrials.
+
+The first part moves batches of images from the worker processes to the main process, either
+pickled through the answers queue or written to shared memory slots. The second part reads a short
+validation sequence several times, either starting new workers for every run or with one worker
+pool for all the runs, like TFKerasTrialController does.
+
+Usage: python -m tests.benchmarks.keras_enqueuer [--batch-size 64] [--image-size 224] ...
+"""
+
+import argparse
+import time
+from typing import Any, Tuple
+
+import numpy as np
+from tensorflow.keras.utils import Sequence
+
+from determined import keras
+from determined.keras import _enqueuer
+
+
+class ImageSequence(Sequence):
+    def __init__(self, args: argparse.Namespace) -> None:
+        self._length = args.batches
+        shape = (args.batch_size, args.image_size, args.image_size, 3)
+        self._images = np.random.randint(0, 255, size=shape, dtype=np.uint8)
+        self._labels = np.arange(args.batch_size, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Tuple[Any, Any]:
+        return self._images.astype(np.float32), self._labels
+
+
+def run(args: argparse.Namespace, shared_memory_transport: bool) -> float:
+    class WorkerPool(_enqueuer._MultiprocessingWorkerPool):
+        pass
+
+    WorkerPool.shared_memory_transport = shared_memory_transport
+    sequence = ImageSequence(args)
+    sampler = keras._Sampler(len(sequence), 0, 1, False, 0, 0)
+    pool = WorkerPool([sequence], args.workers)
+    enqueuer = _enqueuer._ParallelEnqueuer(
+        sequence, sampler, True, pool, args.max_queue_size, owns_pool=True
+    )
+    with enqueuer:
+        data = enqueuer.data()
+        for _ in range(args.warmup_batches):
+            next(data)
+        start = time.perf_counter()
+        for _ in range(args.batches):
+            next(data)
+        return time.perf_counter() - start
+
+
+def validation_runs(args: argparse.Namespace, pooled: bool) -> float:
+    args = argparse.Namespace(**vars(args))
+    args.batches = args.validation_batches
+    sequence = ImageSequence(args)
+    pool = keras._build_worker_pool([sequence], args.workers, True) if pooled else None
+    start = time.perf_counter()
+    if pool is not None:
+        pool.start()
+    try:
+        for _ in range(args.validation_runs):
+            with keras._build_enqueuer(
+                sequence=sequence,
+                workers=args.workers,
+                use_multiprocessing=True,
+                max_queue_size=args.max_queue_size,
+                shard_rank=0,
+                num_shards=1,
+                repeat=False,
+                shuffle=False,
+                shuffle_seed=0,
+                prior_batches_trained=0,
+                pool=pool,
+            ) as enqueuer:
+                for _ in enqueuer.data():
+                    pass
+    finally:
+        if pool is not None:
+            pool.stop()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--image-size", type=int, default=224)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-queue-size", type=int, default=10)
+    parser.add_argument("--batches", type=int, default=100)
+    parser.add_argument("--warmup-batches", type=int, default=10)
+    parser.add_argument("--validation-runs", type=int, default=20)
+    parser.add_argument("--validation-batches", type=int, default=4)
+    args = parser.parse_args()
+
+    batch_mb = args.batch_size * args.image_size * args.image_size * 3 * 4 / 1e6
+    print(f"{args.workers} workers, batches of {batch_mb:.1f} MB")
+    for shared_memory_transport in (False, True):
+        elapsed = run(args, shared_memory_transport)
+        print(
+            "{:>13}: {:8.2f} ms/batch, {:8.1f} MB/s".format(
+                "shared memory" if shared_memory_transport else "pickled",
+                elapsed / args.batches * 1000,
+                batch_mb * args.batches / elapsed,
+            )
+        )
+
+    print(f"{args.validation_runs} validation runs of {args.validation_batches} batches")
+    for pooled in (False, True):
+        elapsed = validation_runs(args, pooled)
+        print(
+            "{:>13}: {:8.2f} ms/run".format(
+                "worker pool" if pooled else "new workers",
+                elapsed / args.validation_runs * 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
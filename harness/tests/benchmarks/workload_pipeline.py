@@ -0,0 +1,72 @@
+"""
+Benchmark the per-workload overhead of the SubprocessLauncher, which broadcasts every workload to
+the training processes of a machine and gathers their responses.
+
+The training processes answer immediately (see tests/fixtures/fake_metrics_worker.py), so the time
+per workload is the overhead that the launcher adds to each scheduling unit of a real trial.
+
+Usage: python -m tests.benchmarks.workload_pipeline [--workers 1 4] [--scheduling-units 1 100]
+"""
+
+import argparse
+import time
+from typing import List
+
+from determined import layers, workload
+from tests.experiment import utils
+
+
+def run(num_workers: int, scheduling_unit: int, num_workloads: int) -> float:
+    """Return the mean time per workload, in seconds."""
+    exp_config = utils.make_default_exp_config({"global_batch_size": 1}, scheduling_unit)
+    env = utils.make_default_env_context({"global_batch_size": 1}, experiment_config=exp_config)
+    env.slot_ids = list(range(num_workers))
+    hvd_config = utils.make_default_hvd_config()
+    # The torch distributed backend launches every training process directly, without horovodrun.
+    hvd_config.use = num_workers > 1
+    hvd_config.backend = "torch"
+
+    timings = []  # type: List[float]
+
+    def make_workloads() -> workload.Stream:
+        interceptor = workload.WorkloadResponseInterceptor()
+        for i in range(num_workloads):
+            start = time.perf_counter()
+            wkld = workload.train_workload(
+                i + 1, num_batches=scheduling_unit, total_batches_processed=i * scheduling_unit
+            )
+            yield from interceptor.send(wkld, [])
+            assert len(interceptor.metrics_result()["metrics"]["batch_metrics"]) == scheduling_unit
+            timings.append(time.perf_counter() - start)
+        yield from interceptor.send(workload.terminate_workload(), [])
+
+    launcher = layers.SubprocessLauncher(
+        env=env,
+        workloads=make_workloads(),
+        load_path=None,
+        rendezvous_info=utils.make_default_rendezvous_info(),
+        hvd_config=hvd_config,
+        python_subprocess_entrypoint="tests.fixtures.fake_metrics_worker",
+    )
+    launcher.run()
+    # Leave out the first workloads, which include the startup of the processes.
+    steady = timings[len(timings) // 10 :]
+    return sum(steady) / len(steady)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--scheduling-units", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--workloads", type=int, default=500)
+    args = parser.parse_args()
+
+    print("workers  scheduling_unit  per-workload overhead")
+    for num_workers in args.workers:
+        for scheduling_unit in args.scheduling_units:
+            overhead = run(num_workers, scheduling_unit, args.workloads)
+            print(f"{num_workers:>7}  {scheduling_unit:>15}  {overhead * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 import os
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
+from typing import List, Optional
 
 import pytest
 import requests
@@ -9,6 +12,7 @@ import requests_mock
 import determined.cli.cli as cli
 import determined.cli.command as command
 from determined.common import constants, context
+from determined.common.declarative_argparse import Cmd
 from tests.filetree import FileTree
 
 MINIMAL_CONFIG = '{"description": "test"}'
@@ -194,3 +198,39 @@ def test_read_context_ignore_pycaches(tmp_path: Path) -> None:
     ) as tree:
         model_def, _ = context.read_context(tree)
         assert {f["path"] for f in model_def} == {"A.py", "subdir", "subdir/A.py"}
+
+
+@pytest.mark.parametrize(
+    "args,subcommand",
+    [
+        (["experiment", "list"], "experiment"),
+        (["-m", "localhost:8080", "e", "list"], "e"),
+        (["--master=localhost:8080", "trial", "logs", "1"], "trial"),
+        (["--mast", "localhost:8080", "-u", "admin", "agent"], "agent"),
+        (["--version"], None),
+        ([], None),
+    ],
+)
+def test_find_subcommand(args: List[str], subcommand: Optional[str]) -> None:
+    assert cli._find_subcommand(args) == subcommand
+
+
+def test_subcommand_modules_match_descriptions() -> None:
+    # The names and help strings of the lazily imported subcommands must match their modules.
+    described = [
+        (cmd.name, cmd.help_str) for cmd in cli.subcommands_description() if isinstance(cmd, Cmd)
+    ]
+    listed = [cmd for _, cmds in cli.subcommand_modules for cmd in cmds]
+    assert described == listed
+
+
+def test_subcommands_are_imported_lazily() -> None:
+    heavy = ["boto3", "determined.cli.agent", "determined.deploy", "OpenSSL"]
+    script = (
+        "import sys\n"
+        "import determined.cli.cli as cli\n"
+        "cli.subcommands_description(['experiment', 'list'])\n"
+        f"print([m for m in {heavy!r} if m in sys.modules])\n"
+    )
+    out = subprocess.check_output([sys.executable, "-c", script], universal_newlines=True)
+    assert out.strip() == "[]"
@@ -1,12 +1,14 @@
 import os
 import re
+import subprocess
+import sys
 from typing import Any, Dict, Iterator, List, Optional, Type
 
 import pytest
 
 from determined.common import schemas, yaml
 from determined.common.schemas import expconf
-from determined.common.schemas.expconf import _v0
+from determined.common.schemas.expconf import _gen_validators, _v0
 
 
 def strip_runtime_defaultable(obj: Any, defaulted: Any) -> Any:
@@ -85,6 +87,7 @@ class Case:
         self.run_completeness()
         self.run_sanity_errors()
         self.run_completeness_errors()
+        self.run_compiled()
         self.run_defaulted()
         self.run_round_trip()
         self.run_merged()
@@ -140,6 +143,17 @@ class Case:
                     msg += "\n    ".join(errors)
                     raise ValueError(msg)
 
+    def run_compiled(self) -> None:
+        # The checks above only use the compiled validators to skip jsonschema for valid configs.
+        for urls, compiled, expected in [
+            (self.sane_as, _gen_validators.sanity, True),
+            (self.complete_as, _gen_validators.completeness, True),
+            (self.sanity_errors, _gen_validators.sanity, False),
+            (self.completeness_errors, _gen_validators.completeness, False),
+        ]:
+            for url in urls or []:
+                assert compiled[url](self.case) == expected, f"failed while testing {self.name}"
+
     def run_defaulted(self) -> None:
         if not self.defaulted and not self.default_as:
             return
@@ -222,6 +236,25 @@ def test_schemas(test_case: str) -> None:
     Case(**case).run()
 
 
+def test_valid_configs_skip_jsonschema() -> None:
+    script = """
+import sys
+from determined.common.schemas import expconf
+from determined.common.schemas.expconf import _gen
+
+url = "http://determined.ai/schemas/expconf/v0/shared-fs.json"
+assert not expconf.sanity_validation_errors({"type": "shared_fs", "host_path": "/tmp"}, url)
+assert "jsonschema" not in sys.modules
+assert len(_gen.schemas._parsed) == 0
+
+assert expconf.sanity_validation_errors({"type": "shared_fs", "host_path": 1}, url)
+assert "jsonschema" in sys.modules
+assert url in _gen.schemas._parsed
+assert len(_gen.schemas._parsed) < len(_gen.schemas)
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
 def lint_schema_subclasses(cls: type) -> None:
     """Recursively check all SchemaBase subclasses"""
     for sub in cls.__subclasses__():
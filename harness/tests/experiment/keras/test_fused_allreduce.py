@@ -0,0 +1,46 @@
+from typing import Any, List
+
+import numpy as np
+import pytest
+
+from determined import keras
+
+
+@pytest.mark.parametrize(
+    "value,fusable",
+    [
+        (3, True),
+        (0.5, True),
+        (np.float32(0.5), True),
+        (np.int64(7), True),
+        (np.array(0.5), True),
+        (True, False),
+        (np.array([0.5, 1.5]), False),
+        (np.array("a"), False),
+        ("a", False),
+        (None, False),
+    ],
+)
+def test_is_fusable(value: Any, fusable: bool) -> None:
+    assert keras._is_fusable(value) == fusable
+
+
+def test_fused_allreduce() -> None:
+    # The buffer of every worker, as packed by each one of them.
+    buffers = []  # type: List[np.ndarray]
+    workers = [([10], [0.5, np.float32(2.0)]), ([22], [1.5, np.float32(4.0)])]
+
+    def record(buffer: np.ndarray) -> np.ndarray:
+        buffers.append(buffer)
+        return buffer
+
+    for sums, averages in workers:
+        keras._fused_allreduce(sums, averages, record, size=2)
+    assert all(buffer.dtype == np.float64 for buffer in buffers)
+
+    def allreduce_sum(buffer: np.ndarray) -> Any:
+        return sum(buffers)
+
+    summed, averaged = keras._fused_allreduce(*workers[0], allreduce_sum, size=2)
+    assert summed == [32]
+    assert averaged == [1.0, 3.0]
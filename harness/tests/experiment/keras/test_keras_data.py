@@ -1,9 +1,16 @@
+import subprocess
+import sys
+import textwrap
+from multiprocessing import shared_memory
+from typing import Any
+
 import numpy as np
 import pytest
 from tensorflow.keras.utils import Sequence
 
 import determined as det
 from determined import keras
+from determined.keras import _enqueuer
 from determined.common import check
 from tests.experiment import utils  # noqa: I100
 
@@ -124,14 +131,14 @@ def test_sampler(shuffle, skip, rank_size):
     rank, size = rank_size
     seed = 777
 
-    # Build a list of globally expected indices; just a stream of indices, shuffled every epoch.
-    rng = np.random.RandomState(seed)
+    # Build a list of globally expected indices; just a stream of indices, shuffled every epoch
+    # with a seed of its own.
     all_indices = []
-    one_epoch_indices = list(range(epoch_len))
-    for _ in range(15):
+    for epoch in range(15):
         if shuffle:
-            rng.shuffle(one_epoch_indices)
-        all_indices += one_epoch_indices
+            all_indices += list(np.random.RandomState([seed, epoch]).permutation(epoch_len))
+        else:
+            all_indices += list(range(epoch_len))
 
     # Expect the appropriate shard of the stream for ourselves.
     expect_shard = [all_indices[i] for i in range(rank, len(all_indices), size)]
@@ -181,3 +188,138 @@ def test_enqueuer(shuffle, skip, rank_size, workers, use_multiprocessing) -> Non
         assert list(enqueuer.data()) == list(sampler.yield_epoch()), "first epoch was wrong"
         assert list(enqueuer.data()) == list(sampler.yield_epoch()), "second epoch was wrong"
         assert list(enqueuer.data()) == list(sampler.yield_epoch()), "third epoch was wrong"
+
+
+class ArraySequence(Sequence):
+    """Batches of arrays which grow with the index, mixed with values that are not arrays."""
+
+    def __len__(self) -> int:
+        return 40
+
+    def __getitem__(self, index: int) -> Any:
+        x = {
+            "image": np.full((index + 1, 8, 8), index, dtype=np.uint8),
+            "weights": np.arange(index, dtype=np.float64),
+        }
+        y = np.array([str(index)] * 2, dtype=object)
+        return x, [y, index]
+
+
+@pytest.mark.parametrize("shared_memory_transport", [False, True])
+def test_multiprocessing_enqueuer_arrays(shared_memory_transport: bool) -> None:
+    sequence = ArraySequence()
+    sampler = keras._Sampler(len(sequence), 0, 1, True, 777, 0)
+
+    class WorkerPool(_enqueuer._MultiprocessingWorkerPool):
+        pass
+
+    WorkerPool.shared_memory_transport = shared_memory_transport
+    pool = WorkerPool([sequence], 3)
+    enqueuer = _enqueuer._ParallelEnqueuer(sequence, sampler, False, pool, 4, owns_pool=True)
+
+    expected_sampler = keras._Sampler(len(sequence), 0, 1, True, 777, 0)
+    with enqueuer:
+        for _ in range(2):
+            expected = [sequence[i] for i in expected_sampler.yield_epoch()]
+            for (x, (y, index)), (expect_x, (expect_y, expect_index)) in zip(
+                enqueuer.data(), expected
+            ):
+                assert index == expect_index
+                assert x.keys() == expect_x.keys()
+                for k in x:
+                    assert x[k].dtype == expect_x[k].dtype
+                    assert np.array_equal(x[k], expect_x[k])
+                assert np.array_equal(y, expect_y)
+        segments = [s.name for s in pool.segments if s is not None]
+        assert bool(segments) == shared_memory_transport
+
+    for name in segments:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+def test_shared_memory_resource_tracking() -> None:
+    # Worker processes forked after the main process started its resource tracker share that
+    # tracker. If workers unregistered the segments they create or attach, the main process would
+    # find its registrations missing when it unlinks them, and the tracker would complain on stderr.
+    script = textwrap.dedent(
+        """
+        from multiprocessing import resource_tracker
+
+        import numpy as np
+        from tensorflow.keras.utils import Sequence
+        from determined import keras
+        from determined.keras import _enqueuer
+
+        class ArraySequence(Sequence):
+            def __len__(self):
+                return 20
+
+            def __getitem__(self, index):
+                return np.full((index + 1, 64), index, dtype=np.float32)
+
+        resource_tracker.ensure_running()
+        sequence = ArraySequence()
+        sampler = keras._Sampler(len(sequence), 0, 1, False, 0, 0)
+        pool = _enqueuer._MultiprocessingWorkerPool([sequence], 2)
+        enqueuer = _enqueuer._ParallelEnqueuer(sequence, sampler, False, pool, 4, owns_pool=True)
+        with enqueuer:
+            for _ in range(2):
+                for i, batch in enumerate(enqueuer.data()):
+                    assert batch.shape == (i + 1, 64)
+        """
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        timeout=300,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "resource_tracker" not in proc.stderr
+
+
+@pytest.mark.parametrize("use_multiprocessing", [False, True])
+def test_worker_pool_shared_by_enqueuers(use_multiprocessing: bool) -> None:
+    training = IdentitySequence(100)
+    validation = ArraySequence()
+    pool = keras._build_worker_pool([training, validation], 3, use_multiprocessing)
+    assert pool is not None
+
+    def build(sequence: Sequence, repeat: bool) -> keras._Enqueuer:
+        return keras._build_enqueuer(
+            sequence=sequence,
+            workers=0,
+            use_multiprocessing=False,
+            max_queue_size=5,
+            shard_rank=0,
+            num_shards=1,
+            repeat=repeat,
+            shuffle=False,
+            shuffle_seed=0,
+            prior_batches_trained=0,
+            pool=pool,
+        )
+
+    pool.start()
+    try:
+        with build(training, True) as training_enqueuer:
+            training_data = training_enqueuer.data()
+            assert [next(training_data) for _ in range(10)] == list(range(10))
+            for run in range(3):
+                # Validation runs read from the same workers while training batches are in flight.
+                with build(validation, False) as validation_enqueuer:
+                    validation_data = validation_enqueuer.data()
+                    if run == 0:
+                        # Stop reading early, like in test mode.
+                        assert next(validation_data)[1][1] == 0
+                    else:
+                        assert [batch[1][1] for batch in validation_data] == list(range(40))
+                assert next(training_data) == 10 + run
+            # Only the batches requested by the training enqueuer are left.
+            assert set(pool.received) | pool.cancelled <= set(training_enqueuer.requested)
+        assert all(worker.is_alive() for worker in pool.workers)
+    finally:
+        pool.stop()
+    assert not any(worker.is_alive() for worker in pool.workers)
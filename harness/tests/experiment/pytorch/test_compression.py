@@ -0,0 +1,115 @@
+import threading
+from typing import Callable, List
+
+import torch
+
+from determined.pytorch import _compression
+
+
+class ThreadCollective(_compression._GradientCollective):
+    """A collective between threads, each of which plays the part of one slot."""
+
+    def __init__(self, shared: "SharedState", rank: int) -> None:
+        self._shared = shared
+        self._rank = rank
+
+    def size(self) -> int:
+        return self._shared.size
+
+    def _exchange(self, tensor: torch.Tensor) -> List[torch.Tensor]:
+        self._shared.tensors[self._rank] = tensor.clone()
+        self._shared.barrier.wait()
+        tensors = list(self._shared.tensors)
+        self._shared.barrier.wait()
+        return tensors
+
+    def allreduce_sum(self, tensor: torch.Tensor, name: str) -> torch.Tensor:
+        return torch.stack(self._exchange(tensor)).sum(dim=0)
+
+    def allgather(self, tensor: torch.Tensor, name: str) -> torch.Tensor:
+        return torch.cat(self._exchange(tensor))
+
+
+class SharedState:
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.tensors = [torch.empty(0)] * size  # type: List[torch.Tensor]
+        self.barrier = threading.Barrier(size)
+
+
+def run_slots(size: int, fn: Callable[[int, _compression._GradientCollective], None]) -> None:
+    shared = SharedState(size)
+    errors = []  # type: List[BaseException]
+
+    def run(rank: int) -> None:
+        try:
+            fn(rank, ThreadCollective(shared, rank))
+        except BaseException as e:
+            shared.barrier.abort()
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(rank,)) for rank in range(size)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def make_grads(rank: int) -> List[torch.Tensor]:
+    generator = torch.Generator().manual_seed(rank)
+    return [
+        torch.randn(64, 128, generator=generator),
+        torch.randn(16, 4, 3, 3, generator=generator),
+        torch.randn(128, generator=generator),
+    ]
+
+
+def test_topk_error_feedback() -> None:
+    size, steps = 3, 20
+    totals = [None] * size  # type: List
+    errors = [None] * size  # type: List
+
+    def slot(rank: int, collective: _compression._GradientCollective) -> None:
+        compressor = _compression._TopKCompressor(collective, ratio=0.05)
+        total = [torch.zeros_like(grad) for grad in make_grads(rank)]
+        for _ in range(steps):
+            grads = make_grads(rank)
+            assert compressor.allreduce_mean(grads) > 9
+            for t, grad in zip(total, grads):
+                t.add_(grad)
+        totals[rank] = total
+        errors[rank] = [compressor._errors[idx] for idx in range(len(total))]
+
+    run_slots(size, slot)
+
+    # With error feedback, no gradient is lost: every gradient has either been sent or is still
+    # part of the error of its slot.
+    for idx, grads in enumerate(zip(*(make_grads(rank) for rank in range(size)))):
+        unsent = sum(slot_errors[idx] for slot_errors in errors)
+        expected = (sum(grads) * steps - unsent) / size
+        for total in totals:
+            assert torch.allclose(total[idx], expected, atol=1e-4)
+
+
+def test_powersgd_approximates_mean() -> None:
+    size = 2
+    low_rank = torch.randn(64, 4) @ torch.randn(4, 128)
+    results = [None] * size  # type: List
+
+    def slot(rank: int, collective: _compression._GradientCollective) -> None:
+        compressor = _compression._PowerSGDCompressor(collective, rank=4)
+        for _ in range(3):
+            grads = [low_rank * (rank + 1), torch.full((128,), float(rank))]
+            ratio = compressor.allreduce_mean(grads)
+        results[rank] = grads
+        assert ratio > 5
+
+    run_slots(size, slot)
+
+    # Every slot ends up with the same gradients, a low-rank matrix is reconstructed exactly, and
+    # vectors are averaged without compression.
+    for grads in results:
+        assert torch.allclose(grads[0], results[0][0])
+        assert torch.allclose(grads[0], low_rank * 1.5, atol=1e-3)
+        assert torch.equal(grads[1], torch.full((128,), 0.5))
@@ -0,0 +1,128 @@
+import threading
+from typing import Any, List, Tuple
+
+import pytest
+import torch
+
+from determined.pytorch import _gradient_buckets
+
+
+class ThreadAsyncCollective(_gradient_buckets._AsyncCollective):
+    """
+    A collective between threads, each of which plays the part of one slot. Allreduces are
+    recorded when they are started and only exchanged when they are waited on.
+    """
+
+    def __init__(self, barrier: threading.Barrier, tensors: List[Any], rank: int) -> None:
+        self._barrier = barrier
+        self._tensors = tensors
+        self._rank = rank
+        self.started = []  # type: List[str]
+
+    def size(self) -> int:
+        return len(self._tensors)
+
+    def allreduce_sum_async(self, tensor: torch.Tensor, name: str) -> Any:
+        self.started.append(name)
+        return tensor, name
+
+    def wait(self, handle: Any) -> None:
+        tensor, name = handle
+        self._tensors[self._rank] = (name, tensor.clone())
+        self._barrier.wait()
+        names = {n for n, _ in self._tensors}
+        assert names == {name}, "slots waited on different buckets"
+        total = sum(t for _, t in self._tensors)
+        self._barrier.wait()
+        tensor.copy_(total)
+
+
+def make_model() -> torch.nn.Module:
+    torch.manual_seed(0)
+    return torch.nn.Sequential(
+        torch.nn.Linear(8, 32), torch.nn.ReLU(), torch.nn.Linear(32, 32), torch.nn.Linear(32, 2)
+    )
+
+
+def batch(rank: int, step: int) -> torch.Tensor:
+    return torch.randn(4, 8, generator=torch.Generator().manual_seed(rank * 100 + step))
+
+
+@pytest.mark.parametrize("passes_per_step", [1, 3])
+def test_bucket_reducer_averages_gradients(passes_per_step: int) -> None:
+    size = 2
+    barrier = threading.Barrier(size)
+    tensors = [None] * size  # type: List[Any]
+    results = [None] * size  # type: List[Any]
+    errors = []  # type: List[BaseException]
+    # The models are made before the threads are started, since they use the global random seed.
+    models = [make_model() for _ in range(size)]
+
+    def slot(rank: int) -> None:
+        try:
+            model = models[rank]
+            collective = ThreadAsyncCollective(barrier, tensors, rank)
+            # Small buckets, so that the model is split into several of them.
+            reducer = _gradient_buckets._GradientBucketReducer(
+                list(model.parameters()),
+                collective,
+                bucket_cap_bytes=1024,
+                passes_per_step=passes_per_step,
+            )
+            started_during_backward = []  # type: List[int]
+            for step in range(passes_per_step):
+                model(batch(rank, step)).sum().backward()
+                started_during_backward.append(len(collective.started))
+            reducer.synchronize()
+            results[rank] = (
+                started_during_backward,
+                collective.started,
+                [p.grad.clone() for p in model.parameters()],
+            )
+        except BaseException as e:
+            barrier.abort()
+            errors.append(e)
+
+    threads = [threading.Thread(target=slot, args=(rank,)) for rank in range(size)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+    # The expected gradients are the mean over slots of the gradients accumulated by each slot.
+    expected = [torch.zeros_like(p) for p in make_model().parameters()]
+    for rank in range(size):
+        model = make_model()
+        for step in range(passes_per_step):
+            model(batch(rank, step)).sum().backward()
+        for e, p in zip(expected, model.parameters()):
+            e.add_(p.grad / size)
+
+    for started_during_backward, started, grads in results:
+        # Every bucket was started during the last backward pass, and none before it.
+        assert started_during_backward == [0] * (passes_per_step - 1) + [len(started)]
+        assert len(started) > 1
+        # Buckets are started in order, beginning with the last layers.
+        assert started == [f"det_grad_bucket_{i}" for i in range(len(started))]
+        for grad, e in zip(grads, expected):
+            assert torch.allclose(grad, e, atol=1e-6)
+
+
+def test_bucket_reducer_unused_parameters() -> None:
+    model = make_model()
+    unused = torch.nn.Linear(2, 2)
+    params = list(model.parameters()) + list(unused.parameters())
+
+    class LocalCollective(ThreadAsyncCollective):
+        def wait(self, handle: Tuple[torch.Tensor, str]) -> None:
+            pass
+
+    collective = LocalCollective(threading.Barrier(1), [None], 0)
+    reducer = _gradient_buckets._GradientBucketReducer(params, collective, bucket_cap_bytes=1 << 20)
+    model(batch(0, 0)).sum().backward()
+    # The bucket with the unused parameters is only started once the optimizer is synchronized.
+    assert collective.started == []
+    reducer.synchronize()
+    assert collective.started == ["det_grad_bucket_0"]
+    assert all(torch.equal(p.grad, torch.zeros_like(p)) for p in unused.parameters())
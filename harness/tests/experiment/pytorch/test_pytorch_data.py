@@ -117,6 +117,37 @@ def test_pytorch_adapt_batch_sampler():
                 assert torch.all(torch.eq(pair[0], pair[1]))
 
 
+@pytest.mark.parametrize("num_replicas", [1, 3])
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_skip_batch_sampler_seeks(shuffle: bool, num_replicas: int) -> None:
+    skip = 37
+
+    def make_batch_sampler(rank: int) -> torch.utils.data.BatchSampler:
+        dataloader = det.pytorch.DataLoader(list(range(23)), batch_size=2, shuffle=shuffle)
+        if shuffle:
+            dataloader.sampler.seed = 777
+        return det.pytorch.adapt_batch_sampler(
+            dataloader.batch_sampler, repeat=True, num_replicas=num_replicas, rank=rank
+        )
+
+    for rank in range(num_replicas):
+        # Generate the skipped batches, which the SkipBatchSampler must not do.
+        iterator = iter(make_batch_sampler(rank))
+        for _ in range(skip):
+            next(iterator)
+        expected = [next(iterator) for _ in range(30)]
+
+        skip_sampler = SkipBatchSampler(make_batch_sampler(rank), skip, same_length=True)
+        skip_iterator = iter(skip_sampler)
+        assert [next(skip_iterator) for _ in range(30)] == expected
+
+    if shuffle:
+        # Every epoch is shuffled differently.
+        repeat_iterator = iter(make_batch_sampler(0))
+        epochs = [[next(repeat_iterator) for _ in range(12)] for _ in range(2)]
+        assert epochs[0] != epochs[1]
+
+
 def test_pytorch_batch_sampler_mutual_exclusion():
     dataloader = det.pytorch.DataLoader(make_dataset(), drop_last=True, shuffle=True, batch_size=2)
     assert dataloader.get_data_loader() is not None
@@ -76,6 +76,33 @@ class TestPyTorchTrial:
         )
         controller.run()
 
+    def test_onevar_deferred_metric_transfer(self) -> None:
+        class DeferredOneVarTrial(pytorch_onevar_model.OneVarTrial):
+            def __init__(self, context: pytorch.PyTorchTrialContext) -> None:
+                context.experimental.defer_metric_transfer(flush_batches=3)
+                super().__init__(context)
+
+        def make_workloads() -> workload.Stream:
+            trainer = utils.TrainAndValidate()
+
+            yield from trainer.send(steps=10, validation_freq=5, scheduling_unit=4)
+            training_metrics, validation_metrics = trainer.result()
+
+            # Batches are flushed mid-step and at the end of each step, in order.
+            assert len(training_metrics) == 40
+            for idx, batch_metrics in enumerate(training_metrics):
+                pytorch_onevar_model.OneVarTrial.check_batch_metrics(batch_metrics, idx)
+
+            yield workload.terminate_workload(), [], workload.ignore_workload_response
+
+        controller = utils.make_trial_controller_from_trial_implementation(
+            trial_class=DeferredOneVarTrial,
+            hparams=self.hparams,
+            workloads=make_workloads(),
+            trial_seed=self.trial_seed,
+        )
+        controller.run()
+
     def test_xor_multi_validation(self) -> None:
         def make_workloads() -> workload.Stream:
             trainer = utils.TrainAndValidate()
@@ -518,3 +545,24 @@ def test_native_api_local_test() -> None:
             **os.environ,
         },
     )
+
+
+def test_convert_batch_metrics_to_numpy() -> None:
+    controller = pytorch._pytorch_trial.PyTorchTrialController
+    loss = torch.tensor(1.0, requires_grad=True)
+    batch_metrics = [
+        controller._detach_metrics(
+            {"loss": loss * i, "vector": torch.arange(3) + i, "ragged": torch.ones(i + 1), "x": i}
+        )
+        for i in range(3)
+    ]
+    # Metrics are copied, so that updating a metric in place later does not change them.
+    with torch.no_grad():
+        loss += 1
+
+    converted = controller._convert_batch_metrics_to_numpy(batch_metrics)
+    for i, metrics in enumerate(converted):
+        assert metrics["loss"].shape == () and metrics["loss"] == i
+        assert metrics["vector"].tolist() == [i, i + 1, i + 2]
+        assert metrics["ragged"].tolist() == [1.0] * (i + 1)
+        assert metrics["x"] == i
@@ -1,6 +1,9 @@
+import threading
+from typing import Any, Callable, Dict, List
+
 import numpy as np
 
-from determined.pytorch import Reducer, _reduce_metrics
+from determined.pytorch import Reducer, _collective, _reduce_metrics
 
 
 def test_reducer() -> None:
@@ -12,3 +15,114 @@ def test_reducer() -> None:
 
     batches_per_process = [1, 2, 5, 4, 5, 6]
     assert np.around(_reduce_metrics(Reducer.AVG, metrics, batches_per_process), decimals=2) == 6.43
+
+
+class ThreadCollective(_collective._TensorCollective):
+    """Run the collectives of several slots, each one in its own thread."""
+
+    def __init__(self, shared: Dict[str, Any], rank: int) -> None:
+        self.shared = shared
+        self.rank = rank
+
+    def _exchange(self, array: Any) -> List[Any]:
+        barrier = self.shared["barrier"]
+        self.shared["arrays"][self.rank] = np.array(array, dtype=np.float64)
+        barrier.wait()
+        arrays = list(self.shared["arrays"])
+        barrier.wait()
+        return arrays
+
+    def allgather(self, array: np.ndarray) -> np.ndarray:
+        return np.stack(self._exchange(array))
+
+    def allreduce_sum(self, array: np.ndarray) -> np.ndarray:
+        return np.sum(self._exchange(array), axis=0)
+
+
+def run_slots(fns: List[Callable[[_collective._TensorCollective], Any]]) -> List[Any]:
+    shared = {
+        "barrier": threading.Barrier(len(fns)),
+        "arrays": [None] * len(fns),
+    }  # type: Dict[str, Any]
+    results = [None] * len(fns)  # type: List[Any]
+
+    def run(rank: int) -> None:
+        results[rank] = fns[rank](ThreadCollective(shared, rank))
+
+    threads = [threading.Thread(target=run, args=(rank,)) for rank in range(len(fns))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_allreduce_reduced_metrics() -> None:
+    reducers = {"loss": Reducer.AVG, "count": Reducer.SUM}
+    slot_metrics = [{"loss": 1.0, "count": 3}, {"loss": 4.0, "count": 5}]
+    slot_batches = [1, 2]
+
+    def reduce_on_slot(rank: int) -> Callable[[_collective._TensorCollective], Any]:
+        return lambda collective: _collective._allreduce_reduced_metrics(
+            collective, slot_metrics[rank], slot_batches[rank], reducers
+        )
+
+    results = run_slots([reduce_on_slot(0), reduce_on_slot(1)])
+    assert results[0] == results[1] == {"loss": 3.0, "count": 8.0}
+
+    reducers = {"loss": Reducer.MAX, "count": Reducer.MIN}
+    results = run_slots([reduce_on_slot(0), reduce_on_slot(1)])
+    assert results[0] == results[1] == {"loss": 4.0, "count": 3.0}
+
+    # Every slot falls back if any slot has a non-numeric metric.
+    slot_metrics[1]["loss"] = "nan"
+    assert run_slots([reduce_on_slot(0), reduce_on_slot(1)]) == [None, None]
+
+
+def test_allreduce_mean_batch_metrics() -> None:
+    slot_metrics = [
+        [{"loss": np.array(1.0), "acc": 0.5}, {"loss": np.array(2.0), "acc": None}],
+        [{"loss": np.array(3.0), "acc": 1.0}, {"loss": np.array(4.0), "acc": 0.25}],
+    ]
+
+    def average_on_slot(rank: int) -> Callable[[_collective._TensorCollective], Any]:
+        return lambda collective: _collective._allreduce_mean_batch_metrics(
+            collective, slot_metrics[rank]
+        )
+
+    results = run_slots([average_on_slot(0), average_on_slot(1)])
+    assert results[0] == results[1]
+    assert results[0] == [{"loss": 2.0, "acc": 0.75}, {"loss": 3.0, "acc": 0.25}]
+    assert isinstance(results[0][0]["loss"], np.ndarray)
+
+    # Every slot falls back if the slots do not agree on the metric names.
+    slot_metrics[1] = [{"loss": 3.0}, {"loss": 4.0}]
+    assert run_slots([average_on_slot(0), average_on_slot(1)]) == [None, None]
+
+
+def test_allgather_per_slot_metrics() -> None:
+    slot_values = [
+        [3, 0.5, np.arange(4, dtype=np.int32).reshape(2, 2), ["a", 1]],
+        [5, 1.5, np.ones((2, 2), dtype=np.int32), ["b"]],
+    ]
+    pickled = []  # type: List[Any]
+
+    def pickled_allgather(values: Any) -> List[Any]:
+        # Stand in for the pickled gather, which only receives the non-numeric values.
+        pickled.append(values)
+        return [[["a", 1]], [["b"]]]
+
+    def gather_on_slot(rank: int) -> Callable[[_collective._TensorCollective], Any]:
+        return lambda collective: _collective._allgather_per_slot_metrics(
+            collective, slot_values[rank], pickled_allgather
+        )
+
+    results = run_slots([gather_on_slot(0), gather_on_slot(1)])
+    for gathered in results:
+        assert [slot[:2] for slot in gathered] == [[3, 0.5], [5, 1.5]]
+        assert isinstance(gathered[0][0], int) and isinstance(gathered[0][1], float)
+        for slot in range(2):
+            assert gathered[slot][2].dtype == np.int32
+            assert np.array_equal(gathered[slot][2], slot_values[slot][2])
+        assert [slot[3] for slot in gathered] == [["a", 1], ["b"]]
+    assert sorted(pickled, key=repr) == [[["a", 1]], [["b"]]]
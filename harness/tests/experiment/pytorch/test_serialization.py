@@ -0,0 +1,121 @@
+import pathlib
+from typing import Any, List, Tuple
+
+import numpy as np
+import torch
+from _pytest.monkeypatch import MonkeyPatch
+
+from determined.pytorch import _serialization
+
+
+def assert_equal(expected: Any, actual: Any) -> None:
+    assert type(expected) is type(actual)
+    if isinstance(expected, dict):
+        assert list(expected) == list(actual)
+        for key in expected:
+            assert_equal(expected[key], actual[key])
+    elif isinstance(expected, (list, tuple)):
+        assert len(expected) == len(actual)
+        for e, a in zip(expected, actual):
+            assert_equal(e, a)
+    elif isinstance(expected, torch.Tensor):
+        assert expected.dtype == actual.dtype
+        assert expected.shape == actual.shape and expected.stride() == actual.stride()
+        assert expected.requires_grad == actual.requires_grad
+        assert torch.equal(expected, actual)
+    elif isinstance(expected, np.ndarray):
+        assert np.array_equal(expected, actual)
+    else:
+        assert expected == actual
+
+
+def make_checkpoint() -> Any:
+    model = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.BatchNorm1d(8))
+    optimizer = torch.optim.Adam(model.parameters())
+    model(torch.randn(3, 4)).sum().backward()
+    optimizer.step()
+
+    shared = torch.arange(12, dtype=torch.float32)
+    return {
+        "models_state_dict": [model.state_dict()],
+        "optimizers_state_dict": [optimizer.state_dict()],
+        "views": [shared, shared[2:5], shared.reshape(3, 4).t()],
+        "dtypes": [
+            torch.ones(3, dtype=dtype)
+            for dtype in (torch.float16, torch.bfloat16, torch.int8, torch.bool, torch.complex64)
+        ],
+        "empty": torch.empty(0, 2),
+        "parameter": torch.nn.Parameter(torch.randn(2, 2)),
+        "rng_state": {"np_rng_state": np.random.get_state(), "cpu": torch.random.get_rng_state()},
+    }
+
+
+def test_load_checkpoint(tmp_path: pathlib.Path) -> None:
+    checkpoint = make_checkpoint()
+    path = str(tmp_path.joinpath("state_dict.pth"))
+    torch.save(checkpoint, path)
+
+    loaded = _serialization._load_checkpoint(path)
+    assert_equal(checkpoint, loaded)
+
+    # Views of the same storage still share it.
+    views = loaded["views"]
+    views[0][3] = -1
+    assert views[1][1] == -1 and views[2][3, 0] == -1
+
+    # The checkpoint is mapped copy-on-write, so modifying the tensors does not modify the file.
+    assert_equal(checkpoint, _serialization._load_checkpoint(path))
+
+
+def test_load_legacy_checkpoint(tmp_path: pathlib.Path) -> None:
+    checkpoint = make_checkpoint()
+    del checkpoint["rng_state"]
+    path = str(tmp_path.joinpath("state_dict.pth"))
+    torch.save(checkpoint, path, _use_new_zipfile_serialization=False)
+
+    assert_equal(checkpoint, _serialization._load_checkpoint(path))
+
+
+def test_rebuild_tensor_is_replaced(tmp_path: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    # Memory mapping relies on torch.save() pickling tensors with the private function of torch
+    # that _MmapUnpickler replaces; if that changes, checkpoints are silently loaded in full.
+    assert _serialization._can_replace_rebuild_tensor()
+
+    path = str(tmp_path.joinpath("state_dict.pth"))
+    torch.save(make_checkpoint(), path)
+
+    classes = []  # type: List[Tuple[str, str]]
+    find_class = _serialization._MmapUnpickler.find_class
+
+    def record_find_class(self: Any, module: str, name: str) -> Any:
+        classes.append((module, name))
+        return find_class(self, module, name)
+
+    monkeypatch.setattr(_serialization._MmapUnpickler, "find_class", record_find_class)
+    _serialization._load_mmapped(path)
+    rebuild_fns = {c for c in classes if c[1].startswith("_rebuild")}
+    assert rebuild_fns == {_serialization._REBUILD_TENSOR, ("torch._utils", "_rebuild_parameter")}
+
+
+def test_clone_optimizer_state(tmp_path: pathlib.Path) -> None:
+    checkpoint = make_checkpoint()
+    path = str(tmp_path.joinpath("state_dict.pth"))
+    torch.save(checkpoint, path)
+    loaded = _serialization._load_checkpoint(path)
+
+    model = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.BatchNorm1d(8))
+    optimizer = torch.optim.Adam(model.parameters())
+    optimizer.load_state_dict(loaded["optimizers_state_dict"][0])
+    _serialization._clone_optimizer_state(optimizer)
+
+    mapped = {
+        value.data_ptr()
+        for state in loaded["optimizers_state_dict"][0]["state"].values()
+        for value in state.values()
+        if isinstance(value, torch.Tensor)
+    }
+    for param_id, state in optimizer.state_dict()["state"].items():
+        for key, value in state.items():
+            assert_equal(checkpoint["optimizers_state_dict"][0]["state"][param_id][key], value)
+            if isinstance(value, torch.Tensor):
+                assert value.data_ptr() not in mapped
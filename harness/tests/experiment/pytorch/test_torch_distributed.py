@@ -0,0 +1,71 @@
+import os
+import socket
+from typing import Tuple
+
+import torch
+import torch.multiprocessing as mp
+
+from determined.horovod import hvd
+
+WORLD_SIZE = 2
+
+
+def make_model_and_optimizer(rank: int) -> Tuple[torch.nn.Module, torch.optim.Optimizer]:
+    torch.manual_seed(rank)
+    model = torch.nn.Linear(4, 2)
+    optimizer = torch.optim.Adam(model.parameters(), lr=0.1 * (rank + 1))
+    # Give the optimizer some state, which differs between ranks.
+    model(torch.randn(3, 4)).sum().backward()
+    optimizer.step()
+    return model, optimizer
+
+
+def worker(local_rank: int, port: int) -> None:
+    os.environ.update(
+        {
+            "RANK": str(local_rank),
+            "WORLD_SIZE": str(WORLD_SIZE),
+            "LOCAL_RANK": str(local_rank),
+            "LOCAL_WORLD_SIZE": str(WORLD_SIZE),
+            "MASTER_ADDR": "localhost",
+            "MASTER_PORT": str(port),
+        }
+    )
+    hvd.require_horovod_type("torch.distributed", "test_torch_distributed is in use.")
+    hvd.init()
+    rank = hvd.rank()
+    assert (hvd.size(), hvd.local_rank(), hvd.local_size()) == (WORLD_SIZE, rank, WORLD_SIZE)
+
+    # Like Horovod, allreduce averages by default and leaves its input unchanged.
+    tensor = torch.tensor([1.0, 2.0]) * (rank + 1)
+    assert torch.equal(hvd.allreduce(tensor), torch.tensor([1.5, 3.0]))
+    assert torch.equal(hvd.allreduce(tensor, op=hvd.Sum), torch.tensor([3.0, 6.0]))
+    assert torch.equal(tensor, torch.tensor([1.0, 2.0]) * (rank + 1))
+
+    handle = hvd.allreduce_async_(tensor, op=hvd.Sum, name="async")
+    hvd.synchronize(handle)
+    assert torch.equal(tensor, torch.tensor([3.0, 6.0]))
+
+    # The first dimension of gathered tensors may differ between ranks.
+    gathered = hvd.allgather(torch.full((rank + 1, 2), float(rank)))
+    assert torch.equal(gathered, torch.tensor([[0.0, 0.0], [1.0, 1.0], [1.0, 1.0]]))
+
+    assert hvd.broadcast_object({"rank": rank}, root_rank=0) == {"rank": 0}
+
+    model, optimizer = make_model_and_optimizer(rank)
+    hvd.broadcast_parameters(model.state_dict(), root_rank=0)
+    hvd.broadcast_optimizer_state(optimizer, root_rank=0)
+    expected_model, expected_optimizer = make_model_and_optimizer(0)
+    for p, expected in zip(model.parameters(), expected_model.parameters()):
+        assert torch.equal(p, expected)
+    assert optimizer.param_groups[0]["lr"] == expected_optimizer.param_groups[0]["lr"]
+    for p, expected in zip(model.parameters(), expected_model.parameters()):
+        state, expected_state = optimizer.state[p], expected_optimizer.state[expected]
+        assert torch.equal(state["exp_avg"], expected_state["exp_avg"])
+
+
+def test_torch_distributed_shim() -> None:
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        port = sock.getsockname()[1]
+    mp.spawn(worker, args=(port,), nprocs=WORLD_SIZE)
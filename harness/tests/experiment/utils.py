@@ -140,6 +140,7 @@ def make_default_env_context(
         det_trial_unique_port_offset=0,
         det_trial_runner_network_interface=constants.AUTO_DETECT_TRIAL_RUNNER_NETWORK_INTERFACE,
         det_trial_id="1",
+        det_trial_run_id=1,
         det_experiment_id="1",
         det_agent_id="1",
         det_cluster_id="uuid-123",
@@ -0,0 +1,40 @@
+"""
+A training process that answers every workload immediately, like a trial whose batches take no
+time: the chief reports one metrics dict per batch of scheduling_unit, and the other workers report
+Skipped. Used to measure the overhead of the SubprocessLauncher protocol.
+"""
+import os
+import pathlib
+import sys
+import traceback
+
+from determined import ipc, layers, util, workload
+
+
+def main() -> None:
+    worker_process_env = layers.WorkerProcessContext.from_file(pathlib.Path(sys.argv[1]))
+    is_chief = int(os.environ.get("RANK", "0")) == 0
+    num_batches = worker_process_env.env.experiment_config["scheduling_unit"]
+    batch_metrics = [{"loss": 0.5 + i, "accuracy": 0.25, "step": i} for i in range(num_batches)]
+    metrics = util.make_metrics(num_batches, batch_metrics)
+
+    pub_url = f"tcp://localhost:{worker_process_env.broadcast_pub_port}"
+    sub_url = f"tcp://localhost:{worker_process_env.broadcast_pull_port}"
+    with ipc.ZMQBroadcastClient(pub_url, sub_url) as broadcast_client:
+        for wkld, _, respond in layers.SubprocessReceiver(broadcast_client):
+            if not is_chief:
+                respond(workload.Skipped())
+            elif wkld.kind == workload.Workload.Kind.RUN_STEP:
+                respond(util.wrap_metrics(metrics, False, False, False))
+            else:
+                respond({})
+            if wkld.kind == workload.Workload.Kind.TERMINATE:
+                break
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception:
+        traceback.print_exc(file=sys.stderr)
+        raise
@@ -0,0 +1,43 @@
+import os
+import pathlib
+import sys
+import traceback
+
+import torch
+
+from determined import ipc, layers, workload
+from determined.horovod import hvd
+from tests.fixtures import fake_subprocess_receiver
+
+
+def main() -> None:
+    worker_process_env_path = pathlib.Path(sys.argv[1])
+    worker_process_env = layers.WorkerProcessContext.from_file(worker_process_env_path)
+
+    hvd.require_horovod_type("torch.distributed", "fake_torch_distributed_receiver is in use.")
+    hvd.init()
+    assert hvd.rank() == int(os.environ["RANK"])
+    assert hvd.local_size() == hvd.size() == len(worker_process_env.env.slot_ids)
+
+    pub_url = f"tcp://localhost:{worker_process_env.broadcast_pub_port}"
+    sub_url = f"tcp://localhost:{worker_process_env.broadcast_pull_port}"
+    with ipc.ZMQBroadcastClient(pub_url, sub_url) as broadcast_client:
+        subrec = layers.SubprocessReceiver(broadcast_client)
+
+        # Every training process receives every workload, and only the chief reports metrics.
+        expected = fake_subprocess_receiver.fake_workload_gen()
+        actual = iter(subrec)
+        for i, wkld in enumerate(expected):
+            actual_wkld, _, resp_fn = next(actual)
+            assert wkld == actual_wkld
+            total = hvd.allreduce(torch.tensor([float(i)]), op=hvd.Sum)
+            assert total.item() == i * hvd.size()
+            resp_fn({"count": i} if hvd.rank() == 0 else workload.Skipped())
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception:
+        traceback.print_exc(file=sys.stderr)
+        raise
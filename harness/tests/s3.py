@@ -13,11 +13,11 @@ class MockS3Client:
             raise boto3.exceptions.S3UploadFailedError()
         self.objects[(kwargs["Bucket"], kwargs["Key"])] = kwargs["Body"]
 
-    def upload_file(self, path: str, bucket: str, key: str) -> None:
+    def upload_file(self, path: str, bucket: str, key: str, **_: Any) -> None:
         with open(path, "r") as fp:
             self.put_object(Bucket=bucket, Key=key, Body=fp.read())
 
-    def download_file(self, bucket: str, key: str, path: str) -> None:
+    def download_file(self, bucket: str, key: str, path: str, **_: Any) -> None:
         with open(path, "w") as fp:
             fp.write(self.objects[(bucket, key)])
 
@@ -0,0 +1,184 @@
+import os
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from determined.common import storage
+from tests.storage import util
+
+# The size of the checkpoints created by util.create_checkpoint().
+CHECKPOINT_SIZE = 20
+
+
+@pytest.fixture()
+def manager(tmp_path: Path) -> storage.ContentAddressedStorageManager:
+    backend = storage.SharedFSStorageManager(str(tmp_path.joinpath("storage")))
+    return storage.ContentAddressedStorageManager(backend, chunk_size=8)
+
+
+@pytest.fixture()
+def downloads(
+    manager: storage.ContentAddressedStorageManager, monkeypatch: MonkeyPatch
+) -> List[str]:
+    """Record the storage ID of every checkpoint that is downloaded from storage."""
+    downloaded = []  # type: List[str]
+    download = manager.download
+
+    def record_download(metadata: storage.StorageMetadata, storage_dir: str) -> None:
+        downloaded.append(metadata.storage_id)
+        download(metadata, storage_dir)
+
+    monkeypatch.setattr(manager, "download", record_download)
+    return downloaded
+
+
+def store_checkpoint(manager: storage.StorageManager) -> storage.StorageMetadata:
+    with manager.store_path() as (storage_id, path):
+        util.create_checkpoint(path)
+        metadata = storage.StorageMetadata(storage_id, manager._list_directory(path))
+    assert sum(metadata.resources.values()) == CHECKPOINT_SIZE
+    return metadata
+
+
+def set_last_use(cache: storage.CheckpointCache, metadata: storage.StorageMetadata, t: int) -> None:
+    os.utime(os.path.join(cache.root, "entries", metadata.storage_id + ".lock"), (t, t))
+
+
+def cached_ids(cache: storage.CheckpointCache) -> List[str]:
+    return sorted(
+        name for name in os.listdir(os.path.join(cache.root, "entries")) if "." not in name
+    )
+
+
+def test_cache_hit(
+    manager: storage.ContentAddressedStorageManager, downloads: List[str], tmp_path: Path
+) -> None:
+    cache = storage.CheckpointCache(str(tmp_path.joinpath("cache")))
+    metadata = store_checkpoint(manager)
+
+    for _ in range(3):
+        with cache.restore_path(manager, metadata) as path:
+            util.validate_checkpoint(path)
+    assert downloads == [metadata.storage_id]
+
+    dest = str(tmp_path.joinpath("dest"))
+    cache.download(manager, metadata, dest)
+    util.validate_checkpoint(dest)
+    assert downloads == [metadata.storage_id]
+
+
+def test_cache_integrity(
+    manager: storage.ContentAddressedStorageManager, downloads: List[str], tmp_path: Path
+) -> None:
+    cache = storage.CheckpointCache(str(tmp_path.joinpath("cache")))
+    metadata = store_checkpoint(manager)
+
+    with cache.restore_path(manager, metadata) as path:
+        pass
+    # A truncated file is detected and the checkpoint is downloaded again.
+    with open(os.path.join(path, "subdir", "file.txt"), "w") as f:
+        f.write("nested")
+    with cache.restore_path(manager, metadata) as path:
+        util.validate_checkpoint(path)
+    assert downloads == [metadata.storage_id] * 2
+
+
+def test_cache_lru_eviction(
+    manager: storage.ContentAddressedStorageManager, downloads: List[str], tmp_path: Path
+) -> None:
+    cache = storage.CheckpointCache(str(tmp_path.joinpath("cache")), max_bytes=2 * CHECKPOINT_SIZE)
+    first, second, third = (store_checkpoint(manager) for _ in range(3))
+
+    for t, metadata in enumerate((first, second, first)):
+        with cache.restore_path(manager, metadata):
+            set_last_use(cache, metadata, t)
+    assert cached_ids(cache) == sorted([first.storage_id, second.storage_id])
+
+    # The least recently used checkpoint is evicted.
+    with cache.restore_path(manager, third):
+        pass
+    assert cached_ids(cache) == sorted([first.storage_id, third.storage_id])
+
+    # Checkpoints that are in use are never evicted, even if the cache grows beyond max_bytes.
+    set_last_use(cache, first, 0)
+    with cache.restore_path(manager, first):
+        with cache.restore_path(manager, second) as path:
+            util.validate_checkpoint(path)
+        assert cached_ids(cache) == sorted([first.storage_id, second.storage_id])
+    assert downloads == [first.storage_id, second.storage_id, third.storage_id, second.storage_id]
+
+
+def test_cache_concurrent_restores(
+    manager: storage.ContentAddressedStorageManager, downloads: List[str], tmp_path: Path
+) -> None:
+    metadata = store_checkpoint(manager)
+    errors = []  # type: List[BaseException]
+
+    def restore() -> None:
+        try:
+            # Each restore has its own cache object, like the processes of separate containers.
+            cache = storage.CheckpointCache(str(tmp_path.joinpath("cache")))
+            with cache.restore_path(manager, metadata) as path:
+                util.validate_checkpoint(path)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=restore) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert downloads == [metadata.storage_id]
+
+
+def test_cache_bypassed_for_shared_fs(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    manager = storage.SharedFSStorageManager(str(tmp_path.joinpath("storage")))
+    metadata = store_checkpoint(manager)
+    monkeypatch.setenv("DET_CHECKPOINT_CACHE_DIR", str(tmp_path.joinpath("cache")))
+
+    with storage.cached_restore_path(manager, metadata) as path:
+        assert path == os.path.join(manager._base_path, metadata.storage_id)
+    assert cached_ids(storage.CheckpointCache(str(tmp_path.joinpath("cache")))) == []
+
+
+def test_cache_fetch(
+    manager: storage.ContentAddressedStorageManager,
+    downloads: List[str],
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    cache = storage.CheckpointCache(str(tmp_path.joinpath("cache")))
+    first, second = store_checkpoint(manager), store_checkpoint(manager)
+    fetches = []  # type: List[str]
+
+    def fetch(dest: str) -> bool:
+        fetches.append(dest)
+        # The checkpoint is fetched into an empty directory.
+        os.rmdir(dest)
+        util.create_checkpoint(dest)
+        return True
+
+    # A fetched checkpoint lands in the cache without being downloaded from storage.
+    with cache.restore_path(manager, first, fetch) as path:
+        util.validate_checkpoint(path)
+    with cache.restore_path(manager, first, fetch) as path:
+        util.validate_checkpoint(path)
+    assert len(fetches) == 1 and downloads == []
+    assert cached_ids(cache) == [first.storage_id]
+
+    # The checkpoint is downloaded from storage if the fetch fails.
+    with cache.restore_path(manager, second, lambda _: False) as path:
+        util.validate_checkpoint(path)
+    assert downloads == [second.storage_id]
+
+    # Without the cache, the checkpoint is fetched into a temporary directory.
+    monkeypatch.delenv("DET_CHECKPOINT_CACHE_DIR", raising=False)
+    with storage.cached_restore_path(manager, first, fetch) as path:
+        util.validate_checkpoint(path)
+    assert not os.path.exists(path)
+    assert len(fetches) == 2 and downloads == [second.storage_id]
@@ -0,0 +1,137 @@
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from determined.common import check, storage
+from tests.storage import util
+
+
+@pytest.fixture()
+def backend(tmp_path: Path) -> storage.SharedFSStorageManager:
+    return storage.SharedFSStorageManager(str(tmp_path))
+
+
+@pytest.fixture()
+def manager(backend: storage.SharedFSStorageManager) -> storage.ContentAddressedStorageManager:
+    return storage.ContentAddressedStorageManager(backend, chunk_size=8)
+
+
+def list_chunks(base_path: str) -> List[str]:
+    chunks = []  # type: List[str]
+    for _, _, files in os.walk(os.path.join(base_path, "cas", "chunks")):
+        chunks.extend(files)
+    return sorted(chunks)
+
+
+def store_checkpoint(manager: storage.StorageManager, extra: str = "") -> storage.StorageMetadata:
+    with manager.store_path() as (storage_id, path):
+        util.create_checkpoint(path)
+        if extra:
+            with open(os.path.join(path, "extra.txt"), "w") as f:
+                f.write(extra)
+        metadata = storage.StorageMetadata(storage_id, manager._list_directory(path))
+    return metadata
+
+
+def test_checkpoint_lifecycle(
+    backend: storage.SharedFSStorageManager, manager: storage.ContentAddressedStorageManager
+) -> None:
+    first = store_checkpoint(manager, extra="first checkpoint")
+    # Only the manifests, chunks and references remain in storage.
+    assert os.listdir(backend._base_path) == ["cas"]
+    first_chunks = list_chunks(backend._base_path)
+
+    second = store_checkpoint(manager, extra="second checkpoint")
+    second_chunks = list_chunks(backend._base_path)
+    # The files the checkpoints have in common are only stored once.
+    assert 0 < len(second_chunks) - len(first_chunks) < len(first_chunks)
+
+    for metadata in (first, second):
+        with manager.restore_path(metadata) as path:
+            # Checkpoints are restored outside of the shared storage.
+            assert not path.startswith(backend._base_path)
+            with open(os.path.join(path, "extra.txt")) as f:
+                extra = f.read()
+            os.remove(os.path.join(path, "extra.txt"))
+            util.validate_checkpoint(path)
+        assert extra.startswith("first" if metadata is first else "second")
+
+    manager.delete(first)
+    remaining = list_chunks(backend._base_path)
+    assert set(remaining) < set(second_chunks)
+    with manager.restore_path(second) as path:
+        assert os.path.exists(os.path.join(path, "subdir", "file.txt"))
+
+    manager.delete(second)
+    assert list_chunks(backend._base_path) == []
+    assert os.listdir(os.path.join(backend._base_path, "cas", "manifests")) == []
+
+
+def test_delete_races_with_store(
+    backend: storage.SharedFSStorageManager,
+    manager: storage.ContentAddressedStorageManager,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    metadata = store_checkpoint(manager)
+    chunks = list_chunks(backend._base_path)
+    delete_objects = backend._delete_objects
+
+    def delete_while_storing(keys: List[str]) -> None:
+        # Another checkpoint references each chunk after delete() found it unreferenced, and finds
+        # the chunk still stored.
+        for key in keys:
+            if key.startswith("cas/chunks/"):
+                backend._upload_object("cas/refs/{}/other".format(os.path.basename(key)), b"")
+        delete_objects(keys)
+
+    monkeypatch.setattr(backend, "_delete_objects", delete_while_storing)
+    manager.delete(metadata)
+    assert list_chunks(backend._base_path) == chunks
+
+
+def test_restore_checkpoint_stored_without_dedup(
+    backend: storage.SharedFSStorageManager, manager: storage.ContentAddressedStorageManager
+) -> None:
+    metadata = store_checkpoint(backend)
+
+    with manager.restore_path(metadata) as path:
+        util.validate_checkpoint(path)
+
+    manager.delete(metadata)
+    assert os.listdir(backend._base_path) == []
+
+
+def test_corrupt_chunk(
+    backend: storage.SharedFSStorageManager, manager: storage.ContentAddressedStorageManager
+) -> None:
+    metadata = store_checkpoint(manager)
+    chunk = list_chunks(backend._base_path)[0]
+    with open(os.path.join(backend._base_path, "cas", "chunks", chunk[:2], chunk), "wb") as f:
+        f.write(b"garbage")
+
+    with pytest.raises(check.CheckFailedError, match="is corrupt"):
+        with manager.restore_path(metadata):
+            pass
+
+
+def test_build(tmp_path: Path) -> None:
+    manager = storage.build(
+        {"type": "shared_fs", "host_path": str(tmp_path), "content_addressed": True},
+        container_path=None,
+    )
+    assert isinstance(manager, storage.ContentAddressedStorageManager)
+    storage.validate_manager(manager)
+
+    with pytest.raises(ValueError, match="not supported"):
+        storage.build(
+            {
+                "type": "hdfs",
+                "hdfs_url": "http://hdfs",
+                "hdfs_path": "/",
+                "content_addressed": True,
+            },
+            container_path=None,
+        )
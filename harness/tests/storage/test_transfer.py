@@ -0,0 +1,66 @@
+import threading
+from typing import Dict, List
+
+import pytest
+
+from determined.common.storage import transfer
+
+RESOURCES = {
+    "a.txt": 3,
+    "subdir/": 0,
+    "subdir/b.txt": 5,
+    "subdir/c.txt": 7,
+}
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_parallel_transfer_visits_every_resource(concurrency: int) -> None:
+    seen = []  # type: List[str]
+    lock = threading.Lock()
+
+    def _transfer(rel_path: str) -> None:
+        with lock:
+            seen.append(rel_path)
+
+    stats = transfer.parallel_transfer(_transfer, RESOURCES, concurrency=concurrency)
+
+    assert sorted(seen) == sorted(RESOURCES)
+    assert stats.num_files == 3
+    assert stats.num_bytes == 15
+    assert stats.retries == 0
+
+
+def test_parallel_transfer_retries_retryable_errors() -> None:
+    failures = {"subdir/b.txt": 2}  # type: Dict[str, int]
+    lock = threading.Lock()
+
+    def _transfer(rel_path: str) -> None:
+        with lock:
+            if failures.get(rel_path, 0) > 0:
+                failures[rel_path] -= 1
+                raise ConnectionError("flaky network")
+
+    stats = transfer.parallel_transfer(_transfer, RESOURCES, concurrency=4, max_backoff=0)
+
+    assert stats.retries == 2
+
+
+def test_parallel_transfer_gives_up() -> None:
+    def _transfer(rel_path: str) -> None:
+        raise ConnectionError("network is down")
+
+    with pytest.raises(ConnectionError):
+        transfer.parallel_transfer(_transfer, RESOURCES, max_retries=1, max_backoff=0)
+
+
+def test_parallel_transfer_does_not_retry_other_errors() -> None:
+    calls = []  # type: List[str]
+
+    def _transfer(rel_path: str) -> None:
+        calls.append(rel_path)
+        raise ValueError("bad file")
+
+    with pytest.raises(ValueError):
+        transfer.parallel_transfer(_transfer, {"a.txt": 1}, max_backoff=0)
+
+    assert calls == ["a.txt"]
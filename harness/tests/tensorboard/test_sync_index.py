@@ -0,0 +1,77 @@
+import pathlib
+
+import pytest
+
+from determined import tensorboard
+from determined.tensorboard import sync_index
+
+
+def append(path: pathlib.Path, data: bytes) -> None:
+    with path.open("ab") as f:
+        f.write(data)
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_sync_index_changes(tmp_path: pathlib.Path, use_inotify: bool) -> None:
+    index = sync_index.SyncIndex(tmp_path, use_inotify=use_inotify)
+    events = tmp_path.joinpath("events.out.tfevents.1")
+    append(events, b"header")
+    append(tmp_path.joinpath("notes.txt"), b"not a tensorboard file")
+
+    assert index.changes() == [(events, 0)]
+    assert index.changes() == []
+
+    # Appends are reported with the offset of the bytes that were already reported.
+    append(events, b"event")
+    assert index.changes() == [(events, len(b"header"))]
+
+    # Files in new subdirectories are found.
+    trace = tmp_path.joinpath("plugins", "profile", "run1", "host.trace.json.gz")
+    trace.parent.mkdir(parents=True)
+    append(trace, b"trace")
+    assert index.changes() == [(trace, 0)]
+
+    # Only tfevents files are assumed to be appended to; other files are synced in full.
+    append(trace, b"more trace")
+    assert index.changes() == [(trace, 0)]
+
+    # A file that was rewritten from scratch is synced in full.
+    events.write_bytes(b"new")
+    assert index.changes() == [(events, 0)]
+
+    index.close()
+
+
+def test_sync_index_missing_directory(tmp_path: pathlib.Path) -> None:
+    index = sync_index.SyncIndex(tmp_path.joinpath("missing"))
+    assert index.changes() == []
+
+
+def test_shared_fs_sync_appends(tmp_path: pathlib.Path) -> None:
+    base_path = tmp_path.joinpath("tensorboard")
+    base_path.mkdir()
+    sync_path = pathlib.Path("cluster", "tensorboard", "experiment", "1", "trial", "1")
+    manager = tensorboard.SharedFSTensorboardManager(
+        str(tmp_path.joinpath("storage")), base_path, sync_path
+    )
+
+    events = base_path.joinpath("events.out.tfevents.1")
+    synced = manager.shared_fs_base.joinpath("events.out.tfevents.1")
+
+    append(events, b"header")
+    manager.sync()
+    assert synced.read_bytes() == b"header"
+
+    append(events, b"event")
+    manager.sync()
+    assert synced.read_bytes() == b"headerevent"
+
+    # Files other than tfevents files are copied in full even when they have grown.
+    graph = base_path.joinpath("graph.pb")
+    graph.write_bytes(b"graph")
+    manager.sync()
+    graph.write_bytes(b"rewritten graph")
+    manager.sync()
+    assert manager.shared_fs_base.joinpath("graph.pb").read_bytes() == b"rewritten graph"
+
+    manager.close()
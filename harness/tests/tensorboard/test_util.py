@@ -39,6 +39,7 @@ def get_dummy_env() -> det.EnvContext:
         det_trial_unique_port_offset=0,
         det_trial_runner_network_interface=constants.AUTO_DETECT_TRIAL_RUNNER_NETWORK_INTERFACE,
         det_trial_id="1",
+        det_trial_run_id=1,
         det_agent_id="1",
         det_experiment_id="1",
         det_task_token="",
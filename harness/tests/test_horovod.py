@@ -37,6 +37,7 @@ def create_default_env_context(experiment_config: Dict[str, Any]) -> det.EnvCont
         det_trial_unique_port_offset=0,
         det_trial_runner_network_interface=det_trial_runner_network_interface,
         det_trial_id="1",
+        det_trial_run_id=1,
         det_agent_id="1",
         det_experiment_id="1",
         det_task_token="",
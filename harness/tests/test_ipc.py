@@ -1,10 +1,16 @@
 import abc
 import multiprocessing
+import pathlib
+import socket
 import sys
 import textwrap
+import threading
+import time
 import traceback
 from typing import Any, List, Optional, cast
 
+import numpy as np
+
 from determined import ipc, layers, workload
 from tests.experiment import utils
 from tests.fixtures import fake_subprocess_receiver
@@ -119,6 +125,115 @@ def test_broadcast_server_client() -> None:
                 assert all(g == 2 * msg for g in gathered)
 
 
+class ArrayClientSubproc(Subproc):
+    def __init__(self, pub_url: str, pull_url: str, num_iterations: int, sizes: List[int]) -> None:
+        self._pub_url = pub_url
+        self._pull_url = pull_url
+        self._num_iterations = num_iterations
+        self._sizes = sizes
+        super().__init__()
+
+    def main(self) -> None:
+        with ipc.ZMQBroadcastClient(self._pub_url, self._pull_url) as broadcast_client:
+            broadcast_client.send(ipc.ConnectedMessage(process_id=0))
+            assert broadcast_client.recv() is None
+            for size in self._sizes:
+                payload = {"metric": np.full(size, 2.0), "name": "metric"}
+                for _ in range(self._num_iterations):
+                    broadcast_client.send(payload)
+                    gathered = broadcast_client.recv()
+                    # Arrays are received in place, but must still be writeable.
+                    for msg in gathered:
+                        msg["metric"] *= 2
+                    assert all(
+                        np.array_equal(msg["metric"], payload["metric"] * 2) for msg in gathered
+                    )
+
+
+def run_array_allgather(num_subprocs: int, num_iterations: int, sizes: List[int]) -> List[float]:
+    """Allgather arrays of each size between the server and subprocesses; return mean latencies."""
+    latencies = []
+    with ipc.ZMQBroadcastServer(num_connections=num_subprocs) as broadcast_server:
+        pub_url = f"tcp://localhost:{broadcast_server.get_pub_port()}"
+        pull_url = f"tcp://localhost:{broadcast_server.get_pull_port()}"
+
+        with SubprocGroup(
+            ArrayClientSubproc(pub_url, pull_url, num_iterations, sizes)
+            for _ in range(num_subprocs)
+        ) as subprocs:
+
+            def health_check() -> None:
+                for subproc in subprocs:
+                    assert subproc.is_alive()
+
+            gathered, _ = broadcast_server.gather_with_polling(health_check)
+            assert all(isinstance(g, ipc.ConnectedMessage) for g in gathered)
+            broadcast_server.broadcast(None)
+
+            for size in sizes:
+                start = time.perf_counter()
+                for _ in range(num_iterations):
+                    gathered, _ = broadcast_server.gather_with_polling(health_check)
+                    assert all(g["metric"].shape == (size,) for g in gathered)
+                    broadcast_server.broadcast(gathered)
+                latencies.append((time.perf_counter() - start) / num_iterations)
+    return latencies
+
+
+def test_broadcast_server_client_arrays() -> None:
+    run_array_allgather(num_subprocs=2, num_iterations=2, sizes=[10, 100000])
+
+
+class EmptyResponseClientSubproc(BroadcastClientSubproc):
+    def main(self) -> None:
+        with ipc.ZMQBroadcastClient(self._pub_url, self._pull_url) as broadcast_client:
+            broadcast_client.send(ipc.ConnectedMessage(process_id=0))
+            for exp in self._exp_msgs:
+                msg = broadcast_client.recv()
+                assert msg == exp
+                # Only the first client answers with a payload.
+                if self._rank == 0:
+                    broadcast_client.send(2 * msg)
+                else:
+                    broadcast_client.send_empty()
+
+
+def test_broadcast_server_gather_until() -> None:
+    num_subprocs = 3
+
+    with ipc.ZMQBroadcastServer(num_connections=num_subprocs) as broadcast_server:
+        pub_url = f"tcp://localhost:{broadcast_server.get_pub_port()}"
+        pull_url = f"tcp://localhost:{broadcast_server.get_pull_port()}"
+        msgs = list(range(10))
+
+        with SubprocGroup(
+            EmptyResponseClientSubproc(i, num_subprocs, pub_url, pull_url, msgs)
+            for i in range(num_subprocs)
+        ) as subprocs:
+
+            def health_check() -> None:
+                assert all(subproc.is_alive() for subproc in subprocs)
+
+            gathered, _ = broadcast_server.gather_with_polling(health_check)
+            assert all(isinstance(g, ipc.ConnectedMessage) for g in gathered)
+            assert not broadcast_server.has_pending_messages()
+
+            for msg in msgs:
+                broadcast_server.broadcast(msg)
+                gathered, exception_received = broadcast_server.gather_with_polling(
+                    health_check, until=lambda m: m is not None
+                )
+                assert not exception_received
+                # The gather stops at the only payload, which may arrive before the empty messages.
+                assert gathered[-1] == 2 * msg
+                assert gathered[:-1] == [None] * (len(gathered) - 1)
+                if broadcast_server.has_pending_messages():
+                    remaining, _ = broadcast_server.gather_with_polling(health_check)
+                    gathered += remaining
+                assert len(gathered) == num_subprocs
+                assert not broadcast_server.has_pending_messages()
+
+
 def test_subprocess_launcher_receiver() -> None:
     env = utils.make_default_env_context(hparams={"global_batch_size": 1})
     rendezvous_info = utils.make_default_rendezvous_info()
@@ -141,6 +256,32 @@ def test_subprocess_launcher_receiver() -> None:
     subproc.run()
 
 
+def test_subprocess_launcher_torch_distributed() -> None:
+    env = utils.make_default_env_context(hparams={"global_batch_size": 1})
+    env.slot_ids = [0, 1]
+    rendezvous_info = utils.make_default_rendezvous_info()
+    hvd_config = utils.make_default_hvd_config()
+    hvd_config.use = True
+    hvd_config.backend = "torch"
+
+    def make_workloads() -> workload.Stream:
+        interceptor = workload.WorkloadResponseInterceptor()
+        for i, wkld in enumerate(fake_subprocess_receiver.fake_workload_gen()):
+            yield from interceptor.send(wkld, [])
+            assert interceptor.metrics_result() == {"count": i}
+
+    subproc = layers.SubprocessLauncher(
+        env=env,
+        workloads=make_workloads(),
+        load_path=None,
+        rendezvous_info=rendezvous_info,
+        hvd_config=hvd_config,
+        python_subprocess_entrypoint="tests.fixtures.fake_torch_distributed_receiver",
+    )
+    assert [e["RANK"] for e in subproc._torch_distributed_envs()] == ["0", "1"]
+    subproc.run()
+
+
 def test_zmq_server_client() -> None:
     server = ipc.ZMQServer(num_connections=1, ports=None, port_range=(1000, 65535))
     assert len(server.get_ports()) == 1
@@ -158,3 +299,64 @@ def test_zmq_server_client() -> None:
     server.send(server_object)
     client_object = client.receive()
     assert server_object == client_object
+
+
+def test_file_server_client(tmp_path: pathlib.Path) -> None:
+    root = tmp_path.joinpath("root")
+    root.joinpath("code", "empty").mkdir(parents=True)
+    root.joinpath("state_dict.pth").write_bytes(bytes(range(256)) * 1000)
+    root.joinpath("code", "model_def.py").write_text("model")
+    root.joinpath("code", "empty.txt").write_bytes(b"")
+    resources = {
+        "state_dict.pth": 256000,
+        "code/": 0,
+        "code/empty/": 0,
+        "code/model_def.py": 5,
+        "code/empty.txt": 0,
+    }
+
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        port = s.getsockname()[1]
+
+    results = []  # type: List[bool]
+
+    def receive(dest: pathlib.Path) -> None:
+        with ipc.ZMQFileClient("localhost", port) as client:
+            results.append(client.receive(str(dest), resources, wait_timeout=10, timeout=5))
+
+    dests = [tmp_path.joinpath(f"dest{i}") for i in range(2)]
+    threads = [threading.Thread(target=receive, args=(dest,)) for dest in dests]
+    for thread in threads:
+        thread.start()
+
+    with ipc.ZMQFileServer(resources, port, chunk_size=4096) as server:
+        # The clients keep waiting while the server prepares the files for longer than their
+        # timeout, and a client that does not need the files can finish in the meantime.
+        with server.preparing():
+            with ipc.ZMQFileClient("localhost", port) as client:
+                client.decline(timeout=5)
+            time.sleep(6)
+        assert server.serve(str(root), num_clients=3, timeout=10) == 3
+
+    for thread in threads:
+        thread.join()
+    assert results == [True, True]
+    for dest in dests:
+        assert dest.joinpath("state_dict.pth").read_bytes() == bytes(range(256)) * 1000
+        assert dest.joinpath("code", "model_def.py").read_text() == "model"
+        assert dest.joinpath("code", "empty").is_dir()
+        assert dest.joinpath("code", "empty.txt").read_bytes() == b""
+
+    # Without a server, the client gives up after timeout seconds, rather than after wait_timeout.
+    with ipc.ZMQFileClient("localhost", port) as client:
+        start = time.time()
+        assert not client.receive(str(tmp_path.joinpath("dest")), resources, 60, 1)
+        assert time.time() - start < 10
+
+    # A client that is not served in time gives up and lets the server know.
+    with ipc.ZMQFileServer(resources, port) as server:
+        with server.preparing():
+            with ipc.ZMQFileClient("localhost", port) as client:
+                assert not client.receive(str(tmp_path.joinpath("dest")), resources, 1, 5)
+        assert server.serve(str(root), num_clients=1, timeout=1) == 1
@@ -0,0 +1,191 @@
+import gzip
+import json
+import queue
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from _pytest.monkeypatch import MonkeyPatch
+
+import determined.gpu
+from determined import layers, profiler
+from determined.common import api
+
+
+def test_metric_batch_consume() -> None:
+    batch = profiler.MetricBatch("1", "agent")
+    timestamp = datetime(2021, 6, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+    for i in range(3):
+        batch.append(
+            profiler.MetricType.SYSTEM,
+            profiler.SysMetricName.GPU_UTIL_METRIC,
+            profiler.Measurement(timestamp, i, i * 10),
+            "gpu-0",
+        )
+    batch.append(
+        profiler.MetricType.TIMING, "dataloader_next", profiler.Measurement(timestamp, 2, 0.5)
+    )
+    assert len(batch) == 4
+
+    consumed = {b.labels["name"]: b for b in batch.consume()}
+    assert len(batch) == 0 and batch.consume() == []
+
+    gpu_util = consumed[profiler.SysMetricName.GPU_UTIL_METRIC]
+    assert gpu_util.values == [0.0, 10.0, 20.0]
+    assert gpu_util.batches == [0, 1, 2]
+    assert gpu_util.timestamps == ["2021-06-01T12:00:00.123456+00:00"] * 3
+    assert gpu_util.labels["gpuUuid"] == "gpu-0"
+    assert consumed["dataloader_next"].values == [0.5]
+
+
+def test_measurements_are_dropped_under_pressure(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(profiler, "MAX_QUEUED_MEASUREMENTS", 8)
+    agent = profiler.ProfilerAgent(
+        trial_id="1",
+        agent_id="agent",
+        master_url="http://localhost:8080",
+        profiling_is_enabled=True,
+        global_rank=0,
+        local_rank=1,
+        begin_on_batch=0,
+        send_batch_fn=lambda *_: None,
+        check_data_exists_fn=lambda *_: False,
+    )
+
+    # Without the MetricsBatcherThread running, nothing drains the queue.
+    for i in range(100):
+        agent.record_metric("loss", float(i))
+
+    assert agent.metrics_batcher_queue.qsize() == 8
+    counts = agent.drop_counter.counts()
+    assert counts[profiler.DropCounter.SAMPLED] > 0
+    assert counts[profiler.DropCounter.QUEUE_FULL] > 0
+    assert agent.drop_counter.total == 92
+
+
+def test_enqueue_batch_drops_backlog() -> None:
+    send_queue = queue.Queue(maxsize=1)  # type: queue.Queue
+    drop_counter = profiler.DropCounter()
+    batch = [api.TrialProfilerMetricsBatch([1.0, 2.0], [0, 1], ["", ""], {})]
+
+    profiler.enqueue_batch(send_queue, [], drop_counter)
+    profiler.enqueue_batch(send_queue, batch, drop_counter)
+    profiler.enqueue_batch(send_queue, batch, drop_counter)
+
+    assert send_queue.qsize() == 1
+    assert drop_counter.counts() == {profiler.DropCounter.SEND_BACKLOG: 2}
+
+
+def test_post_batches_is_compressed(monkeypatch: MonkeyPatch) -> None:
+    requests = []  # type: List[Dict[str, Any]]
+    monkeypatch.setattr(api, "post", lambda *args, **kwargs: requests.append(kwargs))
+
+    batch = api.TrialProfilerMetricsBatch([1.0], [0], ["2021-06-01T12:00:00+00:00"], {"a": "b"})
+    api.post_trial_profiler_metrics_batches("http://localhost:8080", [batch])
+
+    assert len(requests) == 1
+    assert requests[0]["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(requests[0]["data"])) == {"batches": [batch.__dict__]}
+
+
+def test_metric_batch_reservoir() -> None:
+    batch = profiler.MetricBatch("1", "agent", max_samples_per_series=5)
+    for i in range(100):
+        timestamp = datetime.fromtimestamp(1600000000 + i, timezone.utc)
+        batch.append(
+            profiler.MetricType.TIMING, "train_batch", profiler.Measurement(timestamp, i, i)
+        )
+    assert len(batch) == 5
+
+    (consumed,) = batch.consume()
+    assert len(set(consumed.batches)) == 5 and set(consumed.batches) < set(range(100))
+    assert consumed.values == [float(b) for b in consumed.batches]
+    assert consumed.timestamps == sorted(consumed.timestamps)
+
+
+def test_metric_batch_run_epoch_label() -> None:
+    measurement = profiler.Measurement(datetime.now(timezone.utc), 0, 1.0)
+    for run_epoch in (0, 2):
+        batch = profiler.MetricBatch("1", "agent", run_epoch=run_epoch)
+        batch.append(profiler.MetricType.TIMING, "train_batch", measurement)
+        (consumed,) = batch.consume()
+        assert consumed.labels["agentId"] == "agent"
+        if run_epoch:
+            assert consumed.labels["runEpoch"] == run_epoch
+        else:
+            # Labels of the first run are unchanged.
+            assert "runEpoch" not in consumed.labels
+
+
+def test_continuous_profiling_after_restart() -> None:
+    def check_data_exists(*_: Any) -> bool:
+        raise AssertionError("continuous profiling does not check for existing data")
+
+    agent = profiler.ProfilerAgent(
+        trial_id="1",
+        agent_id="agent",
+        master_url="http://localhost:8080",
+        profiling_is_enabled=True,
+        global_rank=0,
+        local_rank=1,
+        begin_on_batch=0,
+        send_batch_fn=lambda *_: None,
+        check_data_exists_fn=check_data_exists,
+        continuous=True,
+        sample_every_n_batches=4,
+        max_samples_per_series=10,
+        run_epoch=2,
+    )
+    assert agent.is_enabled
+    assert agent.metrics_batcher_thread.metrics_batch.agent_id == "agent"
+    assert agent.metrics_batcher_thread.metrics_batch.run_epoch == 2
+    assert agent.metrics_batcher_thread.metrics_batch.max_samples_per_series == 10
+
+    sampled = []
+    for batch_idx in range(10):
+        agent.update_batch_idx(batch_idx)
+        sampled.append(agent.is_sampled_batch)
+        agent.record_metric("samples_per_second", 1.0)
+    assert sampled == [i % 4 == 0 for i in range(10)]
+    # The StartMessage and the metrics of batches 0, 4 and 8.
+    assert agent.metrics_batcher_queue.qsize() == 4
+
+
+def test_measurement_ring_buffer(monkeypatch: MonkeyPatch) -> None:
+    now = iter(range(100))
+    monkeypatch.setattr(time, "time", lambda: float(next(now)))
+    measurement = layers._harness_profiler.Measurement("m", multiplier=2.0, max_samples=3)
+    measurement.add_measurement(1)
+    assert measurement.history() == [(0.0, 2.0)]
+    for value in range(2, 6):
+        measurement.add_measurement(value)
+    assert measurement.history() == [(2.0, 6.0), (3.0, 8.0), (4.0, 10.0)]
+
+
+class FakePynvmlWrapper:
+    pynvml_is_available = True
+    device_count = 2
+
+    def nvml_get_gpu_utilization_by_index(self, index: int) -> float:
+        return 50.0 + index
+
+    def nvml_get_memory_utilization_by_index(self, index: int) -> float:
+        return 0.25
+
+
+def test_harness_profiler_samples_gpus_with_nvml(monkeypatch: MonkeyPatch) -> None:
+    def get_gpus() -> Any:
+        raise AssertionError("nvidia-smi should not be used when NVML is available")
+
+    monkeypatch.setattr(profiler, "PynvmlWrapper", FakePynvmlWrapper)
+    monkeypatch.setattr(determined.gpu, "get_gpus", get_gpus)
+
+    harness_profiler = layers.HarnessProfiler(interval=0.01, use_gpu=True, max_samples=4)
+    harness_profiler.start()
+    time.sleep(0.2)
+    harness_profiler.stop()
+
+    results = harness_profiler.results()
+    assert 0 < len(results["CPU Utilization (%)"]) <= 4
+    assert {value for _, value in results["GPU 1 Load (%)"]} == {0.51}
+    assert {value for _, value in results["GPU 0 Memory Utilization (%)"]} == {0.25}
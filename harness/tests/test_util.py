@@ -1,5 +1,13 @@
-from determined.common.util import sizeof_fmt
-from determined.util import _dict_to_list, _list_to_dict
+import random
+import threading
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from determined.common import check
+from determined.common.util import preserve_random_state, sizeof_fmt
+from determined.util import _dict_to_list, _list_to_dict, make_metrics
 
 
 def test_list_to_dict() -> None:
@@ -15,3 +23,53 @@ def test_dict_to_list() -> None:
 def test_sizeof_fmt() -> None:
     assert sizeof_fmt(1024) == "1.0KB"
     assert sizeof_fmt(36) == "36.0B"
+
+
+def test_make_metrics() -> None:
+    batch_metrics = [
+        {"loss": np.array(1.0), "acc": None, "count": 1, "name": "a", "vec": np.array([1, 2])},
+        {"loss": np.array(2.0), "acc": 0.5, "count": 2, "name": "b", "vec": np.array([3, 4])},
+    ]  # type: List[Dict[str, Any]]
+    metrics = make_metrics(2, batch_metrics)
+    assert metrics["num_inputs"] == 2
+    assert metrics["batch_metrics"] is batch_metrics
+    assert metrics["avg_metrics"] == {
+        "loss": 1.5,
+        "acc": 0.5,
+        "count": 1.5,
+        "name": None,
+        "vec": 2.5,
+    }
+
+    with pytest.raises(check.CheckFailedError, match="index: 1"):
+        make_metrics(None, [{"loss": 1.0}, {"acc": 1.0}])
+
+
+def test_preserve_random_state() -> None:
+    @preserve_random_state
+    def draw() -> float:
+        return random.random()
+
+    state = random.getstate()
+    draw()
+    assert random.getstate() == state
+
+
+def test_preserve_random_state_in_background_thread() -> None:
+    started, release = threading.Event(), threading.Event()
+
+    @preserve_random_state
+    def background() -> None:
+        started.set()
+        assert release.wait(timeout=10)
+
+    thread = threading.Thread(target=background)
+    thread.start()
+    assert started.wait(timeout=10)
+
+    # Draws made by the main thread while the background call runs are not rewound when it returns.
+    random.random()
+    state = random.getstate()
+    release.set()
+    thread.join()
+    assert random.getstate() == state
@@ -0,0 +1,85 @@
+import json
+import os
+import pathlib
+import threading
+from typing import List
+
+from determined import constants
+from determined.exec import worker_process_wrapper
+
+
+def forward(
+    tmp_path: pathlib.Path, chunks: List[bytes], **kwargs: object
+) -> worker_process_wrapper.ForwardingStats:
+    read_fd, write_fd = os.pipe()
+    stats = worker_process_wrapper.ForwardingStats()
+    with os.fdopen(read_fd, "rb") as src, (tmp_path / "out").open("wb") as dst:
+
+        def write_chunks() -> None:
+            with os.fdopen(write_fd, "wb", buffering=0) as w:
+                for chunk in chunks:
+                    w.write(chunk)
+
+        writer = threading.Thread(target=write_chunks)
+        writer.start()
+        worker_process_wrapper.forward_stream(src, dst, "3", stats=stats, **kwargs)  # type: ignore
+        writer.join()
+    return stats
+
+
+def test_forward_stream_prefixes_lines(tmp_path: pathlib.Path) -> None:
+    chunks = [b"first line\nsecond ", b"line\n", b"\n", b"no newline"]
+    stats = forward(tmp_path, chunks)
+    assert (tmp_path / "out").read_bytes() == (
+        b"[rank=3] first line\n[rank=3] second line\n[rank=3] \n[rank=3] no newline"
+    )
+    assert stats.lines_forwarded == 4
+    assert stats.lines_dropped == 0
+
+
+def test_forward_stream_json(tmp_path: pathlib.Path) -> None:
+    forward(tmp_path, [b"hello\nworld\n"], stream_name="stderr", log_format="json")
+    records = [json.loads(line) for line in (tmp_path / "out").read_text().splitlines()]
+    assert [(r["rank"], r["stream"], r["log"]) for r in records] == [
+        (3, "stderr", "hello"),
+        (3, "stderr", "world"),
+    ]
+
+
+def test_forward_stream_rate_limit(tmp_path: pathlib.Path) -> None:
+    # With a negligible refill rate, only the first burst of lines is forwarded.
+    limiter = worker_process_wrapper.RateLimiter(rate=1e-9, burst=10)
+    chunks = [b"".join(b"line %d\n" % i for i in range(1000))]
+    stats = forward(tmp_path, chunks, limiter=limiter)
+    lines = (tmp_path / "out").read_bytes().splitlines()
+    assert lines[:10] == [b"[rank=3] line %d" % i for i in range(10)]
+    assert lines[10:] == [b"[rank=3] 990 lines of output were dropped by the log rate limit."]
+    assert (stats.lines_forwarded, stats.lines_dropped) == (10, 990)
+
+
+def test_forward_stream_default_is_unlimited(tmp_path: pathlib.Path) -> None:
+    # The default limit is off, so even floods of output beyond the burst are forwarded whole.
+    limiter = worker_process_wrapper.RateLimiter(
+        rate=constants.WORKER_LOG_RATE_LIMIT_LINES_PER_SECOND,
+        burst=constants.WORKER_LOG_BURST_LINES,
+    )
+    num_lines = constants.WORKER_LOG_BURST_LINES * 2
+    chunks = [b"".join(b"line %d\n" % i for i in range(num_lines))]
+    stats = forward(tmp_path, chunks, limiter=limiter)
+    assert (stats.lines_forwarded, stats.lines_dropped) == (num_lines, 0)
+
+
+def test_write_all_handles_many_buffers() -> None:
+    read_fd, write_fd = os.pipe()
+    buffers = [b"%d," % i for i in range(2000)]
+    worker_process_wrapper.write_all(write_fd, list(buffers))
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as f:
+        assert f.read() == b"".join(buffers)
+
+
+def test_forward_stream_coalesces_writes(tmp_path: pathlib.Path) -> None:
+    stats = forward(tmp_path, [b"".join(b"%d\n" % i for i in range(5000))])
+    assert stats.lines_forwarded == 5000
+    # Lines are written in batches, not one write per line.
+    assert stats.writes < 100
@@ -1,6 +1,8 @@
 import contextlib
 import os
 import pathlib
+import random
+import threading
 from typing import Any, Dict, Iterator, Optional, cast
 
 import numpy as np
@@ -8,7 +10,7 @@ import pytest
 
 import determined as det
 from determined import layers, tensorboard, workload
-from determined.common import check, storage
+from determined.common import check, storage, util
 from tests.experiment import utils
 
 
@@ -22,6 +24,37 @@ class NoopTensorboardManager(tensorboard.TensorboardManager):
     def delete(self) -> None:
         pass
 
+    def close(self) -> None:
+        pass
+
+
+class BlockingTensorboardManager(tensorboard.TensorboardManager):
+    def __init__(self) -> None:
+        self.sync_started = threading.Event()
+        self.allow_sync = threading.Event()
+        self.sync_done = threading.Event()
+        self.num_syncs = 0
+        self.closed = False
+
+    def sync(self) -> None:
+        self.sync_started.set()
+        assert self.allow_sync.wait(timeout=10)
+        self.num_syncs += 1
+        self.sync_done.set()
+
+    def delete(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class RandomStateTensorboardManager(BlockingTensorboardManager):
+    # Like the cloud storage backends, whose syncs fork the random state.
+    @util.preserve_random_state
+    def sync(self) -> None:
+        super().sync()
+
 
 class NoopBatchMetricWriter(tensorboard.BatchMetricWriter):
     def __init__(self) -> None:
@@ -121,6 +154,92 @@ def test_checkpoint_upload_failure(tmp_path: pathlib.Path) -> None:
         trial_controller.run()
 
 
+def test_checkpoint_upload_failure_with_background_sync(tmp_path: pathlib.Path) -> None:
+    storage_manager = FailOnUploadStorageManager(str(tmp_path))
+    tensorboard_manager = BlockingTensorboardManager()
+    tensorboard_manager.allow_sync.set()
+
+    def response_func(metrics: workload.Response) -> None:
+        raise ValueError("response_func should not be called if the upload fails")
+
+    def make_workloads() -> workload.Stream:
+        yield workload.train_workload(1, num_batches=100), [], workload.ignore_workload_response
+        yield workload.checkpoint_workload(), [], response_func
+        yield workload.train_workload(2, num_batches=100), [], response_func
+
+    workload_manager = layers.build_workload_manager(
+        utils.make_default_env_context({"global_batch_size": 64}),
+        make_workloads(),
+        utils.make_default_rendezvous_info(),
+        storage_manager,
+        tensorboard_manager,
+        NoopBatchMetricWriter(),
+    )
+
+    # The upload runs on the trial's own thread, so its error fails the trial right away, and the
+    # background Tensorboard sync is still shut down.
+    with pytest.raises(ValueError, match="upload error"):
+        NoopTrialController(iter(workload_manager)).run()
+    assert tensorboard_manager.closed
+
+
+def test_background_tensorboard_sync() -> None:
+    tensorboard_manager = BlockingTensorboardManager()
+
+    def train_response_func(metrics: workload.Response) -> None:
+        # Training is reported without waiting for Tensorboard files to be synced.
+        assert tensorboard_manager.sync_started.wait(timeout=10)
+        assert tensorboard_manager.num_syncs == 0
+        tensorboard_manager.allow_sync.set()
+
+    def make_workloads() -> workload.Stream:
+        yield workload.train_workload(1, num_batches=100), [], train_response_func
+        yield workload.train_workload(2, num_batches=100), [], workload.ignore_workload_response
+
+    workload_manager = layers.build_workload_manager(
+        utils.make_default_env_context({"global_batch_size": 64}),
+        make_workloads(),
+        utils.make_default_rendezvous_info(),
+        NoopStorageManager(os.devnull),
+        tensorboard_manager,
+        NoopBatchMetricWriter(),
+    )
+
+    NoopTrialController(iter(workload_manager)).run()
+
+    # The sync requested by the last workload is finished before the workload manager exits.
+    assert tensorboard_manager.num_syncs == 2
+    assert tensorboard_manager.closed
+
+
+def test_background_tensorboard_sync_random_state() -> None:
+    tensorboard_manager = RandomStateTensorboardManager()
+
+    def train_response_func(metrics: workload.Response) -> None:
+        # Draws made by the trial while a sync runs in the background are not rewound by the sync.
+        assert tensorboard_manager.sync_started.wait(timeout=10)
+        random.random()
+        state = random.getstate()
+        tensorboard_manager.allow_sync.set()
+        assert tensorboard_manager.sync_done.wait(timeout=10)
+        assert random.getstate() == state
+
+    def make_workloads() -> workload.Stream:
+        yield workload.train_workload(1, num_batches=100), [], train_response_func
+
+    workload_manager = layers.build_workload_manager(
+        utils.make_default_env_context({"global_batch_size": 64}),
+        make_workloads(),
+        utils.make_default_rendezvous_info(),
+        NoopStorageManager(os.devnull),
+        tensorboard_manager,
+        NoopBatchMetricWriter(),
+    )
+
+    NoopTrialController(iter(workload_manager)).run()
+    assert tensorboard_manager.num_syncs == 1
+
+
 def test_reject_nonscalar_searcher_metric() -> None:
     metric_name = "validation_error"
 
@@ -630,6 +630,8 @@ func (m *Master) Run(ctx context.Context) error {
 		},
 	}
 	m.echo.Use(middleware.GzipWithConfig(gzipConfig))
+	// Accept gzip-compressed request bodies, such as batches of profiler metrics.
+	m.echo.Use(middleware.Decompress())
 
 	m.echo.Use(middleware.AddTrailingSlashWithConfig(middleware.TrailingSlashConfig{
 		Skipper: func(c echo.Context) bool {
@@ -644,6 +644,7 @@ func (t *trial) processAllocated(
 			InitialWorkload:     w,
 			WorkloadManagerType: t.sequencer.WorkloadManagerType(),
 			AdditionalFiles:     additionalFiles,
+			RunID:               t.RunID,
 			IsMultiAgent:        len(t.allocations) > 1,
 			Rank:                rank,
 		})
@@ -692,6 +693,12 @@ func (t *trial) processCompletedWorkload(ctx *actor.Context, msg workload.Comple
 	}
 
 	ctx.Log().Infof("trial completed workload: %v", msg.Workload)
+	if transfer := msg.CheckpointTransfer; transfer != nil {
+		ctx.Log().Infof(
+			"checkpoint stored: %d bytes in %.2fs (%.0f bytes/s)",
+			transfer.NumBytes, transfer.Seconds, transfer.BytesPerSecond,
+		)
+	}
 
 	isBestValidationFunc := func() bool {
 		return ctx.Ask(ctx.Self().Parent(), trialQueryIsBestValidation{
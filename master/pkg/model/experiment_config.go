@@ -219,13 +219,14 @@ func (d *DeviceConfig) UnmarshalJSON(data []byte) error {
 type ResourcesConfig struct {
 	Slots int `json:"slots"`
 
-	MaxSlots       *int    `json:"max_slots,omitempty"`
-	Weight         float64 `json:"weight"`
-	NativeParallel bool    `json:"native_parallel,omitempty"`
-	ShmSize        *int    `json:"shm_size,omitempty"`
-	AgentLabel     string  `json:"agent_label"`
-	ResourcePool   string  `json:"resource_pool"`
-	Priority       *int    `json:"priority,omitempty"`
+	MaxSlots           *int    `json:"max_slots,omitempty"`
+	Weight             float64 `json:"weight"`
+	NativeParallel     bool    `json:"native_parallel,omitempty"`
+	DistributedBackend *string `json:"distributed_backend,omitempty"`
+	ShmSize            *int    `json:"shm_size,omitempty"`
+	AgentLabel         string  `json:"agent_label"`
+	ResourcePool       string  `json:"resource_pool"`
+	Priority           *int    `json:"priority,omitempty"`
 
 	Devices DevicesConfig `json:"devices"`
 }
@@ -280,15 +281,18 @@ func (r ResourcesConfig) Validate() []error {
 
 // OptimizationsConfig configures performance optimizations for Horovod training.
 type OptimizationsConfig struct {
-	AggregationFrequency       int    `json:"aggregation_frequency"`
-	AverageAggregatedGradients bool   `json:"average_aggregated_gradients"`
-	AverageTrainingMetrics     bool   `json:"average_training_metrics"`
-	GradientCompression        bool   `json:"gradient_compression"`
-	GradUpdateSizeFile         string `json:"grad_updates_size_file,omitempty"`
-	MixedPrecision             string `json:"mixed_precision"`
-	TensorFusionThreshold      int    `json:"tensor_fusion_threshold"`
-	TensorFusionCycleTime      int    `json:"tensor_fusion_cycle_time"`
-	AutoTuneTensorFusion       bool   `json:"auto_tune_tensor_fusion"`
+	AggregationFrequency         int      `json:"aggregation_frequency"`
+	AverageAggregatedGradients   bool     `json:"average_aggregated_gradients"`
+	AverageTrainingMetrics       bool     `json:"average_training_metrics"`
+	GradientCompression          bool     `json:"gradient_compression"`
+	GradientCompressionMethod    *string  `json:"gradient_compression_method,omitempty"`
+	GradientCompressionRank      *int     `json:"gradient_compression_rank,omitempty"`
+	GradientCompressionTopKRatio *float64 `json:"gradient_compression_topk_ratio,omitempty"`
+	GradUpdateSizeFile           string   `json:"grad_updates_size_file,omitempty"`
+	MixedPrecision               string   `json:"mixed_precision"`
+	TensorFusionThreshold        int      `json:"tensor_fusion_threshold"`
+	TensorFusionCycleTime        int      `json:"tensor_fusion_cycle_time"`
+	AutoTuneTensorFusion         bool     `json:"auto_tune_tensor_fusion"`
 }
 
 // Validate implements the check.Validatable interface.
@@ -369,9 +373,12 @@ type NativeConfig struct {
 
 // ProfilingConfig represents the configuration settings to enable and configure profiling.
 type ProfilingConfig struct {
-	Enabled       bool `json:"enabled"`
-	BeginOnBatch  int  `json:"begin_on_batch"`
-	EndAfterBatch int  `json:"end_after_batch"`
+	Enabled             bool  `json:"enabled"`
+	BeginOnBatch        int   `json:"begin_on_batch"`
+	EndAfterBatch       int   `json:"end_after_batch"`
+	Continuous          *bool `json:"continuous,omitempty"`
+	SampleEveryNBatches *int  `json:"sample_every_n_batches,omitempty"`
+	MaxSamplesPerSeries *int  `json:"max_samples_per_series,omitempty"`
 }
 
 // Validate implements the check.Validatable interface.
@@ -75,12 +75,13 @@ func (t *TensorboardStorageConfig) UnmarshalJSON(data []byte) error {
 
 // SharedFSConfig configures storing on a shared filesystem (e.g., NFS).
 type SharedFSConfig struct {
-	HostPath        string  `json:"host_path"`
-	ContainerPath   *string `json:"container_path,omitempty"`
-	CheckpointPath  *string `json:"checkpoint_path,omitempty"`
-	TensorboardPath *string `json:"tensorboard_path,omitempty"`
-	StoragePath     *string `json:"storage_path,omitempty"`
-	Propagation     *string `json:"propagation,omitempty"`
+	HostPath         string  `json:"host_path"`
+	ContainerPath    *string `json:"container_path,omitempty"`
+	CheckpointPath   *string `json:"checkpoint_path,omitempty"`
+	TensorboardPath  *string `json:"tensorboard_path,omitempty"`
+	StoragePath      *string `json:"storage_path,omitempty"`
+	Propagation      *string `json:"propagation,omitempty"`
+	ContentAddressed *bool   `json:"content_addressed,omitempty"`
 }
 
 // Validate implements the check.Validatable interface.
@@ -138,10 +139,14 @@ func (h HDFSConfig) Validate() []error {
 
 // S3Config configures storing checkpoints on S3.
 type S3Config struct {
-	Bucket      string  `json:"bucket"`
-	AccessKey   *string `json:"access_key,omitempty"`
-	SecretKey   *string `json:"secret_key,omitempty"`
-	EndpointURL *string `json:"endpoint_url,omitempty"`
+	Bucket             string  `json:"bucket"`
+	AccessKey          *string `json:"access_key,omitempty"`
+	SecretKey          *string `json:"secret_key,omitempty"`
+	EndpointURL        *string `json:"endpoint_url,omitempty"`
+	Concurrency        *int    `json:"concurrency,omitempty"`
+	MultipartChunkSize *int    `json:"multipart_chunk_size,omitempty"`
+	MaxRetries         *int    `json:"max_retries,omitempty"`
+	ContentAddressed   *bool   `json:"content_addressed,omitempty"`
 }
 
 // Validate implements the check.Validatable interface.
@@ -149,7 +154,8 @@ func (S3Config) Validate() []error { return nil }
 
 // GCSConfig configures storing checkpoints on GCS.
 type GCSConfig struct {
-	Bucket string `json:"bucket"`
+	Bucket           string `json:"bucket"`
+	ContentAddressed *bool  `json:"content_addressed,omitempty"`
 }
 
 // Validate implements the check.Validatable interface.
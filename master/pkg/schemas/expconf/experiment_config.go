@@ -187,14 +187,15 @@ type ResourcesConfigV0 struct {
 	// Slots is used by commands while trials use SlotsPerTrial.
 	RawSlots *int `json:"slots,omitempty"`
 
-	RawMaxSlots       *int     `json:"max_slots"`
-	RawSlotsPerTrial  *int     `json:"slots_per_trial"`
-	RawWeight         *float64 `json:"weight"`
-	RawNativeParallel *bool    `json:"native_parallel,omitempty"`
-	RawShmSize        *int     `json:"shm_size"`
-	RawAgentLabel     *string  `json:"agent_label"`
-	RawResourcePool   *string  `json:"resource_pool"`
-	RawPriority       *int     `json:"priority"`
+	RawMaxSlots           *int     `json:"max_slots"`
+	RawSlotsPerTrial      *int     `json:"slots_per_trial"`
+	RawWeight             *float64 `json:"weight"`
+	RawNativeParallel     *bool    `json:"native_parallel,omitempty"`
+	RawDistributedBackend *string  `json:"distributed_backend"`
+	RawShmSize            *int     `json:"shm_size"`
+	RawAgentLabel         *string  `json:"agent_label"`
+	RawResourcePool       *string  `json:"resource_pool"`
+	RawPriority           *int     `json:"priority"`
 
 	RawDevices DevicesConfigV0 `json:"devices"`
 }
@@ -202,15 +203,18 @@ type ResourcesConfigV0 struct {
 //go:generate ../gen.sh
 // OptimizationsConfigV0 is a legacy config value.
 type OptimizationsConfigV0 struct {
-	RawAggregationFrequency       *int    `json:"aggregation_frequency"`
-	RawAverageAggregatedGradients *bool   `json:"average_aggregated_gradients"`
-	RawAverageTrainingMetrics     *bool   `json:"average_training_metrics"`
-	RawGradientCompression        *bool   `json:"gradient_compression"`
-	RawGradUpdateSizeFile         *string `json:"grad_updates_size_file"`
-	RawMixedPrecision             *string `json:"mixed_precision,omitempty"`
-	RawTensorFusionThreshold      *int    `json:"tensor_fusion_threshold"`
-	RawTensorFusionCycleTime      *int    `json:"tensor_fusion_cycle_time"`
-	RawAutoTuneTensorFusion       *bool   `json:"auto_tune_tensor_fusion"`
+	RawAggregationFrequency         *int     `json:"aggregation_frequency"`
+	RawAverageAggregatedGradients   *bool    `json:"average_aggregated_gradients"`
+	RawAverageTrainingMetrics       *bool    `json:"average_training_metrics"`
+	RawGradientCompression          *bool    `json:"gradient_compression"`
+	RawGradientCompressionMethod    *string  `json:"gradient_compression_method"`
+	RawGradientCompressionRank      *int     `json:"gradient_compression_rank"`
+	RawGradientCompressionTopKRatio *float64 `json:"gradient_compression_topk_ratio"`
+	RawGradUpdateSizeFile           *string  `json:"grad_updates_size_file"`
+	RawMixedPrecision               *string  `json:"mixed_precision,omitempty"`
+	RawTensorFusionThreshold        *int     `json:"tensor_fusion_threshold"`
+	RawTensorFusionCycleTime        *int     `json:"tensor_fusion_cycle_time"`
+	RawAutoTuneTensorFusion         *bool    `json:"auto_tune_tensor_fusion"`
 }
 
 //go:generate ../gen.sh
@@ -3,7 +3,10 @@ package expconf
 //go:generate ../gen.sh
 // ProfilingConfigV0 configures profiling in the harness.
 type ProfilingConfigV0 struct {
-	RawEnabled       *bool `json:"enabled"`
-	RawBeginOnBatch  *int  `json:"begin_on_batch"`
-	RawEndAfterBatch *int  `json:"end_after_batch"`
+	RawEnabled             *bool `json:"enabled"`
+	RawBeginOnBatch        *int  `json:"begin_on_batch"`
+	RawEndAfterBatch       *int  `json:"end_after_batch"`
+	RawContinuous          *bool `json:"continuous"`
+	RawSampleEveryNBatches *int  `json:"sample_every_n_batches"`
+	RawMaxSamplesPerSeries *int  `json:"max_samples_per_series"`
 }
@@ -93,12 +93,13 @@ func (t *TensorboardStorageConfigV0) UnmarshalJSON(data []byte) error {
 //go:generate ../gen.sh
 // SharedFSConfigV0 is a config for shared filesystem storage.
 type SharedFSConfigV0 struct {
-	RawHostPath        *string `json:"host_path"`
-	RawContainerPath   *string `json:"container_path,omitempty"`
-	RawCheckpointPath  *string `json:"checkpoint_path,omitempty"`
-	RawTensorboardPath *string `json:"tensorboard_path,omitempty"`
-	RawStoragePath     *string `json:"storage_path"`
-	RawPropagation     *string `json:"propagation"`
+	RawHostPath         *string `json:"host_path"`
+	RawContainerPath    *string `json:"container_path,omitempty"`
+	RawCheckpointPath   *string `json:"checkpoint_path,omitempty"`
+	RawTensorboardPath  *string `json:"tensorboard_path,omitempty"`
+	RawStoragePath      *string `json:"storage_path"`
+	RawPropagation      *string `json:"propagation"`
+	RawContentAddressed *bool   `json:"content_addressed"`
 }
 
 // PathInContainer caclulates where the full StoragePath will be inside the container.
@@ -127,16 +128,21 @@ type HDFSConfigV0 struct {
 //go:generate ../gen.sh
 // S3ConfigV0 configures storing checkpoints on S3.
 type S3ConfigV0 struct {
-	RawBucket      *string `json:"bucket"`
-	RawAccessKey   *string `json:"access_key"`
-	RawSecretKey   *string `json:"secret_key"`
-	RawEndpointURL *string `json:"endpoint_url"`
+	RawBucket             *string `json:"bucket"`
+	RawAccessKey          *string `json:"access_key"`
+	RawSecretKey          *string `json:"secret_key"`
+	RawEndpointURL        *string `json:"endpoint_url"`
+	RawConcurrency        *int    `json:"concurrency"`
+	RawMultipartChunkSize *int    `json:"multipart_chunk_size"`
+	RawMaxRetries         *int    `json:"max_retries"`
+	RawContentAddressed   *bool   `json:"content_addressed"`
 }
 
 //go:generate ../gen.sh
 // GCSConfigV0 configures storing checkpoints on GCS.
 type GCSConfigV0 struct {
-	RawBucket *string `json:"bucket"`
+	RawBucket           *string `json:"bucket"`
+	RawContentAddressed *bool   `json:"content_addressed"`
 }
 
 //go:generate ../gen.sh
@@ -19,6 +19,17 @@ func (g *GCSConfigV0) SetBucket(val string) {
 	g.RawBucket = &val
 }
 
+func (g GCSConfigV0) ContentAddressed() bool {
+	if g.RawContentAddressed == nil {
+		panic("You must call WithDefaults on GCSConfigV0 before .ContentAddressed")
+	}
+	return *g.RawContentAddressed
+}
+
+func (g *GCSConfigV0) SetContentAddressed(val bool) {
+	g.RawContentAddressed = &val
+}
+
 func (g GCSConfigV0) ParsedSchema() interface{} {
 	return schemas.ParsedGCSConfigV0()
 }
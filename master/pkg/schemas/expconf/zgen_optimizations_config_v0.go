@@ -52,6 +52,36 @@ func (o *OptimizationsConfigV0) SetGradientCompression(val bool) {
 	o.RawGradientCompression = &val
 }
 
+func (o OptimizationsConfigV0) GradientCompressionMethod() *string {
+	return o.RawGradientCompressionMethod
+}
+
+func (o *OptimizationsConfigV0) SetGradientCompressionMethod(val *string) {
+	o.RawGradientCompressionMethod = val
+}
+
+func (o OptimizationsConfigV0) GradientCompressionRank() int {
+	if o.RawGradientCompressionRank == nil {
+		panic("You must call WithDefaults on OptimizationsConfigV0 before .GradientCompressionRank")
+	}
+	return *o.RawGradientCompressionRank
+}
+
+func (o *OptimizationsConfigV0) SetGradientCompressionRank(val int) {
+	o.RawGradientCompressionRank = &val
+}
+
+func (o OptimizationsConfigV0) GradientCompressionTopKRatio() float64 {
+	if o.RawGradientCompressionTopKRatio == nil {
+		panic("You must call WithDefaults on OptimizationsConfigV0 before .GradientCompressionTopKRatio")
+	}
+	return *o.RawGradientCompressionTopKRatio
+}
+
+func (o *OptimizationsConfigV0) SetGradientCompressionTopKRatio(val float64) {
+	o.RawGradientCompressionTopKRatio = &val
+}
+
 func (o OptimizationsConfigV0) GradUpdateSizeFile() *string {
 	return o.RawGradUpdateSizeFile
 }
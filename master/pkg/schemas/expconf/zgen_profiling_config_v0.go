@@ -38,6 +38,39 @@ func (p *ProfilingConfigV0) SetEndAfterBatch(val *int) {
 	p.RawEndAfterBatch = val
 }
 
+func (p ProfilingConfigV0) Continuous() bool {
+	if p.RawContinuous == nil {
+		panic("You must call WithDefaults on ProfilingConfigV0 before .Continuous")
+	}
+	return *p.RawContinuous
+}
+
+func (p *ProfilingConfigV0) SetContinuous(val bool) {
+	p.RawContinuous = &val
+}
+
+func (p ProfilingConfigV0) SampleEveryNBatches() int {
+	if p.RawSampleEveryNBatches == nil {
+		panic("You must call WithDefaults on ProfilingConfigV0 before .SampleEveryNBatches")
+	}
+	return *p.RawSampleEveryNBatches
+}
+
+func (p *ProfilingConfigV0) SetSampleEveryNBatches(val int) {
+	p.RawSampleEveryNBatches = &val
+}
+
+func (p ProfilingConfigV0) MaxSamplesPerSeries() int {
+	if p.RawMaxSamplesPerSeries == nil {
+		panic("You must call WithDefaults on ProfilingConfigV0 before .MaxSamplesPerSeries")
+	}
+	return *p.RawMaxSamplesPerSeries
+}
+
+func (p *ProfilingConfigV0) SetMaxSamplesPerSeries(val int) {
+	p.RawMaxSamplesPerSeries = &val
+}
+
 func (p ProfilingConfigV0) ParsedSchema() interface{} {
 	return schemas.ParsedProfilingConfigV0()
 }
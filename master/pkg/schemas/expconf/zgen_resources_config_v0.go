@@ -57,6 +57,17 @@ func (r *ResourcesConfigV0) SetNativeParallel(val bool) {
 	r.RawNativeParallel = &val
 }
 
+func (r ResourcesConfigV0) DistributedBackend() string {
+	if r.RawDistributedBackend == nil {
+		panic("You must call WithDefaults on ResourcesConfigV0 before .DistributedBackend")
+	}
+	return *r.RawDistributedBackend
+}
+
+func (r *ResourcesConfigV0) SetDistributedBackend(val string) {
+	r.RawDistributedBackend = &val
+}
+
 func (r ResourcesConfigV0) ShmSize() *int {
 	return r.RawShmSize
 }
@@ -43,6 +43,50 @@ func (s *S3ConfigV0) SetEndpointURL(val *string) {
 	s.RawEndpointURL = val
 }
 
+func (s S3ConfigV0) Concurrency() int {
+	if s.RawConcurrency == nil {
+		panic("You must call WithDefaults on S3ConfigV0 before .Concurrency")
+	}
+	return *s.RawConcurrency
+}
+
+func (s *S3ConfigV0) SetConcurrency(val int) {
+	s.RawConcurrency = &val
+}
+
+func (s S3ConfigV0) MultipartChunkSize() int {
+	if s.RawMultipartChunkSize == nil {
+		panic("You must call WithDefaults on S3ConfigV0 before .MultipartChunkSize")
+	}
+	return *s.RawMultipartChunkSize
+}
+
+func (s *S3ConfigV0) SetMultipartChunkSize(val int) {
+	s.RawMultipartChunkSize = &val
+}
+
+func (s S3ConfigV0) MaxRetries() int {
+	if s.RawMaxRetries == nil {
+		panic("You must call WithDefaults on S3ConfigV0 before .MaxRetries")
+	}
+	return *s.RawMaxRetries
+}
+
+func (s *S3ConfigV0) SetMaxRetries(val int) {
+	s.RawMaxRetries = &val
+}
+
+func (s S3ConfigV0) ContentAddressed() bool {
+	if s.RawContentAddressed == nil {
+		panic("You must call WithDefaults on S3ConfigV0 before .ContentAddressed")
+	}
+	return *s.RawContentAddressed
+}
+
+func (s *S3ConfigV0) SetContentAddressed(val bool) {
+	s.RawContentAddressed = &val
+}
+
 func (s S3ConfigV0) ParsedSchema() interface{} {
 	return schemas.ParsedS3ConfigV0()
 }
@@ -62,6 +62,17 @@ func (s *SharedFSConfigV0) SetPropagation(val string) {
 	s.RawPropagation = &val
 }
 
+func (s SharedFSConfigV0) ContentAddressed() bool {
+	if s.RawContentAddressed == nil {
+		panic("You must call WithDefaults on SharedFSConfigV0 before .ContentAddressed")
+	}
+	return *s.RawContentAddressed
+}
+
+func (s *SharedFSConfigV0) SetContentAddressed(val bool) {
+	s.RawContentAddressed = &val
+}
+
 func (s SharedFSConfigV0) ParsedSchema() interface{} {
 	return schemas.ParsedSharedFSConfigV0()
 }
@@ -440,14 +440,18 @@ var (
         "account_url": true,
         "bucket": true,
         "checkpoint_path": true,
+        "concurrency": true,
         "connection_string": true,
         "container": true,
         "container_path": true,
+        "content_addressed": true,
         "credential": true,
         "endpoint_url": true,
         "hdfs_path": true,
         "hdfs_url": true,
         "host_path": true,
+        "max_retries": true,
+        "multipart_chunk_size": true,
         "propagation": true,
         "secret_key": true,
         "storage_path": true,
@@ -1288,6 +1292,13 @@ var (
             ],
             "default": null
         },
+        "content_addressed": {
+            "type": [
+                "boolean",
+                "null"
+            ],
+            "default": false
+        },
         "save_experiment_best": {
             "type": [
                 "integer",
@@ -1764,6 +1775,33 @@ var (
             ],
             "default": false
         },
+        "gradient_compression_method": {
+            "enum": [
+                null,
+                "fp16",
+                "bf16",
+                "topk",
+                "powersgd"
+            ],
+            "default": null
+        },
+        "gradient_compression_rank": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "minimum": 1,
+            "default": 4
+        },
+        "gradient_compression_topk_ratio": {
+            "type": [
+                "number",
+                "null"
+            ],
+            "exclusiveMinimum": 0,
+            "maximum": 1,
+            "default": 0.01
+        },
         "grad_updates_size_file": {
             "type": [
                 "string",
@@ -1835,6 +1873,29 @@ var (
             ],
             "default": null,
             "minimum": 0
+        },
+        "continuous": {
+            "type": [
+                "boolean",
+                "null"
+            ],
+            "default": false
+        },
+        "sample_every_n_batches": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": 10,
+            "minimum": 1
+        },
+        "max_samples_per_series": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": 100,
+            "minimum": 1
         }
     },
     "compareProperties": {
@@ -1948,6 +2009,14 @@ var (
             "default": [],
             "optionalRef": "http://determined.ai/schemas/expconf/v0/devices.json"
         },
+        "distributed_backend": {
+            "enum": [
+                null,
+                "horovod",
+                "torch"
+            ],
+            "default": "horovod"
+        },
         "max_slots": {
             "type": [
                 "integer",
@@ -2054,6 +2123,37 @@ var (
             ],
             "default": null
         },
+        "concurrency": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": 8,
+            "minimum": 1
+        },
+        "multipart_chunk_size": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": 67108864,
+            "minimum": 5242880
+        },
+        "max_retries": {
+            "type": [
+                "integer",
+                "null"
+            ],
+            "default": 3,
+            "minimum": 0
+        },
+        "content_addressed": {
+            "type": [
+                "boolean",
+                "null"
+            ],
+            "default": false
+        },
         "save_experiment_best": {
             "type": [
                 "integer",
@@ -3107,6 +3207,13 @@ var (
             ],
             "default": null
         },
+        "content_addressed": {
+            "type": [
+                "boolean",
+                "null"
+            ],
+            "default": false
+        },
         "save_experiment_best": {
             "type": [
                 "integer",
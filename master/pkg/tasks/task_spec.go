@@ -315,6 +315,9 @@ type StartTrial struct {
 	WorkloadManagerType model.WorkloadManagerType
 	AdditionalFiles     archive.Archive
 
+	// RunID counts the times the trial's containers have been started, starting at 1.
+	RunID int
+
 	// This is used to hint the resource manager to override defaults and start
 	// the container in host mode iff it has been scheduled across multiple agents.
 	IsMultiAgent bool
@@ -383,6 +386,7 @@ func (s StartTrial) EnvVars(t TaskSpec) map[string]string {
 	return map[string]string{
 		"DET_EXPERIMENT_ID":            fmt.Sprintf("%d", s.InitialWorkload.ExperimentID),
 		"DET_TRIAL_ID":                 fmt.Sprintf("%d", s.InitialWorkload.TrialID),
+		"DET_TRIAL_RUN_ID":             strconv.Itoa(s.RunID),
 		"DET_TRIAL_SEED":               fmt.Sprintf("%d", s.TrialSeed),
 		"DET_EXPERIMENT_CONFIG":        jsonify(s.ExperimentConfig),
 		"DET_HPARAMS":                  jsonify(s.HParams),
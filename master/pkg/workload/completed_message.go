@@ -23,6 +23,8 @@ type CompletedMessage struct {
 	CheckpointMetrics *CheckpointMetrics
 	ValidationMetrics *ValidationMetrics
 	RunMetrics        map[string]interface{}
+	// CheckpointTransfer is only reported for CHECKPOINT_MODEL workloads.
+	CheckpointTransfer *CheckpointTransfer `json:"checkpoint_transfer,omitempty"`
 }
 
 // UnmarshalJSON unmarshals the provided bytes into a workload.CompletedMessage. An error is
@@ -54,6 +56,14 @@ type CheckpointMetrics struct {
 	Format    string         `json:"format"`
 }
 
+// CheckpointTransfer describes how long the trial runner took to persist a checkpoint to
+// checkpoint storage.
+type CheckpointTransfer struct {
+	NumBytes       int64   `json:"num_bytes"`
+	Seconds        float64 `json:"seconds"`
+	BytesPerSecond float64 `json:"bytes_per_second"`
+}
+
 // ValidationMetrics contains the user-defined metrics calculated after a validation
 // workload.
 type ValidationMetrics struct {
@@ -57,8 +57,12 @@ func TestCompletedCheckpointMarshaling(t *testing.T) {
 		StartTime:  time.Now().Round(0),
 		EndTime:    time.Now().Round(0),
 	}
+	original.CheckpointTransfer = &CheckpointTransfer{
+		NumBytes: 100, Seconds: 2, BytesPerSecond: 50,
+	}
 	rebuilt := roundTrip(t, original, &CompletedMessage{}).(*CompletedMessage)
 	assert.DeepEqual(t, metrics, rebuilt.CheckpointMetrics)
+	assert.DeepEqual(t, original.CheckpointTransfer, rebuilt.CheckpointTransfer)
 	assert.Assert(t, rebuilt.RunMetrics == nil)
 	assert.Assert(t, rebuilt.ValidationMetrics == nil)
 }
@@ -5,7 +5,7 @@ import json
 import os
 import re
 import sys
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 HERE = os.path.dirname(__file__)
 ALL_PKGS = ["expconf"]
@@ -454,14 +454,413 @@ def gen_python(schemas: List[Schema]) -> List[str]:
     lines = []
     lines.append("# This is a generated file.  Editing it will make you sad.")
     lines.append("")
-    lines.append("import json")
+    lines.append("from determined.common.schemas.util import LazySchemas")
     lines.append("")
-    lines.append("schemas = {")
+    # Schemas are kept as text and only parsed when they are first used.
+    lines.append("texts = {")
     for schema in schemas:
-        lines.append(f'    "{schema.url}": json.loads(')
-        lines.append(f'        r"""\n{schema.text}\n"""')
-        lines.append("    ),")
+        lines.append(f'    "{schema.url}": r"""\n{schema.text}\n""",')
     lines.append("}")
+    lines.append("")
+    lines.append("schemas = LazySchemas(texts)")
+
+    return lines
+
+
+# Keywords which have no effect on whether an instance is valid.
+ANNOTATION_KEYWORDS = {
+    "$comment",
+    "$id",
+    "$schema",
+    "default",
+    "defaultMessage",
+    "description",
+    "examples",
+    "title",
+    "unionKey",
+}
+
+# Keywords which only apply to instances of a certain json type, and the python checks for those
+# types, which match the Draft 7 semantics of jsonschema.
+TYPE_CHECKS = {
+    "array": "isinstance(x, list)",
+    "boolean": "isinstance(x, bool)",
+    "integer": "_is_integer(x)",
+    "null": "x is None",
+    "number": "_is_number(x)",
+    "object": "isinstance(x, dict)",
+    "string": "isinstance(x, str)",
+}
+TYPED_KEYWORDS = {
+    "additionalProperties": "object",
+    "compareProperties": "object",
+    "disallowProperties": "object",
+    "exclusiveMaximum": "number",
+    "exclusiveMinimum": "number",
+    "items": "array",
+    "maximum": "number",
+    "minimum": "number",
+    "minLength": "string",
+    "maxLength": "string",
+    "pattern": "string",
+    "properties": "object",
+    "required": "object",
+}
+
+# Helpers of the generated validators.  Each one matches the jsonschema (or extensions.py)
+# behavior that it replaces.
+PYTHON_VALIDATOR_HELPERS = '''
+def _is_integer(x: Any) -> bool:
+    if isinstance(x, bool):
+        return False
+    return isinstance(x, int) or (isinstance(x, float) and x.is_integer())
+
+
+def _is_number(x: Any) -> bool:
+    return isinstance(x, numbers.Number) and not isinstance(x, bool)
+
+
+def _equal(one: Any, two: Any) -> bool:
+    """Compare like json-schema, where booleans are not numbers."""
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return bool(one == two)
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(
+            key in two and _equal(value, two[key]) for key, value in one.items()
+        )
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return bool(one == two)
+
+
+def _has_all(x: Any, keys: Tuple[str, ...]) -> bool:
+    return all(key in x for key in keys)
+
+
+def _get_by_path(x: Any, path: str) -> Any:
+    for key in path.split("."):
+        if not x:
+            return None
+        x = x.get(key)
+    return x
+
+
+def _compare(compare: Dict[str, str], x: Any) -> bool:
+    a = _get_by_path(x, compare["a"])
+    b = _get_by_path(x, compare["b"])
+    if a is None or b is None:
+        return True
+    if compare["type"] == "a<b":
+        return bool(a < b)
+    if compare["type"] == "a<=b":
+        return bool(a <= b)
+    a = os.path.normpath(a)
+    b = os.path.normpath(b)
+    if os.path.isabs(a):
+        return bool(a.startswith(b))
+    return not a.startswith("..")
+
+'''
+
+
+def literal(value: Any) -> str:
+    """Return a python literal for a json value, with double-quoted strings."""
+    if isinstance(value, str):
+        return json.dumps(value)
+    if isinstance(value, list):
+        return "[" + ", ".join(literal(v) for v in value) + "]"
+    if isinstance(value, tuple):
+        if len(value) == 1:
+            return f"({literal(value[0])},)"
+        return "(" + ", ".join(literal(v) for v in value) + ")"
+    if isinstance(value, dict):
+        items = (f"{literal(k)}: {literal(v)}" for k, v in value.items())
+        return "{" + ", ".join(items) + "}"
+    return repr(value)
+
+
+def frozenset_literal(values: Any) -> str:
+    # Sort the values so that the output is deterministic.
+    return "frozenset([" + ", ".join(literal(v) for v in sorted(values)) + "])"
+
+
+class PythonValidatorCompiler:
+    """
+    Compile json schemas, including our extensions, into python functions which return whether an
+    instance is valid, without reporting why not.
+
+    The compiled functions are far faster than jsonschema, so they are used to skip jsonschema
+    entirely for valid configs.  jsonschema remains the reference implementation, and it is still
+    what generates the error messages for invalid configs, so a compiled function must agree with
+    jsonschema on every instance.  The one exception is instances on which jsonschema raises,
+    like a compareProperties of values which cannot be compared: a compiled function stops at the
+    first failed check, so it may reject a union member without raising and accept another one.
+
+    Every subschema becomes a function, and identical functions are only generated once.
+    """
+
+    def __init__(self, schemas: List[Schema]) -> None:
+        self.schemas = {schema.url: schema.schema for schema in schemas}
+        # (url, complete) -> the name of the function validating against that schema.
+        self.roots = {}  # type: Dict[Tuple[str, bool], str]
+        self.pending = []  # type: List[Tuple[str, bool]]
+        # Function body -> function name, for deduplicating subschemas.
+        self.bodies = {}  # type: Dict[str, str]
+        # Constant expression -> name of a module-level variable holding it.
+        self.constants = {}  # type: Dict[str, str]
+        self.functions = []  # type: List[List[str]]
+
+    def root(self, url: str, complete: bool) -> str:
+        """Return the name of the function for a whole schema, compiling it later if needed."""
+        if url not in self.schemas:
+            raise AssertionError(f"unknown schema url: {url}")
+        key = (url, complete)
+        if key not in self.roots:
+            suffix = os.path.splitext(url[len(URLBASE) + 1 :])[0]
+            suffix = re.sub("[^a-zA-Z0-9]", "_", suffix)
+            self.roots[key] = ("_complete_" if complete else "_sane_") + suffix
+            self.pending.append(key)
+        return self.roots[key]
+
+    def constant(self, expr: str) -> str:
+        """Return the name of a module-level variable holding the value of expr."""
+        if expr not in self.constants:
+            self.constants[expr] = f"_C{len(self.constants)}"
+        return self.constants[expr]
+
+    def compile(self) -> None:
+        for schema in self.schemas.values():
+            self.root(schema["$id"], complete=False)
+            self.root(schema["$id"], complete=True)
+        while self.pending:
+            url, complete = self.pending.pop(0)
+            body = self.body(self.schemas[url], complete)
+            self.functions.append(self.function(self.roots[(url, complete)], body))
+
+    def function(self, name: str, body: List[str]) -> List[str]:
+        return [f"def {name}(x: Any) -> bool:", *body, "    return True"]
+
+    def node(self, schema: Any, complete: bool) -> Optional[str]:
+        """
+        Return the name of the function for a subschema, or None if every instance is valid.
+        """
+        if schema is True:
+            return None
+        if isinstance(schema, dict) and "$ref" in schema:
+            return self.root(schema["$ref"], complete)
+        body = self.body(schema, complete)
+        if not body:
+            return None
+        key = "\n".join(body)
+        if key not in self.bodies:
+            self.bodies[key] = f"_f{len(self.bodies)}"
+            self.functions.append(self.function(self.bodies[key], body))
+        return self.bodies[key]
+
+    def body(self, schema: Any, complete: bool) -> List[str]:
+        """Return statements which return False if the instance x is invalid."""
+        if schema is False:
+            return ["    return False"]
+        if not isinstance(schema, dict):
+            raise AssertionError(f"invalid schema: {schema}")
+        if "$ref" in schema:
+            # Like jsonschema for Draft 7, ignore the siblings of $ref.
+            return [
+                f"    if not {self.root(schema['$ref'], complete)}(x):",
+                "        return False",
+            ]
+
+        # Checks which apply to any instance.
+        conditions = []  # type: List[str]
+        # Checks which only apply to instances of a type.
+        typed = {}  # type: Dict[str, List[str]]
+        for keyword, value in schema.items():
+            if keyword in ANNOTATION_KEYWORDS:
+                continue
+            if keyword in ("eventually", "eventuallyRequired") and not complete:
+                continue
+            checks = self.keyword(keyword, value, schema, complete)
+            if keyword in TYPED_KEYWORDS:
+                typed.setdefault(TYPED_KEYWORDS[keyword], []).extend(checks)
+            else:
+                conditions.extend(checks)
+
+        lines = []
+        for condition in conditions:
+            lines += [f"    if {condition}:", "        return False"]
+        for typ in sorted(typed):
+            if not typed[typ]:
+                continue
+            lines.append(f"    if {TYPE_CHECKS[typ]}:")
+            for condition in typed[typ]:
+                lines += [f"        if {condition}:", "            return False"]
+        return lines
+
+    def call(self, schema: Any, complete: bool, arg: str = "x") -> str:
+        """Return an expression for whether arg is valid against a subschema."""
+        name = self.node(schema, complete)
+        return "True" if name is None else f"{name}({arg})"
+
+    def keyword(
+        self, keyword: str, value: Any, schema: Dict, complete: bool
+    ) -> List[str]:
+        """Return conditions which are true if the instance x is invalid."""
+        if keyword == "type":
+            types = value if isinstance(value, list) else [value]
+            if len(types) == 1:
+                return [f"not {TYPE_CHECKS[types[0]]}"]
+            return ["not (" + " or ".join(TYPE_CHECKS[t] for t in types) + ")"]
+
+        if keyword == "properties":
+            out = []
+            for prop, sub in value.items():
+                name = self.node(sub, complete)
+                if name is not None:
+                    out.append(
+                        f"{literal(prop)} in x and not {name}(x[{literal(prop)}])"
+                    )
+            return out
+
+        if keyword == "additionalProperties":
+            if "patternProperties" in schema:
+                raise AssertionError("patternProperties is not supported")
+            properties = schema.get("properties", {})
+            if value is False:
+                if not properties:
+                    return ["x"]
+                return [
+                    f"not {self.constant(frozenset_literal(properties))}.issuperset(x)"
+                ]
+            name = self.node(value, complete)
+            if name is None:
+                return []
+            if not properties:
+                return [f"not all(map({name}, x.values()))"]
+            known = self.constant(frozenset_literal(properties))
+            return [f"any(k not in {known} and not {name}(v) for k, v in x.items())"]
+
+        if keyword == "required":
+            return (
+                [" or ".join(f"{literal(key)} not in x" for key in value)]
+                if value
+                else []
+            )
+
+        if keyword == "eventuallyRequired":
+            # Unlike required, eventuallyRequired does not check that the instance is an object.
+            return [f"not _has_all(x, {literal(tuple(value))})"] if value else []
+
+        if keyword == "disallowProperties":
+            return (
+                [" or ".join(f"{literal(key)} in x" for key in value)] if value else []
+            )
+
+        if keyword == "items":
+            if isinstance(value, list):
+                return [
+                    f"len(x) > {i} and not {self.call(sub, complete, f'x[{i}]')}"
+                    for i, sub in enumerate(value)
+                ]
+            name = self.node(value, complete)
+            return [] if name is None else [f"not all(map({name}, x))"]
+
+        if keyword == "const":
+            if isinstance(value, str):
+                return [f"x != {literal(value)}"]
+            if value is None or isinstance(value, bool):
+                return [f"x is not {literal(value)}"]
+            return [f"not _equal(x, {self.constant(literal(value))})"]
+
+        if keyword == "enum":
+            # Only strings are equal to strings, and only None is equal to None.
+            if all(v is None or isinstance(v, str) for v in value):
+                return [f"x not in {self.constant(literal(tuple(value)))}"]
+            return [f"not any(_equal(x, e) for e in {self.constant(literal(value))})"]
+
+        if keyword == "minimum":
+            return [f"x < {value!r}"]
+        if keyword == "maximum":
+            return [f"x > {value!r}"]
+        if keyword == "exclusiveMinimum":
+            return [f"x <= {value!r}"]
+        if keyword == "exclusiveMaximum":
+            return [f"x >= {value!r}"]
+        if keyword == "minLength":
+            return [f"len(x) < {value!r}"]
+        if keyword == "maxLength":
+            return [f"len(x) > {value!r}"]
+        if keyword == "pattern":
+            return [f"not {self.constant(f're.compile({literal(value)})')}.search(x)"]
+
+        if keyword == "not":
+            return [f"{self.call(value, complete)}"]
+        if keyword == "allOf":
+            return [f"not {self.call(sub, complete)}" for sub in value]
+        if keyword == "checks":
+            return [f"not {self.call(sub, complete)}" for sub in value.values()]
+        if keyword == "eventually":
+            return [f"not {self.call(value, complete)}"]
+        if keyword == "anyOf":
+            return ["not (" + " or ".join(self.call(s, complete) for s in value) + ")"]
+        if keyword in ("oneOf", "union"):
+            subs = value["items"] if keyword == "union" else value
+            # Every subschema is checked, since more than one matching is also invalid.
+            return ["(" + " + ".join(self.call(s, complete) for s in subs) + ") != 1"]
+
+        if keyword == "optionalRef":
+            return [f"x is not None and not {self.root(value, complete)}(x)"]
+
+        if keyword == "conditional":
+            enforce = self.call(value["enforce"], complete)
+            if "when" in value:
+                condition = self.call(value["when"], complete)
+            else:
+                condition = f"not {self.call(value['unless'], complete)}"
+            return [f"{condition} and not {enforce}"]
+
+        if keyword == "compareProperties":
+            if value["type"] not in ("a<b", "a<=b", "a_is_subdir_of_b"):
+                raise AssertionError(f"unrecognized comparison {value['type']}")
+            return [f"not _compare({self.constant(literal(value))}, x)"]
+
+        raise AssertionError(
+            f"the python validator generator does not support the {keyword} keyword"
+        )
+
+
+def gen_python_validators(schemas: List[Schema]) -> List[str]:
+    compiler = PythonValidatorCompiler(schemas)
+    compiler.compile()
+
+    lines = []
+    lines.append("# This is a generated file.  Editing it will make you sad.")
+    lines.append("")
+    lines.append("import numbers")
+    lines.append("import os")
+    lines.append("import re")
+    lines.append("from collections.abc import Mapping, Sequence")
+    lines.append("from typing import Any, Callable, Dict, Tuple")
+    lines.append("")
+    lines.append(PYTHON_VALIDATOR_HELPERS)
+    for expr, name in compiler.constants.items():
+        lines.append(f"{name} = {expr}")
+    for function in compiler.functions:
+        lines.append("")
+        lines.append("")
+        lines.extend(function)
+    for complete, variable in [(False, "sanity"), (True, "completeness")]:
+        lines.append("")
+        lines.append("")
+        lines.append(f"{variable} = {{")
+        for schema in schemas:
+            lines.append(
+                f'    "{schema.url}": {compiler.roots[(schema.url, complete)]},'
+            )
+        lines.append("}  # type: Dict[str, Callable[[Any], bool]]")
 
     return lines
 
@@ -495,6 +894,16 @@ def python_main(package: str, output: Optional[str]) -> None:
     maybe_write_output(lines, output)
 
 
+def python_validators_main(package: str, output: Optional[str]) -> None:
+    assert package is not None, "--package must be provided"
+    files = list_files(package)
+    schemas = read_schemas(files)
+
+    lines = gen_python_validators(schemas)
+
+    maybe_write_output(lines, output)
+
+
 def go_struct_main(package: str, file: str, line: int, imports: Optional[str]) -> None:
     assert package is not None, "GOPACKAGE not set"
     assert file is not None, "GOFILE not set"
@@ -536,6 +945,11 @@ if __name__ == "__main__":
     python_parser.add_argument("--package", required=True)
     python_parser.add_argument("--output")
 
+    # Python validator generator.
+    python_validators_parser = subparsers.add_parser("python-validators")
+    python_validators_parser.add_argument("--package", required=True)
+    python_validators_parser.add_argument("--output")
+
     # Go struct generator, expect environment variables set by go generate.
     go_struct_parser = subparsers.add_parser("go-struct")
     go_struct_parser.add_argument("--package", default=os.environ.get("GOPACKAGE"))
@@ -554,6 +968,8 @@ if __name__ == "__main__":
         generator = args.pop("generator")
         if generator == "python":
             python_main(**args)
+        elif generator == "python-validators":
+            python_validators_main(**args)
         elif generator == "go-struct":
             go_struct_main(**args)
         elif generator == "go-root":